@@ -10,6 +10,7 @@ import yaml
 from datetime import datetime, timedelta
 from typing import Any, Dict, List
 from agents.base_agent import BaseAgent
+from core.rollups import Rollups
 
 
 class CoachingAgent(BaseAgent):
@@ -159,9 +160,8 @@ class CoachingAgent(BaseAgent):
             }
 
     def _check_pattern_alerts(self) -> List[Dict[str, str]]:
-        """패턴 기반 알림 (연속 일수 등)"""
+        """패턴 기반 알림 (연속 일수 등, daily_rollup 최근 N일)"""
         alerts = []
-        cursor = self.conn.cursor()
 
         # 최근 N일 수면 체크
         consecutive_days = self.config.get("alerts", {}).get("consecutive_days_check", 3)
@@ -170,14 +170,13 @@ class CoachingAgent(BaseAgent):
         today = datetime.now().date()
         start_date = today - timedelta(days=consecutive_days - 1)
 
-        cursor.execute("""
-            SELECT COUNT(*) as count
-            FROM daily_health
-            WHERE date >= ? AND date <= ? AND sleep_h < ?
-        """, (start_date.strftime("%Y-%m-%d"), today.strftime("%Y-%m-%d"), warning_threshold))
+        days = [
+            day for day in Rollups(self.conn).days(start_date.strftime("%Y-%m-%d"), today.strftime("%Y-%m-%d"))
+            if day["health_logged"]
+        ]
 
-        result = cursor.fetchone()
-        if result and result["count"] >= consecutive_days:
+        low_sleep = sum(1 for day in days if day["sleep_h"] is not None and day["sleep_h"] < warning_threshold)
+        if low_sleep >= consecutive_days:
             alerts.append({
                 "type": "warning",
                 "category": "sleep_pattern",
@@ -185,14 +184,8 @@ class CoachingAgent(BaseAgent):
             })
 
         # 운동 0분 연속 체크
-        cursor.execute("""
-            SELECT COUNT(*) as count
-            FROM daily_health
-            WHERE date >= ? AND date <= ? AND (workout_min IS NULL OR workout_min = 0)
-        """, (start_date.strftime("%Y-%m-%d"), today.strftime("%Y-%m-%d")))
-
-        result = cursor.fetchone()
-        if result and result["count"] >= consecutive_days:
+        no_workout = sum(1 for day in days if not day["workout_min"])
+        if no_workout >= consecutive_days:
             alerts.append({
                 "type": "info",
                 "category": "workout_pattern",
@@ -208,20 +201,15 @@ class CoachingAgent(BaseAgent):
         Returns:
             인사이트 딕셔너리
         """
-        cursor = self.conn.cursor()
         insights = []
 
-        # 주간 평균 수면
+        # 주간 합계 (daily_rollup 최근 8일)
         week_ago = (datetime.now() - timedelta(days=7)).strftime("%Y-%m-%d")
-        cursor.execute("""
-            SELECT AVG(sleep_h) as avg_sleep, COUNT(*) as days
-            FROM daily_health
-            WHERE date >= ? AND sleep_h IS NOT NULL
-        """, (week_ago,))
-
-        result = cursor.fetchone()
-        if result and result["days"] > 0:
-            avg_sleep = result["avg_sleep"]
+        week = Rollups(self.conn).window(week_ago, datetime.now().strftime("%Y-%m-%d"))
+
+        # 주간 평균 수면
+        if week["sleep_days"] > 0:
+            avg_sleep = week["avg_sleep"]
             target = self.config.get("health_targets", {}).get("sleep_hours", 7)
 
             if avg_sleep < target - 1:
@@ -238,20 +226,11 @@ class CoachingAgent(BaseAgent):
                 })
 
         # 주간 총 운동 시간
-        cursor.execute("""
-            SELECT SUM(workout_min) as total_workout
-            FROM daily_health
-            WHERE date >= ?
-        """, (week_ago,))
-
-        result = cursor.fetchone()
-        if result:
-            total_workout = result["total_workout"] or 0
-            insights.append({
-                "type": "trend",
-                "category": "workout",
-                "message": f"주간 총 운동: {total_workout}분"
-            })
+        insights.append({
+            "type": "trend",
+            "category": "workout",
+            "message": f"주간 총 운동: {week['total_workout']}분"
+        })
 
         return {
             "success": True,
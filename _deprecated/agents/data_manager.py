@@ -8,6 +8,7 @@ import sqlite3
 from datetime import datetime, date, timedelta
 from typing import Any, Dict, List, Optional, Tuple
 from agents.base_agent import BaseAgent
+from core.rollups import Rollups
 
 
 class DataManagerAgent(BaseAgent):
@@ -317,12 +318,10 @@ class DataManagerAgent(BaseAgent):
             "weight_kg": health_row["weight_kg"] if health_row else None,
         }
 
-        # 할일 통계
-        cursor.execute("SELECT COUNT(*) as total FROM tasks WHERE date(created_at) = ?", (date_str,))
-        total_tasks = cursor.fetchone()["total"]
-
-        cursor.execute("SELECT COUNT(*) as done FROM tasks WHERE date(completed_at) = ?", (date_str,))
-        done_tasks = cursor.fetchone()["done"]
+        # 할일 통계 (daily_rollup)
+        day = Rollups(self.conn).day(date_str)
+        total_tasks = day["tasks_created"]
+        done_tasks = day["tasks_done"]
 
         tasks = {
             "total": total_tasks,
@@ -354,40 +353,18 @@ class DataManagerAgent(BaseAgent):
         }
 
     def get_weekly_stats(self) -> Dict[str, Any]:
-        """주간 통계"""
-        cursor = self.conn.cursor()
+        """주간 통계 (daily_rollup 최근 8일)"""
         today = datetime.now().date()
         week_ago = today - timedelta(days=7)
 
-        # 평균 수면 시간
-        cursor.execute("""
-            SELECT AVG(sleep_h) as avg_sleep
-            FROM daily_health
-            WHERE date >= ? AND date <= ?
-        """, (week_ago.strftime("%Y-%m-%d"), today.strftime("%Y-%m-%d")))
-        avg_sleep = cursor.fetchone()["avg_sleep"]
-
-        # 총 운동 시간
-        cursor.execute("""
-            SELECT SUM(workout_min) as total_workout
-            FROM daily_health
-            WHERE date >= ? AND date <= ?
-        """, (week_ago.strftime("%Y-%m-%d"), today.strftime("%Y-%m-%d")))
-        total_workout = cursor.fetchone()["total_workout"]
-
-        # 완료한 할일 수
-        cursor.execute("""
-            SELECT COUNT(*) as completed
-            FROM tasks
-            WHERE completed_at >= ? AND completed_at <= ?
-        """, (week_ago.strftime("%Y-%m-%d"), today.strftime("%Y-%m-%d")))
-        completed_tasks = cursor.fetchone()["completed"]
+        week = Rollups(self.conn).window(week_ago.strftime("%Y-%m-%d"), today.strftime("%Y-%m-%d"))
+        avg_sleep = week["avg_sleep"]
 
         return {
             "period": f"{week_ago} ~ {today}",
             "avg_sleep": round(avg_sleep, 1) if avg_sleep else 0,
-            "total_workout": total_workout or 0,
-            "completed_tasks": completed_tasks
+            "total_workout": week["total_workout"],
+            "completed_tasks": week["tasks_done"]
         }
 
     # ===== 학습 기록 (Learning Logs) =====
@@ -0,0 +1,220 @@
+"""
+비동기 처리 파이프라인 (AsyncSimpleLLM)
+SimpleLLM과 같은 단계(파싱 → 실행 → 응답 → 대화 저장)를 asyncio로 실행하고,
+서로 기다릴 필요가 없는 작업은 동시에 진행한다.
+
+    파싱 (정규식 / LLM ainvoke)  ┐
+    입력 임베딩 (RAG 저장용)      │ 동시
+    메모리 검색어 임베딩 → 실행   │ (DB는 작업 스레드)
+    응답 생성 (ainvoke/astream)  ┘
+    → 대화 저장 큐 (입력 임베딩은 캐시 적중)
+
+동기 코드(CLI, Streamlit)는 process()/process_stream()을 그대로 호출하면 된다
+(프로세스 공용 이벤트 루프 core.async_runtime.event_loop에서 실행).
+"""
+import asyncio
+import time
+from typing import Any, AsyncIterator, Dict, Iterator, List, Optional
+
+from core.async_runtime import event_loop
+from core.config import config
+from core.database import Database
+from core.prompt_usage import prompt_usage
+from core.simple_llm import SimpleLLM
+
+
+class AsyncSimpleLLM(SimpleLLM):
+    """SimpleLLM의 asyncio 버전 (LLM/임베딩 호출은 await, DB 실행은 작업 스레드)"""
+
+    def process(self, user_input: str, chat_history: Optional[List[Dict]] = None) -> str:
+        """동기 호출 (공용 이벤트 루프에서 aprocess 실행)"""
+        return event_loop.run(self.aprocess(user_input, chat_history))
+
+    def process_stream(
+        self,
+        user_input: str,
+        chat_history: Optional[List[Dict]] = None
+    ) -> Iterator[str]:
+        """동기 스트리밍 (st.write_stream 등에 그대로 사용)"""
+        return event_loop.iterate(self.aprocess_stream(user_input, chat_history))
+
+    async def aprocess(self, user_input: str, chat_history: Optional[List[Dict]] = None) -> str:
+        """
+        사용자 입력 처리 (비동기)
+
+        Args:
+            user_input: 사용자 입력
+            chat_history: 대화 이력 (선택)
+
+        Returns:
+            응답 메시지
+        """
+        prefetch = self._prefetch_input(user_input)
+        try:
+            plan, ok = await self._aprepare(user_input, prefetch)
+            response = await self._ainvoke_plan(plan)
+        except Exception as e:
+            return f"처리 중 오류 발생: {str(e)}"
+
+        if ok:
+            await self._asave_turn(user_input, response, prefetch)
+        return response
+
+    async def aprocess_stream(
+        self,
+        user_input: str,
+        chat_history: Optional[List[Dict]] = None
+    ) -> AsyncIterator[str]:
+        """
+        사용자 입력 처리 (비동기 스트리밍, 응답 토큰이 도착하는 대로 yield)
+
+        Yields:
+            응답 텍스트 조각
+        """
+        prefetch = self._prefetch_input(user_input)
+        try:
+            plan, ok = await self._aprepare(user_input, prefetch)
+        except Exception as e:
+            yield f"처리 중 오류 발생: {str(e)}"
+            return
+
+        chunks = []
+        async for token in self._astream_plan(plan):
+            chunks.append(token)
+            yield token
+
+        if ok:
+            await self._asave_turn(user_input, "".join(chunks).strip(), prefetch)
+
+    # ========================================
+    # 단계별 비동기 처리
+    # ========================================
+
+    async def _aprepare(self, user_input: str, prefetch: Optional[asyncio.Future]):
+        """
+        파싱 → 실행 → 응답 준비
+
+        Returns:
+            (응답 plan, 정상 처리 여부 - 파싱 실패면 False이고 대화를 저장하지 않음)
+        """
+        parsed = await self._aparse(user_input)
+        if not parsed.get("success"):
+            error = parsed.get("error", "처리 중 오류가 발생했습니다.")
+            return {"kind": "response", "text": error, "messages": [], "cache_key": None,
+                    "embedding": None, "fallback": error}, False
+
+        # 메모리 검색어 임베딩을 미리 계산 → 실행 중 RAG 검색은 캐시 적중
+        await self._aembed(self._memory_queries(parsed))
+        results = await asyncio.to_thread(self._execute_turn, parsed)
+
+        # 의미 기반 응답 캐시는 입력 임베딩을 사용 (미리 계산한 것을 기다림)
+        if prefetch is not None and self.response_cache and self.response_cache.semantic:
+            await prefetch
+
+        return self._response_plan(user_input, results), True
+
+    async def _aparse(self, user_input: str) -> Dict[str, Any]:
+        """정규식 fast path → LLM (ainvoke)"""
+        fast = self._fast_parse(user_input)
+        if fast is not None:
+            return fast
+
+        try:
+            started = time.perf_counter()
+            response = await self.llm.ainvoke(self._parse_messages(user_input))
+            prompt_usage.record("parse", response, started)
+            return self._parse_llm_output(response.content, user_input)
+        except Exception as e:
+            return {"success": False, "error": f"파싱 오류: {str(e)}"}
+
+    async def _ainvoke_plan(self, plan: Dict[str, Any]) -> str:
+        """응답 한 번에 생성 (_invoke_plan의 비동기 버전)"""
+        if plan["text"] is not None:
+            return plan["text"]
+
+        try:
+            started = time.perf_counter()
+            response = await self.llm.ainvoke(plan["messages"])
+            prompt_usage.record(plan["kind"], response, started)
+            answer = response.content.strip()
+        except Exception:
+            return plan["fallback"]
+
+        self._cache_response(plan, answer)
+        return answer
+
+    async def _astream_plan(self, plan: Dict[str, Any]) -> AsyncIterator[str]:
+        """응답 토큰 스트리밍 (_stream_plan의 비동기 버전)"""
+        if plan["text"] is not None:
+            yield plan["text"]
+            return
+
+        chunks, usage = [], None
+        started = time.perf_counter()
+        try:
+            async for chunk in self.llm.astream(plan["messages"]):
+                if getattr(chunk, "usage_metadata", None):
+                    usage = chunk
+                if chunk.content:
+                    chunks.append(chunk.content)
+                    yield chunk.content
+        except Exception as e:
+            if not chunks:
+                yield plan["fallback"]
+            else:
+                print(f"⚠️  응답 스트리밍 중단: {e}")
+            return
+
+        prompt_usage.record(plan["kind"], usage, started)
+        self._cache_response(plan, "".join(chunks).strip())
+
+    async def _asave_turn(self, user_input: str, response: str, prefetch: Optional[asyncio.Future]):
+        """입력 임베딩이 끝난 뒤 저장 큐에 넣음 (저장할 때 임베딩 재요청 없음)"""
+        if prefetch is not None:
+            await prefetch
+        self._save_turn(user_input, response)
+
+    # ========================================
+    # 임베딩 미리 계산
+    # ========================================
+
+    def _prefetch_input(self, user_input: str) -> Optional[asyncio.Future]:
+        """입력 임베딩을 백그라운드 작업으로 시작 (RAG가 없으면 None)"""
+        if not self.rag or not self.rag_writer:
+            return None
+        return asyncio.ensure_future(self._aembed([user_input]))
+
+    async def _aembed(self, texts: List[str]):
+        """임베딩 캐시 채우기 (실패해도 처리는 계속, 필요한 곳에서 다시 시도)"""
+        if not self.rag or not texts:
+            return
+        try:
+            await self.rag.embedding_service.agenerate_embeddings_batch(texts)
+        except Exception as e:
+            print(f"⚠️  임베딩 미리 계산 실패: {e}")
+
+    def _memory_queries(self, parsed: Dict[str, Any]) -> List[str]:
+        """query_memory 의도의 검색어"""
+        return [
+            intent_data["entities"]["query"]
+            for intent_data in parsed.get("intents", [])
+            if intent_data.get("intent") == "query_memory"
+            and (intent_data.get("entities") or {}).get("query")
+        ]
+
+
+def create_agent(db: Database, pipeline: Optional[str] = None) -> SimpleLLM:
+    """
+    설정에 맞는 대화 에이전트 생성
+
+    Args:
+        db: 연결된 Database
+        pipeline: sync 또는 async (기본: config.yaml llm.pipeline)
+
+    Returns:
+        SimpleLLM 또는 AsyncSimpleLLM
+    """
+    pipeline = pipeline or config.get("llm.pipeline", "sync")
+    if pipeline == "async":
+        return AsyncSimpleLLM(db)
+    return SimpleLLM(db)
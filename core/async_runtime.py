@@ -0,0 +1,74 @@
+"""
+프로세스 공용 이벤트 루프 (백그라운드 스레드)
+동기 코드(CLI, Streamlit)에서 코루틴을 실행할 때 사용한다.
+
+    event_loop.run(agent.aprocess("7시간 잤어"))        # 결과까지 대기
+    for token in event_loop.iterate(agent.aprocess_stream(...)):
+        ...
+
+asyncio.run()처럼 호출마다 루프를 새로 만들지 않으므로, 루프에 묶이는
+비동기 HTTP 연결 풀(core.client_registry)을 호출 사이에 계속 재사용할 수 있다.
+"""
+import asyncio
+import threading
+from typing import Any, AsyncIterator, Awaitable, Iterator, Optional
+
+
+class EventLoopThread:
+    """백그라운드 스레드에서 계속 도는 이벤트 루프 하나 (처음 사용할 때 시작)"""
+
+    def __init__(self, name: str = "horcrux-event-loop"):
+        self.name = name
+        self._lock = threading.Lock()
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def loop(self) -> asyncio.AbstractEventLoop:
+        """실행 중인 루프 (없으면 스레드 시작)"""
+        with self._lock:
+            if self._loop is None or self._loop.is_closed():
+                self._loop = asyncio.new_event_loop()
+                self._thread = threading.Thread(
+                    target=self._loop.run_forever, name=self.name, daemon=True
+                )
+                self._thread.start()
+            return self._loop
+
+    def run(self, coro: Awaitable, timeout: Optional[float] = None) -> Any:
+        """
+        코루틴을 공용 루프에서 실행하고 결과 반환 (호출한 스레드는 대기)
+
+        Raises:
+            RuntimeError: 공용 루프 스레드 안에서 호출한 경우 (교착 방지, await 사용)
+        """
+        if threading.current_thread() is self._thread:
+            coro.close()
+            raise RuntimeError("이벤트 루프 스레드에서는 run() 대신 await를 사용하세요.")
+        return asyncio.run_coroutine_threadsafe(coro, self.loop).result(timeout)
+
+    def iterate(self, agen: AsyncIterator) -> Iterator:
+        """비동기 제너레이터 → 동기 이터레이터 (항목마다 공용 루프에서 실행)"""
+        try:
+            while True:
+                try:
+                    yield self.run(agen.__anext__())
+                except StopAsyncIteration:
+                    return
+        finally:
+            self.run(agen.aclose())
+
+    def stop(self):
+        """루프 종료 (다음 사용 때 새로 시작)"""
+        with self._lock:
+            loop, thread = self._loop, self._thread
+            self._loop, self._thread = None, None
+
+        if loop is not None and loop.is_running():
+            loop.call_soon_threadsafe(loop.stop)
+            thread.join()
+            loop.close()
+
+
+# 전역 이벤트 루프
+event_loop = EventLoopThread()
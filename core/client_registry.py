@@ -0,0 +1,308 @@
+"""
+LLM 클라이언트 레지스트리 (프로세스 전역)
+provider/model마다 HTTP 연결 풀(httpx.Client, keep-alive) 하나를 만들어
+세션, 백그라운드 작업(RAG 저장 등)이 모두 같은 연결을 재사용한다.
+
+    clients.chat_openai("gpt-4o-mini")          # LangChain ChatOpenAI
+    clients.openai("text-embedding-3-small")    # OpenAI SDK (임베딩)
+    clients.stats()                             # provider/model별 지연 시간
+
+풀 크기와 타임아웃은 config.yaml의 llm.http_pool에서 설정.
+SDK(openai, langchain_openai, anthropic)와 httpx는 처음 요청할 때 import.
+
+비동기 연결 풀(httpx.AsyncClient)은 연결이 이벤트 루프에 묶이므로
+core.async_runtime.event_loop (프로세스 공용 루프)에서만 사용한다.
+"""
+import threading
+import time
+from collections import deque
+from typing import Any, Callable, Dict, Optional, Tuple
+
+from core.config import config
+
+# llm.http_pool 기본값
+DEFAULT_POOL = {
+    "max_connections": 20,        # provider/model당 최대 동시 연결
+    "max_keepalive": 10,          # 유지할 유휴 연결 수
+    "keepalive_expiry": 60.0,     # 유휴 연결 유지 시간 (초)
+    "timeout": 60.0,              # 요청 타임아웃 (초)
+    "connect_timeout": 5.0,       # 연결 타임아웃 (초)
+}
+
+
+class LatencyStats:
+    """클라이언트별 요청 지연 시간 (최근 window개로 백분위 계산)"""
+
+    def __init__(self, window: int = 256):
+        self._lock = threading.Lock()
+        self._samples = deque(maxlen=window)
+        self.calls = 0
+        self.errors = 0
+        self.total_ms = 0.0
+        self.max_ms = 0.0
+
+    def record(self, ms: float, error: bool = False):
+        with self._lock:
+            self.calls += 1
+            self.errors += int(error)
+            self.total_ms += ms
+            self.max_ms = max(self.max_ms, ms)
+            self._samples.append(ms)
+
+    def snapshot(self) -> Dict[str, Any]:
+        """
+        Returns:
+            {"calls", "errors", "avg_ms", "p50_ms", "p95_ms", "max_ms"}
+        """
+        with self._lock:
+            samples = sorted(self._samples)
+            calls, errors, total, peak = self.calls, self.errors, self.total_ms, self.max_ms
+
+        def percentile(p):
+            if not samples:
+                return 0.0
+            return round(samples[min(len(samples) - 1, int(p * len(samples)))], 1)
+
+        return {
+            "calls": calls,
+            "errors": errors,
+            "avg_ms": round(total / calls, 1) if calls else 0.0,
+            "p50_ms": percentile(0.50),
+            "p95_ms": percentile(0.95),
+            "max_ms": round(peak, 1),
+        }
+
+
+class TimedTransport:
+    """httpx 전송 계층 래퍼: 요청마다 응답 헤더까지의 시간을 기록"""
+
+    def __init__(self, transport, stats: LatencyStats):
+        self._transport = transport
+        self.stats = stats
+
+    def handle_request(self, request):
+        start = time.perf_counter()
+        try:
+            response = self._transport.handle_request(request)
+        except Exception:
+            self.stats.record((time.perf_counter() - start) * 1000, error=True)
+            raise
+        self.stats.record((time.perf_counter() - start) * 1000, error=response.status_code >= 500)
+        return response
+
+    def close(self):
+        self._transport.close()
+
+    def __enter__(self):
+        self._transport.__enter__()
+        return self
+
+    def __exit__(self, *args):
+        self._transport.__exit__(*args)
+
+
+class AsyncTimedTransport:
+    """TimedTransport의 비동기 버전 (httpx.AsyncClient용)"""
+
+    def __init__(self, transport, stats: LatencyStats):
+        self._transport = transport
+        self.stats = stats
+
+    async def handle_async_request(self, request):
+        start = time.perf_counter()
+        try:
+            response = await self._transport.handle_async_request(request)
+        except Exception:
+            self.stats.record((time.perf_counter() - start) * 1000, error=True)
+            raise
+        self.stats.record((time.perf_counter() - start) * 1000, error=response.status_code >= 500)
+        return response
+
+    async def aclose(self):
+        await self._transport.aclose()
+
+    async def __aenter__(self):
+        await self._transport.__aenter__()
+        return self
+
+    async def __aexit__(self, *args):
+        await self._transport.__aexit__(*args)
+
+
+class ClientRegistry:
+    """provider/model별 HTTP 연결 풀 + SDK 클라이언트 캐시 (스레드 안전)"""
+
+    def __init__(self, pool: Optional[Dict[str, Any]] = None):
+        """
+        Args:
+            pool: 연결 풀 설정 (기본: config.yaml llm.http_pool)
+        """
+        self.pool = {**DEFAULT_POOL, **(pool or config.get("llm.http_pool", {}) or {})}
+        self._lock = threading.RLock()
+        self._http: Dict[Tuple[str, str], Any] = {}
+        self._async_http: Dict[Tuple[str, str], Any] = {}
+        self._transports: Dict[Tuple[str, str], TimedTransport] = {}
+        self._stats: Dict[Tuple[str, str], LatencyStats] = {}
+        self._clients: Dict[tuple, Any] = {}
+
+    def http_client(self, provider: str, model: str):
+        """
+        provider/model 공용 httpx.Client (keep-alive 연결 풀)
+
+        Args:
+            provider: openai, anthropic, ollama
+            model: 모델 이름
+
+        Returns:
+            httpx.Client
+        """
+        key = (provider, model)
+        with self._lock:
+            if key not in self._http:
+                import httpx
+
+                stats = self._stats.setdefault(key, LatencyStats())
+                self._transports[key] = TimedTransport(httpx.HTTPTransport(limits=self._limits()), stats)
+                self._http[key] = httpx.Client(transport=self._transports[key], timeout=self._timeout())
+            return self._http[key]
+
+    def transport(self, provider: str, model: str) -> TimedTransport:
+        """
+        http_client(provider, model)가 쓰는 전송 계층 (httpx.Client를 직접 만드는 SDK용)
+
+        Returns:
+            TimedTransport (연결 풀 + 지연 시간 지표)
+        """
+        with self._lock:
+            self.http_client(provider, model)
+            return self._transports[(provider, model)]
+
+    def async_http_client(self, provider: str, model: str):
+        """
+        provider/model 공용 httpx.AsyncClient (지연 시간 지표는 동기 풀과 합산)
+
+        Returns:
+            httpx.AsyncClient
+        """
+        key = (provider, model)
+        with self._lock:
+            if key not in self._async_http:
+                import httpx
+
+                stats = self._stats.setdefault(key, LatencyStats())
+                self._async_http[key] = httpx.AsyncClient(
+                    transport=AsyncTimedTransport(httpx.AsyncHTTPTransport(limits=self._limits()), stats),
+                    timeout=self._timeout(),
+                )
+            return self._async_http[key]
+
+    def get(self, provider: str, model: str, factory: Callable, **params):
+        """
+        (provider, model, params)마다 클라이언트 하나를 만들어 재사용
+
+        Args:
+            provider: 제공자 이름
+            model: 모델 이름
+            factory: factory(http_client) → 클라이언트 (처음 한 번만 호출)
+            **params: 클라이언트를 구분하는 설정값 (api_key, temperature 등)
+
+        Returns:
+            캐시된 클라이언트
+        """
+        key = (provider, model, tuple(sorted(params.items())))
+        with self._lock:
+            if key not in self._clients:
+                self._clients[key] = factory(self.http_client(provider, model))
+            return self._clients[key]
+
+    def chat_openai(
+        self,
+        model: str = "gpt-4o-mini",
+        temperature: float = 0.7,
+        max_tokens: Optional[int] = None,
+        api_key: Optional[str] = None
+    ):
+        """LangChain ChatOpenAI (공용 연결 풀 사용)"""
+        def create(http_client):
+            from langchain_openai import ChatOpenAI
+
+            kwargs = {"max_tokens": max_tokens} if max_tokens is not None else {}
+            return ChatOpenAI(
+                model=model, temperature=temperature, api_key=api_key,
+                http_client=http_client,
+                http_async_client=self.async_http_client("openai", model),  # ainvoke/astream
+                stream_usage=True,  # 스트리밍도 토큰 사용량 (프롬프트 캐시 적중) 보고
+                **kwargs
+            )
+
+        return self.get("openai", model, create,
+                        temperature=temperature, max_tokens=max_tokens, api_key=api_key)
+
+    def openai(self, model: str, api_key: Optional[str] = None):
+        """OpenAI SDK 클라이언트 (model은 연결 풀/지표 구분용)"""
+        def create(http_client):
+            from openai import OpenAI
+            return OpenAI(api_key=api_key, http_client=http_client)
+
+        return self.get("openai", model, create, api_key=api_key)
+
+    def async_openai(self, model: str, api_key: Optional[str] = None):
+        """AsyncOpenAI SDK 클라이언트 (임베딩 비동기 호출)"""
+        def create(http_client):
+            from openai import AsyncOpenAI
+            return AsyncOpenAI(api_key=api_key, http_client=self.async_http_client("openai", model))
+
+        return self.get("openai", model, create, api_key=api_key, mode="async")
+
+    def anthropic(self, model: str, api_key: Optional[str] = None):
+        """Anthropic SDK 클라이언트"""
+        def create(http_client):
+            from anthropic import Anthropic
+            return Anthropic(api_key=api_key, http_client=http_client)
+
+        return self.get("anthropic", model, create, api_key=api_key)
+
+    def ollama(self, model: str, host: str = "http://localhost:11434"):
+        """Ollama 클라이언트 (로컬 서버)"""
+        def create(http_client):
+            import ollama
+            # ollama.Client는 httpx.Client를 직접 만들므로 같은 전송 계층/타임아웃을 넘김
+            return ollama.Client(host=host, transport=self.transport("ollama", model), timeout=self._timeout())
+
+        return self.get("ollama", model, create, host=host)
+
+    def stats(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Returns:
+            {"provider/model": LatencyStats.snapshot()}
+        """
+        with self._lock:
+            items = list(self._stats.items())
+        return {f"{provider}/{model}": s.snapshot() for (provider, model), s in items}
+
+    def close(self):
+        """연결 풀 모두 닫기 (캐시된 클라이언트도 버림, 비동기 풀은 버리기만 함)"""
+        with self._lock:
+            for http in self._http.values():
+                http.close()
+            self._http.clear()
+            self._async_http.clear()
+            self._transports.clear()
+            self._clients.clear()
+            self._stats.clear()
+
+    def _limits(self):
+        import httpx
+        return httpx.Limits(
+            max_connections=self.pool["max_connections"],
+            max_keepalive_connections=self.pool["max_keepalive"],
+            keepalive_expiry=self.pool["keepalive_expiry"],
+        )
+
+    def _timeout(self):
+        import httpx
+        return httpx.Timeout(self.pool["timeout"], connect=self.pool["connect_timeout"])
+
+
+# 전역 클라이언트 레지스트리
+clients = ClientRegistry()
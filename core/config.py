@@ -55,6 +55,10 @@ class Config:
         if llm_provider := os.getenv("LLM_PROVIDER"):
             self.config.setdefault("llm", {})["provider"] = llm_provider
 
+        # 응답 모드 (배포별: template, llm)
+        if response_mode := os.getenv("LLM_RESPONSE_MODE"):
+            self.config.setdefault("llm", {})["response_mode"] = response_mode
+
         # API 키들은 환경 변수에서 직접 읽도록
         # (보안상 config.yaml에 저장하지 않음)
 
@@ -82,7 +86,11 @@ class Config:
             "llm": {
                 "provider": "langchain",
                 "enabled": True,
-                "strategy": "fallback"
+                "strategy": "fallback",
+                "response_mode": "template",
+                "fast_path": {
+                    "min_confidence": 0.85
+                }
             },
             "database": {
                 "path": "horcrux.db"
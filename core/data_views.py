@@ -0,0 +1,168 @@
+"""
+대시보드 데이터 뷰 (키셋 페이지네이션)
+테이블 전체를 읽지 않고 (정렬 키, id) 커서로 한 페이지씩 조회한다.
+
+    WHERE (date, id) < (:last_date, :last_id)
+    ORDER BY date DESC, id DESC
+    LIMIT :page_size + 1
+
+OFFSET과 달리 몇 번째 페이지든 인덱스로 바로 찾아가므로 기록이 많아도 일정한 속도.
+"""
+from collections import OrderedDict
+from typing import Any, Dict, Optional, Tuple
+
+from core.database import fetch_dataframe
+
+
+class DataView:
+    """테이블 하나의 페이지 단위 조회 정의"""
+
+    def __init__(
+        self,
+        title: str,
+        select: str,
+        sort_column: Optional[str] = None,
+        id_column: str = "id"
+    ):
+        """
+        Args:
+            title: 화면 제목
+            select: SELECT ... FROM ... (WHERE/ORDER BY/LIMIT 제외, JOIN 가능)
+            sort_column: 정렬 키 (NOT NULL 컬럼 또는 식, None이면 id만으로 정렬)
+            id_column: 동률을 가르는 고유 키
+        """
+        self.title = title
+        self.select = select
+        self.sort_column = sort_column
+        self.id_column = id_column
+
+    def page_query(
+        self,
+        after: Optional[Tuple] = None,
+        page_size: int = 50,
+        placeholder: str = '?'
+    ) -> Tuple[str, tuple]:
+        """
+        한 페이지 SQL (다음 페이지 확인용으로 page_size + 1행)
+
+        Args:
+            after: 이전 페이지 마지막 행의 커서 (fetch_page()의 next_cursor)
+            page_size: 페이지 크기
+            placeholder: SQL placeholder (SQLite: ?, PostgreSQL: %s)
+        """
+        p = placeholder
+        if self.sort_column:
+            keys = [self.sort_column, self.id_column]
+            aliases = f"{self.sort_column} AS _sort_key, {self.id_column} AS _row_id"
+        else:
+            keys = [self.id_column]
+            aliases = f"{self.id_column} AS _row_id"
+
+        where = ""
+        if after:
+            where = f"WHERE ({', '.join(keys)}) < ({', '.join([p] * len(keys))})"
+
+        sql = f"""
+            {self.select.replace('SELECT', f'SELECT {aliases},', 1)}
+            {where}
+            ORDER BY {', '.join(f'{k} DESC' for k in keys)}
+            LIMIT {p}
+        """
+        return sql, tuple(after or ()) + (page_size + 1,)
+
+    def fetch_page(
+        self,
+        conn,
+        after: Optional[Tuple] = None,
+        page_size: int = 50,
+        placeholder: str = '?'
+    ) -> Dict[str, Any]:
+        """
+        한 페이지 조회
+
+        Returns:
+            {
+                "frame": DataFrame (최대 page_size행),
+                "next_cursor": 다음 페이지 커서 또는 None (마지막 페이지)
+            }
+        """
+        sql, params = self.page_query(after, page_size, placeholder)
+        frame = fetch_dataframe(conn, sql, params)
+
+        next_cursor = None
+        if len(frame) > page_size:
+            frame = frame.iloc[:page_size]
+            last = frame.iloc[-1]
+            next_cursor = ((last["_sort_key"], last["_row_id"]) if self.sort_column
+                           else (last["_row_id"],))
+            # numpy 스칼라 → 파이썬 값 (SQL 파라미터/캐시 키로 사용)
+            next_cursor = tuple(v.item() if hasattr(v, "item") else v for v in next_cursor)
+
+        frame = frame.drop(columns=[c for c in ("_sort_key", "_row_id") if c in frame.columns])
+        return {"frame": frame.reset_index(drop=True), "next_cursor": next_cursor}
+
+
+# 대시보드 탭 → 뷰 목록 (탭을 열 때만 해당 뷰를 조회)
+DATA_VIEWS: "OrderedDict[str, Dict[str, DataView]]" = OrderedDict([
+    ("💤 건강 데이터", {
+        "daily_health": DataView(
+            "💤 일일 건강 기록 (daily_health)",
+            "SELECT * FROM daily_health", sort_column="date"),
+    }),
+    ("📝 할일", {
+        "tasks": DataView(
+            "📝 할일 목록 (tasks)",
+            "SELECT * FROM tasks"),
+    }),
+    ("🎯 습관", {
+        "habits": DataView(
+            "🎯 습관 목록 (habits)",
+            "SELECT * FROM habits"),
+        "habit_logs": DataView(
+            "📅 습관 로그 (habit_logs)",
+            "SELECT * FROM habit_logs", sort_column="date"),
+    }),
+    ("💎 경험치", {
+        "exp_logs": DataView(
+            "💎 경험치 로그 (exp_logs)",
+            "SELECT * FROM exp_logs", sort_column="date"),
+        "user_progress": DataView(
+            "📈 레벨 진행도 (user_progress)",
+            "SELECT * FROM user_progress"),
+    }),
+    ("📊 기타", {
+        "custom_metrics": DataView(
+            "📊 커스텀 메트릭 (custom_metrics)",
+            "SELECT * FROM custom_metrics", sort_column="date"),
+    }),
+    ("👥 인물 정보", {
+        "people": DataView(
+            "👥 인물 정보 (people)",
+            "SELECT * FROM people", sort_column="COALESCE(importance_score, 0)"),
+    }),
+    ("🤝 상호작용", {
+        "interactions": DataView(
+            "🤝 상호작용 로그 (interactions)",
+            """SELECT i.id, p.name as person_name, i.date, i.type,
+                      i.summary, i.sentiment, i.location, i.duration_min
+               FROM interactions i
+               JOIN people p ON i.person_id = p.id""",
+            sort_column="i.date", id_column="i.id"),
+    }),
+    ("📚 지식/회고", {
+        "knowledge_entries": DataView(
+            "📚 지식 저장소 (knowledge_entries)",
+            "SELECT * FROM knowledge_entries", sort_column="learned_date"),
+        "reflections": DataView(
+            "💭 회고/성찰 (reflections)",
+            "SELECT * FROM reflections", sort_column="date"),
+    }),
+])
+
+
+def find_view(name: str) -> DataView:
+    """뷰 이름으로 찾기"""
+    for views in DATA_VIEWS.values():
+        if name in views:
+            return views[name]
+    raise KeyError(f"알 수 없는 데이터 뷰: {name}")
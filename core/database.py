@@ -11,9 +11,14 @@
 import sqlite3
 import os
 import json
+import threading
+import time
+from contextlib import contextmanager
 from datetime import datetime
 from pathlib import Path
-from typing import Optional, Union
+from typing import Any, Callable, Dict, List, Optional, Union
+
+from core.migrations import MigrationRunner
 
 # PostgreSQL 지원
 try:
@@ -24,6 +29,400 @@ except ImportError:
     POSTGRES_AVAILABLE = False
 
 
+def rows_to_dataframe(columns, rows, dtypes: Optional[Dict[str, Any]] = None):
+    """
+    조회 결과 → DataFrame (열 단위 구성)
+
+    행마다 dict를 만들지 않고 튜플 행을 한 번에 열 배열로 변환한다
+    (DataFrame.from_records). dict 행(RealDictRow)은 컬럼별로 모아서 구성.
+
+    Args:
+        columns: 컬럼 이름 (cursor.description 순서, 중복 허용)
+        rows: fetchall() 결과
+        dtypes: 컬럼별 dtype (예: {"sleep_h": "float64"}, 선택)
+
+    Returns:
+        pandas.DataFrame
+    """
+    import pandas as pd
+
+    if rows and isinstance(rows[0], dict):
+        df = pd.DataFrame(dict(enumerate([row[c] for row in rows] for c in columns)))
+        df.columns = columns
+    else:
+        df = pd.DataFrame.from_records(rows, columns=columns, coerce_float=True)
+
+    if dtypes:
+        df = df.astype(dtypes)
+    return df
+
+
+def fetch_dataframe(conn, sql: str, params: tuple = (), dtypes: Optional[Dict[str, Any]] = None):
+    """
+    연결에서 SQL 실행 → DataFrame
+
+    행 객체(sqlite3.Row, RealDictRow) 생성을 건너뛰도록 튜플 커서로 조회한다.
+    """
+    if isinstance(conn, sqlite3.Connection):
+        cursor = conn.cursor()
+        cursor.row_factory = None
+    elif POSTGRES_AVAILABLE:
+        cursor = conn.cursor(cursor_factory=psycopg2.extensions.cursor)
+    else:
+        cursor = conn.cursor()
+
+    cursor.execute(sql, params)
+    columns = [d[0] for d in cursor.description]
+    return rows_to_dataframe(columns, cursor.fetchall(), dtypes)
+
+
+class PostgresConnectionPool:
+    """
+    ThreadedConnectionPool 스타일 연결 풀 (PostgreSQL/Supabase)
+
+    - getconn()/putconn(): 작업 단위로 짧게 빌려 쓰고 반납
+    - 일정 시간 유휴였던 연결은 꺼낼 때 SELECT 1로 생존 확인
+    - 끊긴 연결은 폐기하고 지수 백오프로 재연결
+    """
+
+    def __init__(
+        self,
+        connect: Callable[[], Any],
+        minconn: int = 1,
+        maxconn: int = 5,
+        max_retries: int = 3,
+        backoff: float = 0.5,
+        health_check_interval: float = 30.0,
+        timeout: float = 10.0
+    ):
+        """
+        Args:
+            connect: 새 연결을 만드는 함수
+            minconn: 생성 시 미리 여는 연결 수
+            maxconn: 최대 연결 수 (사용 중 + 유휴)
+            max_retries: 연결 실패 시 재시도 횟수
+            backoff: 첫 재시도 대기 시간 (초, 매번 2배)
+            health_check_interval: 이 시간(초) 이상 유휴였던 연결만 생존 확인
+            timeout: 풀이 가득 찼을 때 반납을 기다리는 최대 시간 (초)
+        """
+        if maxconn < 1 or minconn > maxconn:
+            raise ValueError(f"잘못된 풀 크기: minconn={minconn}, maxconn={maxconn}")
+
+        self._connect_fn = connect
+        self.minconn = minconn
+        self.maxconn = maxconn
+        self.max_retries = max_retries
+        self.backoff = backoff
+        self.health_check_interval = health_check_interval
+        self.timeout = timeout
+
+        self._cond = threading.Condition()
+        self._idle = []      # [(conn, 반납 시각)] - LIFO
+        self._in_use = {}    # id(conn) -> conn
+        self._size = 0       # 열려 있거나 생성 중인 연결 수
+        self._closed = False
+
+        # 메트릭
+        self.created = 0
+        self.discarded = 0
+        self.reconnects = 0
+        self.waits = 0
+
+        # 초기 연결 (설정 오류는 재시도 없이 바로 알림)
+        for _ in range(minconn):
+            conn = self._connect(retries=0)
+            self._size += 1
+            self._idle.append((conn, time.monotonic()))
+
+    def getconn(self, timeout: Optional[float] = None):
+        """
+        연결 빌리기 (유휴 연결 재사용, 없으면 새로 생성)
+
+        Raises:
+            RuntimeError: 풀이 닫혔거나 timeout 동안 연결을 얻지 못한 경우
+        """
+        deadline = time.monotonic() + (self.timeout if timeout is None else timeout)
+
+        while True:
+            conn, idle_since = self._reserve(deadline)
+
+            if conn is not None:
+                stale = time.monotonic() - idle_since >= self.health_check_interval
+                if stale and not self.is_alive(conn):
+                    # 끊긴 연결 폐기 → 같은 자리에 새 연결
+                    self._discard(conn, release=False)
+                    with self._cond:
+                        self.reconnects += 1
+                    conn = None
+
+            if conn is None:
+                try:
+                    conn = self._connect()
+                except Exception:
+                    with self._cond:
+                        self._size -= 1
+                        self._cond.notify()
+                    raise
+
+            with self._cond:
+                self._in_use[id(conn)] = conn
+            return conn
+
+    def putconn(self, conn, close: bool = False):
+        """
+        연결 반납
+
+        Args:
+            conn: getconn()으로 받은 연결
+            close: True면 재사용하지 않고 닫음 (오류가 난 연결 등)
+        """
+        with self._cond:
+            if self._in_use.pop(id(conn), None) is None:
+                return
+
+        if not close and not self._closed and not getattr(conn, 'closed', 0):
+            try:
+                # 커밋되지 않은 작업/실패한 트랜잭션 정리
+                conn.rollback()
+            except Exception:
+                close = True
+        else:
+            close = True
+
+        if close:
+            self._discard(conn)
+            return
+
+        with self._cond:
+            self._idle.append((conn, time.monotonic()))
+            self._cond.notify()
+
+    @contextmanager
+    def connection(self):
+        """작업 단위 연결 (with 블록이 끝나면 반납, 연결 오류면 폐기)"""
+        conn = self.getconn()
+        broken = False
+        try:
+            yield conn
+        except Exception as e:
+            broken = self._is_disconnect(e) or bool(getattr(conn, 'closed', 0))
+            raise
+        finally:
+            self.putconn(conn, close=broken)
+
+    def is_alive(self, conn) -> bool:
+        """연결 생존 확인 (SELECT 1)"""
+        if getattr(conn, 'closed', 0):
+            return False
+        try:
+            cursor = conn.cursor()
+            cursor.execute("SELECT 1")
+            cursor.fetchone()
+            conn.rollback()
+            return True
+        except Exception:
+            return False
+
+    def stats(self) -> Dict[str, int]:
+        """
+        풀 메트릭
+
+        Returns:
+            size (열린 연결), in_use, idle, max_size, created, discarded,
+            reconnects (끊긴 연결 교체), waits (풀이 가득 차 대기한 횟수)
+        """
+        with self._cond:
+            return {
+                "size": self._size,
+                "in_use": len(self._in_use),
+                "idle": len(self._idle),
+                "max_size": self.maxconn,
+                "created": self.created,
+                "discarded": self.discarded,
+                "reconnects": self.reconnects,
+                "waits": self.waits,
+            }
+
+    def closeall(self):
+        """모든 연결 종료 (사용 중인 연결 포함)"""
+        with self._cond:
+            self._closed = True
+            conns = [conn for conn, _ in self._idle] + list(self._in_use.values())
+            self._idle.clear()
+            self._in_use.clear()
+            self._size = 0
+            self._cond.notify_all()
+
+        for conn in conns:
+            try:
+                conn.close()
+            except Exception:
+                pass
+
+    def _reserve(self, deadline: float):
+        """유휴 연결을 꺼내거나 새 연결 자리를 예약 (conn=None)"""
+        with self._cond:
+            waited = False
+            while True:
+                if self._closed:
+                    raise RuntimeError("연결 풀이 닫혔습니다.")
+
+                if self._idle:
+                    return self._idle.pop()
+
+                if self._size < self.maxconn:
+                    self._size += 1
+                    return None, 0.0
+
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    raise RuntimeError(
+                        f"연결 풀 고갈: {self.maxconn}개 모두 사용 중 ({self.timeout}초 대기)"
+                    )
+                if not waited:
+                    self.waits += 1
+                    waited = True
+                self._cond.wait(remaining)
+
+    def _connect(self, retries: Optional[int] = None):
+        """새 연결 (실패 시 지수 백오프 재시도)"""
+        retries = self.max_retries if retries is None else retries
+        delay = self.backoff
+
+        for attempt in range(retries + 1):
+            try:
+                conn = self._connect_fn()
+                with self._cond:
+                    self.created += 1
+                return conn
+            except Exception as e:
+                if attempt == retries:
+                    raise
+                print(f"⚠️  DB 연결 실패, {delay:.1f}초 후 재시도 ({attempt + 1}/{retries}): {e}")
+                time.sleep(delay)
+                delay *= 2
+
+    def _discard(self, conn, release: bool = True):
+        """연결 닫기 (release=True면 풀 크기에서 제외)"""
+        try:
+            conn.close()
+        except Exception:
+            pass
+
+        with self._cond:
+            if release and not self._closed:
+                self._size -= 1
+            self.discarded += 1
+            self._cond.notify()
+
+    @staticmethod
+    def _is_disconnect(error: Exception) -> bool:
+        """연결이 끊겨서 난 오류인지 (psycopg2 OperationalError/InterfaceError)"""
+        if POSTGRES_AVAILABLE:
+            return isinstance(error, (psycopg2.OperationalError, psycopg2.InterfaceError))
+        return False
+
+
+class SQLiteConnectionPool:
+    """
+    스레드별 SQLite 연결
+
+    - 스레드마다 자기 연결을 재사용 (Streamlit 세션/백그라운드 스레드 간 공유 없음)
+    - 종료된 스레드의 연결은 다음 연결 생성 시 정리
+    - :memory: DB는 연결마다 별도 DB가 되므로 하나의 연결을 공유
+    """
+
+    def __init__(self, db_path: str):
+        self.db_path = db_path
+        self._lock = threading.Lock()
+        self._connections = {}  # threading.Thread -> conn
+        self._shared = self._connect() if db_path == ":memory:" else None
+
+        # 메트릭
+        self.created = 1 if self._shared is not None else 0
+        self.discarded = 0
+
+    def getconn(self):
+        """현재 스레드의 연결 (없으면 생성)"""
+        if self._shared is not None:
+            return self._shared
+
+        thread = threading.current_thread()
+        with self._lock:
+            conn = self._connections.get(thread)
+            if conn is None:
+                self._prune()
+                conn = self._connect()
+                self._connections[thread] = conn
+                self.created += 1
+            return conn
+
+    def putconn(self, conn, close: bool = False):
+        """반납 (스레드 연결은 계속 재사용, close=True면 닫음)"""
+        if not close or conn is self._shared:
+            return
+
+        with self._lock:
+            for thread, owned in list(self._connections.items()):
+                if owned is conn:
+                    del self._connections[thread]
+                    self.discarded += 1
+        conn.close()
+
+    @contextmanager
+    def connection(self):
+        """작업 단위 연결 (SQLite는 현재 스레드 연결)"""
+        yield self.getconn()
+
+    def is_alive(self, conn) -> bool:
+        """닫힌 연결인지 확인"""
+        try:
+            conn.execute("SELECT 1")
+            return True
+        except sqlite3.Error:
+            return False
+
+    def stats(self) -> Dict[str, int]:
+        """
+        연결 메트릭
+
+        Returns:
+            size (열린 연결), threads (연결을 가진 스레드), created, discarded
+        """
+        with self._lock:
+            size = len(self._connections) + (1 if self._shared is not None else 0)
+            return {
+                "size": size,
+                "threads": len(self._connections),
+                "created": self.created,
+                "discarded": self.discarded,
+            }
+
+    def closeall(self):
+        """모든 스레드의 연결 종료"""
+        with self._lock:
+            conns = list(self._connections.values())
+            self._connections.clear()
+        if self._shared is not None:
+            conns.append(self._shared)
+            self._shared = None
+
+        for conn in conns:
+            conn.close()
+
+    def _connect(self) -> sqlite3.Connection:
+        # check_same_thread=False: closeall()은 다른 스레드에서 호출될 수 있음
+        conn = sqlite3.connect(self.db_path, check_same_thread=False)
+        conn.row_factory = sqlite3.Row
+        return conn
+
+    def _prune(self):
+        """종료된 스레드의 연결 정리 (호출자가 lock 보유)"""
+        for thread in [t for t in self._connections if not t.is_alive()]:
+            self._connections.pop(thread).close()
+            self.discarded += 1
+
+
 class Database:
     """SQLite/PostgreSQL 데이터베이스 관리 클래스"""
 
@@ -32,6 +431,8 @@ class Database:
         self.conn: Optional[Union[sqlite3.Connection, 'psycopg2.connection']] = None
         self.db_type = None  # 'sqlite' or 'postgres'
         self.connection_error = None  # PostgreSQL 연결 에러 저장
+        self.pool: Optional[Union[PostgresConnectionPool, SQLiteConnectionPool]] = None
+        self.data_version = 0  # 쓰기마다 증가 (대시보드 캐시 무효화 키)
 
     def connect(self) -> Union[sqlite3.Connection, 'psycopg2.connection']:
         """데이터베이스 연결 (환경에 따라 SQLite 또는 PostgreSQL)"""
@@ -43,10 +444,11 @@ class Database:
             # PostgreSQL (Supabase) 연결
             try:
                 # Supabase URL 형식: postgresql://postgres:[PASSWORD]@[HOST]:[PORT]/postgres
-                self.conn = psycopg2.connect(
-                    supabase_url,
-                    cursor_factory=RealDictCursor
+                self.pool = PostgresConnectionPool(
+                    lambda: psycopg2.connect(supabase_url, cursor_factory=RealDictCursor),
+                    **self._pool_options()
                 )
+                self.conn = self.pool.getconn()
                 self.db_type = 'postgres'
                 self.connection_error = None
                 print("✓ PostgreSQL (Supabase) 연결 성공")
@@ -67,24 +469,121 @@ class Database:
         return self.conn
 
     def _connect_sqlite(self):
-        """SQLite 연결"""
-        self.conn = sqlite3.connect(self.db_path, check_same_thread=False)
-        self.conn.row_factory = sqlite3.Row
+        """SQLite 연결 (스레드별 연결)"""
+        self.pool = SQLiteConnectionPool(self.db_path)
+        self.conn = self.pool.getconn()
         self.db_type = 'sqlite'
 
+    def _pool_options(self) -> Dict[str, Any]:
+        """config.yaml database.pool 설정"""
+        from core.config import config
+
+        return {
+            "minconn": config.get("database.pool.min_size", 1),
+            "maxconn": config.get("database.pool.max_size", 5),
+            "max_retries": config.get("database.pool.max_retries", 3),
+            "backoff": config.get("database.pool.backoff_seconds", 0.5),
+            "health_check_interval": config.get("database.pool.health_check_interval", 30),
+            "timeout": config.get("database.pool.timeout", 10),
+        }
+
+    @property
+    def separate_connections(self) -> bool:
+        """스레드마다 다른 연결을 쓸 수 있는지 (PostgreSQL 풀, 파일 SQLite)"""
+        if isinstance(self.pool, PostgresConnectionPool):
+            return True
+        return isinstance(self.pool, SQLiteConnectionPool) and self.pool._shared is None
+
+    @contextmanager
+    def connection(self):
+        """
+        작업 단위 연결 (풀에서 빌려 쓰고 with 블록이 끝나면 반납)
+
+        PostgreSQL은 풀의 연결, SQLite는 현재 스레드의 연결을 사용한다.
+        풀 없이 conn만 설정된 경우(기존 호출 방식)에는 conn을 그대로 사용.
+        """
+        if self.pool is None:
+            if not self.conn:
+                raise RuntimeError("데이터베이스가 연결되지 않았습니다. connect()를 먼저 호출하세요.")
+            yield self.conn
+            return
+
+        with self.pool.connection() as conn:
+            yield conn
+
+    def ensure_connection(self):
+        """
+        conn 생존 확인, 끊겼으면 재연결
+
+        Returns:
+            사용 가능한 연결 (self.conn)
+        """
+        if self.pool is None or (self.conn and self.pool.is_alive(self.conn)):
+            return self.conn
+
+        print("⚠️  데이터베이스 연결이 끊겨 재연결합니다.")
+        if self.conn:
+            self.pool.putconn(self.conn, close=True)
+            if isinstance(self.pool, PostgresConnectionPool):
+                self.pool.reconnects += 1
+        self.conn = self.pool.getconn()
+        return self.conn
+
+    def query_df(self, sql: str, params: tuple = (), dtypes: Optional[Dict[str, Any]] = None):
+        """
+        SQL 결과를 DataFrame으로 (대시보드/리포트 공용)
+
+        Args:
+            sql: SELECT 문 (placeholder는 DB 종류에 맞게)
+            params: 파라미터
+            dtypes: 컬럼별 dtype (선택)
+
+        Returns:
+            pandas.DataFrame (컬럼은 cursor.description 순서)
+        """
+        with self.connection() as conn:
+            return fetch_dataframe(conn, sql, params, dtypes)
+
+    def mark_changed(self):
+        """데이터 변경 알림 (data_version 증가 → 캐시된 조회 결과 무효화)"""
+        self.data_version += 1
+
+    def pool_stats(self) -> Dict[str, int]:
+        """연결 풀 메트릭 (풀이 없으면 빈 dict)"""
+        return self.pool.stats() if self.pool else {}
+
     def close(self):
         """데이터베이스 연결 종료"""
-        if self.conn:
+        if self.pool:
+            self.pool.closeall()
+            self.pool = None
+        elif self.conn:
             self.conn.close()
-            self.conn = None
+        self.conn = None
+
+    def migrate(self) -> List[int]:
+        """
+        밀린 스키마 마이그레이션 적용 (core/migrations.py)
+
+        최신 스키마면 버전 조회 한 번으로 끝난다.
 
-    def init_schema(self):
-        """모든 테이블 생성"""
+        Returns:
+            이번에 적용한 버전 목록
+        """
         if not self.conn:
             raise RuntimeError("데이터베이스가 연결되지 않았습니다. connect()를 먼저 호출하세요.")
 
-        cursor = self.conn.cursor()
+        return MigrationRunner(self).migrate()
+
+    def init_schema(self) -> List[int]:
+        """스키마를 최신 버전으로 (migrate()와 같음)"""
+        applied = self.migrate()
+        if applied:
+            print(f"✓ 데이터베이스 스키마 초기화 완료 (v{applied[-1]})")
+        return applied
 
+    def _create_tables(self, cursor):
+        """기본 테이블 생성 (마이그레이션 1 baseline_schema)"""
         # SQL 문법 선택 (SQLite vs PostgreSQL)
         if self.db_type == 'postgres':
             serial = "SERIAL PRIMARY KEY"
@@ -265,6 +764,8 @@ class Database:
         """)
 
         # 13. 대화 메모리 (Conversation Memory)
+        # SQLite: embedding은 float32 BLOB / PostgreSQL: pgvector 마이그레이션으로 추가
+        embedding_column = ",\n                embedding BLOB" if self.db_type != 'postgres' else ""
         cursor.execute(f"""
             CREATE TABLE IF NOT EXISTS conversation_memory (
                 id {serial},
@@ -272,16 +773,10 @@ class Database:
                 role TEXT NOT NULL CHECK(role IN ('user', 'assistant')),
                 content TEXT NOT NULL,
                 timestamp TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                context TEXT
+                context TEXT{embedding_column}
             )
         """)
 
-        # 인덱스 생성
-        self._create_indexes(cursor)
-
-        self.conn.commit()
-        print("✓ 데이터베이스 스키마 초기화 완료 (13개 테이블)")
-
     def _create_indexes(self, cursor):
         """성능 최적화를 위한 인덱스 생성"""
         indexes = [
@@ -329,6 +824,8 @@ class Database:
                 VALUES (1, 0, 0)
             """)
             print("✓ 사용자 진행도 초기화 (Level 1, 0 XP)")
+            self.conn.commit()
+
     def reset_database(self):
         """데이터베이스 초기화 (개발용)"""
         if not self.conn:
@@ -338,6 +835,12 @@ class Database:
 
         # 모든 테이블 삭제 (역순으로, 외래키 때문에)
         tables = [
+            # Schema version
+            "schema_version",
+            # Rollups
+            "weekly_rollup", "daily_rollup",
+            # RAG cache
+            "embedding_cache",
             # Phase 5A tables
             "conversation_memory", "reflections", "knowledge_entries",
             "interactions", "people",
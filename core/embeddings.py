@@ -2,28 +2,295 @@
 Embedding service for RAG system
 Uses OpenAI text-embedding-3-small model
 """
+import hashlib
 import os
-from typing import List, Optional
-from openai import OpenAI
+import sqlite3
+import threading
+import unicodedata
+from array import array
+from collections import OrderedDict
+from contextlib import contextmanager
+from typing import Dict, List, Optional, Tuple
+
+
+def embedding_to_blob(embedding: List[float]) -> bytes:
+    """Encode embedding as compact float32 bytes (4 bytes per dimension)"""
+    return array('f', embedding).tobytes()
+
+
+def blob_to_embedding(blob) -> List[float]:
+    """Decode float32 bytes (bytes/memoryview) back to a list of floats"""
+    vector = array('f')
+    vector.frombytes(bytes(blob))
+    return vector.tolist()
+
+
+class EmbeddingCache:
+    """
+    Content-addressed embedding cache
+
+    Keyed by (model, sha256 of normalized text). Recent entries are kept in an
+    in-memory LRU; when a database is given, entries are also persisted in the
+    embedding_cache table (float32 BLOB) so they survive restarts.
+
+    Persisting never commits someone else's transaction: with SQLite the cache
+    shares the thread's connection with UnitOfWork, so while that connection
+    has an open transaction new entries are queued and written on a later call
+    (or flush()) once it is idle. Code running beside someone else's open
+    transaction on another connection (parallel reads in SimpleLLM) wraps its
+    work in deferred(), which only queues entries on that thread.
+    """
+
+    def __init__(self, database=None, max_size: int = 1024):
+        """
+        Initialize cache
+
+        Args:
+            database: Optional connected Database instance for persistence
+            max_size: Maximum number of in-memory entries
+        """
+        self.db = database
+        self.max_size = max_size
+        self._memory: "OrderedDict[str, List[float]]" = OrderedDict()
+        self._pending: List[Tuple[str, str, List[float]]] = []  # (key, model, embedding)
+        self._lock = threading.Lock()
+        self._local = threading.local()  # deferred() nesting depth per thread
+
+        self.hits = 0
+        self.misses = 0
+        self.store_hits = 0
+
+        if self.db is not None:
+            try:
+                self._ensure_table()
+            except Exception as e:
+                print(f"⚠️  Embedding cache table unavailable, using memory only: {e}")
+                self.db = None
+
+    @staticmethod
+    def normalize(text: str) -> str:
+        """Normalize text before hashing (NFC, collapsed whitespace)"""
+        return " ".join(unicodedata.normalize("NFC", text).split())
+
+    def make_key(self, model: str, text: str) -> str:
+        """Cache key for (model, text)"""
+        digest = hashlib.sha256(self.normalize(text).encode("utf-8")).hexdigest()
+        return f"{model}:{digest}"
+
+    def get(self, model: str, text: str) -> Optional[List[float]]:
+        """
+        Look up a cached embedding
+
+        Returns:
+            Embedding vector or None on miss
+        """
+        key = self.make_key(model, text)
+
+        with self._lock:
+            if key in self._memory:
+                self._memory.move_to_end(key)
+                self.hits += 1
+                return self._memory[key]
+
+            if self._pending:
+                self._flush_pending()
+            embedding = self._load(key) if self.db is not None else None
+            if embedding is not None:
+                self._remember(key, embedding)
+                self.hits += 1
+                self.store_hits += 1
+                return embedding
+
+            self.misses += 1
+            return None
+
+    def put(self, model: str, text: str, embedding: List[float]):
+        """Store an embedding in memory and (if configured) in the database"""
+        key = self.make_key(model, text)
+
+        with self._lock:
+            self._remember(key, embedding)
+            if self.db is not None:
+                self._pending.append((key, model, embedding))
+                self._flush_pending()
+
+    def flush(self) -> int:
+        """
+        Write queued entries to the database (skipped while the connection is in a transaction)
+
+        Returns:
+            Number of entries still queued
+        """
+        with self._lock:
+            if self._pending:
+                self._flush_pending()
+            return len(self._pending)
+
+    @contextmanager
+    def deferred(self):
+        """
+        Queue new entries without writing them on this thread
+
+        Used by work that runs on a separate connection while another thread
+        holds the write transaction (SQLite would block on its lock). The owner
+        of that transaction calls flush() after committing.
+        """
+        self._local.depth = getattr(self._local, 'depth', 0) + 1
+        try:
+            yield self
+        finally:
+            self._local.depth -= 1
+
+    def stats(self) -> Dict[str, float]:
+        """
+        Hit/miss statistics
+
+        Returns:
+            Dict with hits, misses, store_hits, size, pending and hit_rate
+        """
+        total = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "store_hits": self.store_hits,
+            "size": len(self._memory),
+            "pending": len(self._pending),
+            "hit_rate": self.hits / total if total else 0.0
+        }
+
+    def _remember(self, key: str, embedding: List[float]):
+        """Insert into LRU, evicting the oldest entry when full"""
+        self._memory[key] = embedding
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.max_size:
+            self._memory.popitem(last=False)
+
+    def _placeholder(self) -> str:
+        return '%s' if self.db.db_type == 'postgres' else '?'
+
+    def _ensure_table(self):
+        """Create embedding_cache table if missing"""
+        blob = "BYTEA" if self.db.db_type == 'postgres' else "BLOB"
+        with self.db.connection() as conn:
+            try:
+                cursor = conn.cursor()
+                cursor.execute(f"""
+                    CREATE TABLE IF NOT EXISTS embedding_cache (
+                        cache_key TEXT PRIMARY KEY,
+                        model TEXT NOT NULL,
+                        embedding {blob} NOT NULL,
+                        created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+                    )
+                """)
+                conn.commit()
+            except Exception:
+                conn.rollback()
+                raise
+
+    def _load(self, key: str) -> Optional[List[float]]:
+        """Read embedding from database"""
+        try:
+            with self.db.connection() as conn:
+                cursor = conn.cursor()
+                cursor.execute(
+                    f"SELECT embedding FROM embedding_cache WHERE cache_key = {self._placeholder()}",
+                    (key,)
+                )
+                row = cursor.fetchone()
+        except Exception as e:
+            print(f"⚠️  Embedding cache lookup failed: {e}")
+            return None
+
+        if not row:
+            return None
+
+        return blob_to_embedding(row['embedding'] if hasattr(row, 'keys') else row[0])
+
+    @staticmethod
+    def _in_transaction(conn) -> bool:
+        """Whether the connection has uncommitted work (e.g. an open UnitOfWork)"""
+        if isinstance(conn, sqlite3.Connection):
+            return conn.in_transaction
+        status = getattr(conn, 'get_transaction_status', None)
+        return bool(status and status() != 0)  # psycopg2 TRANSACTION_STATUS_IDLE
+
+    def _flush_pending(self):
+        """Write queued embeddings (float32 BLOB) unless deferred or mid-transaction; failed writes stay queued"""
+        if getattr(self._local, 'depth', 0):
+            return
+
+        if self.db.db_type == 'postgres':
+            import psycopg2
+            to_blob = lambda e: psycopg2.Binary(embedding_to_blob(e))
+        else:
+            to_blob = embedding_to_blob
+
+        p = self._placeholder()
+        with self.db.connection() as conn:
+            if self._in_transaction(conn):
+                return
+
+            rows = [(key, model, to_blob(embedding)) for key, model, embedding in self._pending]
+            try:
+                cursor = conn.cursor()
+                cursor.executemany(f"""
+                    INSERT INTO embedding_cache (cache_key, model, embedding)
+                    VALUES ({p}, {p}, {p})
+                    ON CONFLICT (cache_key) DO NOTHING
+                """, rows)
+                conn.commit()
+            except Exception as e:
+                # 실패한 항목은 큐에 남겨 다음 호출(또는 flush())에서 다시 쓴다
+                print(f"⚠️  Embedding cache store failed: {e}")
+                conn.rollback()
+                return
+            del self._pending[:len(rows)]
 
 
 class EmbeddingService:
     """임베딩 생성 서비스"""
 
-    def __init__(self, api_key: Optional[str] = None):
+    def __init__(self, api_key: Optional[str] = None, cache: Optional[EmbeddingCache] = None):
         """
         Initialize embedding service
 
         Args:
             api_key: OpenAI API key (defaults to OPENAI_API_KEY env var)
+            cache: Embedding cache (defaults to an in-memory LRU)
         """
         self.api_key = api_key or os.getenv("OPENAI_API_KEY")
         if not self.api_key:
             raise ValueError("OPENAI_API_KEY not found in environment")
 
-        self.client = OpenAI(api_key=self.api_key)
+        self._client = None  # created on first API call (openai import is slow)
+        self._async_client = None
         self.model = "text-embedding-3-small"
         self.dimensions = 1536  # text-embedding-3-small default dimensions
+        self.cache = cache if cache is not None else EmbeddingCache()
+
+    @property
+    def client(self):
+        """OpenAI client (shared per model via the client registry, created on first use)"""
+        if self._client is None:
+            from core.client_registry import clients
+            self._client = clients.openai(self.model, api_key=self.api_key)
+        return self._client
+
+    @client.setter
+    def client(self, value):
+        self._client = value
+
+    @property
+    def async_client(self):
+        """AsyncOpenAI client for the shared event loop (see core.async_runtime)"""
+        if self._async_client is None:
+            from core.client_registry import clients
+            self._async_client = clients.async_openai(self.model, api_key=self.api_key)
+        return self._async_client
+
+    @async_client.setter
+    def async_client(self, value):
+        self._async_client = value
 
     def generate_embedding(self, text: str) -> List[float]:
         """
@@ -42,13 +309,19 @@ class EmbeddingService:
         if not text or not text.strip():
             raise ValueError("Text cannot be empty")
 
+        cached = self.cache.get(self.model, text)
+        if cached is not None:
+            return cached
+
         try:
             response = self.client.embeddings.create(
                 model=self.model,
                 input=text.strip(),
                 encoding_format="float"
             )
-            return response.data[0].embedding
+            embedding = response.data[0].embedding
+            self.cache.put(self.model, text, embedding)
+            return embedding
 
         except Exception as e:
             raise Exception(f"Failed to generate embedding: {str(e)}")
@@ -75,20 +348,73 @@ class EmbeddingService:
         if not filtered_texts:
             raise ValueError("All texts are empty after filtering")
 
+        # Only send cache misses to the API
+        results: List[Optional[List[float]]] = [
+            self.cache.get(self.model, t) for t in filtered_texts
+        ]
+        missing = [i for i, emb in enumerate(results) if emb is None]
+        if not missing:
+            return results
+
         try:
             response = self.client.embeddings.create(
                 model=self.model,
-                input=filtered_texts,
+                input=[filtered_texts[i] for i in missing],
                 encoding_format="float"
             )
 
             # Sort by index to maintain order
             embeddings = sorted(response.data, key=lambda x: x.index)
-            return [emb.embedding for emb in embeddings]
+            for i, emb in zip(missing, embeddings):
+                results[i] = emb.embedding
+                self.cache.put(self.model, filtered_texts[i], emb.embedding)
+
+            return results
 
         except Exception as e:
             raise Exception(f"Failed to generate batch embeddings: {str(e)}")
 
+    async def agenerate_embedding(self, text: str) -> List[float]:
+        """Async version of generate_embedding (same cache)"""
+        return (await self.agenerate_embeddings_batch([text]))[0]
+
+    async def agenerate_embeddings_batch(self, texts: List[str]) -> List[List[float]]:
+        """
+        Async version of generate_embeddings_batch (same cache, one API call for all misses)
+
+        Raises:
+            ValueError: If texts list is empty
+            Exception: If OpenAI API call fails
+        """
+        if not texts:
+            raise ValueError("Texts list cannot be empty")
+
+        filtered_texts = [t.strip() for t in texts if t and t.strip()]
+        if not filtered_texts:
+            raise ValueError("All texts are empty after filtering")
+
+        results: List[Optional[List[float]]] = [
+            self.cache.get(self.model, t) for t in filtered_texts
+        ]
+        missing = [i for i, emb in enumerate(results) if emb is None]
+        if not missing:
+            return results
+
+        try:
+            response = await self.async_client.embeddings.create(
+                model=self.model,
+                input=[filtered_texts[i] for i in missing],
+                encoding_format="float"
+            )
+        except Exception as e:
+            raise Exception(f"Failed to generate batch embeddings: {str(e)}")
+
+        for i, emb in zip(missing, sorted(response.data, key=lambda x: x.index)):
+            results[i] = emb.embedding
+            self.cache.put(self.model, filtered_texts[i], emb.embedding)
+
+        return results
+
     def calculate_cost(self, text_count: int, avg_tokens_per_text: int = 50) -> float:
         """
         Estimate embedding cost
@@ -147,3 +473,7 @@ if __name__ == "__main__":
     print(f"  1,000 texts: ${cost:.4f}")
     cost = service.calculate_cost(text_count=10000)
     print(f"  10,000 texts: ${cost:.4f}")
+
+    # Cache statistics
+    service.generate_embedding(text)
+    print(f"\nCache stats: {service.cache.stats()}")
@@ -0,0 +1,117 @@
+"""
+의도 실행 계획 (읽기/쓰기 분류 + 테이블 의존성)
+한 메시지의 의도를 읽기/쓰기로 나누고, 앞선 쓰기가 건드린 테이블을 읽지 않는
+조회는 작업 스레드에서 별도 연결로 동시에 실행한다. 쓰기(와 쓰기 결과를 읽는
+조회)는 입력 순서대로 하나의 트랜잭션에서 실행.
+
+    [query_memory, sleep, workout, summary]
+      parallel: [0]         people/knowledge 조회 - 앞선 쓰기 없음
+      ordered:  [1, 2, 3]   summary는 sleep/workout이 쓴 daily_health를 읽음
+
+병렬 조회는 이번 메시지의 쓰기가 커밋되기 전 상태를 읽는다 (의존성이 없으므로
+순서대로 실행했을 때와 같은 결과).
+"""
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Optional, Set
+
+from core.config import config
+
+# 의도별로 읽는 테이블 (쓰기 없음)
+READS: Dict[str, Set[str]] = {
+    "summary": {"daily_health", "tasks", "exp_logs"},  # daily_rollup (트리거 집계)
+    "query_memory": {"people", "knowledge_entries", "conversation_memory"},
+    "chat": set(),
+}
+
+# 의도별로 쓰는 테이블 (목록에 없는 의도는 모든 테이블을 쓴다고 가정)
+WRITES: Dict[str, Set[str]] = {
+    "sleep": {"daily_health"},
+    "workout": {"daily_health"},
+    "protein": {"daily_health"},
+    "weight": {"daily_health"},
+    "study": {"custom_metrics"},
+    "task_add": {"tasks"},
+    "task_complete": {"tasks"},
+    "learning_log": {"learning_logs"},
+    "remember_person": {"people"},
+    "remember_interaction": {"people", "interactions"},
+    "remember_knowledge": {"knowledge_entries"},
+    "reflect": {"reflections"},
+}
+
+_executor: Optional[ThreadPoolExecutor] = None
+_executor_lock = threading.Lock()
+
+
+def read_executor() -> ThreadPoolExecutor:
+    """병렬 조회용 스레드 풀 (프로세스 공용, config database.parallel_reads.max_workers)"""
+    global _executor
+    with _executor_lock:
+        if _executor is None:
+            _executor = ThreadPoolExecutor(
+                max_workers=config.get("database.parallel_reads.max_workers", 4),
+                thread_name_prefix="intent-read"
+            )
+        return _executor
+
+
+class IntentScheduler:
+    """의도 목록 → 실행 계획"""
+
+    def __init__(self, enabled: Optional[bool] = None):
+        """
+        Args:
+            enabled: 병렬 조회 사용 여부 (기본: config database.parallel_reads.enabled)
+        """
+        if enabled is None:
+            enabled = config.get("database.parallel_reads.enabled", True)
+        self.enabled = enabled
+
+    @staticmethod
+    def is_read(intent: str) -> bool:
+        return intent in READS
+
+    def plan(self, intents: List[Dict]) -> Dict[str, List[int]]:
+        """
+        실행 계획
+
+        Args:
+            intents: [{"intent", "entities"}, ...]
+
+        Returns:
+            {"parallel": 별도 연결에서 동시에 실행할 조회 인덱스,
+             "ordered": 트랜잭션 안에서 순서대로 실행할 인덱스}
+        """
+        everything = list(range(len(intents)))
+        if not self.enabled or len(intents) < 2:
+            return {"parallel": [], "ordered": everything}
+
+        parallel, ordered = [], []
+        written: Set[str] = set()
+        write_all = False
+
+        for i, intent_data in enumerate(intents):
+            intent = intent_data.get("intent")
+
+            if intent in READS:
+                tables = READS[intent]
+                # 읽는 테이블이 없으면(chat) 스레드로 보낼 필요 없음
+                if tables and not write_all and not (tables & written):
+                    parallel.append(i)
+                else:
+                    ordered.append(i)
+                continue
+
+            ordered.append(i)
+            if intent in WRITES:
+                written |= WRITES[intent]
+            else:
+                write_all = True
+
+        # 동시에 실행할 DB 작업이 하나뿐이면 스레드 없이 순서대로
+        db_work = [i for i in everything if READS.get(intents[i].get("intent"), True)]
+        if not parallel or len(db_work) < 2:
+            return {"parallel": [], "ordered": everything}
+
+        return {"parallel": parallel, "ordered": ordered}
@@ -10,12 +10,14 @@ import sqlite3
 from dotenv import load_dotenv
 load_dotenv()
 
-from langchain_openai import ChatOpenAI
 from langchain.agents import AgentExecutor, create_openai_functions_agent
 from langchain.tools import Tool
 from langchain.prompts import ChatPromptTemplate, MessagesPlaceholder
 from langchain_core.messages import SystemMessage, HumanMessage
 
+from core.client_registry import clients
+from core.rollups import Rollups
+
 
 class HorcruxAgent:
     """LangChain Agent 기반 Horcrux 시스템"""
@@ -29,7 +31,7 @@ class HorcruxAgent:
             raise ValueError("OPENAI_API_KEY 환경 변수가 설정되지 않았습니다.")
 
         # LLM 초기화
-        self.llm = ChatOpenAI(
+        self.llm = clients.chat_openai(
             model="gpt-4o-mini",
             temperature=0.7,
             api_key=api_key
@@ -542,43 +544,18 @@ class HorcruxAgent:
         try:
             date = params.strip() if params.strip() else datetime.now().strftime("%Y-%m-%d")
 
-            cursor = self.conn.cursor()
-
-            # 건강 데이터
-            cursor.execute("""
-                SELECT sleep_h, workout_min, protein_g, weight_kg
-                FROM daily_health
-                WHERE date = ?
-            """, (date,))
-            health = cursor.fetchone()
-
-            # 할일
-            cursor.execute("""
-                SELECT COUNT(*) as done,
-                       (SELECT COUNT(*) FROM tasks WHERE date(created_at) = ?) as total
-                FROM tasks
-                WHERE status = 'done' AND date(completed_at) = ?
-            """, (date, date))
-            tasks = cursor.fetchone()
-
-            # XP
-            cursor.execute("""
-                SELECT SUM(exp_gained) FROM exp_logs WHERE date = ?
-            """, (date,))
-            exp = cursor.fetchone()[0] or 0
+            # 건강/할일/XP 집계 (daily_rollup 한 행)
+            day = Rollups(self.conn).day(date)
 
             summary = [f"📊 {date} 요약\n"]
 
-            if health:
-                if health[0]: summary.append(f"💤 수면: {health[0]}시간")
-                if health[1]: summary.append(f"💪 운동: {health[1]}분")
-                if health[2]: summary.append(f"🍗 단백질: {health[2]}g")
-                if health[3]: summary.append(f"⚖️ 체중: {health[3]}kg")
-
-            if tasks:
-                summary.append(f"📝 할일: {tasks[0]}/{tasks[1]} 완료")
+            if day["sleep_h"]: summary.append(f"💤 수면: {day['sleep_h']}시간")
+            if day["workout_min"]: summary.append(f"💪 운동: {day['workout_min']}분")
+            if day["protein_g"]: summary.append(f"🍗 단백질: {day['protein_g']}g")
+            if day["weight_kg"]: summary.append(f"⚖️ 체중: {day['weight_kg']}kg")
 
-            summary.append(f"⭐ 획득 XP: {exp}")
+            summary.append(f"📝 할일: {day['tasks_done']}/{day['tasks_created']} 완료")
+            summary.append(f"⭐ 획득 XP: {day['exp_gained']}")
 
             return "\n".join(summary)
 
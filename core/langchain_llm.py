@@ -8,12 +8,13 @@ from dotenv import load_dotenv
 
 # .env 파일 자동 로드
 load_dotenv()
-from langchain_openai import ChatOpenAI
 from langchain_core.messages import SystemMessage, HumanMessage
 from langchain_core.output_parsers import JsonOutputParser
 from langchain_core.prompts import ChatPromptTemplate
 import yaml
 
+from core.client_registry import clients
+
 
 class LangChainLLM:
     """LangChain 기반 LLM 클라이언트"""
@@ -31,7 +32,7 @@ class LangChainLLM:
             raise ValueError("OPENAI_API_KEY 환경 변수가 설정되지 않았습니다.")
 
         # LangChain ChatOpenAI 초기화
-        self.llm = ChatOpenAI(
+        self.llm = clients.chat_openai(
             model="gpt-4o-mini",  # 가장 저렴한 모델
             temperature=0.7,
             max_tokens=500,
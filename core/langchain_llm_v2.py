@@ -7,12 +7,13 @@ import json
 from dotenv import load_dotenv
 
 load_dotenv()
-from langchain_openai import ChatOpenAI
 from langchain_core.prompts import ChatPromptTemplate, SystemMessagePromptTemplate, HumanMessagePromptTemplate
 from langchain_core.output_parsers import JsonOutputParser
 from langchain_core.runnables import RunnablePassthrough
 import yaml
 
+from core.client_registry import clients
+
 
 class LangChainLLM:
     """LangChain LCEL 기반 LLM 클라이언트"""
@@ -28,7 +29,7 @@ class LangChainLLM:
             raise ValueError("OPENAI_API_KEY 환경 변수가 설정되지 않았습니다.")
 
         # LangChain ChatOpenAI 초기화
-        self.llm = ChatOpenAI(
+        self.llm = clients.chat_openai(
             model="gpt-4o-mini",
             temperature=0.7,
             max_tokens=500,
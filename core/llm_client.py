@@ -6,6 +6,8 @@ from typing import Optional, Dict, Any, List
 from abc import ABC, abstractmethod
 import yaml
 
+from core.client_registry import clients
+
 
 class LLMClient(ABC):
     """LLM 클라이언트 추상 클래스"""
@@ -51,8 +53,8 @@ class ClaudeLLMClient(LLMClient):
                 ".env 파일을 확인하세요."
             )
 
-        self.client = Anthropic(api_key=api_key)
         self.model = config.get("model", "claude-3-5-sonnet-20241022")
+        self.client = clients.anthropic(self.model, api_key=api_key)
         self.max_tokens = config.get("max_tokens", 1000)
         self.temperature = config.get("temperature", 0.7)
 
@@ -182,8 +184,8 @@ class OpenAILLMClient(LLMClient):
                 ".env 파일을 확인하세요."
             )
 
-        self.client = OpenAI(api_key=api_key)
         self.model = config.get("model", "gpt-4o-mini")
+        self.client = clients.openai(self.model, api_key=api_key)
         self.max_tokens = config.get("max_tokens", 1000)
         self.temperature = config.get("temperature", 0.7)
 
@@ -301,8 +303,7 @@ class OllamaLLMClient(LLMClient):
 
     def __init__(self, config: Dict[str, Any]):
         try:
-            import ollama
-            self.ollama = ollama
+            import ollama  # noqa: F401
         except ImportError:
             raise ImportError(
                 "ollama 라이브러리가 필요합니다. "
@@ -311,6 +312,7 @@ class OllamaLLMClient(LLMClient):
 
         self.host = config.get("host", "http://localhost:11434")
         self.model = config.get("model", "llama3.2:3b")
+        self.client = clients.ollama(self.model, host=self.host)
         self.max_tokens = config.get("max_tokens", 1000)
         self.temperature = config.get("temperature", 0.7)
 
@@ -329,7 +331,7 @@ class OllamaLLMClient(LLMClient):
         messages.append({"role": "user", "content": prompt})
 
         try:
-            response = self.ollama.chat(
+            response = self.client.chat(
                 model=self.model,
                 messages=messages,
                 options={
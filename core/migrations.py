@@ -0,0 +1,183 @@
+"""
+버전 기반 스키마 마이그레이션
+schema_version 테이블에 적용한 버전을 기록하고, 아직 적용하지 않은 것만
+버전 순서대로 한 번씩 실행한다 (마이그레이션마다 트랜잭션 하나).
+
+    앱 시작 (최신 스키마): SELECT MAX(version) FROM schema_version  → 끝
+    새 DB / 이전 버전 DB: 밀린 마이그레이션만 적용
+
+새 마이그레이션은 MIGRATIONS 끝에 다음 버전 번호로 추가한다 (기존 항목 수정 금지).
+SQL 파일은 migrations/ 폴더에 두고 _sql_file()로 등록.
+"""
+from pathlib import Path
+from typing import Callable, List, Optional, Sequence
+
+from core import rollups
+
+MIGRATIONS_DIR = Path(__file__).parent.parent / "migrations"
+
+# PostgreSQL: 여러 프로세스가 동시에 시작해도 한 곳에서만 적용 (pg_advisory_xact_lock 키)
+ADVISORY_LOCK_KEY = 7310_2025
+
+
+class Migration:
+    """스키마 변경 한 단위"""
+
+    def __init__(
+        self,
+        version: int,
+        name: str,
+        apply: Callable,
+        dialects: Sequence[str] = ('sqlite', 'postgres')
+    ):
+        """
+        Args:
+            version: 버전 번호 (1부터, 증가 순서)
+            name: 이름 (schema_version에 기록)
+            apply: apply(db, cursor) - 커밋하지 않음
+            dialects: 적용할 DB 종류 (그 외에는 버전만 기록)
+        """
+        self.version = version
+        self.name = name
+        self.apply = apply
+        self.dialects = tuple(dialects)
+
+
+def split_sql(text: str) -> List[str]:
+    """SQL 스크립트 → 문장 목록 (-- 주석 줄 제거, ; 기준)"""
+    lines = [line for line in text.splitlines() if not line.strip().startswith("--")]
+    return [s.strip() for s in "\n".join(lines).split(";") if s.strip()]
+
+
+def _sql_file(filename: str) -> Callable:
+    """migrations/ SQL 파일을 실행하는 apply 함수"""
+    def apply(db, cursor):
+        for statement in split_sql((MIGRATIONS_DIR / filename).read_text(encoding="utf-8")):
+            cursor.execute(statement)
+    return apply
+
+
+def _baseline(db, cursor):
+    db._create_tables(cursor)
+    db._create_indexes(cursor)
+
+
+def _rollups(db, cursor):
+    rollups.install(cursor, db.db_type)
+
+
+MIGRATIONS: List[Migration] = [
+    Migration(1, "baseline_schema", _baseline),
+    Migration(2, "add_pgvector_support", _sql_file("001_add_pgvector_support.sql"), dialects=('postgres',)),
+    Migration(3, "add_rollups", _rollups),
+]
+
+
+class MigrationRunner:
+    """밀린 마이그레이션 적용"""
+
+    def __init__(self, db, migrations: Optional[List[Migration]] = None):
+        """
+        Args:
+            db: Database (connect() 이후)
+            migrations: 마이그레이션 목록 (기본: MIGRATIONS)
+        """
+        self.db = db
+        self.migrations = sorted(migrations or MIGRATIONS, key=lambda m: m.version)
+        self.placeholder = '%s' if db.db_type == 'postgres' else '?'
+
+    @property
+    def latest_version(self) -> int:
+        return self.migrations[-1].version if self.migrations else 0
+
+    def current_version(self, conn) -> int:
+        """적용된 최신 버전 (schema_version이 없으면 0)"""
+        cursor = conn.cursor()
+        try:
+            cursor.execute("SELECT MAX(version) AS version FROM schema_version")
+        except Exception:
+            conn.rollback()
+            return 0
+        row = cursor.fetchone()
+        version = row["version"] if isinstance(row, dict) else row[0]
+        return version or 0
+
+    def pending(self) -> List[Migration]:
+        """아직 적용하지 않은 마이그레이션"""
+        with self.db.connection() as conn:
+            version = self.current_version(conn)
+        return [m for m in self.migrations if m.version > version]
+
+    def migrate(self) -> List[int]:
+        """
+        밀린 마이그레이션을 버전 순서대로 적용
+
+        마이그레이션마다 트랜잭션 하나 (실패하면 그 마이그레이션 전체 롤백 후 예외).
+        다른 프로세스가 먼저 적용한 버전은 건너뜀.
+
+        Returns:
+            이번에 적용한 버전 목록 (최신이면 [])
+        """
+        with self.db.connection() as conn:
+            version = self.current_version(conn)
+            if version >= self.latest_version:
+                return []
+
+            self._ensure_version_table(conn)
+            applied = []
+
+            for migration in self.migrations:
+                if migration.version <= version:
+                    continue
+
+                cursor = conn.cursor()
+                self._begin(conn, cursor)
+                try:
+                    if self._is_applied(cursor, migration.version):
+                        conn.rollback()
+                        continue
+
+                    if self.db.db_type in migration.dialects:
+                        migration.apply(self.db, cursor)
+
+                    p = self.placeholder
+                    cursor.execute(
+                        f"INSERT INTO schema_version (version, name) VALUES ({p}, {p})",
+                        (migration.version, migration.name)
+                    )
+                    conn.commit()
+                except Exception:
+                    conn.rollback()
+                    raise
+
+                applied.append(migration.version)
+                print(f"✓ 마이그레이션 {migration.version:03d} {migration.name}")
+
+            return applied
+
+    def _ensure_version_table(self, conn):
+        cursor = conn.cursor()
+        cursor.execute("""
+            CREATE TABLE IF NOT EXISTS schema_version (
+                version INTEGER PRIMARY KEY,
+                name TEXT NOT NULL,
+                applied_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+            )
+        """)
+        conn.commit()
+
+    def _begin(self, conn, cursor):
+        """트랜잭션 시작 + 다른 프로세스와의 동시 적용 방지"""
+        if self.db.db_type == 'postgres':
+            cursor.execute("SELECT pg_advisory_xact_lock(%s)", (ADVISORY_LOCK_KEY,))
+        else:
+            # sqlite3 모듈은 DDL 앞에서 트랜잭션을 열지 않으므로 직접 시작 (쓰기 잠금)
+            if conn.in_transaction:
+                conn.commit()
+            cursor.execute("BEGIN IMMEDIATE")
+
+    def _is_applied(self, cursor, version: int) -> bool:
+        cursor.execute(
+            f"SELECT 1 FROM schema_version WHERE version = {self.placeholder}", (version,)
+        )
+        return cursor.fetchone() is not None
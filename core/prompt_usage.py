@@ -0,0 +1,106 @@
+"""
+프롬프트 토큰 사용량 (제공자 프롬프트 캐시 적중 측정)
+LLM 호출마다 입력 토큰 중 캐시에서 읽은 토큰(cached)과 새로 처리한 토큰(uncached),
+지연 시간을 프롬프트 종류(parse, response, chat)별로 모은다.
+
+OpenAI/Anthropic은 앞부분(prefix)이 이전 요청과 바이트 단위로 같을 때만 캐시를
+사용하므로, 시스템 프롬프트처럼 고정된 부분을 앞에 두고 시간·입력 같은 동적인
+부분은 마지막 메시지에 둔다.
+
+    prompt_usage.record("parse", response, started)
+    prompt_usage.stats()  # {"parse": {"calls", "prompt_tokens", "cached_tokens", ...}}
+"""
+import threading
+import time
+from typing import Any, Dict, Optional
+
+
+def token_usage(message: Any) -> Optional[Dict[str, int]]:
+    """
+    LangChain 응답 메시지의 토큰 사용량
+
+    Returns:
+        {"prompt", "cached", "output"} 또는 None (사용량 정보 없음)
+    """
+    meta = getattr(message, "usage_metadata", None)
+    if meta:
+        details = meta.get("input_token_details") or {}
+        return {
+            "prompt": meta.get("input_tokens") or 0,
+            "cached": details.get("cache_read") or 0,
+            "output": meta.get("output_tokens") or 0,
+        }
+
+    # usage_metadata가 없는 버전: OpenAI 원본 token_usage
+    usage = (getattr(message, "response_metadata", None) or {}).get("token_usage")
+    if usage:
+        details = usage.get("prompt_tokens_details") or {}
+        return {
+            "prompt": usage.get("prompt_tokens") or 0,
+            "cached": details.get("cached_tokens") or 0,
+            "output": usage.get("completion_tokens") or 0,
+        }
+
+    return None
+
+
+class PromptUsageTracker:
+    """프롬프트 종류별 토큰/지연 시간 누적 (스레드 안전)"""
+
+    FIELDS = ("calls", "reported", "prompt_tokens", "cached_tokens", "output_tokens", "total_ms")
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._totals: Dict[str, Dict[str, float]] = {}
+
+    def record(self, kind: str, message: Any = None, started: Optional[float] = None):
+        """
+        호출 한 번 기록
+
+        Args:
+            kind: 프롬프트 종류 (parse, response, chat)
+            message: LLM 응답 (스트리밍이면 사용량이 담긴 마지막 조각)
+            started: 호출 시작 시각 (time.perf_counter())
+        """
+        usage = token_usage(message) if message is not None else None
+        elapsed = (time.perf_counter() - started) * 1000 if started is not None else 0.0
+
+        with self._lock:
+            totals = self._totals.setdefault(kind, dict.fromkeys(self.FIELDS, 0))
+            totals["calls"] += 1
+            totals["total_ms"] += elapsed
+            if usage:
+                totals["reported"] += 1
+                totals["prompt_tokens"] += usage["prompt"]
+                totals["cached_tokens"] += usage["cached"]
+                totals["output_tokens"] += usage["output"]
+
+    def stats(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Returns:
+            {kind: {"calls", "prompt_tokens", "cached_tokens", "uncached_tokens",
+                    "cache_ratio", "output_tokens", "avg_ms"}}
+        """
+        with self._lock:
+            items = [(kind, dict(t)) for kind, t in self._totals.items()]
+
+        return {
+            kind: {
+                "calls": t["calls"],
+                "prompt_tokens": t["prompt_tokens"],
+                "cached_tokens": t["cached_tokens"],
+                "uncached_tokens": t["prompt_tokens"] - t["cached_tokens"],
+                "cache_ratio": round(t["cached_tokens"] / t["prompt_tokens"], 3) if t["prompt_tokens"] else 0.0,
+                "output_tokens": t["output_tokens"],
+                "avg_ms": round(t["total_ms"] / t["calls"], 1) if t["calls"] else 0.0,
+            }
+            for kind, t in items
+        }
+
+    def reset(self):
+        with self._lock:
+            self._totals.clear()
+
+
+# 전역 사용량 기록
+prompt_usage = PromptUsageTracker()
@@ -2,11 +2,19 @@
 RAG (Retrieval-Augmented Generation) Manager
 Handles conversation memory storage and retrieval with vector embeddings
 """
+import atexit
+import os
+import queue
+import threading
 import uuid
 from datetime import datetime
 from typing import List, Dict, Optional, Tuple
 from core.database import Database
-from core.embeddings import EmbeddingService
+from core.embeddings import (
+    EmbeddingService, EmbeddingCache, embedding_to_blob, blob_to_embedding
+)
+from core.config import config
+from core.vector_index import BaseVectorIndex, VectorIndexFactory, NUMPY_AVAILABLE
 
 
 class RAGManager:
@@ -20,9 +28,15 @@ class RAGManager:
             database: Connected Database instance
         """
         self.db = database
-        self.embedding_service = EmbeddingService()
+        self.embedding_service = EmbeddingService(cache=EmbeddingCache(database))
         self.session_id = str(uuid.uuid4())  # Unique session ID
 
+        # SQLite: in-process vector index (loaded lazily on first search)
+        self._vector_index: Optional[BaseVectorIndex] = None
+        self._index_lock = threading.Lock()
+        if self.db.db_type != 'postgres':
+            self._ensure_sqlite_embedding_column()
+
     def save_conversation(
         self,
         role: str,
@@ -62,43 +76,110 @@ class RAGManager:
             embedding = None
 
         # Save to database
-        cursor = self.db.conn.cursor()
+        with self.db.connection() as conn:
+            cursor = conn.cursor()
+
+            if self.db.db_type == 'postgres':
+                # PostgreSQL with vector type
+                if embedding:
+                    cursor.execute("""
+                        INSERT INTO conversation_memory
+                        (session_id, role, content, context, embedding, timestamp)
+                        VALUES (%s, %s, %s, %s, %s, %s)
+                        RETURNING id
+                    """, (sid, role, content, context, embedding, datetime.now()))
+                else:
+                    cursor.execute("""
+                        INSERT INTO conversation_memory
+                        (session_id, role, content, context, timestamp)
+                        VALUES (%s, %s, %s, %s, %s)
+                        RETURNING id
+                    """, (sid, role, content, context, datetime.now()))
+
+                result = cursor.fetchone()
+                record_id = result['id'] if result else None
 
-        if self.db.db_type == 'postgres':
-            # PostgreSQL with vector type
-            if embedding:
-                cursor.execute("""
-                    INSERT INTO conversation_memory
-                    (session_id, role, content, context, embedding, timestamp)
-                    VALUES (%s, %s, %s, %s, %s, %s)
-                    RETURNING id
-                """, (sid, role, content, context, embedding, datetime.now()))
             else:
+                # SQLite (embedding stored as float32 BLOB)
                 cursor.execute("""
                     INSERT INTO conversation_memory
-                    (session_id, role, content, context, timestamp)
-                    VALUES (%s, %s, %s, %s, %s)
-                    RETURNING id
-                """, (sid, role, content, context, datetime.now()))
+                    (session_id, role, content, context, embedding, timestamp)
+                    VALUES (?, ?, ?, ?, ?, ?)
+                """, (sid, role, content, context,
+                      embedding_to_blob(embedding) if embedding else None, datetime.now()))
 
-            result = cursor.fetchone()
-            record_id = result['id'] if result else None
+                record_id = cursor.lastrowid
 
-        else:
-            # SQLite (embedding stored as JSON text for compatibility)
-            import json
-            embedding_json = json.dumps(embedding) if embedding else None
+            conn.commit()
 
-            cursor.execute("""
-                INSERT INTO conversation_memory
-                (session_id, role, content, context, timestamp)
-                VALUES (?, ?, ?, ?, ?)
-            """, (sid, role, content, context, datetime.now()))
+        return record_id
 
-            record_id = cursor.lastrowid
+    def save_conversations_batch(self, turns: List[Dict]) -> int:
+        """
+        Save multiple conversation turns with one embedding request and one bulk INSERT
 
-        self.db.conn.commit()
-        return record_id
+        Args:
+            turns: List of dicts with role, content, context, session_id, timestamp
+
+        Returns:
+            Number of saved records
+        """
+        if not turns:
+            return 0
+
+        # Generate embeddings in one API call
+        try:
+            embeddings = self.embedding_service.generate_embeddings_batch(
+                [t['content'] for t in turns]
+            )
+        except Exception as e:
+            print(f"⚠️  Failed to generate batch embeddings: {e}")
+            embeddings = None
+
+        with self.db.connection() as conn:
+            cursor = conn.cursor()
+
+            if self.db.db_type == 'postgres':
+                from psycopg2.extras import execute_values
+
+                if embeddings:
+                    rows = [
+                        (t['session_id'] or self.session_id, t['role'], t['content'],
+                         t.get('context'), embedding, t['timestamp'])
+                        for t, embedding in zip(turns, embeddings)
+                    ]
+                    execute_values(cursor, """
+                        INSERT INTO conversation_memory
+                        (session_id, role, content, context, embedding, timestamp)
+                        VALUES %s
+                    """, rows)
+                else:
+                    rows = [
+                        (t['session_id'] or self.session_id, t['role'], t['content'],
+                         t.get('context'), t['timestamp'])
+                        for t in turns
+                    ]
+                    execute_values(cursor, """
+                        INSERT INTO conversation_memory
+                        (session_id, role, content, context, timestamp)
+                        VALUES %s
+                    """, rows)
+
+            else:
+                # SQLite (float32 BLOB, one transaction)
+                cursor.executemany("""
+                    INSERT INTO conversation_memory
+                    (session_id, role, content, context, embedding, timestamp)
+                    VALUES (?, ?, ?, ?, ?, ?)
+                """, [
+                    (t['session_id'] or self.session_id, t['role'], t['content'], t.get('context'),
+                     embedding_to_blob(embeddings[i]) if embeddings else None, t['timestamp'])
+                    for i, t in enumerate(turns)
+                ])
+
+            conn.commit()
+
+        return len(turns)
 
     def search_similar_conversations(
         self,
@@ -118,11 +199,11 @@ class RAGManager:
             List of conversation records with similarity scores
 
         Note:
-            Only works with PostgreSQL + pgvector. Returns empty list for SQLite.
+            PostgreSQL uses pgvector. SQLite uses the in-process NumPy index,
+            falling back to text search when numpy or embeddings are unavailable.
         """
         if self.db.db_type != 'postgres':
-            print("⚠️  Vector search requires PostgreSQL + pgvector. Using fallback text search.")
-            return self._fallback_text_search(query, top_k, role_filter)
+            return self._sqlite_vector_search(query, top_k, role_filter)
 
         # Generate query embedding
         try:
@@ -132,28 +213,29 @@ class RAGManager:
             return []
 
         # Vector similarity search using cosine distance
-        cursor = self.db.conn.cursor()
-
-        role_clause = "AND role = %s" if role_filter else ""
-        role_param = (query_embedding, role_filter, top_k) if role_filter else (query_embedding, top_k)
-
-        cursor.execute(f"""
-            SELECT
-                id,
-                session_id,
-                role,
-                content,
-                context,
-                timestamp,
-                1 - (embedding <=> %s) AS similarity
-            FROM conversation_memory
-            WHERE embedding IS NOT NULL
-            {role_clause}
-            ORDER BY embedding <=> %s
-            LIMIT %s
-        """, role_param)
-
-        results = cursor.fetchall()
+        with self.db.connection() as conn:
+            cursor = conn.cursor()
+
+            role_clause = "AND role = %s" if role_filter else ""
+            role_param = (query_embedding, role_filter, top_k) if role_filter else (query_embedding, top_k)
+
+            cursor.execute(f"""
+                SELECT
+                    id,
+                    session_id,
+                    role,
+                    content,
+                    context,
+                    timestamp,
+                    1 - (embedding <=> %s) AS similarity
+                FROM conversation_memory
+                WHERE embedding IS NOT NULL
+                {role_clause}
+                ORDER BY embedding <=> %s
+                LIMIT %s
+            """, role_param)
+
+            results = cursor.fetchall()
 
         return [
             {
@@ -168,6 +250,153 @@ class RAGManager:
             for row in results
         ]
 
+    def _sqlite_vector_search(
+        self,
+        query: str,
+        top_k: int = 5,
+        role_filter: Optional[str] = None
+    ) -> List[Dict]:
+        """
+        Vector search for SQLite using the in-process index
+
+        Falls back to text search if numpy is missing, no embeddings are
+        stored yet, or the query embedding cannot be generated.
+        """
+        index = self._get_vector_index()
+        if index is None or len(index) == 0:
+            return self._fallback_text_search(query, top_k, role_filter)
+
+        try:
+            query_embedding = self.embedding_service.generate_embedding(query)
+        except Exception as e:
+            print(f"⚠️  Failed to generate query embedding: {e}")
+            return self._fallback_text_search(query, top_k, role_filter)
+
+        hits = index.search(query_embedding, top_k, role_filter)
+        if not hits:
+            return []
+
+        ids = [record_id for record_id, _ in hits]
+        with self.db.connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute(f"""
+                SELECT id, session_id, role, content, context, timestamp
+                FROM conversation_memory
+                WHERE id IN ({', '.join('?' for _ in ids)})
+            """, ids)
+            rows = {row[0]: row for row in cursor.fetchall()}
+
+        return [
+            {
+                'id': record_id,
+                'session_id': rows[record_id][1],
+                'role': rows[record_id][2],
+                'content': rows[record_id][3],
+                'context': rows[record_id][4],
+                'timestamp': rows[record_id][5],
+                'similarity': similarity
+            }
+            for record_id, similarity in hits
+            if record_id in rows
+        ]
+
+    def _get_vector_index(self) -> Optional[BaseVectorIndex]:
+        """
+        Load the SQLite vector index on first use, then catch up on every search
+
+        Rows written since the last search (by this session, other sessions or
+        other processes) are added incrementally: ids grow in commit order on
+        SQLite, so the largest indexed id is the watermark. Embeddings backfilled
+        into older rows (batch_generate_embeddings) invalidate the index instead.
+        """
+        if not NUMPY_AVAILABLE:
+            return None
+
+        with self._index_lock:
+            if self._vector_index is None:
+                self._vector_index = self._load_vector_index()
+            else:
+                self._vector_index.add_many(self._embedded_rows(self._vector_index.max_id))
+
+            return self._vector_index
+
+    def _load_vector_index(self) -> BaseVectorIndex:
+        """
+        Build the index configured under rag.vector_index
+
+        If a persisted index exists at rag.vector_index.path, it is reused and
+        only rows added since it was saved are read from the database.
+        """
+        settings = dict(config.get("rag.vector_index", {}) or {})
+        backend = settings.pop("backend", "flat")
+        path = self._vector_index_path()
+
+        index = None
+        if path and os.path.exists(path):
+            try:
+                index = VectorIndexFactory.load(path)
+                if index.backend != backend:
+                    index = None
+            except Exception as e:
+                print(f"⚠️  Failed to load vector index: {e}")
+                index = None
+
+        since = index.max_id if index is not None else 0
+        if index is None:
+            index = VectorIndexFactory.create(backend, self.embedding_service.dimensions, **settings)
+
+        items = self._embedded_rows(since)
+        if since:
+            index.add_many(items)
+        else:
+            index.build(items)
+
+        if path and items:
+            try:
+                index.save(path)
+            except Exception as e:
+                print(f"⚠️  Failed to save vector index: {e}")
+
+        return index
+
+    def _embedded_rows(self, since: int) -> List[Tuple[int, List[float], str]]:
+        """(id, embedding, role) of SQLite rows with an embedding and id > since (primary key range)"""
+        with self.db.connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute("""
+                SELECT id, embedding, role
+                FROM conversation_memory
+                WHERE id > ? AND embedding IS NOT NULL
+                ORDER BY id
+            """, (since,))
+            return [(row[0], blob_to_embedding(row[1]), row[2]) for row in cursor.fetchall()]
+
+    def _vector_index_path(self) -> Optional[str]:
+        """Persisted index path (.npz) or None"""
+        path = config.get("rag.vector_index.path")
+        if path and not path.endswith(".npz"):
+            path += ".npz"
+        return path
+
+    def _invalidate_vector_index(self):
+        """Drop in-memory and persisted index (rebuilt on next search)"""
+        with self._index_lock:
+            self._vector_index = None
+
+        path = self._vector_index_path()
+        if path and os.path.exists(path):
+            os.remove(path)
+
+    def _ensure_sqlite_embedding_column(self):
+        """Add embedding BLOB column to conversation_memory on older SQLite databases"""
+        with self.db.connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute("PRAGMA table_info(conversation_memory)")
+            columns = [row[1] for row in cursor.fetchall()]
+            if columns and 'embedding' not in columns:
+                cursor.execute("ALTER TABLE conversation_memory ADD COLUMN embedding BLOB")
+                conn.commit()
+
     def _fallback_text_search(
         self,
         query: str,
@@ -179,22 +408,23 @@ class RAGManager:
 
         Uses simple SQL LIKE for keyword matching
         """
-        cursor = self.db.conn.cursor()
+        with self.db.connection() as conn:
+            cursor = conn.cursor()
 
-        role_clause = "AND role = ?" if role_filter else ""
-        params = (f"%{query}%", role_filter, top_k) if role_filter else (f"%{query}%", top_k)
+            role_clause = "AND role = ?" if role_filter else ""
+            params = (f"%{query}%", role_filter, top_k) if role_filter else (f"%{query}%", top_k)
 
-        cursor.execute(f"""
-            SELECT
-                id, session_id, role, content, context, timestamp
-            FROM conversation_memory
-            WHERE content LIKE ?
-            {role_clause}
-            ORDER BY timestamp DESC
-            LIMIT ?
-        """, params)
+            cursor.execute(f"""
+                SELECT
+                    id, session_id, role, content, context, timestamp
+                FROM conversation_memory
+                WHERE content LIKE ?
+                {role_clause}
+                ORDER BY timestamp DESC
+                LIMIT ?
+            """, params)
 
-        results = cursor.fetchall()
+            results = cursor.fetchall()
 
         return [
             {
@@ -217,51 +447,56 @@ class RAGManager:
             Number of embeddings generated
 
         Note:
-            Only works with PostgreSQL + pgvector
+            PostgreSQL stores pgvector values, SQLite stores float32 BLOBs
         """
-        if self.db.db_type != 'postgres':
-            print("⚠️  Batch embedding generation requires PostgreSQL")
-            return 0
+        is_postgres = self.db.db_type == 'postgres'
+        p = '%s' if is_postgres else '?'
 
         # Get conversations without embeddings
-        cursor = self.db.conn.cursor()
-        cursor.execute("""
-            SELECT id, content
-            FROM conversation_memory
-            WHERE embedding IS NULL
-            ORDER BY timestamp ASC
-        """)
-
-        rows = cursor.fetchall()
-        if not rows:
-            print("✓ All conversations already have embeddings")
-            return 0
+        with self.db.connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute("""
+                SELECT id, content
+                FROM conversation_memory
+                WHERE embedding IS NULL
+                ORDER BY timestamp ASC
+            """)
 
-        print(f"📝 Generating embeddings for {len(rows)} conversations...")
+            rows = cursor.fetchall()
+            if not rows:
+                print("✓ All conversations already have embeddings")
+                return 0
 
-        # Generate embeddings in batch
-        contents = [row['content'] for row in rows]
-        ids = [row['id'] for row in rows]
+            print(f"📝 Generating embeddings for {len(rows)} conversations...")
 
-        try:
-            embeddings = self.embedding_service.generate_embeddings_batch(contents)
+            # Generate embeddings in batch
+            contents = [row['content'] for row in rows]
+            ids = [row['id'] for row in rows]
 
-            # Update database
-            for record_id, embedding in zip(ids, embeddings):
-                cursor.execute("""
-                    UPDATE conversation_memory
-                    SET embedding = %s
-                    WHERE id = %s
-                """, (embedding, record_id))
+            try:
+                embeddings = self.embedding_service.generate_embeddings_batch(contents)
 
-            self.db.conn.commit()
-            print(f"✅ Generated {len(embeddings)} embeddings")
-            return len(embeddings)
+                # Update database
+                for record_id, embedding in zip(ids, embeddings):
+                    cursor.execute(f"""
+                        UPDATE conversation_memory
+                        SET embedding = {p}
+                        WHERE id = {p}
+                    """, (embedding if is_postgres else embedding_to_blob(embedding), record_id))
 
-        except Exception as e:
-            print(f"❌ Failed to generate batch embeddings: {e}")
-            self.db.conn.rollback()
-            return 0
+                conn.commit()
+
+                # Reload SQLite index with the new vectors on next search
+                if not is_postgres:
+                    self._invalidate_vector_index()
+
+                print(f"✅ Generated {len(embeddings)} embeddings")
+                return len(embeddings)
+
+            except Exception as e:
+                print(f"❌ Failed to generate batch embeddings: {e}")
+                conn.rollback()
+                return 0
 
     def get_conversation_history(
         self,
@@ -279,26 +514,27 @@ class RAGManager:
             List of conversation records ordered by timestamp
         """
         sid = session_id or self.session_id
-        cursor = self.db.conn.cursor()
+        with self.db.connection() as conn:
+            cursor = conn.cursor()
 
-        if self.db.db_type == 'postgres':
-            cursor.execute("""
-                SELECT id, session_id, role, content, context, timestamp
-                FROM conversation_memory
-                WHERE session_id = %s
-                ORDER BY timestamp ASC
-                LIMIT %s
-            """, (sid, limit))
-        else:
-            cursor.execute("""
-                SELECT id, session_id, role, content, context, timestamp
-                FROM conversation_memory
-                WHERE session_id = ?
-                ORDER BY timestamp ASC
-                LIMIT ?
-            """, (sid, limit))
+            if self.db.db_type == 'postgres':
+                cursor.execute("""
+                    SELECT id, session_id, role, content, context, timestamp
+                    FROM conversation_memory
+                    WHERE session_id = %s
+                    ORDER BY timestamp ASC
+                    LIMIT %s
+                """, (sid, limit))
+            else:
+                cursor.execute("""
+                    SELECT id, session_id, role, content, context, timestamp
+                    FROM conversation_memory
+                    WHERE session_id = ?
+                    ORDER BY timestamp ASC
+                    LIMIT ?
+                """, (sid, limit))
 
-        results = cursor.fetchall()
+            results = cursor.fetchall()
 
         return [
             {
@@ -313,6 +549,138 @@ class RAGManager:
         ]
 
 
+class ConversationWriter:
+    """
+    Write-behind queue for conversation memory
+
+    Turns are accepted immediately and persisted by a background thread,
+    which batches embeddings and INSERTs. Pending turns are drained on
+    close() and at interpreter exit.
+    """
+
+    _STOP = object()
+
+    def __init__(self, rag: RAGManager, batch_size: int = 16, flush_interval: float = 0.5):
+        """
+        Initialize writer and start the background thread
+
+        Args:
+            rag: RAGManager used for persistence
+            batch_size: Maximum turns per bulk write
+            flush_interval: Seconds to wait for more turns before writing a partial batch
+        """
+        self.rag = rag
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+
+        self.written = 0
+        self.failed = 0
+
+        self._queue: queue.Queue = queue.Queue()
+        self._closed = False
+        self._thread = threading.Thread(target=self._run, name="rag-writer", daemon=True)
+        self._thread.start()
+
+        atexit.register(self.close)
+
+    def submit(
+        self,
+        role: str,
+        content: str,
+        context: Optional[str] = None,
+        session_id: Optional[str] = None
+    ):
+        """
+        Queue a conversation turn for saving (returns immediately)
+
+        Raises:
+            ValueError: If role is invalid or content is empty
+            RuntimeError: If the writer is already closed
+        """
+        if role not in ['user', 'assistant']:
+            raise ValueError("Role must be 'user' or 'assistant'")
+
+        if not content or not content.strip():
+            raise ValueError("Content cannot be empty")
+
+        if self._closed:
+            raise RuntimeError("ConversationWriter is closed")
+
+        self._queue.put({
+            'role': role,
+            'content': content,
+            'context': context,
+            'session_id': session_id,
+            'timestamp': datetime.now()
+        })
+
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """
+        Block until every turn queued so far is written
+
+        Returns:
+            True if flushed within timeout
+        """
+        if self._closed:
+            return not self._thread.is_alive()
+
+        done = threading.Event()
+        self._queue.put(done)
+        return done.wait(timeout)
+
+    def close(self, timeout: Optional[float] = 10.0):
+        """Drain pending turns and stop the background thread"""
+        if self._closed:
+            return
+
+        self._closed = True
+        self._queue.put(self._STOP)
+        self._thread.join(timeout)
+
+    def _run(self):
+        """Background loop: collect turns into batches and write them"""
+        batch: List[Dict] = []
+
+        while True:
+            try:
+                item = self._queue.get(timeout=self.flush_interval if batch else None)
+            except queue.Empty:
+                self._write(batch)
+                batch = []
+                continue
+
+            if item is self._STOP:
+                self._write(batch)
+                return
+
+            if isinstance(item, threading.Event):
+                self._write(batch)
+                batch = []
+                item.set()
+                continue
+
+            batch.append(item)
+            if len(batch) >= self.batch_size:
+                self._write(batch)
+                batch = []
+
+    def _write(self, batch: List[Dict]):
+        """Persist one batch (errors are logged, never raised)"""
+        if not batch:
+            return
+
+        try:
+            self.written += self.rag.save_conversations_batch(batch)
+        except Exception as e:
+            self.failed += len(batch)
+            print(f"⚠️  대화 저장 실패: {e}")
+            try:
+                with self.rag.db.connection() as conn:
+                    conn.rollback()
+            except Exception:
+                pass
+
+
 # Example usage
 if __name__ == "__main__":
     import sys
@@ -0,0 +1,206 @@
+"""
+응답 캐시 (2차 LLM 호출 생략)
+실행 결과 컨텍스트가 구조적으로 같으면 이전 응답을 재사용한다.
+예: sleep 7h 성공 → "수면 7h 기록. 목표 충족." (백 번째라도 LLM 호출 없음)
+
+- 키: 정규화된 (의도, 성공 여부, 메시지, 데이터) → sha256
+- 정책: LRU (max_size) + TTL (ttl_seconds)
+- 일반 대화: 정규화된 입력 텍스트 키, 선택적으로 임베딩 유사도 매칭
+"""
+import hashlib
+import json
+import re
+import threading
+import time
+import unicodedata
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+from core.vector_index import NUMPY_AVAILABLE
+
+if NUMPY_AVAILABLE:
+    import numpy as np
+
+
+class ResponseCache:
+    """TTL/LRU 응답 캐시"""
+
+    # 메시지 안의 "7.0" → "7" (정규식 파서는 float, LLM 파서는 int를 돌려줌)
+    TRAILING_ZERO_PATTERN = re.compile(r'(\d)\.0+(?!\d)')
+
+    def __init__(
+        self,
+        max_size: int = 512,
+        ttl_seconds: Optional[float] = 86400,
+        ignore_fields: Iterable[str] = ("date",),
+        similarity_threshold: Optional[float] = None,
+        clock: Callable[[], float] = time.monotonic
+    ):
+        """
+        Args:
+            max_size: 최대 항목 수 (초과 시 가장 오래 안 쓴 항목 제거)
+            ttl_seconds: 항목 유효 시간 (None이면 만료 없음)
+            ignore_fields: 키에서 제외할 데이터 필드 (응답 문구에 영향 없는 값)
+            similarity_threshold: 일반 대화 임베딩 유사도 기준 (None이면 정확 일치만)
+            clock: 현재 시각 함수 (테스트용)
+        """
+        self.max_size = max_size
+        self.ttl_seconds = ttl_seconds
+        self.ignore_fields = frozenset(ignore_fields)
+        self.similarity_threshold = similarity_threshold
+        self._clock = clock
+
+        # key -> (response, 저장 시각, 정규화된 임베딩 또는 None)
+        self._entries: "OrderedDict[str, Tuple[str, float, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+        self.hits = 0
+        self.similar_hits = 0
+        self.misses = 0
+        self.expired = 0
+
+    @property
+    def semantic(self) -> bool:
+        """임베딩 유사도 매칭 사용 여부"""
+        return bool(self.similarity_threshold) and NUMPY_AVAILABLE
+
+    def make_key(self, results: List[Dict[str, Any]]) -> str:
+        """
+        실행 결과 → 캐시 키
+
+        Args:
+            results: SimpleLLM._execute() 결과 [{"intent", "result"}, ...]
+        """
+        context = [
+            {
+                "intent": r["intent"],
+                "success": bool(r["result"].get("success")),
+                "message": self._normalize(r["result"].get("message") or r["result"].get("error")),
+                "data": self._normalize(r["result"].get("data")),
+            }
+            for r in results
+        ]
+        payload = json.dumps(context, sort_keys=True, ensure_ascii=False, default=str)
+        return "result:" + hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    def make_chat_key(self, text: str) -> str:
+        """일반 대화 입력 → 캐시 키 (NFC, 공백 정리, 끝 문장부호 무시)"""
+        normalized = " ".join(unicodedata.normalize("NFC", text).split()).rstrip(".!?~ ")
+        return "chat:" + hashlib.sha256(normalized.encode("utf-8")).hexdigest()
+
+    def get(self, key: str) -> Optional[str]:
+        """
+        캐시 조회
+
+        Returns:
+            응답 문자열 또는 None (없거나 만료)
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and self._expired(entry):
+                del self._entries[key]
+                self.expired += 1
+                entry = None
+
+            if entry is None:
+                self.misses += 1
+                return None
+
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[0]
+
+    def get_similar(self, embedding: List[float]) -> Optional[str]:
+        """
+        임베딩이 가장 가까운 일반 대화 응답 (유사도 ≥ similarity_threshold)
+
+        Returns:
+            응답 문자열 또는 None
+        """
+        if not self.semantic:
+            return None
+
+        query = self._unit(embedding)
+        with self._lock:
+            candidates = [
+                (key, entry) for key, entry in self._entries.items()
+                if entry[2] is not None and len(entry[2]) == len(query)
+                and not self._expired(entry)
+            ]
+            if not candidates:
+                return None
+
+            scores = np.stack([entry[2] for _, entry in candidates]) @ query
+            best = int(np.argmax(scores))
+            if scores[best] < self.similarity_threshold:
+                return None
+
+            key, entry = candidates[best]
+            self._entries.move_to_end(key)
+            self.similar_hits += 1
+            return entry[0]
+
+    def put(self, key: str, response: str, embedding: Optional[List[float]] = None):
+        """
+        응답 저장
+
+        Args:
+            key: make_key() 또는 make_chat_key() 결과
+            response: LLM 응답
+            embedding: 일반 대화 입력 임베딩 (유사도 매칭용, 선택)
+        """
+        vector = self._unit(embedding) if embedding is not None and self.semantic else None
+
+        with self._lock:
+            self._entries[key] = (response, self._clock(), vector)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+
+    def clear(self):
+        """전체 삭제"""
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> Dict[str, float]:
+        """
+        캐시 통계
+
+        Returns:
+            hits, similar_hits, misses, expired, size, hit_rate
+        """
+        hits = self.hits + self.similar_hits
+        total = hits + self.misses
+        return {
+            "hits": self.hits,
+            "similar_hits": self.similar_hits,
+            "misses": self.misses,
+            "expired": self.expired,
+            "size": len(self._entries),
+            "hit_rate": hits / total if total else 0.0
+        }
+
+    def _expired(self, entry: Tuple[str, float, Any]) -> bool:
+        return self.ttl_seconds is not None and self._clock() - entry[1] > self.ttl_seconds
+
+    def _normalize(self, value: Any) -> Any:
+        """키에 쓸 데이터 정리 (무시 필드 제거, 7.0 → 7, 실수 반올림)"""
+        if isinstance(value, dict):
+            return {
+                k: self._normalize(v) for k, v in value.items()
+                if k not in self.ignore_fields
+            }
+        if isinstance(value, (list, tuple)):
+            return [self._normalize(v) for v in value]
+        if isinstance(value, float):
+            value = round(value, 4)
+            return int(value) if value.is_integer() else value
+        if isinstance(value, str):
+            return self.TRAILING_ZERO_PATTERN.sub(r'\1', value)
+        return value
+
+    @staticmethod
+    def _unit(embedding: List[float]):
+        vector = np.asarray(embedding, dtype=np.float32)
+        norm = float(np.linalg.norm(vector))
+        return vector / norm if norm else vector
@@ -0,0 +1,144 @@
+"""
+템플릿 응답 렌더러 (응답 생성 LLM 호출 생략)
+결정적인 기록 결과는 Precision Mode 문구로 바로 변환한다.
+
+예:
+- 수면 5h → "수면 5h 기록. 목표 대비 -2h."
+- 운동 30min → "운동 30min 기록. 목표 충족."
+- 복합 → "수면 7h 기록. 목표 충족. 할일 추가: 보고서 (마감 2025-10-20, 우선순위 high)."
+
+chat, query_memory, summary는 해석이 필요하므로 렌더링하지 않는다 (None → LLM).
+"""
+from typing import Any, Callable, Dict, List, Optional
+
+
+class ResponseRenderer:
+    """의도별 템플릿 응답"""
+
+    # LLM 응답이 필요한 의도
+    LLM_INTENTS = {"chat", "query_memory", "summary"}
+
+    # 실패 메시지에 쓰는 의도 이름
+    LABELS = {
+        "sleep": "수면 기록",
+        "workout": "운동 기록",
+        "study": "공부 기록",
+        "protein": "단백질 기록",
+        "weight": "체중 기록",
+        "task_add": "할일 추가",
+        "task_complete": "할일 완료",
+        "learning_log": "학습 기록",
+        "remember_person": "인물 저장",
+        "remember_interaction": "상호작용 기록",
+        "remember_knowledge": "지식 저장",
+        "reflect": "회고 기록",
+    }
+
+    def __init__(self, targets: Optional[Dict[str, float]] = None):
+        """
+        Args:
+            targets: config.yaml health_targets (sleep_hours, workout_minutes, protein_grams)
+        """
+        targets = targets or {}
+        self.targets = {
+            "sleep_hours": targets.get("sleep_hours", 7),
+            "workout_minutes": targets.get("workout_minutes", 30),
+            "protein_grams": targets.get("protein_grams", 100),
+        }
+
+        self._templates: Dict[str, Callable[[Dict[str, Any]], str]] = {
+            "sleep": self._sleep,
+            "workout": self._workout,
+            "study": lambda d: f"공부 {self._num(d['hours'])}h 기록 완료.",
+            "protein": self._protein,
+            "weight": lambda d: f"체중 {self._num(d['kg'])}kg 기록.",
+            "task_add": self._task_add,
+            "task_complete": lambda d: f"할일 완료: {d['title']}.",
+            "learning_log": lambda d: f"학습 기록: {d['title']}.",
+            "remember_person": self._person,
+            "remember_interaction": lambda d: f"'{d['person']}' 상호작용 기록.",
+            "remember_knowledge": lambda d: f"지식 저장: {d['title']}.",
+            "reflect": lambda d: "회고 기록 완료.",
+        }
+
+    def can_render(self, results: List[Dict[str, Any]]) -> bool:
+        """모든 의도에 템플릿이 있는지 (LLM이 필요한 의도가 없는지)"""
+        return bool(results) and all(
+            r["intent"] not in self.LLM_INTENTS and r["intent"] in self._templates
+            for r in results
+        )
+
+    def render(self, results: List[Dict[str, Any]]) -> Optional[str]:
+        """
+        실행 결과 → 응답 문장
+
+        Args:
+            results: SimpleLLM._execute() 결과 [{"intent", "result"}, ...]
+
+        Returns:
+            응답 문자열, LLM이 필요한 의도가 섞여 있으면 None
+        """
+        if not self.can_render(results):
+            return None
+
+        sentences = []
+        for r in results:
+            intent, result = r["intent"], r["result"]
+
+            if not result.get("success"):
+                error = result.get("error", "알 수 없는 오류")
+                sentences.append(f"{self.LABELS[intent]} 실패: {error}.")
+                continue
+
+            try:
+                sentences.append(self._templates[intent](result.get("data") or {}))
+            except (KeyError, TypeError, ValueError):
+                # 데이터 형식이 예상과 다르면 헬퍼 메시지 그대로
+                sentences.append(f"{result.get('message', self.LABELS[intent])}.")
+
+        return " ".join(sentences)
+
+    # === 의도별 템플릿 ===
+
+    def _sleep(self, data: Dict[str, Any]) -> str:
+        hours = float(data["hours"])
+        return f"수면 {self._num(hours)}h 기록. {self._delta(hours, self.targets['sleep_hours'], 'h')}"
+
+    def _workout(self, data: Dict[str, Any]) -> str:
+        minutes = float(data["minutes"])
+        return f"운동 {self._num(minutes)}min 기록. {self._delta(minutes, self.targets['workout_minutes'], 'min')}"
+
+    def _protein(self, data: Dict[str, Any]) -> str:
+        grams = float(data["grams"])
+        return f"단백질 {self._num(grams)}g 기록. {self._delta(grams, self.targets['protein_grams'], 'g')}"
+
+    def _task_add(self, data: Dict[str, Any]) -> str:
+        details = []
+        if data.get("due"):
+            details.append(f"마감 {data['due']}")
+        if data.get("priority") and data["priority"] != "normal":
+            details.append(f"우선순위 {data['priority']}")
+
+        suffix = f" ({', '.join(details)})" if details else ""
+        return f"할일 추가: {data['title']}{suffix}."
+
+    def _person(self, data: Dict[str, Any]) -> str:
+        relationship = f" ({data['relationship']})" if data.get("relationship") else ""
+        return f"'{data['name']}'{relationship} 정보 저장."
+
+    # === 포맷 ===
+
+    def _delta(self, value: float, target: float, unit: str) -> str:
+        """목표 대비 편차 ("목표 충족." / "목표 대비 -2h." / "목표 대비 +1h (충족).")"""
+        delta = round(value - target, 2)
+        if delta == 0:
+            return "목표 충족."
+        if delta > 0:
+            return f"목표 대비 +{self._num(delta)}{unit} (충족)."
+        return f"목표 대비 -{self._num(-delta)}{unit}."
+
+    @staticmethod
+    def _num(value: float) -> str:
+        """숫자 표기 (7.0 → 7, 7.5 → 7.5)"""
+        value = round(float(value), 2)
+        return str(int(value)) if value.is_integer() else f"{value:g}"
@@ -0,0 +1,375 @@
+"""
+일/주 단위 집계 테이블 (Rollups)
+요약/주간 통계/코칭 알림이 원본 테이블을 매번 집계하지 않도록
+daily_rollup / weekly_rollup을 트리거로 갱신해 둔다.
+
+    daily_health, tasks, exp_logs 쓰기
+        → (트리거) daily_rollup 해당 날짜 행 갱신
+        → (트리거) weekly_rollup 해당 주(월요일 시작) 행 재계산 (daily_rollup 7행)
+
+조회는 날짜 기본키 조회 한 번:
+    SELECT * FROM daily_rollup WHERE date = ?
+
+트리거로 유지하므로 SimpleLLM 외의 쓰기 경로(LangChain 에이전트, 구 에이전트,
+시드 스크립트)도 그대로 반영된다. 기존 DB는 install() 시 한 번 rebuild()로 채움.
+"""
+from typing import Any, Dict, List, Optional
+
+# daily_rollup 건강 컬럼 (daily_health 복사본)
+HEALTH_COLUMNS = ("sleep_h", "workout_min", "protein_g", "weight_kg")
+
+# 방언별 SQL 조각
+_DIALECTS = {
+    "sqlite": {
+        "day": "date({})",
+        "week": "date({}, 'weekday 0', '-6 days')",
+        "next_week": "date({}, '+7 days')",
+    },
+    "postgres": {
+        "day": "CAST({} AS DATE)",
+        "week": "CAST(date_trunc('week', {}) AS DATE)",
+        "next_week": "({} + 7)",
+    },
+}
+
+# 트리거 대상: 테이블 → (UPDATE 감시 컬럼, 행 반영 SQL 생성 함수 이름)
+_SOURCES = {
+    "daily_health": ("date, " + ", ".join(HEALTH_COLUMNS), "_health_sql"),
+    "tasks": ("status, created_at, completed_at", "_tasks_sql"),
+    "exp_logs": ("date, exp_gained", "_exp_sql"),
+}
+
+
+def _health_sql(row: str, sign: int, d: Dict[str, str]) -> List[str]:
+    """daily_health 행 반영 (sign=1: 추가, -1: 제거)"""
+    if sign > 0:
+        values = ", ".join(f"{row}.{c}" for c in HEALTH_COLUMNS)
+        updates = ", ".join(f"{c} = excluded.{c}" for c in HEALTH_COLUMNS)
+        return [f"""
+            INSERT INTO daily_rollup (date, health_logged, {', '.join(HEALTH_COLUMNS)})
+            VALUES ({row}.date, 1, {values})
+            ON CONFLICT (date) DO UPDATE SET health_logged = 1, {updates}
+        """]
+
+    clears = ", ".join(f"{c} = NULL" for c in HEALTH_COLUMNS)
+    return [f"UPDATE daily_rollup SET health_logged = 0, {clears} WHERE date = {row}.date"]
+
+
+def _tasks_sql(row: str, sign: int, d: Dict[str, str]) -> List[str]:
+    """tasks 행 반영 (생성일 tasks_created, 완료일 tasks_done)"""
+    created = d["day"].format(f"{row}.created_at")
+    completed = d["day"].format(f"{row}.completed_at")
+    is_done = f"{row}.status = 'done' AND {row}.completed_at IS NOT NULL"
+
+    if sign > 0:
+        return [
+            f"""
+            INSERT INTO daily_rollup (date, tasks_created)
+            SELECT {created}, 1 WHERE {row}.created_at IS NOT NULL
+            ON CONFLICT (date) DO UPDATE SET tasks_created = daily_rollup.tasks_created + 1
+            """,
+            f"""
+            INSERT INTO daily_rollup (date, tasks_done)
+            SELECT {completed}, 1 WHERE {is_done}
+            ON CONFLICT (date) DO UPDATE SET tasks_done = daily_rollup.tasks_done + 1
+            """,
+        ]
+
+    return [
+        f"UPDATE daily_rollup SET tasks_created = tasks_created - 1 WHERE date = {created}",
+        f"UPDATE daily_rollup SET tasks_done = tasks_done - 1 WHERE date = {completed} AND {is_done}",
+    ]
+
+
+def _exp_sql(row: str, sign: int, d: Dict[str, str]) -> List[str]:
+    """exp_logs 행 반영"""
+    if sign > 0:
+        return [f"""
+            INSERT INTO daily_rollup (date, exp_gained)
+            VALUES ({row}.date, {row}.exp_gained)
+            ON CONFLICT (date) DO UPDATE SET exp_gained = daily_rollup.exp_gained + excluded.exp_gained
+        """]
+    return [f"UPDATE daily_rollup SET exp_gained = exp_gained - {row}.exp_gained WHERE date = {row}.date"]
+
+
+def _weekly_sql(row: str, d: Dict[str, str]) -> str:
+    """row.date가 속한 주의 weekly_rollup 재계산 (daily_rollup 최대 7행)"""
+    week = d["week"].format(f"{row}.date")
+    return f"""
+        INSERT INTO weekly_rollup (
+            week_start, days_logged, sleep_days, sleep_total, workout_total,
+            protein_total, tasks_created, tasks_done, exp_gained
+        )
+        SELECT {week},
+               COALESCE(SUM(health_logged), 0), COUNT(sleep_h), SUM(sleep_h), SUM(workout_min),
+               SUM(protein_g), COALESCE(SUM(tasks_created), 0), COALESCE(SUM(tasks_done), 0),
+               COALESCE(SUM(exp_gained), 0)
+        FROM daily_rollup
+        WHERE date >= {week} AND date < {d["next_week"].format(week)}
+        ON CONFLICT (week_start) DO UPDATE SET
+            days_logged = excluded.days_logged,
+            sleep_days = excluded.sleep_days,
+            sleep_total = excluded.sleep_total,
+            workout_total = excluded.workout_total,
+            protein_total = excluded.protein_total,
+            tasks_created = excluded.tasks_created,
+            tasks_done = excluded.tasks_done,
+            exp_gained = excluded.exp_gained
+    """
+
+
+def _table_exists(cursor, db_type: str, table: str) -> bool:
+    if db_type == 'postgres':
+        cursor.execute("SELECT to_regclass(%s) IS NOT NULL AS present", (table,))
+        row = cursor.fetchone()
+        return bool(row["present"] if isinstance(row, dict) else row[0])
+
+    cursor.execute("SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = ?", (table,))
+    return cursor.fetchone() is not None
+
+
+def install(cursor, db_type: str = 'sqlite') -> bool:
+    """
+    집계 테이블 + 트리거 생성 (여러 번 호출해도 안전)
+
+    처음 만들 때는 기존 데이터로 rebuild()까지 실행한다.
+
+    Args:
+        cursor: DB 커서
+        db_type: 'sqlite' 또는 'postgres'
+
+    Returns:
+        새로 만들었으면 True
+    """
+    d = _DIALECTS[db_type]
+    created = not _table_exists(cursor, db_type, "daily_rollup")
+
+    cursor.execute("""
+        CREATE TABLE IF NOT EXISTS daily_rollup (
+            date DATE PRIMARY KEY,
+            health_logged INTEGER NOT NULL DEFAULT 0,
+            sleep_h REAL,
+            workout_min INTEGER,
+            protein_g REAL,
+            weight_kg REAL,
+            tasks_created INTEGER NOT NULL DEFAULT 0,
+            tasks_done INTEGER NOT NULL DEFAULT 0,
+            exp_gained INTEGER NOT NULL DEFAULT 0
+        )
+    """)
+    cursor.execute("""
+        CREATE TABLE IF NOT EXISTS weekly_rollup (
+            week_start DATE PRIMARY KEY,
+            days_logged INTEGER NOT NULL DEFAULT 0,
+            sleep_days INTEGER NOT NULL DEFAULT 0,
+            sleep_total REAL,
+            workout_total INTEGER,
+            protein_total REAL,
+            tasks_created INTEGER NOT NULL DEFAULT 0,
+            tasks_done INTEGER NOT NULL DEFAULT 0,
+            exp_gained INTEGER NOT NULL DEFAULT 0
+        )
+    """)
+
+    if db_type == 'postgres':
+        _install_postgres_triggers(cursor, d)
+    else:
+        _install_sqlite_triggers(cursor, d)
+
+    if created:
+        rebuild(cursor, db_type)
+    return created
+
+
+def _install_sqlite_triggers(cursor, d: Dict[str, str]):
+    """SQLite: 테이블별 INSERT/UPDATE/DELETE 트리거"""
+    for table, (watched, builder) in _SOURCES.items():
+        build = globals()[builder]
+        bodies = {
+            "INSERT": build("NEW", 1, d),
+            f"UPDATE OF {watched}": build("OLD", -1, d) + build("NEW", 1, d),
+            "DELETE": build("OLD", -1, d),
+        }
+        for event, statements in bodies.items():
+            name = f"trg_rollup_{table}_{event.split()[0].lower()}"
+            body = ";\n".join(s.strip() for s in statements)
+            cursor.execute(f"""
+                CREATE TRIGGER IF NOT EXISTS {name}
+                AFTER {event} ON {table}
+                BEGIN
+                    {body};
+                END
+            """)
+
+    for event in ("INSERT", "UPDATE"):
+        cursor.execute(f"""
+            CREATE TRIGGER IF NOT EXISTS trg_rollup_weekly_{event.lower()}
+            AFTER {event} ON daily_rollup
+            BEGIN
+                {_weekly_sql("NEW", d).strip()};
+            END
+        """)
+
+
+def _install_postgres_triggers(cursor, d: Dict[str, str]):
+    """PostgreSQL: 테이블별 plpgsql 함수 하나 + 트리거"""
+    for table, (watched, builder) in _SOURCES.items():
+        build = globals()[builder]
+        remove = ";\n".join(s.strip() for s in build("OLD", -1, d))
+        add = ";\n".join(s.strip() for s in build("NEW", 1, d))
+        cursor.execute(f"""
+            CREATE OR REPLACE FUNCTION rollup_{table}() RETURNS trigger AS $$
+            BEGIN
+                IF TG_OP IN ('UPDATE', 'DELETE') THEN
+                    {remove};
+                END IF;
+                IF TG_OP IN ('INSERT', 'UPDATE') THEN
+                    {add};
+                END IF;
+                RETURN NULL;
+            END;
+            $$ LANGUAGE plpgsql
+        """)
+        cursor.execute(f"DROP TRIGGER IF EXISTS trg_rollup_{table} ON {table}")
+        cursor.execute(f"""
+            CREATE TRIGGER trg_rollup_{table}
+            AFTER INSERT OR DELETE OR UPDATE OF {watched} ON {table}
+            FOR EACH ROW EXECUTE FUNCTION rollup_{table}()
+        """)
+
+    cursor.execute(f"""
+        CREATE OR REPLACE FUNCTION rollup_weekly() RETURNS trigger AS $$
+        BEGIN
+            {_weekly_sql("NEW", d).strip()};
+            RETURN NULL;
+        END;
+        $$ LANGUAGE plpgsql
+    """)
+    cursor.execute("DROP TRIGGER IF EXISTS trg_rollup_weekly ON daily_rollup")
+    cursor.execute("""
+        CREATE TRIGGER trg_rollup_weekly
+        AFTER INSERT OR UPDATE ON daily_rollup
+        FOR EACH ROW EXECUTE FUNCTION rollup_weekly()
+    """)
+
+
+def rebuild(cursor, db_type: str = 'sqlite'):
+    """
+    원본 테이블에서 집계 테이블 전체 재계산 (초기 채우기/복구용)
+
+    weekly_rollup은 daily_rollup 트리거가 채운다.
+    """
+    d = _DIALECTS[db_type]
+    cursor.execute("DELETE FROM weekly_rollup")
+    cursor.execute("DELETE FROM daily_rollup")
+
+    cursor.execute(f"""
+        INSERT INTO daily_rollup (date, health_logged, {', '.join(HEALTH_COLUMNS)})
+        SELECT date, 1, {', '.join(HEALTH_COLUMNS)} FROM daily_health
+    """)
+
+    aggregates = [
+        ("tasks_created", "tasks", d["day"].format("created_at"), "COUNT(*)", "created_at IS NOT NULL"),
+        ("tasks_done", "tasks", d["day"].format("completed_at"), "COUNT(*)",
+         "status = 'done' AND completed_at IS NOT NULL"),
+        ("exp_gained", "exp_logs", "date", "SUM(exp_gained)", "exp_gained IS NOT NULL"),
+    ]
+    for column, table, key, total, condition in aggregates:
+        cursor.execute(f"""
+            INSERT INTO daily_rollup (date, {column})
+            SELECT {key}, {total} FROM {table}
+            WHERE {condition}
+            GROUP BY {key}
+            ON CONFLICT (date) DO UPDATE SET {column} = excluded.{column}
+        """)
+
+
+class Rollups:
+    """집계 테이블 조회 (날짜 기본키 조회)"""
+
+    DAY_DEFAULTS = {
+        "health_logged": 0, "sleep_h": None, "workout_min": None, "protein_g": None,
+        "weight_kg": None, "tasks_created": 0, "tasks_done": 0, "exp_gained": 0,
+    }
+
+    def __init__(self, conn, placeholder: str = '?'):
+        """
+        Args:
+            conn: DB 연결 (SQLite 또는 PostgreSQL)
+            placeholder: SQL placeholder (SQLite: ?, PostgreSQL: %s)
+        """
+        self.conn = conn
+        self.placeholder = placeholder
+
+    def _fetch(self, sql: str, params: tuple) -> List[Dict[str, Any]]:
+        cursor = self.conn.cursor()
+        cursor.execute(sql, params)
+        columns = [c[0] for c in cursor.description]
+        return [
+            dict(row) if isinstance(row, dict) else dict(zip(columns, row))
+            for row in cursor.fetchall()
+        ]
+
+    def day(self, date: str) -> Dict[str, Any]:
+        """
+        하루 집계 (기록이 없으면 기본값)
+
+        Args:
+            date: YYYY-MM-DD
+
+        Returns:
+            {"date", "health_logged", "sleep_h", "workout_min", "protein_g", "weight_kg",
+             "tasks_created", "tasks_done", "exp_gained"}
+        """
+        rows = self._fetch(
+            f"SELECT * FROM daily_rollup WHERE date = {self.placeholder}", (date,)
+        )
+        return rows[0] if rows else {"date": date, **self.DAY_DEFAULTS}
+
+    def days(self, start: str, end: str) -> List[Dict[str, Any]]:
+        """기간 내 일별 집계 (start ≤ date ≤ end, 날짜순, 기록 있는 날만)"""
+        p = self.placeholder
+        return self._fetch(
+            f"SELECT * FROM daily_rollup WHERE date >= {p} AND date <= {p} ORDER BY date",
+            (start, end)
+        )
+
+    def window(self, start: str, end: str) -> Dict[str, Any]:
+        """
+        기간 합계 (start ≤ date ≤ end)
+
+        Returns:
+            {"days_logged", "sleep_days", "avg_sleep", "total_workout", "total_protein",
+             "tasks_created", "tasks_done", "exp_gained"}
+        """
+        rows = self.days(start, end)
+        sleep = [r["sleep_h"] for r in rows if r["sleep_h"] is not None]
+        return {
+            "days_logged": sum(r["health_logged"] for r in rows),
+            "sleep_days": len(sleep),
+            "avg_sleep": sum(sleep) / len(sleep) if sleep else None,
+            "total_workout": sum(r["workout_min"] or 0 for r in rows),
+            "total_protein": sum(r["protein_g"] or 0 for r in rows),
+            "tasks_created": sum(r["tasks_created"] for r in rows),
+            "tasks_done": sum(r["tasks_done"] for r in rows),
+            "exp_gained": sum(r["exp_gained"] for r in rows),
+        }
+
+    def week(self, week_start: str) -> Optional[Dict[str, Any]]:
+        """
+        주간 집계 (월요일 시작)
+
+        Args:
+            week_start: 해당 주 월요일 YYYY-MM-DD
+
+        Returns:
+            weekly_rollup 행 + avg_sleep, 기록이 없으면 None
+        """
+        rows = self._fetch(
+            f"SELECT * FROM weekly_rollup WHERE week_start = {self.placeholder}", (week_start,)
+        )
+        if not rows:
+            return None
+        week = rows[0]
+        week["avg_sleep"] = week["sleep_total"] / week["sleep_days"] if week["sleep_days"] else None
+        return week
@@ -1,58 +1,227 @@
 """
-SimpleLLM - 100% LLM 기반 올인원 시스템
-- 파싱: LLM (GPT-4o-mini)
+SimpleLLM - LLM 기반 올인원 시스템
+- 파싱: 정규식 fast path → 신뢰도 낮으면 LLM (GPT-4o-mini)
 - 실행: DB 헬퍼 메서드
 - 응답: LLM (GPT-4o-mini)
 """
 import os
 import sqlite3
 import json
+import time
+from concurrent.futures import wait
+from contextlib import nullcontext
 from datetime import datetime
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, Iterator, List, Optional, Union
 
-from dotenv import load_dotenv
-load_dotenv()
+from core.config import config  # .env 로드 포함
+from core.client_registry import clients
+from core.database import Database
+from core.intent_scheduler import IntentScheduler, read_executor
+from core.prompt_usage import prompt_usage
+from core.rag_manager import RAGManager, ConversationWriter
+from core.unit_of_work import UnitOfWork
+from core.rollups import Rollups
+from core.response_cache import ResponseCache
+from core.response_renderer import ResponseRenderer
+from parsers.fast_parser import FastParser
+
+# LLM 파싱 시스템 프롬프트 (고정 prefix - 시간 등 동적인 값을 넣지 말 것, _parse_messages 참고)
+# OpenAI 프롬프트 캐시는 1,024 토큰 이상부터 적용되므로 예시 블록까지 포함해 그 이상을 유지
+# (gpt-4o-mini o200k_base 기준 약 1,550 토큰 - 줄이면 prompt_usage의 parse 적중률이 0%가 됨)
+PARSE_SYSTEM_PROMPT = """당신은 한국어 건강/할일/메모리 관리 데이터 파서입니다.
 
-from langchain_openai import ChatOpenAI
-from langchain_core.messages import SystemMessage, HumanMessage
+**역할**: 사용자 입력을 분석하여 의도(intent)와 엔티티를 JSON으로 추출
 
-from core.database import Database
-from core.rag_manager import RAGManager
+**가능한 의도**:
+- sleep: 수면 기록
+- workout: 운동 기록
+- study: 공부/학습 시간 기록
+- protein: 단백질 섭취
+- weight: 체중 기록
+- task_add: 할일 추가
+- task_complete: 할일 완료
+- learning_log: 학습 내용 기록
+- remember_person: 사람 정보 저장
+- remember_interaction: 상호작용 기록
+- remember_knowledge: 지식 저장
+- query_memory: 메모리 검색
+- reflect: 회고/성찰
+- summary: 요약 조회
+- chat: 일반 대화
+
+**중요**:
+- "지금", "현재", "지금까지"는 사용자 메시지의 현재 시간 기준으로 계산
+- 예: "오후 3시부터 지금까지" (현재 18시) = 3시간
+- 여러 의도가 있으면 배열로 반환
+
+**응답 형식** (순수 JSON만):
+```json
+{"intent": "sleep", "entities": {"sleep_hours": 7, "date": "2025-10-17"}, "confidence": 0.95}
+```
+또는 복합:
+```json
+[
+  {"intent": "sleep", "entities": {"sleep_hours": 7}},
+  {"intent": "workout", "entities": {"workout_minutes": 30}}
+]
+```
+
+**엔티티 키 이름**:
+- sleep: sleep_hours (숫자)
+- workout: workout_minutes (숫자)
+- study: study_hours (숫자)
+- protein: protein_grams (숫자)
+- weight: weight_kg (숫자)
+- task_add: task_title (문자열), due_date (선택), priority (선택, 값: 'low'/'normal'/'high'/'urgent')
+- task_complete: task_title (문자열)
+- remember_person: name, relationship_type, tags (리스트), notes
+- remember_interaction: person_name, type, summary, date
+- remember_knowledge: title, content, category
+- query_memory: query, type (people/knowledge/interactions)
+- learning_log: title, content
+- reflect: content, topic, mood
+
+**중요 제약**:
+- priority는 반드시 'low', 'normal', 'high', 'urgent' 중 하나
+- 약속/이벤트도 task_add로 처리, priority는 생략하거나 'normal' 사용
+- "30분 전에", "10분 늦게", "2시 30분" 같은 시점/시각은 기록할 시간이 아님
+- 운동 중량("70kg 벤치")은 체중이 아님, 계획/목표/부정("할 거야", "목표", "안 잤어")은 기록하지 않음
+- 날짜가 없으면 date는 생략 (오늘로 처리됨)
+
+**예시** (현재 시간 2025-10-17 21:00 기준):
+입력: "어제 7시간 30분 잤어"
+{"intent": "sleep", "entities": {"sleep_hours": 7.5, "date": "2025-10-16"}, "confidence": 0.95}
+
+입력: "30분 전에 일어났는데 6시간밖에 못 잤네"
+{"intent": "sleep", "entities": {"sleep_hours": 6}, "confidence": 0.85}
+
+입력: "오후 3시부터 지금까지 공부했어"
+{"intent": "study", "entities": {"study_hours": 6}, "confidence": 0.9}
+
+입력: "헬스 한시간 반 하고 단백질 40g 먹었어"
+[
+  {"intent": "workout", "entities": {"workout_minutes": 90}},
+  {"intent": "protein", "entities": {"protein_grams": 40}}
+]
+
+입력: "아침 몸무게 72.4키로"
+{"intent": "weight", "entities": {"weight_kg": 72.4}, "confidence": 0.95}
+
+입력: "70kg 벤치 5세트 했어"
+{"intent": "workout", "entities": {}, "confidence": 0.6}
+
+입력: "다음 주 월요일까지 분기 보고서 제출해야 해, 급해"
+{"intent": "task_add", "entities": {"task_title": "분기 보고서 제출", "due_date": "2025-10-20", "priority": "urgent"}, "confidence": 0.9}
+
+입력: "내일 저녁 7시 민수랑 약속"
+{"intent": "task_add", "entities": {"task_title": "민수와 저녁 약속 (19:00)", "due_date": "2025-10-18", "priority": "normal"}, "confidence": 0.9}
+
+입력: "보고서 작성 끝냈어"
+{"intent": "task_complete", "entities": {"task_title": "보고서 작성"}, "confidence": 0.85}
+
+입력: "파이썬 제너레이터는 값을 하나씩 지연 생성한다는 걸 배웠어"
+{"intent": "learning_log", "entities": {"title": "파이썬 제너레이터", "content": "값을 하나씩 지연 생성한다"}, "confidence": 0.9}
+
+입력: "이창하는 대학교 때 친해진 형이야, 등산 좋아함"
+{"intent": "remember_person", "entities": {"name": "이창하", "relationship_type": "대학 선배", "tags": ["대학교", "등산"], "notes": "대학교 때 친해진 형, 등산을 좋아함"}, "confidence": 0.9}
+
+입력: "오늘 지수랑 점심 먹으면서 이직 고민 얘기했어"
+{"intent": "remember_interaction", "entities": {"person_name": "지수", "type": "meal", "summary": "점심 식사, 이직 고민 상담", "date": "2025-10-17"}, "confidence": 0.9}
+
+입력: "창하 형에 대해 뭐 기억나?"
+{"intent": "query_memory", "entities": {"query": "창하", "type": "people"}, "confidence": 0.9}
+
+입력: "오늘 하루 돌아보니 집중이 잘 안 됐다, 내일은 아침에 운동부터"
+{"intent": "reflect", "entities": {"content": "집중이 잘 안 됐다, 내일은 아침에 운동부터", "topic": "집중력", "mood": "아쉬움"}, "confidence": 0.85}
+
+입력: "이번 주 정리해줘"
+{"intent": "summary", "entities": {}, "confidence": 0.95}
+
+입력: "오늘 날씨 진짜 좋다"
+{"intent": "chat", "entities": {}, "confidence": 0.9}
+"""
 
 
 class SimpleLLM:
     """간단하고 유연한 LLM 기반 시스템"""
 
-    def __init__(self, db_conn: sqlite3.Connection):
-        self.conn = db_conn
-
-        # 데이터베이스 타입 감지
-        self.db_type = 'postgres' if os.getenv("SUPABASE_URL") else 'sqlite'
+    def __init__(self, db: Union[Database, sqlite3.Connection]):
+        """
+        Args:
+            db: 연결된 Database (권장, 턴마다 풀에서 연결 사용) 또는 DB 연결 객체
+        """
+        if isinstance(db, Database):
+            self.db = db
+            self.db_type = db.db_type
+        else:
+            # 기존 호출 방식: 연결 객체를 Database로 감쌈 (풀 없음)
+            self.db = Database()
+            self.db.conn = db
+            self.db_type = 'postgres' if os.getenv("SUPABASE_URL") else 'sqlite'
+            self.db.db_type = self.db_type
+
+        self.conn = self.db.conn
+        self.uow: Optional[UnitOfWork] = None  # _execute 동안의 작업 단위
+
+        # 의존성 없는 조회는 별도 연결에서 동시에 (연결을 나눌 수 없는 :memory:/단일 연결은 순서대로)
+        self.scheduler = IntentScheduler(
+            enabled=config.get("database.parallel_reads.enabled", True) and self.db.separate_connections
+        )
 
         # SQL placeholder 설정 (SQLite: ?, PostgreSQL: %s)
         self.placeholder = '%s' if self.db_type == 'postgres' else '?'
 
         # OpenAI API 키 확인
-        api_key = os.getenv("OPENAI_API_KEY")
-        if not api_key:
+        self.api_key = os.getenv("OPENAI_API_KEY")
+        if not self.api_key:
             raise ValueError("OPENAI_API_KEY 환경 변수가 설정되지 않았습니다.")
 
-        # LLM 초기화 (파싱 + 응답 생성)
-        self.llm = ChatOpenAI(
-            model="gpt-4o-mini",
-            temperature=0.7,
-            api_key=api_key
-        )
+        # LLM (파싱 + 응답 생성): 처음 호출할 때 생성 (langchain_openai import가 무거움)
+        self._llm = None
+
+        # 정규식 fast path (fallback: 정규식 실패 시에만 LLM, always: 항상 LLM)
+        self.parse_strategy = config.get("llm.strategy", "fallback")
+        self.fast_path_min_confidence = config.get("llm.fast_path.min_confidence", 0.85)
+        self.fast_parser = FastParser() if self.parse_strategy != "always" else None
+
+        # 응답 모드 (template: 기록 의도는 템플릿, chat/query_memory/summary만 LLM, llm: 항상 LLM)
+        self.response_mode = config.get("llm.response_mode", "template")
+        self.renderer = ResponseRenderer(config.get("health_targets"))
+
+        # 응답 캐시 (같은 실행 결과면 응답 생성 LLM 호출 생략)
+        self.response_cache = None
+        if config.get("llm.response_cache.enabled", True):
+            self.response_cache = ResponseCache(
+                max_size=config.get("llm.response_cache.max_size", 512),
+                ttl_seconds=config.get("llm.response_cache.ttl_seconds", 86400),
+                ignore_fields=config.get("llm.response_cache.ignore_fields", ["date"]),
+                similarity_threshold=config.get("llm.response_cache.chat_similarity")
+            )
 
         # RAG 초기화 (대화 메모리 + 벡터 검색)
         try:
-            db_wrapper = Database()
-            db_wrapper.conn = db_conn
-            db_wrapper.db_type = self.db_type
-            self.rag = RAGManager(db_wrapper)
+            self.rag = RAGManager(self.db)
+            # 대화 저장은 백그라운드에서 (응답 지연 없음)
+            self.rag_writer = ConversationWriter(self.rag)
         except Exception as e:
             print(f"⚠️  RAG 초기화 실패: {e}")
             self.rag = None
+            self.rag_writer = None
+
+    @property
+    def llm(self):
+        """ChatOpenAI (첫 사용 시 레지스트리에서 가져옴, 세션끼리 연결 풀 공유)"""
+        if self._llm is None:
+            self._llm = clients.chat_openai(
+                model="gpt-4o-mini",
+                temperature=0.7,
+                api_key=self.api_key
+            )
+        return self._llm
+
+    @llm.setter
+    def llm(self, value):
+        self._llm = value
 
     def process(self, user_input: str, chat_history: Optional[List[Dict]] = None) -> str:
         """
@@ -66,111 +235,160 @@ class SimpleLLM:
             응답 메시지
         """
         try:
-            # 1단계: LLM 파싱
-            parsed = self._parse_with_llm(user_input)
+            # 1단계: 파싱 (정규식 fast path → LLM)
+            parsed = self._parse(user_input)
 
             if not parsed.get("success"):
                 return parsed.get("error", "처리 중 오류가 발생했습니다.")
 
-            # 2단계: 실행
-            results = self._execute(parsed)
+            # 2단계: 실행 (이번 턴 동안만 풀에서 연결을 빌림)
+            results = self._execute_turn(parsed)
 
             # 3단계: LLM 응답 생성
             response = self._generate_response(user_input, results, parsed)
 
-            # 4단계: 대화 저장 (RAG)
-            if self.rag:
-                try:
-                    self.rag.save_conversation('user', user_input)
-                    self.rag.save_conversation('assistant', response)
-                except Exception as e:
-                    print(f"⚠️  대화 저장 실패: {e}")
+            # 4단계: 대화 저장 (RAG, 백그라운드 큐)
+            self._save_turn(user_input, response)
 
             return response
 
         except Exception as e:
             return f"처리 중 오류 발생: {str(e)}"
 
+    def process_stream(
+        self,
+        user_input: str,
+        chat_history: Optional[List[Dict]] = None
+    ) -> Iterator[str]:
+        """
+        사용자 입력 처리 (스트리밍)
+
+        파싱·실행은 process()와 같고, 응답은 LLM 토큰이 도착하는 대로 yield한다.
+        Streamlit에서는 st.write_stream()으로 바로 렌더링할 수 있다.
+
+        Args:
+            user_input: 사용자 입력
+            chat_history: 대화 이력 (선택)
+
+        Yields:
+            응답 텍스트 조각
+        """
+        try:
+            parsed = self._parse(user_input)
+
+            if not parsed.get("success"):
+                yield parsed.get("error", "처리 중 오류가 발생했습니다.")
+                return
+
+            results = self._execute_turn(parsed)
+            plan = self._response_plan(user_input, results)
+
+        except Exception as e:
+            yield f"처리 중 오류 발생: {str(e)}"
+            return
+
+        chunks = []
+        for token in self._stream_plan(plan):
+            chunks.append(token)
+            yield token
+
+        # 대화 저장 (스트리밍이 끝난 뒤 전체 응답으로)
+        self._save_turn(user_input, "".join(chunks).strip())
+
+    def close(self):
+        """대기 중인 대화 저장을 마치고 종료"""
+        if self.rag_writer:
+            self.rag_writer.close()
+
+    def _execute_turn(self, parsed: Dict[str, Any]) -> List[Dict[str, Any]]:
+        """이번 턴 동안만 풀에서 연결을 빌려 실행 (SQLite는 호출한 스레드의 연결)"""
+        with self.db.connection() as conn:
+            self.conn = conn
+            return self._execute(parsed)
+
+    def _save_turn(self, user_input: str, response: str):
+        """대화 저장 (RAG, 백그라운드 큐에 넣고 바로 반환)"""
+        if self.rag_writer:
+            try:
+                self.rag_writer.submit('user', user_input)
+                self.rag_writer.submit('assistant', response)
+            except Exception as e:
+                print(f"⚠️  대화 저장 실패: {e}")
+
     # ========================================
-    # 1단계: LLM 파싱
+    # 1단계: 파싱 (정규식 fast path → LLM)
     # ========================================
 
-    def _parse_with_llm(self, user_input: str) -> Dict[str, Any]:
-        """LLM으로 입력 파싱"""
-        current_time = datetime.now().strftime("%Y-%m-%d %H:%M")
-        current_hour = datetime.now().hour
+    def _parse(self, user_input: str) -> Dict[str, Any]:
+        """정규식으로 먼저 파싱하고, 신뢰도가 낮으면 LLM으로 넘김"""
+        fast = self._fast_parse(user_input)
+        if fast is not None:
+            return fast
 
-        system_prompt = f"""당신은 한국어 건강/할일/메모리 관리 데이터 파서입니다.
+        return self._parse_with_llm(user_input)
 
-**현재 시간**: {current_time} (오후 {current_hour}시)
+    def _fast_parse(self, user_input: str) -> Optional[Dict[str, Any]]:
+        """
+        정규식 fast path
 
-**역할**: 사용자 입력을 분석하여 의도(intent)와 엔티티를 JSON으로 추출
+        Returns:
+            파싱 결과, LLM 파싱이 필요하면 None
+        """
+        if self.fast_parser:
+            fast = self.fast_parser.parse(user_input)
 
-**가능한 의도**:
-- sleep: 수면 기록
-- workout: 운동 기록
-- study: 공부/학습 시간 기록
-- protein: 단백질 섭취
-- weight: 체중 기록
-- task_add: 할일 추가
-- task_complete: 할일 완료
-- learning_log: 학습 내용 기록
-- remember_person: 사람 정보 저장
-- remember_interaction: 상호작용 기록
-- remember_knowledge: 지식 저장
-- query_memory: 메모리 검색
-- reflect: 회고/성찰
-- summary: 요약 조회
-- chat: 일반 대화
+            if fast["success"] and fast["confidence"] >= self.fast_path_min_confidence:
+                return fast
 
-**중요**:
-- "지금", "현재", "지금까지"는 위의 현재 시간 기준으로 계산
-- 예: "오후 3시부터 지금까지" (현재 {current_hour}시) = {current_hour - 15}시간
-- 여러 의도가 있으면 배열로 반환
+            # never: LLM 파싱 사용 안 함 (해석 불가 입력은 일반 대화로)
+            if self.parse_strategy == "never":
+                if fast["success"]:
+                    return fast
+                return {
+                    "success": True,
+                    "multiple": False,
+                    "intents": [{
+                        "intent": "chat",
+                        "entities": {"message": user_input}
+                    }],
+                    "parser": "regex"
+                }
 
-**응답 형식** (순수 JSON만):
-```json
-{{"intent": "sleep", "entities": {{"sleep_hours": 7, "date": "2025-10-17"}}, "confidence": 0.95}}
-```
-또는 복합:
-```json
-[
-  {{"intent": "sleep", "entities": {{"sleep_hours": 7}}}},
-  {{"intent": "workout", "entities": {{"workout_minutes": 30}}}}
-]
-```
+        return None
 
-**엔티티 키 이름**:
-- sleep: sleep_hours (숫자)
-- workout: workout_minutes (숫자)
-- study: study_hours (숫자)
-- protein: protein_grams (숫자)
-- weight: weight_kg (숫자)
-- task_add: task_title (문자열), due_date (선택), priority (선택, 값: 'low'/'normal'/'high'/'urgent')
-- remember_person: name, relationship_type, tags (리스트), notes
-- remember_interaction: person_name, type, summary, date
-- remember_knowledge: title, content, category
-- query_memory: query, type (people/knowledge/interactions)
-- learning_log: title, content
-- reflect: content, topic, mood
+    def _parse_with_llm(self, user_input: str) -> Dict[str, Any]:
+        """LLM으로 입력 파싱"""
+        try:
+            started = time.perf_counter()
+            response = self.llm.invoke(self._parse_messages(user_input))
+            prompt_usage.record("parse", response, started)
+            return self._parse_llm_output(response.content, user_input)
+        except Exception as e:
+            return {"success": False, "error": f"파싱 오류: {str(e)}"}
 
-**중요 제약**:
-- priority는 반드시 'low', 'normal', 'high', 'urgent' 중 하나
-- 약속/이벤트도 task_add로 처리, priority는 생략하거나 'normal' 사용
-"""
+    def _parse_messages(self, user_input: str) -> List[tuple]:
+        """
+        LLM 파싱 프롬프트 (system, human)
 
-        user_prompt = f"""사용자 입력: "{user_input}"
+        시스템 프롬프트는 고정 문자열(PARSE_SYSTEM_PROMPT)이라 호출마다 바이트 단위로 같고
+        (제공자 프롬프트 캐시 적중), 현재 시간과 입력은 마지막 human 메시지에만 넣는다.
+        """
+        now = datetime.now()
+        user_prompt = f"""현재 시간: {now.strftime("%Y-%m-%d %H:%M")} ({now.hour}시)
+
+사용자 입력: "{user_input}"
 
 이 입력을 분석하여 JSON으로 응답하세요. 순수 JSON만 출력하세요."""
 
-        try:
-            messages = [
-                SystemMessage(content=system_prompt),
-                HumanMessage(content=user_prompt)
-            ]
+        return [
+            ("system", PARSE_SYSTEM_PROMPT),
+            ("human", user_prompt)
+        ]
 
-            response = self.llm.invoke(messages)
-            content = response.content.strip()
+    def _parse_llm_output(self, content: str, user_input: str) -> Dict[str, Any]:
+        """LLM 파싱 응답(JSON) → 파싱 결과 (JSON이 아니면 일반 대화)"""
+        try:
+            content = content.strip()
 
             # JSON 파싱
             # 마크다운 코드 블록 제거
@@ -187,13 +405,15 @@ class SimpleLLM:
                 return {
                     "success": True,
                     "multiple": False,
-                    "intents": [parsed]
+                    "intents": [parsed],
+                    "parser": "llm"
                 }
             elif isinstance(parsed, list):
                 return {
                     "success": True,
                     "multiple": True,
-                    "intents": parsed
+                    "intents": parsed,
+                    "parser": "llm"
                 }
             else:
                 return {"success": False, "error": "잘못된 파싱 결과"}
@@ -208,71 +428,187 @@ class SimpleLLM:
                     "entities": {"message": user_input}
                 }]
             }
-        except Exception as e:
-            return {"success": False, "error": f"파싱 오류: {str(e)}"}
 
     # ========================================
     # 2단계: 실행 (DB 헬퍼 메서드)
     # ========================================
 
+    # 쓰기가 없는 의도 (실행 전 예약된 쓰기를 flush해 같은 트랜잭션에서 읽고, 롤백돼도 결과 유지)
+    READ_INTENTS = {"query_memory", "summary", "chat"}
+
     def _execute(self, parsed: Dict[str, Any]) -> List[Dict[str, Any]]:
-        """파싱 결과 실행"""
-        results = []
+        """
+        파싱 결과 실행
+
+        한 메시지의 모든 쓰기는 하나의 트랜잭션(UnitOfWork)으로 묶어 마지막에
+        한 번 커밋한다. 실행 중 예외가 나면 전부 롤백하고 쓰기 의도는 모두 실패 처리.
+
+        앞선 쓰기에 의존하지 않는 조회(IntentScheduler)는 쓰기와 동시에 작업 스레드에서
+        별도 연결로 실행하고, 모두 끝난 뒤 커밋한다 (커밋 전 상태를 읽으므로 순서대로
+        실행한 것과 같은 결과). 병렬 조회의 실패는 그 의도만 실패 처리 (쓰기는 유지).
+        """
+        results: Dict[int, Dict[str, Any]] = {}
         intents = parsed.get("intents", [])
+        plan = self.scheduler.plan(intents)
 
-        for intent_data in intents:
-            intent = intent_data.get("intent")
-            entities = intent_data.get("entities", {})
+        futures = {
+            i: read_executor().submit(
+                self._run_read, intents[i].get("intent"), intents[i].get("entities", {})
+            )
+            for i in plan["parallel"]
+        }
 
-            try:
-                if intent == "sleep":
-                    result = self._store_sleep(entities)
-                elif intent == "workout":
-                    result = self._store_workout(entities)
-                elif intent == "study":
-                    result = self._store_study(entities)
-                elif intent == "protein":
-                    result = self._store_protein(entities)
-                elif intent == "weight":
-                    result = self._store_weight(entities)
-                elif intent == "task_add":
-                    result = self._add_task(entities)
-                elif intent == "task_complete":
-                    result = self._complete_task(entities)
-                elif intent == "learning_log":
-                    result = self._store_learning_log(entities)
-                elif intent == "remember_person":
-                    result = self._store_person(entities)
-                elif intent == "remember_interaction":
-                    result = self._store_interaction(entities)
-                elif intent == "remember_knowledge":
-                    result = self._store_knowledge(entities)
-                elif intent == "query_memory":
-                    result = self._query_memory(entities)
-                elif intent == "reflect":
-                    result = self._store_reflection(entities)
-                elif intent == "summary":
-                    result = self._get_summary(entities)
-                elif intent == "chat":
-                    result = {"success": True, "message": "대화"}
-                else:
-                    result = {"success": False, "error": f"알 수 없는 의도: {intent}"}
-
-                results.append({
+        self.uow = UnitOfWork(self.conn, self.placeholder)
+        try:
+            for i in plan["ordered"]:
+                intent = intents[i].get("intent")
+                entities = intents[i].get("entities", {})
+
+                try:
+                    if intent in self.READ_INTENTS:
+                        self.uow.flush()
+                    result = self._run_intent(intent, entities)
+                except Exception as e:
+                    results[i] = {
+                        "intent": intent,
+                        "result": {"success": False, "error": str(e)}
+                    }
+                    raise
+
+                results[i] = {
                     "intent": intent,
                     "result": result
-                })
+                }
+
+            # 병렬 조회가 끝난 뒤 커밋 (뒤에 오는 같은 테이블 쓰기가 조회 결과에 섞이지 않게)
+            wait(futures.values())
+            self.uow.commit()
+
+            # 쓰기가 있었으면 대시보드 캐시 무효화
+            if any(r["intent"] not in self.READ_INTENTS and r["result"].get("success")
+                   for r in results.values()):
+                self.db.mark_changed()
+
+        except Exception as e:
+            self.uow.rollback()
+            results.update(self._collect_reads(intents, futures))
+            return self._rolled_back(intents, results, e)
+
+        finally:
+            self.uow = None
+            if self.rag:
+                # 트랜잭션 중이나 병렬 조회에서 미뤄 둔 임베딩 캐시 저장
+                self.rag.embedding_service.cache.flush()
+
+        results.update(self._collect_reads(intents, futures))
+        return [results[i] for i in range(len(intents))]
 
+    def _run_read(self, intent: str, entities: Dict) -> Dict:
+        """
+        조회 의도를 작업 스레드의 별도 연결에서 실행
+
+        조회 스레드는 DB에 쓰지 않는다. 요청 스레드가 쓰기 트랜잭션(파일 SQLite 락)을
+        잡은 채 이 조회를 기다리므로, 임베딩 캐시 저장은 큐에만 넣고 커밋 뒤
+        _execute의 cache.flush()가 쓴다.
+        """
+        cache = self.rag.embedding_service.cache if self.rag else None
+        with self.db.connection() as conn, (cache.deferred() if cache else nullcontext()):
+            try:
+                return self._run_intent(intent, entities, conn)
+            finally:
+                conn.rollback()  # PostgreSQL: SELECT가 연 트랜잭션 종료 후 풀에 반납
+
+    def _collect_reads(self, intents: List[Dict], futures: Dict) -> Dict[int, Dict[str, Any]]:
+        """병렬 조회 결과 (예외는 그 의도의 실패로)"""
+        collected = {}
+        for i, future in futures.items():
+            try:
+                result = future.result()
             except Exception as e:
-                results.append({
+                result = {"success": False, "error": str(e)}
+            collected[i] = {"intent": intents[i].get("intent"), "result": result}
+        return collected
+
+    def _run_intent(self, intent: str, entities: Dict, conn=None) -> Dict:
+        """의도별 헬퍼 호출 (conn: 조회 의도가 사용할 연결, 기본 self.conn)"""
+        if intent == "sleep":
+            return self._store_sleep(entities)
+        elif intent == "workout":
+            return self._store_workout(entities)
+        elif intent == "study":
+            return self._store_study(entities)
+        elif intent == "protein":
+            return self._store_protein(entities)
+        elif intent == "weight":
+            return self._store_weight(entities)
+        elif intent == "task_add":
+            return self._add_task(entities)
+        elif intent == "task_complete":
+            return self._complete_task(entities)
+        elif intent == "learning_log":
+            return self._store_learning_log(entities)
+        elif intent == "remember_person":
+            return self._store_person(entities)
+        elif intent == "remember_interaction":
+            return self._store_interaction(entities)
+        elif intent == "remember_knowledge":
+            return self._store_knowledge(entities)
+        elif intent == "query_memory":
+            return self._query_memory(entities, conn)
+        elif intent == "reflect":
+            return self._store_reflection(entities)
+        elif intent == "summary":
+            return self._get_summary(entities, conn)
+        elif intent == "chat":
+            return {"success": True, "message": "대화"}
+        else:
+            return {"success": False, "error": f"알 수 없는 의도: {intent}"}
+
+    def _rolled_back(
+        self,
+        intents: List[Dict],
+        results: Dict[int, Dict[str, Any]],
+        error: Exception
+    ) -> List[Dict[str, Any]]:
+        """
+        롤백 후 결과 정리
+
+        실패한 의도는 원래 오류, 조회 의도는 이미 얻은 결과 유지,
+        나머지 쓰기 의도는 취소로 표시한다.
+        """
+        rolled_back = []
+        for i, intent_data in enumerate(intents):
+            intent = intent_data.get("intent")
+            done = results.get(i)
+
+            if done and (intent in self.READ_INTENTS or not done["result"].get("success")):
+                rolled_back.append(done)
+            else:
+                rolled_back.append({
                     "intent": intent,
-                    "result": {"success": False, "error": str(e)}
+                    "result": {
+                        "success": False,
+                        "error": f"다른 기록 저장 실패로 취소되었습니다 ({error})"
+                    }
                 })
 
-        return results
+        return rolled_back
 
     # === DB 헬퍼 메서드 ===
 
+    def _commit(self):
+        """메시지 처리 중에는 UnitOfWork가 마지막에 한 번 커밋"""
+        if self.uow is None:
+            self.conn.commit()
+
+    def _upsert_daily_health(self, date: str, **values):
+        """daily_health UPSERT (메시지 처리 중에는 날짜별로 모아서 한 번에)"""
+        if self.uow is not None:
+            self.uow.upsert_daily_health(date, **values)
+        else:
+            with UnitOfWork(self.conn, self.placeholder) as uow:
+                uow.upsert_daily_health(date, **values)
+
     def _store_sleep(self, entities: Dict) -> Dict:
         """수면 기록"""
         hours = entities.get("sleep_hours")
@@ -281,18 +617,12 @@ class SimpleLLM:
         if not hours:
             return {"success": False, "error": "수면 시간이 필요합니다"}
 
-        cursor = self.conn.cursor()
-        cursor.execute(f"""
-            INSERT INTO daily_health (date, sleep_h)
-            VALUES ({self.placeholder}, {self.placeholder})
-            ON CONFLICT(date) DO UPDATE SET sleep_h = excluded.sleep_h
-        """, (date, hours))
-        self.conn.commit()
+        self._upsert_daily_health(date, sleep_h=hours)
 
         return {
             "success": True,
             "message": f"수면 {hours}시간 기록",
-            "data": {"hours": hours, "date": date, "target": 7}
+            "data": {"hours": hours, "date": date, "target": self.renderer.targets["sleep_hours"]}
         }
 
     def _store_workout(self, entities: Dict) -> Dict:
@@ -303,18 +633,12 @@ class SimpleLLM:
         if not minutes:
             return {"success": False, "error": "운동 시간이 필요합니다"}
 
-        cursor = self.conn.cursor()
-        cursor.execute(f"""
-            INSERT INTO daily_health (date, workout_min)
-            VALUES ({self.placeholder}, {self.placeholder})
-            ON CONFLICT(date) DO UPDATE SET workout_min = excluded.workout_min
-        """, (date, minutes))
-        self.conn.commit()
+        self._upsert_daily_health(date, workout_min=minutes)
 
         return {
             "success": True,
             "message": f"운동 {minutes}분 기록",
-            "data": {"minutes": minutes, "date": date, "target": 30}
+            "data": {"minutes": minutes, "date": date, "target": self.renderer.targets["workout_minutes"]}
         }
 
     def _store_study(self, entities: Dict) -> Dict:
@@ -330,7 +654,7 @@ class SimpleLLM:
             INSERT INTO custom_metrics (date, metric_name, value, unit, category)
             VALUES ({self.placeholder}, 'study', {self.placeholder}, 'hours', 'learning')
         """, (date, hours))
-        self.conn.commit()
+        self._commit()
 
         return {
             "success": True,
@@ -346,18 +670,12 @@ class SimpleLLM:
         if not grams:
             return {"success": False, "error": "단백질 양이 필요합니다"}
 
-        cursor = self.conn.cursor()
-        cursor.execute(f"""
-            INSERT INTO daily_health (date, protein_g)
-            VALUES ({self.placeholder}, {self.placeholder})
-            ON CONFLICT(date) DO UPDATE SET protein_g = excluded.protein_g
-        """, (date, grams))
-        self.conn.commit()
+        self._upsert_daily_health(date, protein_g=grams)
 
         return {
             "success": True,
             "message": f"단백질 {grams}g 기록",
-            "data": {"grams": grams, "date": date, "target": 100}
+            "data": {"grams": grams, "date": date, "target": self.renderer.targets["protein_grams"]}
         }
 
     def _store_weight(self, entities: Dict) -> Dict:
@@ -368,13 +686,7 @@ class SimpleLLM:
         if not kg:
             return {"success": False, "error": "체중이 필요합니다"}
 
-        cursor = self.conn.cursor()
-        cursor.execute(f"""
-            INSERT INTO daily_health (date, weight_kg)
-            VALUES ({self.placeholder}, {self.placeholder})
-            ON CONFLICT(date) DO UPDATE SET weight_kg = excluded.weight_kg
-        """, (date, kg))
-        self.conn.commit()
+        self._upsert_daily_health(date, weight_kg=kg)
 
         return {
             "success": True,
@@ -401,7 +713,7 @@ class SimpleLLM:
             INSERT INTO tasks (title, due, priority, status)
             VALUES ({self.placeholder}, {self.placeholder}, {self.placeholder}, 'pending')
         """, (title, due_date, priority))
-        self.conn.commit()
+        self._commit()
 
         return {
             "success": True,
@@ -434,7 +746,7 @@ class SimpleLLM:
             SET status = 'done', completed_at = CURRENT_TIMESTAMP
             WHERE id = {self.placeholder}
         """, (task_id,))
-        self.conn.commit()
+        self._commit()
 
         return {
             "success": True,
@@ -457,7 +769,7 @@ class SimpleLLM:
             INSERT INTO learning_logs (date, title, content, category)
             VALUES ({self.placeholder}, {self.placeholder}, {self.placeholder}, {self.placeholder})
         """, (date, title, content, category))
-        self.conn.commit()
+        self._commit()
 
         return {
             "success": True,
@@ -485,7 +797,7 @@ class SimpleLLM:
                 personality_notes = excluded.personality_notes,
                 updated_at = CURRENT_TIMESTAMP
         """, (name, relationship_type, json.dumps(tags), notes))
-        self.conn.commit()
+        self._commit()
 
         return {
             "success": True,
@@ -524,7 +836,7 @@ class SimpleLLM:
             INSERT INTO interactions (person_id, date, type, summary)
             VALUES ({self.placeholder}, {self.placeholder}, {self.placeholder}, {self.placeholder})
         """, (person_id, date, interaction_type, summary))
-        self.conn.commit()
+        self._commit()
 
         return {
             "success": True,
@@ -547,7 +859,7 @@ class SimpleLLM:
             INSERT INTO knowledge_entries (title, content, category, learned_date)
             VALUES ({self.placeholder}, {self.placeholder}, {self.placeholder}, {self.placeholder})
         """, (title, content, category, date))
-        self.conn.commit()
+        self._commit()
 
         return {
             "success": True,
@@ -555,7 +867,7 @@ class SimpleLLM:
             "data": {"title": title, "content": content}
         }
 
-    def _query_memory(self, entities: Dict) -> Dict:
+    def _query_memory(self, entities: Dict, conn=None) -> Dict:
         """메모리 검색 (RAG 기반)"""
         query = entities.get("query")
         memory_type = entities.get("type")
@@ -563,7 +875,7 @@ class SimpleLLM:
         if not query:
             return {"success": False, "error": "검색어가 필요합니다"}
 
-        cursor = self.conn.cursor()
+        cursor = (conn or self.conn).cursor()
         results = {}
 
         # RAG 기반 대화 검색 (최우선)
@@ -643,7 +955,7 @@ class SimpleLLM:
             INSERT INTO reflections (date, topic, content, mood)
             VALUES ({self.placeholder}, {self.placeholder}, {self.placeholder}, {self.placeholder})
         """, (date, topic, content, mood))
-        self.conn.commit()
+        self._commit()
 
         return {
             "success": True,
@@ -651,41 +963,20 @@ class SimpleLLM:
             "data": {"content": content, "topic": topic}
         }
 
-    def _get_summary(self, entities: Dict) -> Dict:
-        """요약 조회"""
+    def _get_summary(self, entities: Dict, conn=None) -> Dict:
+        """요약 조회 (daily_rollup 한 행)"""
         date = entities.get("date", datetime.now().strftime("%Y-%m-%d"))
 
-        cursor = self.conn.cursor()
-
-        # 건강 데이터
-        cursor.execute(f"""
-            SELECT sleep_h, workout_min, protein_g, weight_kg
-            FROM daily_health
-            WHERE date = {self.placeholder}
-        """, (date,))
-        health = cursor.fetchone()
-
-        # 할일
-        cursor.execute(f"""
-            SELECT COUNT(*) FROM tasks
-            WHERE status = 'done' AND date(completed_at) = {self.placeholder}
-        """, (date,))
-        tasks_done = cursor.fetchone()[0]
-
-        cursor.execute(f"""
-            SELECT COUNT(*) FROM tasks
-            WHERE date(created_at) = {self.placeholder}
-        """, (date,))
-        tasks_total = cursor.fetchone()[0]
+        day = Rollups(conn or self.conn, self.placeholder).day(date)
 
         summary_data = {
             "date": date,
-            "sleep": health[0] if health else None,
-            "workout": health[1] if health else None,
-            "protein": health[2] if health else None,
-            "weight": health[3] if health else None,
-            "tasks_done": tasks_done,
-            "tasks_total": tasks_total
+            "sleep": day["sleep_h"],
+            "workout": day["workout_min"],
+            "protein": day["protein_g"],
+            "weight": day["weight_kg"],
+            "tasks_done": day["tasks_done"],
+            "tasks_total": day["tasks_created"]
         }
 
         return {
@@ -705,14 +996,55 @@ class SimpleLLM:
         parsed: Dict
     ) -> str:
         """LLM으로 자연스러운 응답 생성"""
+        return self._invoke_plan(self._response_plan(user_input, results))
+
+    def _chat_response(self, user_input: str) -> str:
+        """일반 대화 응답 (같은/유사한 입력은 캐시 응답)"""
+        return self._invoke_plan(self._chat_plan(user_input))
+
+    def _response_plan(self, user_input: str, results: List[Dict]) -> Dict[str, Any]:
+        """
+        응답 생성 준비 (프롬프트, 캐시 조회, 실패 시 기본 응답)
+
+        Returns:
+            {
+                "kind": 프롬프트 종류 (response, chat - 토큰 사용량 집계용),
+                "text": 템플릿/캐시로 정해진 응답 또는 None (None이면 LLM),
+                "messages": LLM 메시지,
+                "cache_key": 응답 캐시 키 또는 None,
+                "embedding": 일반 대화 입력 임베딩 또는 None,
+                "fallback": LLM 실패 시 응답
+            }
+        """
+        # 일반 대화인 경우
+        if len(results) == 1 and results[0]["intent"] == "chat":
+            return self._chat_plan(user_input)
+
+        # 결정적인 기록 결과는 템플릿 응답 (LLM 호출 없음)
+        if self.response_mode == "template":
+            rendered = self.renderer.render(results)
+            if rendered is not None:
+                return {
+                    "kind": "response",
+                    "text": rendered,
+                    "messages": [],
+                    "cache_key": None,
+                    "embedding": None,
+                    "fallback": rendered
+                }
 
         # 결과 요약
         success_count = sum(1 for r in results if r["result"].get("success"))
         total_count = len(results)
 
-        # 일반 대화인 경우
-        if len(results) == 1 and results[0]["intent"] == "chat":
-            return self._chat_response(user_input)
+        if success_count == total_count:
+            fallback = f"{success_count}개 항목 기록 완료."
+        else:
+            fallback = f"{success_count}/{total_count}개 항목 기록. 실패 {total_count - success_count}건."
+
+        # 같은 실행 결과에 대한 응답이 캐시에 있으면 LLM 호출 생략
+        cache_key = self.response_cache.make_key(results) if self.response_cache else None
+        cached = self.response_cache.get(cache_key) if cache_key else None
 
         # 처리 결과를 컨텍스트로 변환
         context_parts = []
@@ -763,24 +1095,32 @@ class SimpleLLM:
 
 위 결과를 Precision Mode 규칙에 따라 논리적·사실적 응답으로 변환하세요."""
 
-        try:
-            messages = [
-                SystemMessage(content=system_prompt),
-                HumanMessage(content=user_prompt)
-            ]
+        return {
+            "kind": "response",
+            "text": cached,
+            "messages": [
+                ("system", system_prompt),
+                ("human", user_prompt)
+            ],
+            "cache_key": cache_key,
+            "embedding": None,
+            "fallback": fallback
+        }
 
-            response = self.llm.invoke(messages)
-            return response.content.strip()
+    def _chat_plan(self, user_input: str) -> Dict[str, Any]:
+        """일반 대화 응답 준비 (_response_plan과 같은 형식)"""
+        cache_key, embedding, cached = None, None, None
+        if self.response_cache:
+            cache_key = self.response_cache.make_chat_key(user_input)
+            cached = self.response_cache.get(cache_key)
 
-        except Exception as e:
-            # LLM 실패 시 기본 응답
-            if success_count == total_count:
-                return f"{success_count}개 항목 기록 완료."
-            else:
-                return f"{success_count}/{total_count}개 항목 기록. 실패 {total_count - success_count}건."
+            if cached is None and self.response_cache.semantic and self.rag:
+                try:
+                    embedding = self.rag.embedding_service.generate_embedding(user_input)
+                    cached = self.response_cache.get_similar(embedding)
+                except Exception as e:
+                    print(f"⚠️  대화 임베딩 실패: {e}")
 
-    def _chat_response(self, user_input: str) -> str:
-        """일반 대화 응답"""
         system_prompt = """건강/할일 관리 데이터 시스템.
 
 # PRECISION MODE 활성
@@ -798,14 +1138,61 @@ class SimpleLLM:
 - 직설적 선언문 구조
 - 불확실한 경우 "불확실" 명시"""
 
-        try:
-            messages = [
-                SystemMessage(content=system_prompt),
-                HumanMessage(content=user_input)
-            ]
+        return {
+            "kind": "chat",
+            "text": cached,
+            "messages": [
+                ("system", system_prompt),
+                ("human", user_input)
+            ],
+            "cache_key": cache_key,
+            "embedding": embedding,
+            "fallback": "명령 입력 요청. 예: 7시간 잤어, 30분 운동했어"
+        }
 
-            response = self.llm.invoke(messages)
-            return response.content.strip()
+    def _invoke_plan(self, plan: Dict[str, Any]) -> str:
+        """응답 한 번에 생성 (템플릿/캐시 응답이면 LLM 호출 없음)"""
+        if plan["text"] is not None:
+            return plan["text"]
 
+        try:
+            started = time.perf_counter()
+            response = self.llm.invoke(plan["messages"])
+            prompt_usage.record(plan["kind"], response, started)
+            answer = response.content.strip()
         except Exception:
-            return "명령 입력 요청. 예: 7시간 잤어, 30분 운동했어"
+            # LLM 실패 시 기본 응답 (캐시하지 않음)
+            return plan["fallback"]
+
+        self._cache_response(plan, answer)
+        return answer
+
+    def _stream_plan(self, plan: Dict[str, Any]) -> Iterator[str]:
+        """응답 토큰 스트리밍 (템플릿/캐시 응답이면 한 번에 yield)"""
+        if plan["text"] is not None:
+            yield plan["text"]
+            return
+
+        chunks, usage = [], None
+        started = time.perf_counter()
+        try:
+            for chunk in self.llm.stream(plan["messages"]):
+                if getattr(chunk, "usage_metadata", None):
+                    usage = chunk  # 사용량은 마지막 조각에 (stream_usage)
+                if chunk.content:
+                    chunks.append(chunk.content)
+                    yield chunk.content
+        except Exception as e:
+            # 첫 토큰 전 실패면 기본 응답, 도중 실패면 받은 데까지만 (캐시하지 않음)
+            if not chunks:
+                yield plan["fallback"]
+            else:
+                print(f"⚠️  응답 스트리밍 중단: {e}")
+            return
+
+        prompt_usage.record(plan["kind"], usage, started)
+        self._cache_response(plan, "".join(chunks).strip())
+
+    def _cache_response(self, plan: Dict[str, Any], answer: str):
+        if plan["cache_key"] and answer:
+            self.response_cache.put(plan["cache_key"], answer, plan["embedding"])
@@ -0,0 +1,106 @@
+"""
+작업 단위 (Unit of Work)
+사용자 메시지 하나에서 나온 쓰기를 하나의 트랜잭션으로 묶는다.
+
+- 커밋은 마지막에 한 번 (SQLite fsync 1회, PostgreSQL 왕복 1회)
+- 중간에 실패하면 rollback()으로 전부 취소 (all-or-nothing)
+- daily_health UPSERT는 날짜별로 모아 flush 시 한 문장으로 실행
+  예: "7시간 자고 30분 운동, 단백질 120g" → INSERT ... ON CONFLICT(date) 1회
+"""
+from typing import Any, Dict, List, Tuple
+
+
+class UnitOfWork:
+    """메시지 단위 트랜잭션"""
+
+    # UPSERT 허용 컬럼 (컬럼명은 SQL에 직접 들어가므로 화이트리스트)
+    DAILY_HEALTH_COLUMNS = ("sleep_h", "workout_min", "protein_g", "weight_kg", "note")
+
+    def __init__(self, conn, placeholder: str = '?'):
+        """
+        Args:
+            conn: DB 연결 (SQLite 또는 PostgreSQL)
+            placeholder: SQL placeholder (SQLite: ?, PostgreSQL: %s)
+        """
+        self.conn = conn
+        self.placeholder = placeholder
+        self._daily_health: Dict[str, Dict[str, Any]] = {}
+        self.statements = 0  # flush로 실행한 UPSERT 문장 수
+
+    def __enter__(self) -> "UnitOfWork":
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        if exc_type is None:
+            self.commit()
+        else:
+            self.rollback()
+        return False
+
+    def upsert_daily_health(self, date: str, **values):
+        """
+        daily_health 값 예약 (같은 날짜는 하나로 합침, 나중 값 우선)
+
+        Args:
+            date: YYYY-MM-DD
+            **values: 컬럼별 값 (예: sleep_h=7, workout_min=30)
+
+        Raises:
+            ValueError: 허용되지 않은 컬럼
+        """
+        unknown = set(values) - set(self.DAILY_HEALTH_COLUMNS)
+        if unknown:
+            raise ValueError(f"daily_health에 없는 컬럼: {', '.join(sorted(unknown))}")
+
+        self._daily_health.setdefault(date, {}).update(values)
+
+    def flush(self) -> int:
+        """
+        예약된 UPSERT 실행 (커밋하지 않음)
+
+        같은 트랜잭션 안에서 daily_health를 읽기 전에 호출한다.
+
+        Returns:
+            실행한 문장 수
+        """
+        if not self._daily_health:
+            return 0
+
+        # 컬럼 조합이 같은 날짜끼리는 executemany 한 번으로
+        groups: Dict[Tuple[str, ...], List[tuple]] = {}
+        for date, values in self._daily_health.items():
+            columns = tuple(c for c in self.DAILY_HEALTH_COLUMNS if c in values)
+            groups.setdefault(columns, []).append((date, *(values[c] for c in columns)))
+
+        cursor = self.conn.cursor()
+        p = self.placeholder
+        for columns, rows in groups.items():
+            sql = f"""
+                INSERT INTO daily_health (date, {', '.join(columns)})
+                VALUES ({', '.join([p] * (len(columns) + 1))})
+                ON CONFLICT(date) DO UPDATE SET
+                    {', '.join(f'{c} = excluded.{c}' for c in columns)}
+            """
+            if len(rows) == 1:
+                cursor.execute(sql, rows[0])
+            else:
+                cursor.executemany(sql, rows)
+
+        executed = len(groups)
+        self.statements += executed
+        self._daily_health.clear()
+        return executed
+
+    def commit(self):
+        """남은 UPSERT 실행 후 한 번 커밋 (실패 시 전부 롤백)"""
+        try:
+            self.flush()
+            self.conn.commit()
+        except Exception:
+            self.rollback()
+            raise
+
+    def rollback(self):
+        """예약된 쓰기와 트랜잭션 전체 취소"""
+        self._daily_health.clear()
+        self.conn.rollback()
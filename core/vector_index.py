@@ -0,0 +1,498 @@
+"""
+In-process vector index for SQLite deployments
+NumPy-backed cosine search over conversation_memory embeddings
+
+Backends:
+- flat: exact brute-force search (VectorIndex)
+- ivf: approximate inverted-file search with k-means coarse quantizer (IVFVectorIndex)
+"""
+import threading
+from abc import ABC, abstractmethod
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+
+
+class BaseVectorIndex(ABC):
+    """벡터 인덱스 추상 클래스 (build / add / search / persist)"""
+
+    @abstractmethod
+    def __len__(self) -> int:
+        pass
+
+    @abstractmethod
+    def build(self, items: Iterable[Tuple[int, Sequence[float], str]]):
+        """Replace index contents with items (record_id, vector, role)"""
+        pass
+
+    @abstractmethod
+    def add_many(self, items: Iterable[Tuple[int, Sequence[float], str]]):
+        """Add vectors incrementally"""
+        pass
+
+    @abstractmethod
+    def search_batch(
+        self,
+        queries: Sequence[Sequence[float]],
+        top_k: int = 5,
+        role_filter: Optional[str] = None
+    ) -> List[List[Tuple[int, float]]]:
+        """Top-k cosine search, one result list per query"""
+        pass
+
+    @abstractmethod
+    def save(self, path: str):
+        """Persist index to disk"""
+        pass
+
+    @classmethod
+    @abstractmethod
+    def load(cls, path: str) -> "BaseVectorIndex":
+        """Load index from disk"""
+        pass
+
+    def add(self, record_id: int, vector: Sequence[float], role: str = ""):
+        """Add one vector"""
+        self.add_many([(record_id, vector, role)])
+
+    def search(
+        self,
+        query: Sequence[float],
+        top_k: int = 5,
+        role_filter: Optional[str] = None
+    ) -> List[Tuple[int, float]]:
+        """
+        Top-k cosine search for a single query
+
+        Returns:
+            List of (record_id, similarity), highest similarity first
+        """
+        return self.search_batch([query], top_k, role_filter)[0]
+
+
+class VectorIndex(BaseVectorIndex):
+    """
+    Exact cosine-similarity index
+
+    Vectors are L2-normalized and kept in a contiguous float32 matrix that
+    grows by doubling, so incremental inserts are amortized O(1) and search
+    is a single matrix product followed by argpartition top-k.
+    """
+
+    backend = "flat"
+
+    def __init__(self, dimensions: int = 1536, initial_capacity: int = 1024):
+        """
+        Initialize empty index
+
+        Args:
+            dimensions: Embedding dimensions
+            initial_capacity: Initial number of rows to allocate
+        """
+        if not NUMPY_AVAILABLE:
+            raise ImportError("numpy is required for VectorIndex. Run: pip install numpy")
+
+        self.dimensions = dimensions
+        self._vectors = np.zeros((initial_capacity, dimensions), dtype=np.float32)
+        self._ids = np.zeros(initial_capacity, dtype=np.int64)
+        self._roles = np.empty(initial_capacity, dtype='U9')
+        self._size = 0
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return self._size
+
+    @property
+    def max_id(self) -> int:
+        """Largest stored record id (0 if empty)"""
+        return int(self._ids[:self._size].max()) if self._size else 0
+
+    def build(self, items: Iterable[Tuple[int, Sequence[float], str]]):
+        """Replace index contents"""
+        with self._lock:
+            self._size = 0
+        self.add_many(items)
+
+    def add_many(self, items: Iterable[Tuple[int, Sequence[float], str]]):
+        """
+        Add vectors in bulk
+
+        Args:
+            items: Iterable of (record_id, vector, role)
+        """
+        items = list(items)
+        if not items:
+            return
+
+        ids = np.fromiter((item[0] for item in items), dtype=np.int64, count=len(items))
+        vectors = self._normalize(np.asarray([item[1] for item in items], dtype=np.float32))
+        roles = [item[2] for item in items]
+
+        with self._lock:
+            start = self._append(ids, vectors, roles)
+            self._on_added(start, self._size)
+
+    def search_batch(
+        self,
+        queries: Sequence[Sequence[float]],
+        top_k: int = 5,
+        role_filter: Optional[str] = None
+    ) -> List[List[Tuple[int, float]]]:
+        """
+        Top-k cosine search for several queries in one matrix product
+
+        Args:
+            queries: Query vectors
+            top_k: Number of results per query
+            role_filter: Optional role ('user' or 'assistant')
+
+        Returns:
+            One result list per query
+        """
+        q = self._prepare_queries(queries)
+
+        with self._lock:
+            n = self._size
+            if n == 0 or top_k <= 0:
+                return [[] for _ in range(len(q))]
+
+            scores = q @ self._vectors[:n].T
+            ids = self._ids[:n].copy()
+            if role_filter:
+                scores[:, self._roles[:n] != role_filter] = -np.inf
+
+        return [self._top_k(row, ids, top_k) for row in scores]
+
+    def save(self, path: str):
+        """Persist index as a .npz archive"""
+        with self._lock:
+            np.savez(path, **self._state())
+
+    @classmethod
+    def load(cls, path: str) -> "VectorIndex":
+        """Load index saved with save()"""
+        with np.load(path, allow_pickle=False) as data:
+            state = {key: data[key] for key in data.files}
+
+        backend = str(state["backend"])
+        if backend != cls.backend:
+            raise ValueError(f"Index file backend '{backend}' does not match '{cls.backend}'")
+
+        ids = state["ids"]
+        index = cls(int(state["dimensions"]), initial_capacity=max(len(ids), 1))
+        index._restore(state)
+        return index
+
+    # === 내부 헬퍼 ===
+
+    def _append(self, ids: "np.ndarray", vectors: "np.ndarray", roles: List[str]) -> int:
+        """Append normalized rows; returns start offset (caller holds lock)"""
+        start = self._size
+        end = start + len(ids)
+        self._reserve(end)
+        self._vectors[start:end] = vectors
+        self._ids[start:end] = ids
+        self._roles[start:end] = roles
+        self._size = end
+        return start
+
+    def _on_added(self, start: int, end: int):
+        """Hook for subclasses after rows [start, end) are appended"""
+        pass
+
+    def _state(self) -> Dict[str, Any]:
+        """Arrays to persist"""
+        n = self._size
+        return {
+            "backend": np.array(self.backend),
+            "dimensions": np.array(self.dimensions),
+            "vectors": self._vectors[:n],
+            "ids": self._ids[:n],
+            "roles": self._roles[:n],
+        }
+
+    def _restore(self, state: Dict[str, Any]):
+        """Restore arrays written by _state()"""
+        self._append(state["ids"], state["vectors"], list(state["roles"]))
+
+    def _prepare_queries(self, queries: Sequence[Sequence[float]]) -> "np.ndarray":
+        return self._normalize(np.asarray(queries, dtype=np.float32).reshape(-1, self.dimensions))
+
+    @staticmethod
+    def _top_k(scores: "np.ndarray", ids: "np.ndarray", top_k: int) -> List[Tuple[int, float]]:
+        """argpartition top-k of one score row, sorted descending"""
+        n = len(scores)
+        k = min(top_k, n)
+        if k == 0:
+            return []
+
+        candidates = np.argpartition(-scores, k - 1)[:k] if k < n else np.arange(n)
+        ordered = candidates[np.argsort(-scores[candidates], kind='stable')]
+        return [
+            (int(ids[i]), float(scores[i]))
+            for i in ordered if np.isfinite(scores[i])
+        ]
+
+    def _reserve(self, capacity: int):
+        """Grow storage (doubling) to hold at least capacity rows"""
+        current = len(self._ids)
+        if capacity <= current:
+            return
+
+        new_capacity = max(capacity, current * 2)
+        vectors = np.zeros((new_capacity, self.dimensions), dtype=np.float32)
+        vectors[:self._size] = self._vectors[:self._size]
+        ids = np.zeros(new_capacity, dtype=np.int64)
+        ids[:self._size] = self._ids[:self._size]
+        roles = np.empty(new_capacity, dtype='U9')
+        roles[:self._size] = self._roles[:self._size]
+
+        self._vectors, self._ids, self._roles = vectors, ids, roles
+
+    @staticmethod
+    def _normalize(vectors: "np.ndarray") -> "np.ndarray":
+        """L2-normalize rows (zero vectors stay zero)"""
+        norms = np.linalg.norm(vectors, axis=1, keepdims=True)
+        norms[norms == 0] = 1.0
+        return vectors / norms
+
+
+class IVFVectorIndex(VectorIndex):
+    """
+    Approximate cosine index (inverted file)
+
+    A spherical k-means quantizer splits vectors into nlist cells; a query
+    scans only its nprobe nearest cells. Raising nprobe trades latency for
+    recall (nprobe == nlist is exact). Until enough vectors exist to train
+    the quantizer, search falls back to exact brute force.
+    """
+
+    backend = "ivf"
+
+    def __init__(
+        self,
+        dimensions: int = 1536,
+        nlist: Optional[int] = None,
+        nprobe: int = 8,
+        train_iterations: int = 10,
+        seed: int = 0,
+        initial_capacity: int = 1024
+    ):
+        """
+        Initialize empty IVF index
+
+        Args:
+            dimensions: Embedding dimensions
+            nlist: Number of cells (default: sqrt(n) at training time)
+            nprobe: Cells scanned per query (recall/latency knob)
+            train_iterations: k-means iterations
+            seed: Random seed for k-means initialization
+            initial_capacity: Initial number of rows to allocate
+        """
+        super().__init__(dimensions, initial_capacity)
+        self.nlist = nlist
+        self.nprobe = nprobe
+        self.train_iterations = train_iterations
+        self.seed = seed
+
+        self._centroids: Optional["np.ndarray"] = None
+        self._assignments = np.zeros(initial_capacity, dtype=np.int32)
+        self._lists: List[List[int]] = []
+        self._list_cache: Dict[int, "np.ndarray"] = {}
+
+    @property
+    def is_trained(self) -> bool:
+        return self._centroids is not None
+
+    def build(self, items: Iterable[Tuple[int, Sequence[float], str]]):
+        """Replace contents and train the quantizer on all vectors"""
+        with self._lock:
+            self._size = 0
+            self._centroids = None
+            self._lists = []
+            self._list_cache = {}
+        self.add_many(items)
+
+        with self._lock:
+            if not self.is_trained and self._size:
+                self._train()
+
+    def search_batch(
+        self,
+        queries: Sequence[Sequence[float]],
+        top_k: int = 5,
+        role_filter: Optional[str] = None,
+        nprobe: Optional[int] = None
+    ) -> List[List[Tuple[int, float]]]:
+        """
+        Approximate top-k search
+
+        Args:
+            nprobe: Override cells scanned per query
+        """
+        if not self.is_trained:
+            return super().search_batch(queries, top_k, role_filter)
+
+        q = self._prepare_queries(queries)
+        nprobe = min(nprobe or self.nprobe, len(self._centroids))
+
+        results = []
+        with self._lock:
+            if self._size == 0 or top_k <= 0:
+                return [[] for _ in range(len(q))]
+
+            cell_scores = q @ self._centroids.T
+            if nprobe < len(self._centroids):
+                probes = np.argpartition(-cell_scores, nprobe - 1, axis=1)[:, :nprobe]
+            else:
+                probes = np.tile(np.arange(len(self._centroids)), (len(q), 1))
+
+            for query, cells in zip(q, probes):
+                rows = np.concatenate([self._list_rows(int(c)) for c in cells])
+                if role_filter:
+                    rows = rows[self._roles[rows] == role_filter]
+                scores = self._vectors[rows] @ query
+                results.append(self._top_k(scores, self._ids[rows], top_k))
+
+        return results
+
+    # === 내부 헬퍼 ===
+
+    def _on_added(self, start: int, end: int):
+        """Assign new rows to cells; train once enough vectors exist"""
+        if len(self._assignments) < len(self._ids):
+            assignments = np.zeros(len(self._ids), dtype=np.int32)
+            assignments[:start] = self._assignments[:start]
+            self._assignments = assignments
+
+        if self.is_trained:
+            self._assign(start, end)
+        elif self._size >= self._min_train_size():
+            self._train()
+
+    def _min_train_size(self) -> int:
+        """Vectors needed before training (about 39 per cell, like faiss)"""
+        return 39 * (self.nlist or 64)
+
+    def _train(self):
+        """Spherical k-means on (a sample of) stored vectors (caller holds lock)"""
+        n = self._size
+        nlist = self.nlist or max(1, int(np.sqrt(n)))
+        nlist = min(nlist, n)
+
+        rng = np.random.default_rng(self.seed)
+        sample_size = min(n, max(64 * nlist, 10000), 100000)
+        sample = self._vectors[rng.choice(n, sample_size, replace=False)]
+        centroids = sample[rng.choice(sample_size, nlist, replace=False)].copy()
+
+        for _ in range(self.train_iterations):
+            labels = np.argmax(sample @ centroids.T, axis=1)
+            sums = np.zeros_like(centroids)
+            np.add.at(sums, labels, sample)
+            counts = np.bincount(labels, minlength=nlist)
+
+            # 빈 셀은 임의 샘플로 재시작
+            empty = counts == 0
+            if empty.any():
+                sums[empty] = sample[rng.choice(sample_size, int(empty.sum()))]
+            centroids = self._normalize(sums)
+
+        self._centroids = centroids.astype(np.float32)
+        self.nlist = nlist
+        self._lists = [[] for _ in range(nlist)]
+        self._list_cache = {}
+        self._assign(0, n)
+
+    def _assign(self, start: int, end: int, chunk: int = 65536):
+        """Assign rows [start, end) to nearest cells"""
+        for lo in range(start, end, chunk):
+            hi = min(lo + chunk, end)
+            labels = np.argmax(self._vectors[lo:hi] @ self._centroids.T, axis=1)
+            self._assignments[lo:hi] = labels
+            self._extend_lists(np.arange(lo, hi), labels)
+
+    def _extend_lists(self, rows: "np.ndarray", labels: "np.ndarray"):
+        """Append rows to their cells (grouped with one argsort)"""
+        order = np.argsort(labels, kind='stable')
+        cells, starts = np.unique(labels[order], return_index=True)
+        for cell, group in zip(cells, np.split(rows[order], starts[1:])):
+            self._lists[int(cell)].extend(group.tolist())
+            self._list_cache.pop(int(cell), None)
+
+    def _list_rows(self, cell: int) -> "np.ndarray":
+        """Row indices of one cell (cached as array until the cell changes)"""
+        rows = self._list_cache.get(cell)
+        if rows is None:
+            rows = np.asarray(self._lists[cell], dtype=np.int64)
+            self._list_cache[cell] = rows
+        return rows
+
+    def _state(self) -> Dict[str, Any]:
+        state = super()._state()
+        state.update({
+            "nprobe": np.array(self.nprobe),
+            "nlist": np.array(self.nlist or 0),
+            "centroids": self._centroids if self.is_trained else np.zeros((0, self.dimensions), np.float32),
+            "assignments": self._assignments[:self._size],
+        })
+        return state
+
+    def _restore(self, state: Dict[str, Any]):
+        self.nprobe = int(state["nprobe"])
+        self.nlist = int(state["nlist"]) or None
+        centroids = state["centroids"]
+
+        start = self._append(state["ids"], state["vectors"], list(state["roles"]))
+        self._assignments = np.zeros(len(self._ids), dtype=np.int32)
+
+        if len(centroids):
+            self._centroids = centroids.astype(np.float32)
+            self._lists = [[] for _ in range(len(centroids))]
+            self._assignments[:self._size] = state["assignments"]
+            self._extend_lists(np.arange(self._size), self._assignments[:self._size])
+        else:
+            self._on_added(start, self._size)
+
+
+class VectorIndexFactory:
+    """벡터 인덱스 팩토리"""
+
+    BACKENDS = {
+        "flat": VectorIndex,
+        "ivf": IVFVectorIndex,
+    }
+
+    @staticmethod
+    def create(backend: str = "flat", dimensions: int = 1536, **options) -> BaseVectorIndex:
+        """
+        Create an empty index
+
+        Args:
+            backend: 'flat' (exact) or 'ivf' (approximate)
+            dimensions: Embedding dimensions
+            **options: Backend options (ivf: nlist, nprobe)
+        """
+        if backend == "flat":
+            return VectorIndex(dimensions)
+        elif backend == "ivf":
+            return IVFVectorIndex(
+                dimensions,
+                nlist=options.get("nlist"),
+                nprobe=options.get("nprobe", 8)
+            )
+        else:
+            raise ValueError(f"지원하지 않는 벡터 인덱스: {backend}")
+
+    @staticmethod
+    def load(path: str) -> BaseVectorIndex:
+        """Load an index saved by any backend"""
+        with np.load(path, allow_pickle=False) as data:
+            backend = str(data["backend"])
+
+        if backend not in VectorIndexFactory.BACKENDS:
+            raise ValueError(f"지원하지 않는 벡터 인덱스: {backend}")
+        return VectorIndexFactory.BACKENDS[backend].load(path)
@@ -21,8 +21,8 @@ def main():
     choice = input("\n선택하세요 (1-3): ").strip()
 
     if choice == "1":
-        from interfaces.main_natural import main as natural_main
-        natural_main()
+        from interfaces.chat_cli import main as chat_main
+        chat_main([])
     elif choice == "2":
         from interfaces.main import main as cli_main
         cli_main()
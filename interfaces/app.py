@@ -15,10 +15,12 @@ from dotenv import load_dotenv
 load_dotenv()
 
 import streamlit as st
-import pandas as pd
 from datetime import datetime
+from core.client_registry import clients
+from core.config import config
 from core.database import Database
-from core.simple_llm import SimpleLLM
+from core.data_views import DATA_VIEWS, find_view
+from core.prompt_usage import prompt_usage
 
 
 # 페이지 설정
@@ -29,45 +31,79 @@ st.set_page_config(
     initial_sidebar_state="expanded"
 )
 
-# 세션 상태 초기화
-if 'db' not in st.session_state:
-    # Streamlit Cloud secrets를 환경 변수로 설정
-    if hasattr(st, 'secrets'):
-        for key in ['OPENAI_API_KEY', 'SUPABASE_URL', 'SUPABASE_KEY']:
-            if key in st.secrets:
-                os.environ[key] = st.secrets[key]
+# Streamlit Cloud secrets를 환경 변수로 설정
+if hasattr(st, 'secrets'):
+    for key in ['OPENAI_API_KEY', 'SUPABASE_URL', 'SUPABASE_KEY']:
+        if key in st.secrets:
+            os.environ[key] = st.secrets[key]
 
-    st.session_state.db = Database()
-    st.session_state.db.connect()
 
-    # 데이터베이스 스키마 확인 및 초기화
+@st.cache_resource
+def get_database() -> Database:
+    """프로세스 전체가 공유하는 Database (연결 풀, 세션마다 새로 연결하지 않음)"""
+    db = Database()
+    db.connect()
+
+    # 스키마 마이그레이션 (최신이면 버전 조회 한 번)
     try:
-        cursor = st.session_state.db.conn.cursor()
-
-        # PostgreSQL과 SQLite 모두 지원
-        if st.session_state.db.db_type == 'postgres':
-            cursor.execute("""
-                SELECT table_name FROM information_schema.tables
-                WHERE table_schema = 'public' AND table_name = 'user_progress'
-            """)
-        else:
-            cursor.execute("SELECT name FROM sqlite_master WHERE type='table' AND name='user_progress'")
-
-        if not cursor.fetchone():
-            # 테이블이 없으면 스키마 초기화
-            print("📝 Initializing database schema...")
-            st.session_state.db.init_schema()
-            st.session_state.db.seed_initial_data()
-            print("✅ Database schema initialized!")
+        applied = db.migrate()
+        if applied:
+            db.seed_initial_data()
+            print(f"✅ Database migrated to v{applied[-1]}")
     except Exception as e:
-        print(f"❌ Database initialization error: {e}")
-        st.error(f"데이터베이스 초기화 중 오류: {e}")
+        print(f"❌ Database migration error: {e}")
+        st.error(f"데이터베이스 마이그레이션 중 오류: {e}")
+
+    return db
+
+
+@st.cache_data(ttl=300, show_spinner=False)
+def load_page(view_name: str, after, page_size: int, data_version: int):
+    """
+    데이터 뷰 한 페이지 (키셋 커서)
+
+    data_version은 쓰기마다 증가하므로 기록이 추가되면 캐시가 자동으로 무효화된다.
+    (다른 프로세스의 쓰기는 ttl 후 반영)
+    """
+    db = get_database()
+    placeholder = '%s' if db.db_type == 'postgres' else '?'
+    with db.connection() as conn:
+        return find_view(view_name).fetch_page(conn, after, page_size, placeholder)
+
+
+def render_data_view(name: str, page_size: int):
+    """뷰 한 페이지 + 이전/다음 버튼 (페이지 커서 스택은 세션 상태에 저장)"""
+    cursors = st.session_state.setdefault('page_cursors', {}).setdefault(name, [None])
+    page = load_page(name, cursors[-1], page_size, st.session_state.db.data_version)
+
+    if not page["frame"].empty:
+        st.dataframe(page["frame"], use_container_width=True, hide_index=True)
+    else:
+        st.info("데이터가 없습니다.")
+
+    if len(cursors) == 1 and page["next_cursor"] is None:
+        return
+
+    col_prev, col_page, col_next = st.columns([1, 2, 1])
+    if col_prev.button("◀ 이전", key=f"{name}_prev", disabled=len(cursors) == 1):
+        cursors.pop()
+        st.rerun()
+    col_page.caption(f"{len(cursors)} 페이지 (페이지당 {page_size}건)")
+    if col_next.button("다음 ▶", key=f"{name}_next", disabled=page["next_cursor"] is None):
+        cursors.append(page["next_cursor"])
+        st.rerun()
+
+
+# 세션 상태 초기화
+if 'db' not in st.session_state:
+    st.session_state.db = get_database()
 
 if 'agent' not in st.session_state:
     # SimpleLLM 초기화
     try:
         print("🤖 Initializing SimpleLLM...")
-        st.session_state.agent = SimpleLLM(st.session_state.db.conn)
+        from core.async_llm import create_agent  # LLM/RAG 스택은 세션 시작 시에만 로드
+        st.session_state.agent = create_agent(st.session_state.db)  # llm.pipeline: sync/async
         st.session_state.llm_status = "✅ SimpleLLM 활성화 (GPT-4o-mini)"
         print(f"✅ SimpleLLM initialized! RAG: {st.session_state.agent.rag is not None}")
     except Exception as e:
@@ -95,6 +131,19 @@ with st.sidebar:
         st.write(f"**DB 타입**: {st.session_state.db.db_type}")
         st.write(f"**RAG 활성화**: {st.session_state.agent.rag is not None if 'agent' in st.session_state else 'N/A'}")
 
+        # 연결 풀 상태
+        pool_stats = st.session_state.db.pool_stats()
+        if pool_stats:
+            st.write("**연결 풀**: " + ", ".join(f"{k}={v}" for k, v in pool_stats.items()))
+
+        # LLM 클라이언트 지연 시간 (provider/model별, 프로세스 공용)
+        for name, stats in clients.stats().items():
+            st.write(f"**{name}**: " + ", ".join(f"{k}={v}" for k, v in stats.items()))
+
+        # 프롬프트 토큰 (제공자 프롬프트 캐시 적중률)
+        for kind, stats in prompt_usage.stats().items():
+            st.write(f"**프롬프트 {kind}**: " + ", ".join(f"{k}={v}" for k, v in stats.items()))
+
         # PostgreSQL 연결 에러 표시
         if hasattr(st.session_state.db, 'connection_error') and st.session_state.db.connection_error:
             st.error(f"**PostgreSQL 연결 실패**: {st.session_state.db.connection_error}")
@@ -154,152 +203,36 @@ if menu == "💬 채팅":
             'content': user_input
         })
 
-        # SimpleLLM 처리
-        with st.spinner('처리 중...'):
-            response = st.session_state.agent.process(user_input, st.session_state.chat_history)
+        # SimpleLLM 처리 (응답 토큰을 받는 대로 표시)
+        with chat_container:
+            st.chat_message("user").write(user_input)
+            with st.chat_message("assistant"):
+                response = st.write_stream(
+                    st.session_state.agent.process_stream(user_input, st.session_state.chat_history)
+                )
         st.session_state.chat_history.append({
             'role': 'assistant',
             'content': response
         })
 
-        st.rerun()
-
 
 elif menu == "📊 데이터 보기":
     st.header("📊 저장된 데이터")
 
-    # 데이터 테이블 탭
-    tab1, tab2, tab3, tab4, tab5, tab6, tab7, tab8 = st.tabs([
-        "💤 건강 데이터",
-        "📝 할일",
-        "🎯 습관",
-        "💎 경험치",
-        "📊 기타",
-        "👥 인물 정보",
-        "🤝 상호작용",
-        "📚 지식/회고"
-    ])
-
-    cursor = st.session_state.db.conn.cursor()
-
-    with tab1:
-        st.subheader("💤 일일 건강 기록 (daily_health)")
-        cursor.execute("SELECT * FROM daily_health ORDER BY date DESC")
-        rows = cursor.fetchall()
-        if rows:
-            df = pd.DataFrame([{key: row[key] for key in row.keys()} for row in rows])
-            st.dataframe(df, use_container_width=True, hide_index=True)
-        else:
-            st.info("데이터가 없습니다.")
-
-    with tab2:
-        st.subheader("📝 할일 목록 (tasks)")
-        cursor.execute("SELECT * FROM tasks ORDER BY created_at DESC")
-        rows = cursor.fetchall()
-        if rows:
-            df = pd.DataFrame([{key: row[key] for key in row.keys()} for row in rows])
-            st.dataframe(df, use_container_width=True, hide_index=True)
-        else:
-            st.info("데이터가 없습니다.")
-
-    with tab3:
-        st.subheader("🎯 습관 목록 (habits)")
-        cursor.execute("SELECT * FROM habits")
-        rows = cursor.fetchall()
-        if rows:
-            df = pd.DataFrame([{key: row[key] for key in row.keys()} for row in rows])
-            st.dataframe(df, use_container_width=True, hide_index=True)
-        else:
-            st.info("데이터가 없습니다.")
-
-        st.markdown("---")
-
-        st.subheader("📅 습관 로그 (habit_logs)")
-        cursor.execute("SELECT * FROM habit_logs ORDER BY date DESC")
-        rows = cursor.fetchall()
-        if rows:
-            df = pd.DataFrame([{key: row[key] for key in row.keys()} for row in rows])
-            st.dataframe(df, use_container_width=True, hide_index=True)
-        else:
-            st.info("데이터가 없습니다.")
-
-    with tab4:
-        st.subheader("💎 경험치 로그 (exp_logs)")
-        cursor.execute("SELECT * FROM exp_logs ORDER BY created_at DESC")
-        rows = cursor.fetchall()
-        if rows:
-            df = pd.DataFrame([{key: row[key] for key in row.keys()} for row in rows])
-            st.dataframe(df, use_container_width=True, hide_index=True)
-        else:
-            st.info("데이터가 없습니다.")
-
-        st.markdown("---")
-
-        st.subheader("📈 레벨 진행도 (user_progress)")
-        cursor.execute("SELECT * FROM user_progress")
-        rows = cursor.fetchall()
-        if rows:
-            df = pd.DataFrame([{key: row[key] for key in row.keys()} for row in rows])
-            st.dataframe(df, use_container_width=True, hide_index=True)
-        else:
-            st.info("데이터가 없습니다.")
-
-    with tab5:
-        st.subheader("📊 커스텀 메트릭 (custom_metrics)")
-        cursor.execute("SELECT * FROM custom_metrics ORDER BY date DESC")
-        rows = cursor.fetchall()
-        if rows:
-            df = pd.DataFrame([{key: row[key] for key in row.keys()} for row in rows])
-            st.dataframe(df, use_container_width=True, hide_index=True)
-        else:
-            st.info("데이터가 없습니다.")
-
-    with tab6:
-        st.subheader("👥 인물 정보 (people)")
-        cursor.execute("SELECT * FROM people ORDER BY importance_score DESC, name")
-        rows = cursor.fetchall()
-        if rows:
-            df = pd.DataFrame([{key: row[key] for key in row.keys()} for row in rows])
-            st.dataframe(df, use_container_width=True, hide_index=True)
-        else:
-            st.info("데이터가 없습니다.")
-
-    with tab7:
-        st.subheader("🤝 상호작용 로그 (interactions)")
-        cursor.execute("""
-            SELECT i.id, p.name as person_name, i.date, i.type,
-                   i.summary, i.sentiment, i.location, i.duration_min
-            FROM interactions i
-            JOIN people p ON i.person_id = p.id
-            ORDER BY i.date DESC
-        """)
-        rows = cursor.fetchall()
-        if rows:
-            df = pd.DataFrame([{key: row[key] for key in row.keys()} for row in rows])
-            st.dataframe(df, use_container_width=True, hide_index=True)
-        else:
-            st.info("데이터가 없습니다.")
-
-    with tab8:
-        st.subheader("📚 지식 저장소 (knowledge_entries)")
-        cursor.execute("SELECT * FROM knowledge_entries ORDER BY learned_date DESC")
-        rows = cursor.fetchall()
-        if rows:
-            df = pd.DataFrame([{key: row[key] for key in row.keys()} for row in rows])
-            st.dataframe(df, use_container_width=True, hide_index=True)
-        else:
-            st.info("데이터가 없습니다.")
-
-        st.markdown("---")
-
-        st.subheader("💭 회고/성찰 (reflections)")
-        cursor.execute("SELECT * FROM reflections ORDER BY date DESC")
-        rows = cursor.fetchall()
-        if rows:
-            df = pd.DataFrame([{key: row[key] for key in row.keys()} for row in rows])
-            st.dataframe(df, use_container_width=True, hide_index=True)
-        else:
-            st.info("데이터가 없습니다.")
+    # 선택한 탭의 뷰만 조회 (st.tabs는 보이지 않는 탭까지 매번 실행)
+    tab = st.radio(
+        "데이터",
+        list(DATA_VIEWS.keys()),
+        horizontal=True,
+        label_visibility="collapsed"
+    )
+
+    page_size = config.get("web_ui.page_size", 50)
+    for i, (name, view) in enumerate(DATA_VIEWS[tab].items()):
+        if i:
+            st.markdown("---")
+        st.subheader(view.title)
+        render_data_view(name, page_size)
 
 
 # Footer
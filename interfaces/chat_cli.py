@@ -0,0 +1,70 @@
+#!/usr/bin/env python3
+"""
+Horcrux 대화 CLI (SimpleLLM / AsyncSimpleLLM)
+
+사용법:
+    python interfaces/chat_cli.py                   # config.yaml llm.pipeline
+    python interfaces/chat_cli.py --pipeline async
+"""
+import argparse
+import sys
+from pathlib import Path
+
+# 상위 디렉토리를 path에 추가 (import 경로 해결)
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from core.database import Database
+
+EXIT_COMMANDS = {"exit", "quit", "q", "종료"}
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Horcrux chat CLI")
+    parser.add_argument("--pipeline", choices=["sync", "async"], default=None,
+                        help="processing pipeline (default: config llm.pipeline)")
+    args = parser.parse_args(argv)
+
+    db = Database()
+    db.connect()
+    if db.migrate():
+        db.seed_initial_data()
+
+    from core.async_llm import create_agent  # LLM/RAG 스택은 대화 시작 시에만 로드
+    try:
+        agent = create_agent(db, args.pipeline)
+    except ValueError as e:
+        print(f"❌ {e}")
+        db.close()
+        sys.exit(1)
+    print(f"🤖 Horcrux 대화 모드 ({type(agent).__name__}, 종료: exit)\n")
+
+    history = []
+    try:
+        while True:
+            try:
+                user_input = input("> ").strip()
+            except (EOFError, KeyboardInterrupt):
+                print()
+                break
+
+            if not user_input:
+                continue
+            if user_input.lower() in EXIT_COMMANDS:
+                break
+
+            # 응답 토큰을 받는 대로 출력
+            chunks = []
+            for token in agent.process_stream(user_input, history):
+                chunks.append(token)
+                print(token, end="", flush=True)
+            print("\n")
+
+            history.append({"role": "user", "content": user_input})
+            history.append({"role": "assistant", "content": "".join(chunks)})
+    finally:
+        agent.close()
+        db.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,112 @@
+"""
+한국어 절(clause) 분리
+복합 입력을 연결 어미(-고, -서)와 접속 표현(그리고, 및, 쉼표) 기준으로 절 단위 span으로 나누고,
+같은 스캔에서 각 절의 숫자+단위와 날짜를 미리 뽑아 둔다.
+
+    "어제 일곱시간 자고 1,000보 걸었어"
+      → Clause("어제 일곱시간 자고", (0, 10), numbers=[(7.0, "hours")], date=어제)
+      → Clause("1,000보 걸었어", (11, 21), numbers=[(1000.0, "steps")], date=None)
+
+수량은 NumberParser의 수량 표현(한글 수사 포함)을 그대로 쓰고 단위는 표준 이름이다.
+숫자 토큰을 먼저 매칭하므로 "1,000"의 쉼표는 절 경계가 아니다.
+"""
+import re
+from datetime import datetime
+from typing import List, NamedTuple, Optional, Tuple
+
+from parsers.date_parser import DateParser
+from parsers.number_parser import NumberParser, is_partial_number
+
+
+class Clause(NamedTuple):
+    """절 하나 (span은 입력 텍스트 기준)"""
+    text: str
+    span: Tuple[int, int]
+    numbers: List[Tuple[float, Optional[str]]]  # [(값, 표준 단위), ...] 등장 순서 (단위 없는 숫자는 None)
+    date: Optional[str]                         # 절 안의 첫 날짜 (YYYY-MM-DD)
+
+    def quantity(self, *units: str) -> Optional[float]:
+        """주어진 단위 값의 합 (없으면 None)"""
+        values = [value for value, unit in self.numbers if unit in units]
+        return sum(values) if values else None
+
+
+class ClauseSegmenter:
+    """한 번의 토큰 스캔으로 절 분리 + 숫자/날짜 추출"""
+
+    # 절 경계
+    # 쉼표: 숫자 사이의 쉼표("7,5")는 경계가 아님
+    # -고: 앞이 한글 음절이고 뒤가 보조 용언(싶다, 있다, 계시다)이 아닐 때
+    # -서: 연결 어미 -아서/-어서/-해서 등 (보고서 같은 명사는 제외)
+    BOUNDARY = (
+        r'\s*(?:그리고|및)\s+'
+        r'|\s*(?:(?<!\d),|,(?!\d))\s*'
+        r'|(?<=[가-힣])고(?=\s+(?!싶|있|계))'
+        r'|(?<=[아어여해워와져쳐가나봐])서(?=\s)'
+    )
+
+    def __init__(self, date_parser: Optional[DateParser] = None, number_parser: Optional[NumberParser] = None):
+        self.date_parser = date_parser or DateParser()
+        self.number_parser = number_parser or NumberParser()
+        dp = self.date_parser
+
+        # 날짜 표현 (DateParser와 같은 표현, 긴 키워드 먼저: 그저께가 그제보다 앞)
+        keywords = sorted(dp.relative_dates, key=len, reverse=True)
+        dates = "|".join([re.escape(k) for k in keywords] + [
+            dp.days_ago_pattern.pattern, dp.days_later_pattern.pattern,
+            dp.weeks_ago_pattern.pattern, dp.weeks_later_pattern.pattern,
+            dp.absolute_date_pattern.pattern, dp.month_day_pattern.pattern,
+        ])
+
+        self.token_pattern = re.compile(
+            f"(?P<date>{dates})"
+            f"|(?P<quantity>{self.number_parser.quantity_source})"
+            r"|(?P<number>\d{1,3}(?:,\d{3})+(?:\.\d+)?|\d+(?:\.\d+)?)"
+            f"|(?P<boundary>{self.BOUNDARY})"
+        )
+
+    def segment(self, text: str, reference_date: Optional[datetime] = None) -> List[Clause]:
+        """
+        입력을 절 단위로 분리
+
+        Args:
+            text: 사용자 입력
+            reference_date: 상대 날짜 기준 (기본: 오늘)
+
+        Returns:
+            [Clause, ...] - 경계가 없으면 입력 전체가 절 하나
+        """
+        clauses: List[Clause] = []
+        start = 0
+        numbers: List[Tuple[float, Optional[str]]] = []
+        date: Optional[str] = None
+
+        for match in self.token_pattern.finditer(text):
+            if match.group("quantity") is not None:
+                quantity = self.number_parser.quantity_from_match(match, text)
+                if quantity is not None:
+                    numbers.append(quantity)
+            elif match.group("number") is not None:
+                if not is_partial_number(text, *match.span()):
+                    numbers.append((float(match.group("number").replace(",", "")), None))
+            elif match.group("date") is not None:
+                if date is None:
+                    date = self.date_parser.parse(match.group(), reference_date)
+            else:
+                # 연결 어미(-고, -서)는 앞 절에 남기고, 접속어/쉼표는 버림
+                end = match.end() if match.group().strip() in ("고", "서") else match.start()
+                self._append(clauses, text, start, end, numbers, date)
+                start, numbers, date = match.end(), [], None
+
+        self._append(clauses, text, start, len(text), numbers, date)
+        return clauses
+
+    @staticmethod
+    def _append(clauses: List[Clause], text: str, start: int, end: int, numbers, date):
+        """앞뒤 공백을 뺀 span으로 절 추가 (빈 절은 건너뜀)"""
+        segment = text[start:end]
+        stripped = segment.strip()
+        if not stripped:
+            return
+        start += len(segment) - len(segment.lstrip())
+        clauses.append(Clause(stripped, (start, start + len(stripped)), numbers, date))
@@ -1,16 +1,31 @@
 """
 한국어 날짜 표현 파싱
 예: "어제", "오늘", "3일 전", "지난주 금요일"
+
+상대 키워드는 하나로 합친 정규식으로 찾고(키워드마다 부분 문자열 검사 대신), 찾은 표현은
+기준일별로 메모(LRU)해 둔다. 과거 메시지를 대량으로 처리할 때는 parse_many로 같은 기준
+시각을 쓰면 결과가 실행 시각과 무관하게 같다.
+
+    parser = DateParser(clock=lambda: datetime(2025, 10, 17))
+    parser.parse_many(["어제 7시간 잤어", "3일 전 헬스"])  # ["2025-10-16", "2025-10-14"]
 """
 import re
-from datetime import datetime, timedelta
-from typing import Optional
+from datetime import date, datetime, timedelta
+from functools import lru_cache
+from typing import Callable, List, Optional, Sequence, Union
 
 
 class DateParser:
     """한국어 날짜 표현 파서"""
 
-    def __init__(self):
+    def __init__(self, clock: Optional[Callable[[], datetime]] = None, memo_size: int = 4096):
+        """
+        Args:
+            clock: 기준 시각 함수 (기본: datetime.now) - 테스트/백필에서 고정
+            memo_size: (기준일, 표현) → 날짜 메모 최대 개수
+        """
+        self.clock = clock or datetime.now
+
         # 상대적 날짜 키워드
         self.relative_dates = {
             "오늘": 0,
@@ -36,81 +51,130 @@ class DateParser:
         self.absolute_date_pattern = re.compile(r'(\d{4})[-/](\d{1,2})[-/](\d{1,2})')
         self.month_day_pattern = re.compile(r'(\d{1,2})월\s*(\d{1,2})일')
 
+        # 숫자 날짜 표현 (우선순위 순)
+        self.expression_patterns = [
+            ("days_ago", self.days_ago_pattern),
+            ("days_later", self.days_later_pattern),
+            ("weeks_ago", self.weeks_ago_pattern),
+            ("weeks_later", self.weeks_later_pattern),
+            ("absolute", self.absolute_date_pattern),
+            ("month_day", self.month_day_pattern),
+        ]
+        self._patterns_by_kind = dict(self.expression_patterns)
+
+        # 키워드 하나로 합친 정규식 + 키워드 우선순위 (relative_dates 순서)
+        self._keywords = list(self.relative_dates)
+        self._keyword_rank = {keyword: i for i, keyword in enumerate(self._keywords)}
+        self._keyword_pattern = re.compile(
+            "|".join(re.escape(k) for k in sorted(self._keywords, key=len, reverse=True))
+        )
+        self._digit_pattern = re.compile(r'\d')
+
+        # (기준일, 종류, 표현) → 날짜
+        self._resolve = lru_cache(maxsize=memo_size)(self._compute)
+
     def parse(self, text: str, reference_date: Optional[datetime] = None) -> Optional[str]:
         """
         한국어 날짜 표현을 YYYY-MM-DD 형식으로 변환
 
         Args:
             text: 날짜 표현 ("어제", "3일 전" 등)
-            reference_date: 기준 날짜 (기본: 오늘)
+            reference_date: 기준 날짜 (기본: clock(), 보통 오늘)
 
         Returns:
             YYYY-MM-DD 형식의 날짜 문자열, 파싱 실패 시 None
         """
         if not reference_date:
-            reference_date = datetime.now()
+            reference_date = self.clock()
+        day = reference_date.date() if isinstance(reference_date, datetime) else reference_date
 
         text = text.strip()
 
-        # 1. 상대적 키워드 체크
-        for keyword, offset in self.relative_dates.items():
-            if keyword in text:
-                target_date = reference_date + timedelta(days=offset)
-                return target_date.strftime("%Y-%m-%d")
-
-        # 2. N일 전/후 패턴
-        match = self.days_ago_pattern.search(text)
-        if match:
-            days = int(match.group(1))
-            target_date = reference_date - timedelta(days=days)
-            return target_date.strftime("%Y-%m-%d")
-
-        match = self.days_later_pattern.search(text)
-        if match:
-            days = int(match.group(1))
-            target_date = reference_date + timedelta(days=days)
-            return target_date.strftime("%Y-%m-%d")
-
-        # 3. N주 전/후 패턴
-        match = self.weeks_ago_pattern.search(text)
-        if match:
-            weeks = int(match.group(1))
-            target_date = reference_date - timedelta(weeks=weeks)
-            return target_date.strftime("%Y-%m-%d")
-
-        match = self.weeks_later_pattern.search(text)
-        if match:
-            weeks = int(match.group(1))
-            target_date = reference_date + timedelta(weeks=weeks)
-            return target_date.strftime("%Y-%m-%d")
-
-        # 4. 절대 날짜 (YYYY-MM-DD)
-        match = self.absolute_date_pattern.search(text)
-        if match:
-            year = int(match.group(1))
-            month = int(match.group(2))
-            day = int(match.group(3))
-            try:
-                target_date = datetime(year, month, day)
-                return target_date.strftime("%Y-%m-%d")
-            except ValueError:
-                pass
-
-        # 5. MM월 DD일 패턴
-        match = self.month_day_pattern.search(text)
-        if match:
-            month = int(match.group(1))
-            day = int(match.group(2))
-            year = reference_date.year
-            try:
-                target_date = datetime(year, month, day)
-                return target_date.strftime("%Y-%m-%d")
-            except ValueError:
-                pass
+        # 1. 상대적 키워드
+        keyword = self._find_keyword(text)
+        if keyword:
+            return self._resolve(day, "keyword", keyword)
+
+        # 2~5. 숫자 표현 (N일/N주 전후, 절대 날짜) - 숫자가 없으면 건너뜀
+        if not self._digit_pattern.search(text):
+            return None
+
+        for kind, pattern in self.expression_patterns:
+            match = pattern.search(text)
+            if match:
+                resolved = self._resolve(day, kind, match.group())
+                if resolved:
+                    return resolved
 
         # 파싱 실패
         return None
 
+    def parse_many(
+        self,
+        texts: Sequence[str],
+        reference_date: Union[datetime, Sequence[datetime], None] = None
+    ) -> List[Optional[str]]:
+        """
+        여러 텍스트 일괄 파싱 (과거 메시지 백필 등)
+
+        Args:
+            texts: 텍스트 목록
+            reference_date: 공통 기준 시각, 텍스트별 기준 시각 목록(메시지 작성 시각 등),
+                또는 None (clock()을 한 번만 읽어 모든 텍스트에 사용)
+
+        Returns:
+            텍스트별 YYYY-MM-DD 또는 None
+        """
+        if reference_date is None or isinstance(reference_date, (datetime, date)):
+            references = [reference_date or self.clock()] * len(texts)
+        else:
+            references = list(reference_date)
+            if len(references) != len(texts):
+                raise ValueError("reference_date 목록과 texts의 길이가 다릅니다")
+
+        return [self.parse(text, reference) for text, reference in zip(texts, references)]
+
+    def _find_keyword(self, text: str) -> Optional[str]:
+        """
+        텍스트에 있는 상대 키워드 중 relative_dates 순서가 가장 앞선 것
+
+        정규식으로 하나를 찾은 뒤, 그보다 앞선 키워드만 추가로 확인
+        """
+        match = self._keyword_pattern.search(text)
+        if not match:
+            return None
+
+        found = match.group()
+        for keyword in self._keywords[:self._keyword_rank[found]]:
+            if keyword in text:
+                return keyword
+        return found
+
+    def _compute(self, day: date, kind: str, expression: str) -> Optional[str]:
+        """표현 → 날짜 (lru_cache로 감싸서 _resolve로 사용)"""
+        if kind == "keyword":
+            return (day + timedelta(days=self.relative_dates[expression])).strftime("%Y-%m-%d")
+
+        match = self._patterns_by_kind[kind].match(expression)
+
+        # N일 전/후, N주 전/후
+        if kind in ("days_ago", "days_later", "weeks_ago", "weeks_later"):
+            amount = int(match.group(1))
+            delta = timedelta(days=amount) if kind.startswith("days") else timedelta(weeks=amount)
+            target = day - delta if kind.endswith("ago") else day + delta
+            return target.strftime("%Y-%m-%d")
+
+        # 절대 날짜 (YYYY-MM-DD) / MM월 DD일 (기준일의 연도)
+        if kind == "absolute":
+            year, month, dom = int(match.group(1)), int(match.group(2)), int(match.group(3))
+        else:
+            year, month, dom = day.year, int(match.group(1)), int(match.group(2))
+
+        try:
+            return date(year, month, dom).strftime("%Y-%m-%d")
+        except ValueError:
+            return None
+
     def extract_date_from_sentence(self, sentence: str) -> Optional[str]:
         """
         문장에서 날짜 표현 추출 및 파싱
@@ -134,4 +198,4 @@ class DateParser:
             return parsed
 
         # 날짜 표현이 없으면 오늘로 간주
-        return datetime.now().strftime("%Y-%m-%d")
+        return self.clock().strftime("%Y-%m-%d")
@@ -0,0 +1,268 @@
+"""
+파서 평가 (라벨 코퍼스 기반 정확도 + 처리량)
+tests/test_parsers/corpus/utterances.jsonl의 발화를 파서마다 돌려 의도/엔티티 정확도와
+호출당 지연 시간(p50/p99), 초당 처리량을 잰다. 속도와 정확도를 함께 보고 파서 변경을 판단.
+
+    items = load_corpus()
+    report = evaluate(IntentSuite(), items)
+    # {"parser": "korean_patterns", "items": 2100, "ops_per_sec": ..., "p50_us": ...,
+    #  "intent_accuracy": 0.93, "entity_accuracy": None, "by_tag": {...}}
+
+코퍼스 생성: scripts/build_parser_corpus.py / 벤치마크: scripts/benchmark_parsers.py
+날짜 라벨은 REFERENCE_DATE 기준이라 날짜를 다루는 파서는 같은 기준일로 실행한다.
+"""
+import json
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+from parsers.date_parser import DateParser
+from parsers.fast_parser import FastParser
+from parsers.korean_patterns import KoreanPatterns
+from parsers.number_parser import NumberParser
+
+CORPUS_DIR = Path(__file__).parent.parent / "tests" / "test_parsers" / "corpus"
+DEFAULT_CORPUS = CORPUS_DIR / "utterances.jsonl"
+DEFAULT_RECORDINGS = CORPUS_DIR / "llm_responses.jsonl"
+
+# 코퍼스 날짜 라벨의 기준 시각
+REFERENCE_DATE = datetime(2025, 10, 17, 12, 0)
+
+# 수량 엔티티 (NumberParser 평가 대상)
+NUMERIC_ENTITIES = ("sleep_hours", "workout_minutes", "study_hours", "protein_grams", "weight_kg")
+
+
+def load_corpus(path: Path = DEFAULT_CORPUS) -> List[Dict[str, Any]]:
+    """
+    라벨 코퍼스 로드
+
+    Returns:
+        [{"text", "intents": [{"intent", "entities"}], "tags"}, ...]
+    """
+    with open(path, encoding="utf-8") as f:
+        return [json.loads(line) for line in f if line.strip()]
+
+
+def load_recordings(path: Path = DEFAULT_RECORDINGS) -> Dict[str, Dict[str, Any]]:
+    """
+    녹화된 LLM 파싱 응답
+
+    Returns:
+        {발화: {"text", "content", "latency_ms", "usage"}} (파일이 없으면 빈 dict)
+    """
+    if not path.exists():
+        return {}
+    with open(path, encoding="utf-8") as f:
+        records = [json.loads(line) for line in f if line.strip()]
+    return {r["text"]: r for r in records}
+
+
+def values_match(expected: Any, actual: Any) -> bool:
+    """숫자는 0.01 오차 허용, 나머지는 같은 값"""
+    if isinstance(expected, (int, float)) and isinstance(actual, (int, float)):
+        return abs(expected - actual) < 0.01
+    return expected == actual
+
+
+def entities_match(expected: Dict[str, Any], actual: Dict[str, Any]) -> bool:
+    """라벨에 있는 키가 모두 같은 값 (파서가 더 많은 키를 내는 것은 허용)"""
+    return all(key in actual and values_match(value, actual[key]) for key, value in expected.items())
+
+
+def score_intents(item: Dict[str, Any], intents: Optional[List[Dict]]) -> Tuple[bool, bool]:
+    """
+    파싱 결과 의도 목록 채점
+
+    Returns:
+        (의도 이름 순서가 같은지, 의도와 엔티티가 모두 같은지)
+    """
+    expected = item["intents"]
+    if not intents:
+        return False, False
+    names_ok = [i.get("intent") for i in intents] == [e["intent"] for e in expected]
+    entities_ok = names_ok and all(
+        entities_match(e["entities"], i.get("entities") or {}) for e, i in zip(expected, intents)
+    )
+    return names_ok, entities_ok
+
+
+def expected_date(item: Dict[str, Any]) -> Optional[str]:
+    """발화의 날짜 라벨 (없으면 None)"""
+    for intent in item["intents"]:
+        if intent["entities"].get("date"):
+            return intent["entities"]["date"]
+    return None
+
+
+# ========================================
+# 파서별 평가 스위트
+# ========================================
+
+class ParserSuite:
+    """
+    평가 스위트 기본 클래스
+
+    applies(item)로 대상 발화를 고르고, run(item)만 시간을 잰다.
+    score는 (의도 정답 여부, 엔티티 정답 여부) - 해당 없으면 None.
+    """
+
+    name = "parser"
+
+    def applies(self, item: Dict[str, Any]) -> bool:
+        return True
+
+    def run(self, item: Dict[str, Any]) -> Any:
+        raise NotImplementedError
+
+    def score(self, item: Dict[str, Any], output: Any) -> Tuple[Optional[bool], Optional[bool]]:
+        raise NotImplementedError
+
+
+class IntentSuite(ParserSuite):
+    """KoreanPatterns.match_intent (단일 의도 발화)"""
+
+    name = "korean_patterns"
+
+    def __init__(self):
+        self.patterns = KoreanPatterns()
+
+    def applies(self, item):
+        return len(item["intents"]) == 1
+
+    def run(self, item):
+        return self.patterns.match_intent(item["text"])
+
+    def score(self, item, output):
+        return output == item["intents"][0]["intent"], None
+
+
+class NumberSuite(ParserSuite):
+    """NumberParser (수량 엔티티가 있는 단일 의도 발화)"""
+
+    name = "number_parser"
+
+    def __init__(self):
+        self.parser = NumberParser()
+
+    def applies(self, item):
+        return len(item["intents"]) == 1 and any(
+            key in item["intents"][0]["entities"] for key in NUMERIC_ENTITIES
+        )
+
+    def run(self, item):
+        text = item["text"]
+        key = next(k for k in NUMERIC_ENTITIES if k in item["intents"][0]["entities"])
+
+        if key in ("sleep_hours", "study_hours", "workout_minutes"):
+            minutes = self.parser.parse_duration_minutes(text)
+            if minutes is None:
+                return None
+            return int(minutes) if key == "workout_minutes" else round(minutes / 60, 2)
+        if key == "protein_grams":
+            return self.parser.parse_grams(text)
+        return self.parser.parse_weight(text)
+
+    def score(self, item, output):
+        entities = item["intents"][0]["entities"]
+        key = next(k for k in NUMERIC_ENTITIES if k in entities)
+        return None, output is not None and values_match(entities[key], output)
+
+
+class DateSuite(ParserSuite):
+    """DateParser.parse (모든 발화 - 날짜가 없는 발화는 None이 정답)"""
+
+    name = "date_parser"
+
+    def __init__(self):
+        self.parser = DateParser(clock=lambda: REFERENCE_DATE)
+
+    def run(self, item):
+        return self.parser.parse(item["text"])
+
+    def score(self, item, output):
+        return None, output == expected_date(item)
+
+
+class FastParserSuite(ParserSuite):
+    """
+    FastParser (정규식 fast path 전체)
+
+    min_confidence 미만이면 LLM으로 넘어가므로 답하지 않은 것(오답)으로 센다.
+    """
+
+    name = "fast_parser"
+
+    def __init__(self, min_confidence: float = 0.85):
+        self.parser = FastParser(DateParser(clock=lambda: REFERENCE_DATE))
+        self.min_confidence = min_confidence
+
+    def run(self, item):
+        result = self.parser.parse(item["text"])
+        if result["success"] and result["confidence"] >= self.min_confidence:
+            return result["intents"]
+        return None
+
+    def score(self, item, output):
+        return score_intents(item, output)
+
+
+# ========================================
+# 실행
+# ========================================
+
+def percentile(sorted_values: List[float], q: float) -> float:
+    """정렬된 값의 분위수 (nearest-rank)"""
+    if not sorted_values:
+        return 0.0
+    return sorted_values[min(len(sorted_values) - 1, int(round(q * (len(sorted_values) - 1))))]
+
+
+def accuracy(flags: List[Optional[bool]]) -> Optional[float]:
+    scored = [f for f in flags if f is not None]
+    return round(sum(scored) / len(scored), 4) if scored else None
+
+
+def evaluate(suite: ParserSuite, items: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """
+    스위트 실행
+
+    Returns:
+        {"parser", "items", "ops_per_sec", "p50_us", "p99_us",
+         "intent_accuracy", "entity_accuracy", "by_tag": {tag: {"items", "intent_accuracy", "entity_accuracy"}}}
+    """
+    latencies: List[float] = []
+    intent_flags: List[Optional[bool]] = []
+    entity_flags: List[Optional[bool]] = []
+    tags: Dict[str, Tuple[List, List]] = {}
+
+    for item in items:
+        if not suite.applies(item):
+            continue
+        started = time.perf_counter()
+        output = suite.run(item)
+        latencies.append(time.perf_counter() - started)
+
+        intent_ok, entity_ok = suite.score(item, output)
+        intent_flags.append(intent_ok)
+        entity_flags.append(entity_ok)
+        for tag in item.get("tags", []):
+            by_intent, by_entity = tags.setdefault(tag, ([], []))
+            by_intent.append(intent_ok)
+            by_entity.append(entity_ok)
+
+    total = sum(latencies)
+    latencies.sort()
+    return {
+        "parser": suite.name,
+        "items": len(latencies),
+        "ops_per_sec": round(len(latencies) / total, 1) if total else 0.0,
+        "p50_us": round(percentile(latencies, 0.50) * 1e6, 1),
+        "p99_us": round(percentile(latencies, 0.99) * 1e6, 1),
+        "intent_accuracy": accuracy(intent_flags),
+        "entity_accuracy": accuracy(entity_flags),
+        "by_tag": {
+            tag: {"items": len(i), "intent_accuracy": accuracy(i), "entity_accuracy": accuracy(e)}
+            for tag, (i, e) in sorted(tags.items())
+        },
+    }
@@ -0,0 +1,280 @@
+"""
+정규식 기반 빠른 파서 (LLM 앞단 fast path)
+KoreanPatterns + NumberParser + DateParser 조합으로 단순 기록 입력을 로컬에서 해석
+예: "7시간 잤어", "어제 30분 운동했어", "체중 70.5kg", "오늘 요약"
+
+복합 입력("어제 7시간 자고 30분 운동했어")은 ClauseSegmenter로 절을 나누고, 절마다
+미리 뽑아 둔 숫자/날짜로 엔티티를 채운다 (절마다 다시 파싱하지 않음).
+
+신뢰도(confidence)를 함께 반환하며, 낮으면 호출자가 LLM 파싱으로 넘긴다.
+"""
+import re
+from typing import Any, Dict, List, Optional
+
+from parsers.clause_segmenter import Clause, ClauseSegmenter
+from parsers.korean_patterns import KoreanPatterns
+from parsers.number_parser import NumberParser
+from parsers.date_parser import DateParser
+
+
+class FastParser:
+    """정규식 fast path 파서"""
+
+    # 의도별 키워드 근거 (KoreanPatterns의 느슨한 패턴 보완)
+    INTENT_KEYWORDS = {
+        "sleep": re.compile(r'잤|수면|잠|자[고서]$'),  # "7시간 자고" (복합 입력의 앞 절)
+        "workout": re.compile(r'운동|헬스|러닝|조깅|달리기|걷기|수영'),
+        "protein": re.compile(r'단백질|프로틴'),
+        "weight": re.compile(r'체중|몸무게|kg|키로'),
+        "study": re.compile(r'공부|학습|study'),
+        "summary": re.compile(r'요약|정리|summary'),
+    }
+
+    # 복합 입력 (여러 의도 가능성) - LLM으로 넘김
+    COMPOUND_PATTERN = re.compile(r'그리고|하고|,|고\s|서\s|및')
+
+    # 질문/가정/계획/목표/변화량 표현 - 사실 기록으로 처리하면 안 됨
+    # "자야지", "할 거야", "3시간 공부할 예정", "체중 70kg 목표", "체중 5kg 빠졌어"
+    # 가정은 용언 어미 "(으)면"만 ("자면", "잤으면") - "수면 7시간"의 명사 "면"은 제외
+    QUESTION_PATTERN = re.compile(
+        r'\?|몇|얼마|어떻|어때|할까|(?:으|[하자되보가])면(?:\s|$)|야\s*돼|될까'
+        r'|예정|목표|계획|야지|거야|려고|겠'
+        r'|빠졌|빠짐|늘었|늘음|줄었|줄음|쪘|감량|증량'
+    )
+
+    # 시간/분 기간으로 채우는 엔티티
+    DURATION_ENTITIES = {"sleep_hours", "workout_minutes", "study_hours"}
+
+    # 부정 표현 - "7시간 안 잤어", "운동 못 했어", "자지 않았어", "공부한 적 없어"
+    NEGATION_PATTERN = re.compile(r'(?<![가-힣])[안못]\s*[가-힣]|않|없')
+
+    # 체중 근거 - kg/키로만으로는 운동 중량과 구분되지 않음 ("70kg 벤치 했어")
+    BODY_WEIGHT_PATTERN = re.compile(r'체중|몸무게')
+    EXERCISE_PATTERN = re.compile(
+        r'운동|헬스|벤치|스쿼트|데드|프레스|덤벨|바벨|케틀벨|중량|원판|세트|들었|들어'
+    )
+
+    # 요약 요청 - "정리"만으로는 부족 ("방 정리했어", "책상 정리 할일 추가")
+    SUMMARY_REQUEST_PATTERN = re.compile(
+        r'요약|summary'
+        r'|(?:오늘|어제|하루|이번\s*주)\s*정리(?!했|하고|하면서|할)'
+        r'|^정리\s*해\s*(?:줘|주세요)'
+    )
+
+    def __init__(self, date_parser: Optional[DateParser] = None):
+        """
+        Args:
+            date_parser: 날짜 파서 (기준 시각을 고정하려면 DateParser(clock=...) 전달)
+        """
+        self.patterns = KoreanPatterns()
+        self.number_parser = NumberParser()
+        self.date_parser = date_parser or DateParser()
+        self.segmenter = ClauseSegmenter(self.date_parser, self.number_parser)
+
+    def parse(self, text: str) -> Dict[str, Any]:
+        """
+        입력 텍스트를 SimpleLLM 파싱 결과 형식으로 변환
+
+        Args:
+            text: 사용자 입력
+
+        Returns:
+            {
+                "success": True/False,
+                "multiple": False,
+                "intents": [{"intent": ..., "entities": {...}, "confidence": ...}],
+                "confidence": 0.0~1.0,
+                "parser": "regex"
+            }
+        """
+        text = (text or "").strip()
+        if not text:
+            return self._fail()
+
+        clauses = self.segmenter.segment(text)
+        if len(clauses) > 1:
+            return self._parse_clauses(clauses)
+
+        intent = self.patterns.match_intent(text)
+        keyword = self.INTENT_KEYWORDS.get(intent)
+        if not keyword or not keyword.search(text):
+            return self._fail(intent)
+
+        entities = self._extract_entities(intent, text)
+        confidence = self._calculate_confidence(intent, text, entities)
+
+        return {
+            "success": True,
+            "multiple": False,
+            "intents": [{
+                "intent": intent,
+                "entities": entities,
+                "confidence": confidence
+            }],
+            "confidence": confidence,
+            "parser": "regex"
+        }
+
+    def _parse_clauses(self, clauses: List[Clause]) -> Dict[str, Any]:
+        """
+        복합 입력: 절마다 의도 판별 + 미리 뽑은 숫자/날짜로 엔티티
+
+        한 절이라도 해석할 수 없으면 전체를 LLM으로 넘긴다 (일부만 기록하지 않음).
+        날짜가 없는 절은 앞 절의 날짜를 이어받는다 ("어제 7시간 자고 30분 운동했어").
+        """
+        intents = []
+        date = None
+
+        for clause in clauses:
+            intent = self.patterns.match_intent(clause.text)
+            keyword = self.INTENT_KEYWORDS.get(intent)
+            if not keyword or not keyword.search(clause.text):
+                return self._fail(intent)
+
+            date = clause.date or date
+            entities = self._clause_entities(intent, clause)
+            if date:
+                entities["date"] = date
+
+            confidence = self._calculate_confidence(intent, clause.text, entities)
+            intents.append({"intent": intent, "entities": entities, "confidence": confidence})
+
+        # 전체 신뢰도는 가장 불확실한 절 기준
+        confidence = min(i["confidence"] for i in intents)
+        return {
+            "success": True,
+            "multiple": True,
+            "intents": intents,
+            "confidence": confidence,
+            "parser": "regex"
+        }
+
+    def _clause_entities(self, intent: str, clause: Clause) -> Dict[str, Any]:
+        """절의 숫자+단위 토큰 → 엔티티 (_extract_entities와 같은 키)"""
+        entities: Dict[str, Any] = {}
+        timed = clause.quantity("hours", "minutes") is not None
+
+        # 시간/분이 있으면 기간만 골라냄 ("30분 전에 7시간 자고" → 7시간)
+        if intent in ("sleep", "study") and timed:
+            hours = self._parse_duration_hours(clause.text)
+            if hours:
+                entities["sleep_hours" if intent == "sleep" else "study_hours"] = hours
+
+        elif intent == "workout" and timed:
+            minutes = self.number_parser.parse_duration_minutes(clause.text)
+            if minutes:
+                entities["workout_minutes"] = int(minutes)
+
+        elif intent == "protein":
+            grams = clause.quantity("grams")
+            if grams:
+                entities["protein_grams"] = grams
+
+        elif intent == "weight":
+            kg = clause.quantity("kg")
+            if kg is None and "체중" in clause.text and clause.numbers:
+                kg = clause.numbers[0][0]
+            if kg:
+                entities["weight_kg"] = kg
+
+        return entities
+
+    def _extract_entities(self, intent: str, text: str) -> Dict[str, Any]:
+        """의도별 엔티티 추출 (SimpleLLM 엔티티 키 이름 사용)"""
+        entities: Dict[str, Any] = {}
+
+        date = self.date_parser.parse(text)
+        if date:
+            entities["date"] = date
+
+        if intent == "sleep":
+            hours = self._parse_duration_hours(text)
+            if hours:
+                entities["sleep_hours"] = hours
+
+        elif intent == "workout":
+            minutes = self.number_parser.parse_duration_minutes(text)
+            if minutes:
+                entities["workout_minutes"] = int(minutes)
+
+        elif intent == "study":
+            hours = self._parse_duration_hours(text)
+            if hours:
+                entities["study_hours"] = hours
+
+        elif intent == "protein":
+            grams = self.number_parser.parse_grams(text)
+            if grams:
+                entities["protein_grams"] = grams
+
+        elif intent == "weight":
+            kg = self.number_parser.parse_weight(text)
+            if kg is None:
+                match = self.patterns.weight_patterns[1].search(text)
+                if match:
+                    kg = float(match.group(1))
+            if kg:
+                entities["weight_kg"] = kg
+
+        return entities
+
+    def _parse_duration_hours(self, text: str) -> Optional[float]:
+        """시간 + 분 조합을 시간 단위로 ("7시간 30분" → 7.5, "일곱시간 반" → 7.5)"""
+        minutes = self.number_parser.parse_duration_minutes(text)
+        if minutes is None:
+            return None
+        return round(minutes / 60, 2)
+
+    def _calculate_confidence(self, intent: str, text: str, entities: Dict[str, Any]) -> float:
+        """
+        신뢰도 계산
+
+        Returns:
+            0.0 ~ 1.0 (높을수록 LLM 없이 처리해도 안전)
+        """
+        # 요약은 조회 전용 - 요청 표현이 확인될 때만 바로 처리
+        if intent == "summary":
+            return 0.95 if self.SUMMARY_REQUEST_PATTERN.search(text) else 0.3
+
+        required = {
+            "sleep": "sleep_hours",
+            "workout": "workout_minutes",
+            "study": "study_hours",
+            "protein": "protein_grams",
+            "weight": "weight_kg",
+        }[intent]
+
+        # 수량은 NumberParser가 수사-단위 조합까지 확인한 값 (한글 수사 포함)
+        if required not in entities:
+            return 0.3
+
+        if self.QUESTION_PATTERN.search(text) or self.NEGATION_PATTERN.search(text):
+            return 0.2
+
+        # 기간 후보가 여럿이면 어느 것이 기록 대상인지 모호 ("30분 자고 일어나서 7시간")
+        if required in self.DURATION_ENTITIES and len(self.number_parser.duration_candidates(text)) > 1:
+            return 0.4
+
+        # 운동 어휘와 함께 쓴 kg은 들어 올린 중량일 수 있음
+        if intent == "weight" and self.EXERCISE_PATTERN.search(text):
+            return 0.4 if self.BODY_WEIGHT_PATTERN.search(text) else 0.3
+
+        # 다른 의도 키워드가 함께 있거나 접속 표현이 있으면 복합 입력
+        other_keywords = sum(
+            1 for name, pattern in self.INTENT_KEYWORDS.items()
+            if name != intent and pattern.search(text)
+        )
+        if other_keywords or self.COMPOUND_PATTERN.search(text):
+            return 0.4
+
+        return 0.9
+
+    def _fail(self, intent: str = "unknown") -> Dict[str, Any]:
+        """fast path 처리 불가"""
+        return {
+            "success": False,
+            "multiple": False,
+            "intents": [{"intent": intent, "entities": {}, "confidence": 0.0}],
+            "confidence": 0.0,
+            "parser": "regex"
+        }
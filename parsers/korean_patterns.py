@@ -1,14 +1,62 @@
 """
 한국어 자연어 패턴 정의
 의도(intent) 파악을 위한 정규식 패턴들
+
+의도 판별은 한 번의 키워드 스캔으로 후보 의도를 고른 뒤, 후보 의도의 패턴만
+(의도별로 하나로 합친 정규식) 우선순위 순서대로 검사한다.
+
+    "카드비 계산해야 해"
+      키워드 스캔: 해야 → task_add 후보
+      task_add 정규식 검사 → ("task_add", 우선순위 9, span (3, 7))
 """
 import re
-from typing import Dict, List, Pattern
+from typing import Dict, Iterator, List, NamedTuple, Pattern, Set, Tuple
+
+
+class IntentCandidate(NamedTuple):
+    """매칭된 의도 후보"""
+    intent: str
+    priority: int               # 작을수록 우선 (match_intent는 가장 작은 후보)
+    span: Tuple[int, int]       # 첫 매칭 위치 (입력 텍스트 기준)
 
 
 class KoreanPatterns:
     """한국어 패턴 정의 클래스"""
 
+    # 의도 우선순위 (의도, 패턴 목록 속성)
+    PRIORITY: List[Tuple[str, str]] = [
+        ("summary", "summary_patterns"),            # 다른 키워드와 겹칠 수 있으므로 먼저
+        ("progress", "progress_patterns"),
+        ("sleep", "sleep_patterns"),                # 건강 지표는 할일보다 우선
+        ("workout", "workout_patterns"),
+        ("protein", "protein_patterns"),
+        ("weight", "weight_patterns"),
+        ("study", "study_patterns"),                # 공부 시간도 지표 ("2시간 공부했어")
+        ("task_complete", "task_complete_patterns"),  # 할일 완료는 추가보다 먼저
+        ("task_add", "task_add_patterns"),
+        ("learning_log", "learning_log_patterns"),
+        ("habit_create", "habit_create_patterns"),
+        ("habit_log", "habit_patterns"),
+    ]
+
+    # 의도별 필수 키워드: 그 의도의 어떤 패턴이든 매칭되면 이 중 하나가 텍스트에 있어야 함
+    # (패턴을 추가/수정하면 함께 갱신)
+    KEYWORDS: Dict[str, Tuple[str, ...]] = {
+        "summary": ("요약", "정리", "상황", "summary", "어떻", "어떠", "어때"),
+        "progress": ("레벨", "level", "진행", "progress", "경험치", "xp"),
+        "sleep": ("잤", "자", "수면", "睡"),
+        "workout": ("운동", "헬스", "러닝", "조깅", "달리기", "걷기", "수영"),
+        "protein": ("단백질", "프로틴"),
+        "weight": ("kg", "키로", "체중", "몸무게"),
+        "task_complete": ("완료", "끝", "했어", "했다", "함", "done"),
+        "task_add": ("해야", "할", "하기", "todo", "task", "하자"),
+        "learning_log": ("알게", "알았", "배웠", "깨달았", "이해했", "습득했", "익혔",
+                         "기억", "노트", "메모"),
+        "study": ("공부", "학습", "study"),
+        "habit_create": ("습관", "habit"),
+        "habit_log": ("일째", "성공", "실패", "스킵"),
+    }
+
     def __init__(self):
         # 수면 패턴
         self.sleep_patterns: List[Pattern] = [
@@ -41,21 +89,22 @@ class KoreanPatterns:
         # 체중 패턴
         self.weight_patterns: List[Pattern] = [
             re.compile(r'(\d+\.?\d*)\s*(kg|키로)'),
-            re.compile(r'체중\s*(\d+\.?\d*)'),
+            re.compile(r'체중\s*(\d+\.?\d*)(?![\d,])'),  # "체중 7,5kg"의 7은 아님
             re.compile(r'몸무게'),
         ]
 
         # 할일 추가 패턴
+        # (앞에 한 글자 이상: "(.+?)\s*해야"와 매칭 여부는 같고 긴 입력에서 역추적 없음)
         self.task_add_patterns: List[Pattern] = [
-            re.compile(r'(.+?)\s*(해야|할\s*것|하기|할일|todo)'),
+            re.compile(r'.\s*(해야|할\s*것|하기|할일|todo)'),
             re.compile(r'(할일|todo|task)\s*(.+)'),
-            re.compile(r'(.+?)\s*해야\s*해'),
-            re.compile(r'(.+?)\s*하자'),
+            re.compile(r'.\s*해야\s*해'),
+            re.compile(r'.\s*하자'),
         ]
 
         # 할일 완료 패턴
         self.task_complete_patterns: List[Pattern] = [
-            re.compile(r'(.+?)\s*(완료|끝|했어|했다|함|done)'),
+            re.compile(r'.\s*(완료|끝|했어|했다|함|done)'),
             re.compile(r'(완료|끝|done)\s*(.+)'),
             re.compile(r'할일\s*(\d+)\s*(완료|끝|done)'),
         ]
@@ -81,7 +130,7 @@ class KoreanPatterns:
 
         # 습관 생성 패턴
         self.habit_create_patterns: List[Pattern] = [
-            re.compile(r'(.+?)\s*(습관|habit)\s*(추가|만들|생성)'),
+            re.compile(r'.\s*(습관|habit)\s*(추가|만들|생성)'),
             re.compile(r'(습관|habit)\s*(.+?)\s*(추가|만들|생성)'),
         ]
 
@@ -91,18 +140,43 @@ class KoreanPatterns:
             re.compile(r'(\d+)\s*분\s*(공부|학습|study)'),
             re.compile(r'(공부|학습|study)\s*(\d+\.?\d*)\s*시간'),
             re.compile(r'(공부|학습)\s*중'),
-            re.compile(r'공부\s*하'),
+            re.compile(r'공부\s*하(?!기|자)'),  # "영어 공부하기"는 할일
         ]
 
         # 학습 기록 패턴 (새로운 지식/스킬 습득)
         self.learning_log_patterns: List[Pattern] = [
-            re.compile(r'(.+?)\s*(알게\s*됐|알았|배웠|배웠어|깨달았|이해했|습득했|익혔)'),
-            re.compile(r'(.+?)\s*(에\s*대해|에\s*관해)\s*(알게\s*됐|배웠|깨달았|이해했)'),
-            re.compile(r'(.+?)\s*기억\s*해\s*둬'),
-            re.compile(r'(.+?)\s*노트'),
-            re.compile(r'(.+?)\s*메모'),
+            re.compile(r'.\s*(알게\s*됐|알았|배웠|배웠어|깨달았|이해했|습득했|익혔)'),
+            re.compile(r'.\s*(에\s*대해|에\s*관해)\s*(알게\s*됐|배웠|깨달았|이해했)'),
+            re.compile(r'.\s*기억\s*해\s*둬'),
+            re.compile(r'.\s*노트'),
+            re.compile(r'.\s*메모'),
         ]
 
+        self._compile()
+
+    def _compile(self):
+        """키워드 스캐너 + 의도별 결합 정규식 생성"""
+        self._intent_regex: Dict[str, Pattern] = {
+            intent: re.compile("|".join(f"(?:{p.pattern})" for p in getattr(self, attr)))
+            for intent, attr in self.PRIORITY
+        }
+
+        # 같은 위치에서 시작하는 키워드는 긴 것이 먼저 잡히므로, 그 접두어 키워드의 의도도 포함
+        owners: Dict[str, Set[str]] = {}
+        for intent, keywords in self.KEYWORDS.items():
+            for keyword in keywords:
+                owners.setdefault(keyword, set()).add(intent)
+        self._keyword_intents: Dict[str, frozenset] = {
+            keyword: frozenset().union(*(
+                intents for other, intents in owners.items() if keyword.startswith(other)
+            ))
+            for keyword in owners
+        }
+
+        # 전방 탐색(lookahead)이라 겹치는 키워드도 모두 찾음 ("이해했어" → 이해했, 했어)
+        alternation = "|".join(re.escape(k) for k in sorted(owners, key=len, reverse=True))
+        self._keyword_scan = re.compile(f"(?=({alternation}))")
+
     def match_intent(self, text: str) -> str:
         """
         입력 텍스트에서 의도(intent) 파악
@@ -113,60 +187,39 @@ class KoreanPatterns:
         Returns:
             의도 문자열 ('sleep', 'workout', 'task_add', 'summary', 'unknown' 등)
         """
-        text = text.strip()
-
-        # 우선순위 순서대로 체크
-        # 1. 요약/조회 (다른 키워드와 겹칠 수 있으므로 먼저 체크)
-        if self._matches_any(text, self.summary_patterns):
-            return "summary"
-
-        # 2. 진행도
-        if self._matches_any(text, self.progress_patterns):
-            return "progress"
-
-        # 3. 건강 지표 (할일보다 우선)
-        # 수면
-        if self._matches_any(text, self.sleep_patterns):
-            return "sleep"
-
-        # 운동
-        if self._matches_any(text, self.workout_patterns):
-            return "workout"
-
-        # 단백질
-        if self._matches_any(text, self.protein_patterns):
-            return "protein"
+        for candidate in self._scan(text):
+            return candidate.intent
 
-        # 체중
-        if self._matches_any(text, self.weight_patterns):
-            return "weight"
-
-        # 4. 할일 완료 (추가보다 먼저 체크)
-        if self._matches_any(text, self.task_complete_patterns):
-            return "task_complete"
+        # 알 수 없는 의도
+        return "unknown"
 
-        # 5. 할일 추가
-        if self._matches_any(text, self.task_add_patterns):
-            return "task_add"
+    def match_candidates(self, text: str) -> List[IntentCandidate]:
+        """
+        매칭되는 모든 의도 후보 (우선순위 순)
 
-        # 6. 학습 기록 (지식/스킬 습득)
-        if self._matches_any(text, self.learning_log_patterns):
-            return "learning_log"
+        Args:
+            text: 사용자 입력
 
-        # 7. 공부/학습 (시간 기록)
-        if self._matches_any(text, self.study_patterns):
-            return "study"
+        Returns:
+            [IntentCandidate(intent, priority, span), ...] - 첫 항목이 match_intent 결과
+        """
+        return list(self._scan(text))
 
-        # 7. 습관 생성
-        if self._matches_any(text, self.habit_create_patterns):
-            return "habit_create"
+    def _scan(self, text: str) -> Iterator[IntentCandidate]:
+        """키워드 스캔 한 번 → 후보 의도의 결합 정규식만 우선순위 순서대로 검사"""
+        offset = len(text) - len(text.lstrip())
+        text = text.strip()
 
-        # 8. 습관 기록
-        if self._matches_any(text, self.habit_patterns):
-            return "habit_log"
+        candidates: Set[str] = set()
+        for keyword in {m.group(1) for m in self._keyword_scan.finditer(text)}:
+            candidates |= self._keyword_intents[keyword]
 
-        # 알 수 없는 의도
-        return "unknown"
+        for priority, (intent, _) in enumerate(self.PRIORITY):
+            if intent not in candidates:
+                continue
+            match = self._intent_regex[intent].search(text)
+            if match:
+                yield IntentCandidate(intent, priority, (match.start() + offset, match.end() + offset))
 
     def extract_task_title(self, text: str) -> str:
         """할일 제목 추출"""
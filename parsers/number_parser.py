@@ -1,67 +1,139 @@
 """
 한국어 수량 표현 파싱
-예: "5시간", "30분", "100그램", "반시간"
+예: "5시간", "30분", "100그램", "반시간", "한시간 반", "삼십분", "천오백보", "1시간 20분", "1만5천보"
+
+수사는 미리 만들어 둔 조회 테이블로 값을 찾는다 (정규식으로 후보를 잡고 테이블에서 확인).
+    고유어: 하나/한 ~ 아흔아홉 (스무, 석, 넉 포함) - 시간, 번, 잔, 개 등
+    한자어: 영 ~ 구천구백구십구 (+ "만" 조합) - 분, 그램, 보 등
+    숫자 + 자릿수 혼용: "1만5천", "1만 5000", "2천5백" (해석할 수 없으면 수량 아님)
+
+수사와 단위의 조합은 한국어 관례대로 제한한다 ("다섯 분"은 사람, "이 시간"은 지시어).
+기간은 시점 기준("30분 전에", "10분 늦게")과 시각("2시 30분")을 뺀 시간/분이다.
 """
 import re
-from typing import Optional, Tuple
+from functools import lru_cache
+from typing import Dict, List, Optional, Tuple
+
+# 고유어 수사 (관형형 포함)
+NATIVE_ONES = {
+    1: ("하나", "한"), 2: ("둘", "두"), 3: ("셋", "세", "석"), 4: ("넷", "네", "넉"),
+    5: ("다섯",), 6: ("여섯",), 7: ("일곱",), 8: ("여덟",), 9: ("아홉",),
+}
+NATIVE_TENS = {
+    10: ("열",), 20: ("스물", "스무"), 30: ("서른",), 40: ("마흔",), 50: ("쉰",),
+    60: ("예순",), 70: ("일흔",), 80: ("여든",), 90: ("아흔",),
+}
+
+# 한자어 수사
+SINO_DIGITS = "영일이삼사오육칠팔구"
+SINO_PLACES = ((1000, "천"), (100, "백"), (10, "십"))
+SINO_CHARS = "영공일이삼사오육칠팔구십백천만"
+SINO_PLACE_VALUES = {"천": 1000, "백": 100, "십": 10}
+MIXED_TOKEN = re.compile(r'\d+(?:\.\d+)?|\D')  # "5천3백" → 5, 천, 3, 백
+
+# 기간이 아닌 시간/분: 시점 기준("30분 전에", "10분 늦게")과 시각("2시 30분")
+OFFSET_PATTERN = re.compile(r'\s*(?:쯤|정도|가량)?\s*(?:전|후|뒤|늦게|일찍)')
+CLOCK_PATTERN = re.compile(r'시\s*$')
+
+# 단위 → 표준 이름 (긴 것 먼저: kg이 g보다, min이 m보다 앞)
+UNITS = {
+    "시간": "hours", "hrs": "hours", "hr": "hours", "h": "hours",
+    "분": "minutes", "min": "minutes", "m": "minutes",
+    "kg": "kg", "키로": "kg", "킬로": "kg",
+    "gram": "grams", "그램": "grams", "g": "grams",
+    "km": "km", "걸음": "steps", "보": "steps",
+    "세트": "sets", "번": "times", "회": "times", "잔": "cups", "개": "count",
+}
+ENGLISH_UNITS = {"hrs", "hr", "h", "min", "m", "gram", "g", "km", "kg"}
+
+# 수사 종류별로 쓰지 않는 단위
+NATIVE_EXCLUDED = {"분"} | ENGLISH_UNITS          # "다섯 분" = 다섯 사람
+SINO_EXCLUDED = ENGLISH_UNITS
+
+# 한 글자 한자어 수사(일~구) 뒤 단위 다음에 올 수 있는 글자 ("구분해야" 같은 단어 제외)
+SINO_SINGLE_FOLLOWERS = set("간동만씩정쯤에을은이도")
+
+
+def is_partial_number(text: str, start: int, end: int) -> bool:
+    """
+    숫자 토큰 text[start:end]가 쉼표/점으로 이어진 더 긴 숫자열의 일부인지
+
+    천 단위가 아닌 쉼표("7,5kg", "1,2000보")는 어느 쪽도 수로 읽지 않는다.
+    """
+    before = text[max(start - 2, 0):start]
+    after = text[end:end + 2]
+    return (
+        (len(before) == 2 and before[0].isdigit() and before[1] in ",.")
+        or (len(after) == 2 and after[0] in ",." and after[1].isdigit())
+    )
+
+
+@lru_cache(maxsize=1)
+def numeral_table() -> Dict[str, Tuple[float, str]]:
+    """
+    수사 조회 테이블 (처음 한 번 생성)
+
+    Returns:
+        {수사: (값, 종류)} - 종류는 "native", "sino", "half"(반)
+    """
+    table: Dict[str, Tuple[float, str]] = {"반": (0.5, "half")}
+
+    # 한자어: 영 ~ 구천구백구십구
+    table["영"] = table["공"] = (0, "sino")
+    for n in range(1, 10000):
+        word, rest = "", n
+        for value, place in SINO_PLACES:
+            digit, rest = divmod(rest, value)
+            if digit:
+                word += ("" if digit == 1 else SINO_DIGITS[digit]) + place
+        if rest:
+            word += SINO_DIGITS[rest]
+        table[word] = (n, "sino")
+
+    # 고유어: 하나 ~ 아흔아홉 (스무는 단독으로만)
+    for one, words in NATIVE_ONES.items():
+        for word in words:
+            table[word] = (one, "native")
+    for ten, tens in NATIVE_TENS.items():
+        for ten_word in tens:
+            table[ten_word] = (ten, "native")
+            if ten_word == "스무":
+                continue
+            for one, words in NATIVE_ONES.items():
+                for word in words:
+                    table[ten_word + word] = (ten + one, "native")
+
+    return table
 
 
 class NumberParser:
     """한국어 수량 표현 파서"""
 
     def __init__(self):
-        # 한글 숫자
-        self.korean_numbers = {
-            "영": 0, "일": 1, "이": 2, "삼": 3, "사": 4,
-            "오": 5, "육": 6, "칠": 7, "팔": 8, "구": 9,
-            "십": 10, "백": 100, "천": 1000
-        }
-
-        # 특수 표현
-        self.special_numbers = {
-            "반": 0.5,
-            "한": 1,
-            "두": 2,
-            "세": 3,
-            "네": 4,
-            "다섯": 5,
-            "여섯": 6,
-            "일곱": 7,
-            "여덟": 8,
-            "아홉": 9,
-        }
-
-        # 시간 패턴
-        self.hour_patterns = [
-            re.compile(r'(\d+\.?\d*)\s*시간'),
-            re.compile(r'(\d+\.?\d*)\s*h'),
-            re.compile(r'(\d+\.?\d*)\s*hr'),
-        ]
-
-        # 분 패턴
-        self.minute_patterns = [
-            re.compile(r'(\d+)\s*분'),
-            re.compile(r'(\d+)\s*m(?:in)?'),
-        ]
-
-        # 그램 패턴
-        self.gram_patterns = [
-            re.compile(r'(\d+\.?\d*)\s*g(?:ram)?'),
-            re.compile(r'(\d+\.?\d*)\s*그램'),
-        ]
-
-        # kg 패턴
-        self.kg_patterns = [
-            re.compile(r'(\d+\.?\d*)\s*kg'),
-            re.compile(r'(\d+\.?\d*)\s*키로'),
-        ]
+        self.numerals = numeral_table()
+
+        # 수사 글자 집합으로 후보만 잡고 값은 테이블에서 확인 (수사 목록을 나열하는 것보다 빠름)
+        chars = "".join(sorted(set("".join(self.numerals)) | set(SINO_CHARS)))
+        units = "|".join(re.escape(u) for u in sorted(UNITS, key=len, reverse=True))
+
+        # 수량 = 수사 + 단위 (+ 반)
+        # 한글 수사는 앞에 한글이나 숫자가 붙어 있으면 제외 (단어 중간)
+        # 만 뒤에는 띄어 쓴 나머지 자리도 같은 수 ("1만 5천", "만 오천")
+        self.quantity_source = (
+            r'(?:(?P<digits>\d{1,3}(?:,\d{3})+(?:\.\d+)?|\d+(?:\.\d+)?)'
+            rf'(?P<mult>[만천백십](?:[\d{SINO_DIGITS}천백십만]|(?<=만)\s+)*)?'
+            rf'|(?<![가-힣\d])(?P<word>[{chars}]+(?:(?<=만)\s+[{chars}]+)?))'
+            rf'(?P<gap>\s*)(?P<unit>{units})'
+            r'(?:\s*(?P<half>반)(?:(?![가-힣])|(?=정도|쯤|동안|가량|만에|씩)))?'
+        )
+        self.quantity_pattern = re.compile(self.quantity_source)
 
     def parse_hours(self, text: str) -> Optional[float]:
         """
         시간 표현 파싱
 
         Args:
-            text: "5시간", "3.5시간", "반시간" 등
+            text: "5시간", "3.5시간", "반시간", "한시간 반", "열두 시간" 등
 
         Returns:
             시간 (float) 또는 None
@@ -72,28 +144,14 @@ class NumberParser:
         if "반시간" in text or "반 시간" in text:
             return 0.5
 
-        # 숫자 패턴 매칭
-        for pattern in self.hour_patterns:
-            match = pattern.search(text)
-            if match:
-                try:
-                    return float(match.group(1))
-                except ValueError:
-                    pass
-
-        # 한글 숫자 파싱
-        korean_num = self._parse_korean_number(text)
-        if korean_num is not None and "시간" in text:
-            return float(korean_num)
-
-        return None
+        return self._first(text, "hours")
 
     def parse_minutes(self, text: str) -> Optional[int]:
         """
         분 표현 파싱
 
         Args:
-            text: "30분", "반시간" 등
+            text: "30분", "삼십분", "반시간" 등
 
         Returns:
             분 (int) 또는 None
@@ -104,67 +162,149 @@ class NumberParser:
         if "반시간" in text or "반 시간" in text:
             return 30
 
-        # 숫자 패턴 매칭
-        for pattern in self.minute_patterns:
-            match = pattern.search(text)
-            if match:
-                try:
-                    return int(match.group(1))
-                except ValueError:
-                    pass
+        minutes = self._first(text, "minutes")
+        return int(minutes) if minutes is not None else None
 
-        # 한글 숫자
-        korean_num = self._parse_korean_number(text)
-        if korean_num is not None and "분" in text:
-            return int(korean_num)
+    def parse_duration_minutes(self, text: str) -> Optional[float]:
+        """
+        시간 + 분 복합 표현을 분 단위로
 
-        return None
+        Args:
+            text: "1시간 20분", "한시간 반", "삼십분", "반시간" 등
 
-    def parse_grams(self, text: str) -> Optional[float]:
+        Returns:
+            분 (float) 또는 None - 첫 기간 (duration_candidates 참고)
         """
-        그램 표현 파싱
+        candidates = self.duration_candidates(text)
+        return candidates[0] if candidates else None
+
+    def duration_candidates(self, text: str) -> List[float]:
+        """
+        기간으로 볼 수 있는 시간/분 수량 (분 단위, 등장 순서)
+
+        시간 뒤에 바로 이어지는 분은 합산 ("1시간 20분" → 80). 시점 기준 수량
+        ("30분 전에", "10분 늦게")과 시각("2시 30분")은 기간이 아니므로 제외.
 
         Args:
-            text: "100g", "150그램" 등
+            text: "30분 전에 7시간 잤어" → [420.0]
 
         Returns:
-            그램 (float) 또는 None
+            [분, ...] - 둘 이상이면 어느 것이 기록 대상인지 모호함
         """
         text = text.strip()
+        quantities = [q for q in self.extract_quantities(text) if q[1] in ("hours", "minutes")]
+
+        candidates = []
+        i = 0
+        while i < len(quantities):
+            value, unit, (start, end) = quantities[i]
+            i += 1
+            minutes = value * 60 if unit == "hours" else value
+            if unit == "hours" and i < len(quantities):
+                next_value, next_unit, next_span = quantities[i]
+                if next_unit == "minutes" and not text[end:next_span[0]].strip():
+                    minutes += next_value
+                    end = next_span[1]
+                    i += 1
+
+            if OFFSET_PATTERN.match(text, end):
+                continue
+            if unit == "minutes" and CLOCK_PATTERN.search(text, 0, start):
+                continue
+            candidates.append(minutes)
+
+        return candidates
 
-        # 숫자 패턴 매칭
-        for pattern in self.gram_patterns:
-            match = pattern.search(text)
-            if match:
-                try:
-                    return float(match.group(1))
-                except ValueError:
-                    pass
+    def parse_grams(self, text: str) -> Optional[float]:
+        """
+        그램 표현 파싱
 
-        return None
+        Args:
+            text: "100g", "150그램", "삼십 그램" 등
+
+        Returns:
+            그램 (float) 또는 None
+        """
+        return self._first(text.strip(), "grams")
 
     def parse_weight(self, text: str) -> Optional[float]:
         """
         체중 표현 파싱 (kg)
 
         Args:
-            text: "70kg", "65.5키로" 등
+            text: "70kg", "65.5키로", "칠십 키로" 등
 
         Returns:
             kg (float) 또는 None
         """
-        text = text.strip()
+        return self._first(text.strip(), "kg")
 
-        # 숫자 패턴 매칭
-        for pattern in self.kg_patterns:
-            match = pattern.search(text)
-            if match:
-                try:
-                    return float(match.group(1))
-                except ValueError:
-                    pass
+    def extract_quantities(self, text: str) -> List[Tuple[float, str, Tuple[int, int]]]:
+        """
+        문장의 모든 수량 (등장 순서)
 
-        return None
+        Args:
+            text: 입력 문장
+
+        Returns:
+            [(값, 표준 단위, span), ...] - 단위는 hours, minutes, grams, kg, steps 등
+        """
+        results = []
+        for match in self.quantity_pattern.finditer(text):
+            quantity = self.quantity_from_match(match, text)
+            if quantity is not None:
+                results.append((quantity[0], quantity[1], match.span()))
+        return results
+
+    def quantity_from_match(self, match: "re.Match", text: str) -> Optional[Tuple[float, str]]:
+        """
+        quantity_source 매칭 → (값, 표준 단위)
+
+        다른 정규식에 quantity_source를 넣어 쓸 때도 사용 (ClauseSegmenter)
+
+        Returns:
+            (값, 표준 단위) 또는 None (수사와 단위가 맞지 않음)
+        """
+        raw_unit = match.group("unit")
+        unit = UNITS[raw_unit]
+
+        if match.group("digits") is not None:
+            if is_partial_number(text, *match.span("digits")):
+                return None
+            digits = match.group("digits").replace(",", "")
+            if match.group("mult"):
+                value = self._mixed_value(digits + match.group("mult"))
+                if value is None:
+                    return None
+            else:
+                value = float(digits)
+        else:
+            word = match.group("word")
+            found = self._numeral_value("".join(word.split()))
+            if found is None:
+                return None
+            value, kind = found
+
+            if kind == "half" and unit != "hours":
+                return None
+            if kind == "native" and raw_unit in NATIVE_EXCLUDED:
+                return None
+            if kind == "sino":
+                if raw_unit in SINO_EXCLUDED:
+                    return None
+                # 한 글자 한자어 (일~구): "이 시간", "구분", "사분기" 같은 오인 방지
+                if len(word) == 1:
+                    end = match.end("unit")
+                    follower = text[end:end + 1]
+                    if match.group("gap") or raw_unit == "시간" or (
+                        follower and "가" <= follower <= "힣" and follower not in SINO_SINGLE_FOLLOWERS
+                    ):
+                        return None
+
+        if match.group("half") and unit == "hours":
+            value += 0.5
+
+        return float(value), unit
 
     def extract_number_unit_pairs(self, text: str) -> list:
         """
@@ -200,24 +340,69 @@ class NumberParser:
 
         return results
 
-    def _parse_korean_number(self, text: str) -> Optional[int]:
+    def _first(self, text: str, unit: str) -> Optional[float]:
+        """해당 단위의 첫 수량"""
+        for match in self.quantity_pattern.finditer(text):
+            if UNITS[match.group("unit")] != unit:
+                continue
+            quantity = self.quantity_from_match(match, text)
+            if quantity is not None:
+                return quantity[0]
+        return None
+
+    @staticmethod
+    def _mixed_value(text: str) -> Optional[float]:
         """
-        한글 숫자 표현 파싱 (간단한 버전)
+        숫자와 한자어 자릿수가 섞인 수 ("1만5천" → 15000, "2천5백" → 2500, "1.5만" → 15000)
 
-        Args:
-            text: "다섯", "십" 등
+        Returns:
+            값 또는 None (자릿수 순서가 맞지 않는 등 해석 불가)
+        """
+        text = "".join(text.split())
+        if text.count("만") > 1:
+            return None
+        high, _, low = text.partition("만") if "만" in text else ("", "", text)
+
+        values = []
+        for part in ((high, low) if "만" in text else (low,)):
+            total, pending, last_place = 0.0, None, 10000
+            for token in MIXED_TOKEN.findall(part):
+                if token in SINO_PLACE_VALUES:
+                    place = SINO_PLACE_VALUES[token]
+                    if place >= last_place:
+                        return None
+                    total += (1 if pending is None else pending) * place
+                    pending, last_place = None, place
+                elif pending is not None:
+                    return None
+                elif token[0].isdigit():
+                    pending = float(token)
+                elif token in SINO_DIGITS:
+                    pending = SINO_DIGITS.index(token)
+                else:
+                    return None
+            values.append(total + (pending or 0))
+
+        if len(values) == 2:
+            return (values[0] or 1) * 10000 + values[1]
+        return values[0]
+
+    def _numeral_value(self, word: str) -> Optional[Tuple[float, str]]:
+        """
+        수사 값 (테이블 조회, "만"은 앞뒤를 나눠 조합)
 
         Returns:
-            숫자 또는 None
+            (값, 종류) 또는 None
         """
-        # 특수 표현 체크
-        for word, num in self.special_numbers.items():
-            if word in text:
-                return int(num)
-
-        # 기본 한글 숫자
-        for word, num in self.korean_numbers.items():
-            if word in text:
-                return num
+        found = self.numerals.get(word)
+        if found is not None:
+            return found
+
+        if "만" in word:
+            high, low = word.split("만", 1)
+            high_value = self.numerals.get(high, (0, "")) if high else (1, "sino")
+            low_value = self.numerals.get(low, (0, "")) if low else (0, "sino")
+            if high_value[1] == "sino" and low_value[1] == "sino" and high_value[0] > 0:
+                return high_value[0] * 10000 + low_value[0], "sino"
 
         return None
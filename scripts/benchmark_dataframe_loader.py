@@ -0,0 +1,102 @@
+#!/usr/bin/env python3
+"""
+DataFrame 로더 벤치마크 (행별 dict vs 열 단위 구성)
+daily_health 형태의 합성 테이블에서 조회 결과 → DataFrame 변환 시간을 비교
+
+사용법:
+    python scripts/benchmark_dataframe_loader.py                 # 100k rows
+    python scripts/benchmark_dataframe_loader.py --rows 1000000
+"""
+import argparse
+import sqlite3
+import sys
+import time
+from datetime import date, timedelta
+from pathlib import Path
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import numpy as np
+import pandas as pd
+
+from core.database import fetch_dataframe
+
+QUERY = "SELECT id, date, sleep_h, workout_min, protein_g, weight_kg, notes FROM daily_health"
+
+
+def make_table(rows: int, seed: int) -> sqlite3.Connection:
+    """합성 daily_health 테이블 (메모리 SQLite, row_factory=sqlite3.Row)"""
+    rng = np.random.default_rng(seed)
+    conn = sqlite3.connect(":memory:")
+    conn.row_factory = sqlite3.Row
+    conn.execute("""
+        CREATE TABLE daily_health (
+            id INTEGER PRIMARY KEY, date TEXT, sleep_h REAL, workout_min INTEGER,
+            protein_g REAL, weight_kg REAL, notes TEXT
+        )
+    """)
+    start = date(2000, 1, 1)
+    conn.executemany(
+        "INSERT INTO daily_health VALUES (?, ?, ?, ?, ?, ?, ?)",
+        (
+            (i, (start + timedelta(days=i % 9000)).isoformat(),
+             float(sleep), int(workout), float(protein), float(weight),
+             None if i % 3 else f"메모 {i}")
+            for i, (sleep, workout, protein, weight) in enumerate(zip(
+                rng.normal(7, 1, rows).round(1), rng.integers(0, 90, rows),
+                rng.normal(110, 20, rows).round(), rng.normal(70, 3, rows).round(1)
+            ))
+        )
+    )
+    return conn
+
+
+def dict_rows(conn: sqlite3.Connection) -> pd.DataFrame:
+    """기존 방식: 행마다 dict 생성 후 DataFrame"""
+    cursor = conn.execute(QUERY)
+    return pd.DataFrame([dict(row) for row in cursor.fetchall()])
+
+
+def columnar(conn: sqlite3.Connection) -> pd.DataFrame:
+    """fetch_dataframe: cursor.description + 열 단위 구성"""
+    return fetch_dataframe(conn, QUERY)
+
+
+def read_sql(conn: sqlite3.Connection) -> pd.DataFrame:
+    """참고: pandas.read_sql"""
+    return pd.read_sql(QUERY, conn)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Query → DataFrame loader benchmark")
+    parser.add_argument("--rows", type=int, default=100000, help="table size")
+    parser.add_argument("--repeat", type=int, default=5, help="runs per loader (best is reported)")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    print(f"=== DataFrame 로더 벤치마크 ({args.rows:,} rows x 7 cols) ===\n")
+    conn = make_table(args.rows, args.seed)
+
+    loaders = [("dict rows", dict_rows), ("columnar", columnar), ("pd.read_sql", read_sql)]
+    baseline = None
+    frames = {}
+
+    print(f"{'loader':<14}{'best ms':>10}{'mean ms':>10}{'speedup':>10}")
+    print("-" * 44)
+    for name, loader in loaders:
+        timings = []
+        for _ in range(args.repeat):
+            start = time.perf_counter()
+            frames[name] = loader(conn)
+            timings.append((time.perf_counter() - start) * 1000)
+        best = min(timings)
+        baseline = baseline or best
+        print(f"{name:<14}{best:>10.1f}{np.mean(timings):>10.1f}{baseline / best:>9.1f}x")
+
+    pd.testing.assert_frame_equal(frames["dict rows"], frames["columnar"])
+    print("\n✅ dict rows / columnar 결과 동일")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,112 @@
+#!/usr/bin/env python3
+"""
+시작 시간 벤치마크 (python -X importtime)
+진입점별 import 시간을 재고 예산을 넘거나 무거운 모듈을 미리 불러오면 실패
+
+    horcrux  : horcrux.py 메뉴 표시까지
+    web      : interfaces/app.py 첫 화면까지의 모듈 import (streamlit 자체 제외)
+    session  : 채팅 세션 시작 (core.simple_llm, LLM 클라이언트는 첫 호출 때 로드)
+
+사용법:
+    python scripts/benchmark_import_time.py
+    python scripts/benchmark_import_time.py --budget web=150 --repeat 10
+"""
+import argparse
+import ast
+import subprocess
+import sys
+from pathlib import Path
+from typing import Dict, List, Tuple
+
+ROOT = Path(__file__).parent.parent
+
+# 진입점 → 예산 (ms)
+DEFAULT_BUDGETS = {"horcrux": 100, "web": 250, "session": 500}
+
+# 시작 경로에서 불러오면 안 되는 모듈 (첫 사용 시 로드)
+LAZY_MODULES = ("langchain_openai", "langchain_core", "openai", "pandas")
+
+
+def app_imports() -> List[str]:
+    """interfaces/app.py 최상위 import (streamlit 제외)"""
+    tree = ast.parse((ROOT / "interfaces" / "app.py").read_text(encoding="utf-8"))
+    modules = []
+    for node in tree.body:
+        if isinstance(node, ast.Import):
+            modules += [alias.name for alias in node.names]
+        elif isinstance(node, ast.ImportFrom) and node.module:
+            modules.append(node.module)
+    return [m for m in modules if m.split(".")[0] != "streamlit"]
+
+
+def targets() -> Dict[str, str]:
+    return {
+        "horcrux": "import horcrux",
+        "web": "; ".join(f"import {m}" for m in app_imports()),
+        "session": "import core.simple_llm",
+    }
+
+
+def importtime(code: str) -> Tuple[float, List[str]]:
+    """
+    -X importtime 실행
+
+    Returns:
+        (최상위 import 누적 시간 합 ms, 불러온 모듈 목록)
+    """
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        cwd=ROOT, capture_output=True, text=True, check=True
+    )
+    total, modules = 0, []
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, name = line.split("|")
+        modules.append(name.strip())
+        if not name.startswith("  "):  # 최상위 (들여쓰기 = 다른 모듈 안에서 import)
+            total += int(cumulative)
+    return total / 1000, modules
+
+
+def measure(code: str, repeat: int) -> Tuple[float, List[str]]:
+    """인터프리터 기본 시작분을 뺀 import 시간 (최솟값)"""
+    baseline = min(importtime("pass")[0] for _ in range(repeat))
+    runs = [importtime(code) for _ in range(repeat)]
+    best = min(ms for ms, _ in runs)
+    return max(best - baseline, 0.0), runs[0][1]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Startup import-time benchmark with budgets")
+    parser.add_argument("--repeat", type=int, default=5, help="runs per target (best is reported)")
+    parser.add_argument("--budget", action="append", default=[], metavar="NAME=MS",
+                        help="override a budget, e.g. web=150")
+    args = parser.parse_args()
+
+    budgets = dict(DEFAULT_BUDGETS)
+    for item in args.budget:
+        name, ms = item.split("=")
+        budgets[name] = float(ms)
+
+    print(f"=== import 시간 (best of {args.repeat}) ===\n")
+    print(f"{'target':<10}{'ms':>8}{'budget':>8}  eager heavy modules")
+    print("-" * 60)
+
+    failed = False
+    for name, code in targets().items():
+        ms, modules = measure(code, args.repeat)
+        eager = sorted({m.split(".")[0] for m in modules if m.split(".")[0] in LAZY_MODULES})
+        ok = ms <= budgets[name] and not eager
+        failed |= not ok
+        print(f"{name:<10}{ms:>8.1f}{budgets[name]:>8.0f}  {', '.join(eager) or '-'}"
+              f"{'' if ok else '  ❌'}")
+
+    if failed:
+        print("\n❌ 시작 시간 예산 초과")
+        sys.exit(1)
+    print("\n✅ 모든 진입점이 예산 이내")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,106 @@
+#!/usr/bin/env python3
+"""
+의도 매처 벤치마크 (KoreanPatterns.match_intent)
+키워드 스캔 + 결합 정규식 매처를 기존 방식(의도 목록마다 _matches_any, (.+?) 접두 패턴)과 비교
+
+    short : 일반 채팅 입력 (수십 자)
+    long  : 약 2KB 입력 (일기/회고 붙여넣기)
+
+사용법:
+    python scripts/benchmark_intent_matcher.py
+    python scripts/benchmark_intent_matcher.py --seconds 2 --long-bytes 4096
+"""
+import argparse
+import re
+import sys
+import time
+from pathlib import Path
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from parsers.korean_patterns import KoreanPatterns
+
+SHORT_INPUTS = [
+    "5시간 잤어", "어제 7시간 수면", "30분 운동했어", "헬스 1시간", "단백질 120g",
+    "체중 70.5kg", "카드비 계산해야 해", "프로젝트 마무리 하기", "할일 1 완료",
+    "오늘 요약", "레벨", "파이썬 데코레이터에 대해 배웠어", "2시간 공부했어",
+    "독서 습관 추가", "금연 10일째", "점심 뭐 먹지", "그냥 그런 하루였다",
+    "회의 들어가기 전에 커피 한 잔", "내일 비 온대", "고양이 사진 봤다",
+]
+
+FILLER = "아침에 창밖을 보니 비가 조금 내리고 있었고 출근길 버스는 평소보다 붐볐다. "
+
+
+def long_inputs(size: int):
+    """약 size 바이트(UTF-8) 입력 - 의도 키워드는 끝에만 있거나 아예 없음"""
+    body = FILLER * (size // len(FILLER.encode("utf-8")) + 1)
+    body = body.encode("utf-8")[:size].decode("utf-8", errors="ignore")
+    return [body + tail for tail in ("", " 오늘 7시간 잤어", " 보고서 써야 해", " 새로운 걸 배웠어")]
+
+
+class LegacyMatcher:
+    """기존 방식: 우선순위대로 의도별 패턴 목록을 하나씩 search"""
+
+    def __init__(self, patterns: KoreanPatterns):
+        self.lists = [
+            (intent, [self._original(p) for p in getattr(patterns, attr)])
+            for intent, attr in patterns.PRIORITY
+        ]
+
+    @staticmethod
+    def _original(pattern):
+        """'.\\s*X' → 기존 '(.+?)\\s*X'"""
+        if pattern.pattern.startswith(r".\s*"):
+            return re.compile("(.+?)" + pattern.pattern[1:])
+        return pattern
+
+    def match_intent(self, text: str) -> str:
+        text = text.strip()
+        for intent, patterns in self.lists:
+            if any(p.search(text) for p in patterns):
+                return intent
+        return "unknown"
+
+
+def throughput(match, inputs, seconds: float) -> float:
+    """초당 처리 입력 수"""
+    count = 0
+    deadline = time.perf_counter() + seconds
+    start = time.perf_counter()
+    while time.perf_counter() < deadline:
+        for text in inputs:
+            match(text)
+        count += len(inputs)
+    return count / (time.perf_counter() - start)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Intent matcher throughput benchmark")
+    parser.add_argument("--seconds", type=float, default=1.0, help="time per measurement")
+    parser.add_argument("--long-bytes", type=int, default=2048, help="long input size (UTF-8 bytes)")
+    args = parser.parse_args()
+
+    patterns = KoreanPatterns()
+    legacy = LegacyMatcher(patterns)
+    suites = {"short": SHORT_INPUTS, f"long ({args.long_bytes}B)": long_inputs(args.long_bytes)}
+
+    print("=== 의도 매처 벤치마크 ===\n")
+    print(f"{'inputs':<14}{'legacy ops/s':>14}{'compiled ops/s':>16}{'speedup':>10}")
+    print("-" * 54)
+
+    for name, inputs in suites.items():
+        mismatches = [t[:20] for t in inputs if legacy.match_intent(t) != patterns.match_intent(t)]
+        if mismatches:
+            print(f"❌ {name}: 결과 불일치 {mismatches}")
+            sys.exit(1)
+
+        before = throughput(legacy.match_intent, inputs, args.seconds)
+        after = throughput(patterns.match_intent, inputs, args.seconds)
+        print(f"{name:<14}{before:>14,.0f}{after:>16,.0f}{after / before:>9.1f}x")
+
+    print("\n✅ 모든 입력에서 의도 결과 동일")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,93 @@
+#!/usr/bin/env python3
+"""
+한글 수사 엔진 벤치마크 (NumberParser)
+수사 조회 테이블 생성 비용과 수량 추출 처리량/지연(p50/p99)을 입력 종류별로 잰다.
+
+    digits  : 아라비아 숫자 입력 ("7시간 30분", "1,200g")
+    numeral : 한글 수사 입력 ("일곱시간 반", "삼십분", "천오백보")
+    mixed   : 숫자와 자릿수 혼용 ("1만5천보", "만 오천보") - 값까지 확인
+    none    : 수량 없는 입력 (오인 방지 규칙 포함: "이 시간", "구분")
+
+resolved는 수량을 하나라도 찾은 입력 비율 (LLM으로 넘기지 않고 로컬에서 해결).
+
+사용법:
+    python scripts/benchmark_numerals.py
+    python scripts/benchmark_numerals.py --seconds 2
+"""
+import argparse
+import sys
+import time
+from pathlib import Path
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from parsers.evaluation import percentile
+from parsers.number_parser import NumberParser, numeral_table
+
+INPUTS = {
+    "digits": [
+        "7시간 잤어", "어제 7시간 30분 잤어", "30분 운동했어", "헬스 1시간 20분", "단백질 1,200g",
+        "체중 70.5kg", "1만보 걸었어", "물 3잔", "스쿼트 5세트", "2.5시간 공부했어",
+    ],
+    "numeral": [
+        "일곱시간 잤어", "어제 여섯시간 반 잤어", "삼십분 운동했어", "헬스 한시간 반", "단백질 이십 그램",
+        "몸무게 칠십 키로", "천오백보 걸었어", "물 세 잔", "스쿼트 다섯 세트", "두시간반정도 공부했어",
+    ],
+    "mixed": [
+        "1만5천보 걸었어", "만 오천보", "1만 5000보", "3천5백보", "1.5만보",
+    ],
+    "none": [
+        "이 시간에 뭐해", "구분해야 해", "다섯 분이 오셨어", "오늘 요약", "레벨",
+        "보고서 작성해야 해", "점심 뭐 먹지", "사분기 보고서", "그냥 그런 하루였다", "회의 들어가기 전에",
+    ],
+}
+
+# mixed 입력의 기대값 (걸음 수)
+MIXED_EXPECTED = [15000.0, 15000.0, 15000.0, 3500.0, 15000.0]
+
+
+def measure(parser: NumberParser, inputs, seconds: float):
+    """(초당 처리 수, p50 us, p99 us)"""
+    latencies = []
+    deadline = time.perf_counter() + seconds
+    while time.perf_counter() < deadline:
+        for text in inputs:
+            started = time.perf_counter()
+            parser.extract_quantities(text)
+            latencies.append(time.perf_counter() - started)
+    latencies.sort()
+    return len(latencies) / sum(latencies), percentile(latencies, 0.50) * 1e6, percentile(latencies, 0.99) * 1e6
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Korean numeral engine benchmark")
+    parser.add_argument("--seconds", type=float, default=1.0, help="time per input kind")
+    args = parser.parse_args()
+
+    started = time.perf_counter()
+    table = numeral_table()
+    build_ms = (time.perf_counter() - started) * 1000
+    numbers = NumberParser()
+
+    wrong = [
+        text for text, steps in zip(INPUTS["mixed"], MIXED_EXPECTED)
+        if [(v, u) for v, u, _ in numbers.extract_quantities(text)] != [(steps, "steps")]
+    ]
+    if wrong:
+        print(f"❌ 혼용 수 해석 오류: {wrong}")
+        sys.exit(1)
+
+    print("=== 한글 수사 엔진 벤치마크 ===\n")
+    print(f"수사 테이블: {len(table):,}개, 생성 {build_ms:.1f}ms (프로세스당 한 번)\n")
+    print(f"{'inputs':<10}{'ops/s':>11}{'p50 us':>9}{'p99 us':>9}{'resolved':>10}")
+    print("-" * 49)
+
+    for name, inputs in INPUTS.items():
+        ops, p50, p99 = measure(numbers, inputs, args.seconds)
+        resolved = sum(1 for text in inputs if numbers.extract_quantities(text)) / len(inputs)
+        print(f"{name:<10}{ops:>11,.0f}{p50:>9.1f}{p99:>9.1f}{resolved:>10.0%}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,213 @@
+#!/usr/bin/env python3
+"""
+파서 벤치마크 (처리량 + 정확도)
+라벨 코퍼스(tests/test_parsers/corpus/utterances.jsonl)로 파서별 초당 처리량, 호출당 p50/p99,
+의도/엔티티 정확도를 보고한다.
+
+    korean_patterns : 의도 판별 (단일 의도 발화)
+    number_parser   : 수량 엔티티
+    date_parser     : 날짜 (날짜가 없는 발화는 None이 정답)
+    fast_parser     : 정규식 fast path 전체 (신뢰도 미달 = 오답)
+    llm_replay      : 녹화된 LLM 파싱 응답을 SimpleLLM 파싱 경로로 재생 (네트워크 없음)
+
+LLM 응답 녹화 (OPENAI_API_KEY 필요, 기준 시각을 코퍼스 기준일로 고정):
+    python scripts/benchmark_parsers.py --record --limit 300
+
+사용법:
+    python scripts/benchmark_parsers.py
+    python scripts/benchmark_parsers.py --by-tag --repeat 5
+    python scripts/benchmark_parsers.py --parsers korean_patterns fast_parser --json
+"""
+import argparse
+import json
+import os
+import sys
+import time
+from pathlib import Path
+from types import SimpleNamespace
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from parsers.evaluation import (
+    DEFAULT_CORPUS, DEFAULT_RECORDINGS, REFERENCE_DATE,
+    DateSuite, FastParserSuite, IntentSuite, NumberSuite, ParserSuite,
+    evaluate, load_corpus, load_recordings, score_intents,
+)
+
+
+class ReplayLLM:
+    """녹화된 응답을 돌려주는 LLM (invoke 직전에 next_content 지정)"""
+
+    def __init__(self):
+        self.next_content = ""
+
+    def invoke(self, messages):
+        return SimpleNamespace(content=self.next_content)
+
+
+class LLMReplaySuite(ParserSuite):
+    """
+    SimpleLLM LLM 파싱 경로 (프롬프트 생성 → 녹화 응답 → JSON 정규화)
+
+    측정 지연은 로컬 처리분이고, 녹화 당시 네트워크 지연은 recorded_ms로 따로 보고.
+    """
+
+    name = "llm_replay"
+
+    def __init__(self, recordings):
+        self.recordings = recordings
+        self.llm = ReplayLLM()
+        self.agent = make_agent()
+        self.agent.llm = self.llm
+
+    def applies(self, item):
+        return item["text"] in self.recordings
+
+    def run(self, item):
+        self.llm.next_content = self.recordings[item["text"]]["content"]
+        return self.agent._parse_with_llm(item["text"])
+
+    def score(self, item, output):
+        return score_intents(item, output.get("intents") if output.get("success") else None)
+
+    def close(self):
+        self.agent.close()
+        self.agent.db.close()
+
+
+def make_agent():
+    """RAG 없는 SimpleLLM (인메모리 DB)"""
+    from core.database import Database
+    from core.simple_llm import SimpleLLM
+
+    os.environ.pop("SUPABASE_URL", None)
+    os.environ.setdefault("OPENAI_API_KEY", "sk-replay")
+    database = Database(":memory:")
+    database.connect()
+    database.init_schema()
+
+    agent = SimpleLLM(database)
+    if agent.rag_writer:
+        agent.rag_writer.close()
+    agent.rag = None
+    agent.rag_writer = None
+    return agent
+
+
+def record(items, output: Path, limit: int):
+    """실제 LLM으로 파싱 응답 녹화 (현재 시각은 REFERENCE_DATE로 고정)"""
+    if not os.getenv("OPENAI_API_KEY"):
+        print("❌ OPENAI_API_KEY가 필요합니다")
+        sys.exit(1)
+
+    from core import simple_llm
+    from core.prompt_usage import token_usage
+
+    simple_llm.datetime = SimpleNamespace(now=lambda: REFERENCE_DATE)
+    agent = make_agent()
+    existing = load_recordings(output)
+
+    todo = [item for item in items if item["text"] not in existing][:limit]
+    print(f"🎙️  {len(todo)}개 녹화 중 (기존 {len(existing)}개)...")
+
+    with open(output, "a", encoding="utf-8") as f:
+        for i, item in enumerate(todo, 1):
+            started = time.perf_counter()
+            response = agent.llm.invoke(agent._parse_messages(item["text"]))
+            f.write(json.dumps({
+                "text": item["text"],
+                "content": response.content,
+                "latency_ms": round((time.perf_counter() - started) * 1000, 1),
+                "usage": token_usage(response),
+            }, ensure_ascii=False) + "\n")
+            if i % 50 == 0:
+                print(f"   {i}/{len(todo)}")
+
+    agent.close()
+    print(f"✅ 녹화 완료 → {output}")
+
+
+def recorded_latency(recordings):
+    """녹화 당시 LLM 호출 지연 (p50, p99 ms)"""
+    values = sorted(r["latency_ms"] for r in recordings.values() if r.get("latency_ms") is not None)
+    if not values:
+        return None
+    pick = lambda q: values[min(len(values) - 1, int(round(q * (len(values) - 1))))]
+    return pick(0.50), pick(0.99)
+
+
+def fmt(value, pattern):
+    return "-" if value is None else format(value, pattern)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Parser throughput and accuracy benchmark")
+    parser.add_argument("--corpus", type=Path, default=DEFAULT_CORPUS)
+    parser.add_argument("--recordings", type=Path, default=DEFAULT_RECORDINGS)
+    parser.add_argument("--parsers", nargs="+",
+                        default=["korean_patterns", "number_parser", "date_parser", "fast_parser", "llm_replay"])
+    parser.add_argument("--repeat", type=int, default=1, help="run the corpus N times for timing")
+    parser.add_argument("--by-tag", action="store_true", help="accuracy breakdown by corpus tag")
+    parser.add_argument("--json", action="store_true", help="print raw results as JSON")
+    parser.add_argument("--record", action="store_true", help="record LLM parse responses (network)")
+    parser.add_argument("--limit", type=int, default=500, help="max utterances to record")
+    args = parser.parse_args()
+
+    items = load_corpus(args.corpus)
+    if args.record:
+        record(items, args.recordings, args.limit)
+        return
+
+    from core.config import config
+    suites = {
+        "korean_patterns": IntentSuite,
+        "number_parser": NumberSuite,
+        "date_parser": DateSuite,
+        "fast_parser": lambda: FastParserSuite(config.get("llm.fast_path.min_confidence", 0.85)),
+    }
+
+    recordings = load_recordings(args.recordings)
+    results = []
+    for name in args.parsers:
+        if name == "llm_replay":
+            if not recordings:
+                print(f"ℹ️  llm_replay 건너뜀: 녹화 없음 ({args.recordings}, --record로 생성)\n")
+                continue
+            suite = LLMReplaySuite(recordings)
+        else:
+            suite = suites[name]()
+
+        result = evaluate(suite, items * args.repeat)
+        if isinstance(suite, LLMReplaySuite):
+            result["recorded_ms"] = recorded_latency(recordings)
+            suite.close()
+        results.append(result)
+
+    if args.json:
+        print(json.dumps(results, ensure_ascii=False, indent=2))
+        return
+
+    print(f"=== 파서 벤치마크 ({len(items):,}개 발화, 기준일 {REFERENCE_DATE:%Y-%m-%d}) ===\n")
+    print(f"{'parser':<17}{'items':>7}{'ops/s':>11}{'p50 us':>9}{'p99 us':>9}{'intent':>9}{'entity':>9}")
+    print("-" * 71)
+    for r in results:
+        print(f"{r['parser']:<17}{r['items'] // args.repeat:>7}{r['ops_per_sec']:>11,.0f}"
+              f"{r['p50_us']:>9.1f}{r['p99_us']:>9.1f}"
+              f"{fmt(r['intent_accuracy'], '.1%'):>9}{fmt(r['entity_accuracy'], '.1%'):>9}")
+
+    for r in results:
+        if r.get("recorded_ms"):
+            p50, p99 = r["recorded_ms"]
+            print(f"\n{r['parser']}: 녹화 당시 LLM 호출 p50 {p50:.0f}ms / p99 {p99:.0f}ms")
+
+    if args.by_tag:
+        for r in results:
+            print(f"\n[{r['parser']}] 태그별 정확도")
+            for tag, t in r["by_tag"].items():
+                print(f"  {tag:<12}{t['items'] // args.repeat:>6}"
+                      f"{fmt(t['intent_accuracy'], '.1%'):>9}{fmt(t['entity_accuracy'], '.1%'):>9}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,103 @@
+#!/usr/bin/env python3
+"""
+벡터 인덱스 벤치마크 (recall vs latency)
+합성 코퍼스에서 IVF 근사 검색을 정확 검색(flat)과 비교
+
+사용법:
+    python scripts/benchmark_vector_index.py                  # 100k x 256
+    python scripts/benchmark_vector_index.py --size 1000000   # 1M
+    python scripts/benchmark_vector_index.py --dims 1536 --size 200000
+"""
+import argparse
+import sys
+import time
+from pathlib import Path
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import numpy as np
+
+from core.vector_index import VectorIndex, IVFVectorIndex
+
+
+def make_corpus(size: int, dims: int, clusters: int, seed: int) -> np.ndarray:
+    """클러스터 구조가 있는 합성 임베딩 (실제 대화 임베딩과 유사한 분포)"""
+    rng = np.random.default_rng(seed)
+    centers = rng.normal(size=(clusters, dims)).astype(np.float32)
+    labels = rng.integers(0, clusters, size)
+
+    corpus = np.empty((size, dims), dtype=np.float32)
+    for lo in range(0, size, 100000):
+        hi = min(lo + 100000, size)
+        corpus[lo:hi] = centers[labels[lo:hi]] + 0.6 * rng.normal(size=(hi - lo, dims))
+    return corpus
+
+
+def timed_search(index, queries, top_k, **kwargs):
+    """질의별 지연 측정 (ms)"""
+    latencies = []
+    results = []
+    for query in queries:
+        start = time.perf_counter()
+        results.append(index.search_batch([query], top_k, **kwargs)[0])
+        latencies.append((time.perf_counter() - start) * 1000)
+    return results, np.array(latencies)
+
+
+def recall(exact, approx, top_k):
+    """recall@k (정확 검색 결과 대비)"""
+    hits = [
+        len({r for r, _ in e} & {r for r, _ in a}) / top_k
+        for e, a in zip(exact, approx)
+    ]
+    return float(np.mean(hits))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Vector index recall/latency benchmark")
+    parser.add_argument("--size", type=int, default=100000, help="corpus size")
+    parser.add_argument("--dims", type=int, default=256, help="embedding dimensions")
+    parser.add_argument("--queries", type=int, default=200, help="number of queries")
+    parser.add_argument("--top-k", type=int, default=10)
+    parser.add_argument("--nlist", type=int, default=None, help="IVF cells (default sqrt(N))")
+    parser.add_argument("--nprobe", type=int, nargs="+", default=[1, 4, 8, 16, 32, 64])
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    print(f"=== 벡터 인덱스 벤치마크 ({args.size:,} x {args.dims}, top-{args.top_k}) ===\n")
+
+    corpus = make_corpus(args.size, args.dims, clusters=max(16, args.size // 2000), seed=args.seed)
+    rng = np.random.default_rng(args.seed + 1)
+    picks = rng.choice(args.size, args.queries, replace=False)
+    queries = corpus[picks] + 0.3 * rng.normal(size=(args.queries, args.dims)).astype(np.float32)
+    items = ((i, v, "user") for i, v in enumerate(corpus))
+
+    start = time.perf_counter()
+    flat = VectorIndex(args.dims, initial_capacity=args.size)
+    flat.build((i, v, "user") for i, v in enumerate(corpus))
+    print(f"flat build: {time.perf_counter() - start:.2f}s")
+
+    start = time.perf_counter()
+    ivf = IVFVectorIndex(args.dims, nlist=args.nlist, initial_capacity=args.size)
+    ivf.build(items)
+    print(f"ivf  build: {time.perf_counter() - start:.2f}s (nlist={ivf.nlist})\n")
+
+    exact, flat_ms = timed_search(flat, queries, args.top_k)
+
+    print(f"{'index':<14}{'recall@k':>10}{'p50 ms':>10}{'p99 ms':>10}{'speedup':>10}")
+    print("-" * 54)
+    flat_p50 = np.percentile(flat_ms, 50)
+    print(f"{'flat':<14}{1.0:>10.3f}{flat_p50:>10.2f}{np.percentile(flat_ms, 99):>10.2f}{1.0:>9.1f}x")
+
+    for nprobe in args.nprobe:
+        if nprobe > ivf.nlist:
+            continue
+        approx, ivf_ms = timed_search(ivf, queries, args.top_k, nprobe=nprobe)
+        p50 = np.percentile(ivf_ms, 50)
+        print(f"{'ivf/' + str(nprobe):<14}{recall(exact, approx, args.top_k):>10.3f}"
+              f"{p50:>10.2f}{np.percentile(ivf_ms, 99):>10.2f}{flat_p50 / p50:>9.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,287 @@
+#!/usr/bin/env python3
+"""
+파서 평가 코퍼스 생성 (라벨이 달린 한국어 발화)
+템플릿 × 날짜 표현 × 수량 × 표기(아라비아 숫자 / 한글 수사)를 조합해
+tests/test_parsers/corpus/utterances.jsonl을 만든다. 시드가 고정이라 항상 같은 파일.
+
+라벨은 템플릿에서 정해지므로 파서 출력과 무관 (파서 정확도 측정용).
+날짜 라벨은 parsers.evaluation.REFERENCE_DATE 기준.
+
+    {"text": "어제 7시간 자고 30분 운동했어",
+     "intents": [{"intent": "sleep", "entities": {"sleep_hours": 7.0, "date": "2025-10-16"}},
+                 {"intent": "workout", "entities": {"workout_minutes": 30, "date": "2025-10-16"}}],
+     "tags": ["compound", "date"]}
+
+사용법:
+    python scripts/build_parser_corpus.py
+    python scripts/build_parser_corpus.py --per-template 40 --seed 1
+"""
+import argparse
+import json
+import random
+import sys
+from datetime import timedelta
+from pathlib import Path
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from parsers.evaluation import DEFAULT_CORPUS, REFERENCE_DATE
+
+# (표현, 기준일로부터 일수) - None이면 날짜 없음
+DATES = [
+    ("", None), ("", None), ("", None),
+    ("오늘 ", 0), ("어제 ", -1), ("그제 ", -2), ("그저께 ", -2),
+    ("2일 전에 ", -2), ("3일 전 ", -3), ("1주 전에 ", -7),
+    ("10월 3일 ", "2025-10-03"), ("9월 28일에 ", "2025-09-28"),
+]
+
+# 한글 수사 (표기, 값)
+NATIVE_HOURS = [("한", 1), ("두", 2), ("세", 3), ("네", 4), ("다섯", 5), ("여섯", 6),
+                ("일곱", 7), ("여덟", 8), ("아홉", 9), ("열", 10)]
+SINO_MINUTES = [("십", 10), ("이십", 20), ("삼십", 30), ("사십", 40), ("오십", 50),
+                ("십오", 15), ("이십오", 25), ("사십오", 45)]
+
+TASKS = ["카드비 납부", "보고서 작성", "장보기 목록 정리", "병원 예약", "이메일 답장",
+         "발표 자료 준비", "세탁소 들르기", "우편물 발송", "블로그 글 작성", "방 청소"]
+TOPICS = ["파이썬 데코레이터", "SQL 윈도우 함수", "벡터 검색", "한국사 연표", "기타 코드 진행"]
+WORKOUTS = ["운동", "헬스", "러닝", "조깅", "수영"]
+
+
+def date_label(offset):
+    if offset is None:
+        return None
+    if isinstance(offset, str):
+        return offset
+    return (REFERENCE_DATE + timedelta(days=offset)).strftime("%Y-%m-%d")
+
+
+def with_date(entities, date):
+    if date:
+        entities = dict(entities, date=date)
+    return entities
+
+
+def single(text, intent, entities, tags):
+    return {"text": text, "intents": [{"intent": intent, "entities": entities}], "tags": tags}
+
+
+# ========================================
+# 템플릿 (rng → 발화 하나)
+# ========================================
+
+def sleep_digits(rng):
+    prefix, offset = rng.choice(DATES)
+    date = date_label(offset)
+    h = rng.randint(3, 10)
+    form = rng.randrange(4)
+    if form == 0:
+        return single(f"{prefix}{h}시간 잤어", "sleep", with_date({"sleep_hours": float(h)}, date), ["sleep"])
+    if form == 1:
+        m = rng.choice([10, 15, 20, 30, 40, 45])
+        return single(f"{prefix}{h}시간 {m}분 잤어", "sleep",
+                      with_date({"sleep_hours": round(h + m / 60, 2)}, date), ["sleep"])
+    if form == 2:
+        return single(f"{prefix}{h}시간 수면", "sleep", with_date({"sleep_hours": float(h)}, date), ["sleep"])
+    half = h + 0.5
+    return single(f"{prefix}{half}시간 잤다", "sleep", with_date({"sleep_hours": half}, date), ["sleep"])
+
+
+def sleep_numeral(rng):
+    prefix, offset = rng.choice(DATES)
+    date = date_label(offset)
+    word, h = rng.choice(NATIVE_HOURS[2:])
+    if rng.random() < 0.5:
+        return single(f"{prefix}{word}시간 잤어", "sleep",
+                      with_date({"sleep_hours": float(h)}, date), ["sleep", "numeral"])
+    return single(f"{prefix}{word}시간 반 잤어", "sleep",
+                  with_date({"sleep_hours": h + 0.5}, date), ["sleep", "numeral"])
+
+
+def workout_digits(rng):
+    prefix, offset = rng.choice(DATES)
+    date = date_label(offset)
+    kind = rng.choice(WORKOUTS)
+    form = rng.randrange(4)
+    if form == 0:
+        m = rng.choice([15, 20, 30, 40, 45, 50, 60, 90])
+        return single(f"{prefix}{m}분 {kind}했어", "workout", with_date({"workout_minutes": m}, date), ["workout"])
+    if form == 1:
+        m = rng.choice([20, 30, 40, 45])
+        return single(f"{prefix}{kind} {m}분", "workout", with_date({"workout_minutes": m}, date), ["workout"])
+    if form == 2:
+        h = rng.randint(1, 2)
+        return single(f"{prefix}{kind} {h}시간", "workout", with_date({"workout_minutes": h * 60}, date), ["workout"])
+    h, m = rng.randint(1, 2), rng.choice([10, 20, 30])
+    return single(f"{prefix}{kind} {h}시간 {m}분 했어", "workout",
+                  with_date({"workout_minutes": h * 60 + m}, date), ["workout"])
+
+
+def workout_numeral(rng):
+    prefix, offset = rng.choice(DATES)
+    date = date_label(offset)
+    kind = rng.choice(WORKOUTS)
+    if rng.random() < 0.5:
+        word, m = rng.choice(SINO_MINUTES)
+        return single(f"{prefix}{word}분 {kind}했어", "workout",
+                      with_date({"workout_minutes": m}, date), ["workout", "numeral"])
+    word, h = rng.choice(NATIVE_HOURS[:2])
+    return single(f"{prefix}{kind} {word}시간 반 했어", "workout",
+                  with_date({"workout_minutes": int(h * 60 + 30)}, date), ["workout", "numeral"])
+
+
+def protein(rng):
+    prefix, offset = rng.choice(DATES)
+    date = date_label(offset)
+    g = rng.choice([20, 25, 30, 40, 60, 80, 100, 120, 150])
+    form = rng.randrange(3)
+    if form == 0:
+        text = f"{prefix}단백질 {g}g 먹었어"
+    elif form == 1:
+        text = f"{prefix}프로틴 {g}그램"
+    else:
+        text = f"{prefix}{g}g 단백질 섭취"
+    return single(text, "protein", with_date({"protein_grams": float(g)}, date), ["protein"])
+
+
+def weight(rng):
+    prefix, offset = rng.choice(DATES)
+    date = date_label(offset)
+    kg = round(rng.uniform(50, 95), 1)
+    form = rng.randrange(3)
+    if form == 0:
+        text = f"{prefix}체중 {kg}kg"
+    elif form == 1:
+        text = f"{prefix}몸무게 {kg}키로"
+    else:
+        text = f"{prefix}체중 {kg}"
+    return single(text, "weight", with_date({"weight_kg": kg}, date), ["weight"])
+
+
+def study(rng):
+    prefix, offset = rng.choice(DATES)
+    date = date_label(offset)
+    h = rng.choice([1, 2, 3, 4, 1.5, 2.5])
+    if rng.random() < 0.5:
+        text = f"{prefix}{h}시간 공부했어"
+    else:
+        text = f"{prefix}공부 {h}시간"
+    return single(text, "study", with_date({"study_hours": float(h)}, date), ["study"])
+
+
+def summary(rng):
+    word, offset = rng.choice([("오늘", 0), ("어제", -1)])
+    verb = rng.choice(["요약", "정리", "요약해줘", "정리 좀"])
+    return single(f"{word} {verb}", "summary", {"date": date_label(offset)}, ["summary", "date"])
+
+
+def progress(rng):
+    text = rng.choice(["레벨", "내 레벨 알려줘", "경험치 얼마나 돼", "진행도 보여줘", "지금 몇 레벨이야"])
+    return single(text, "progress", {}, ["progress"])
+
+
+def task_add(rng):
+    title = rng.choice(TASKS)
+    form = rng.randrange(3)
+    if form == 0:
+        text = f"{title}해야 해"
+    elif form == 1:
+        text = f"{title} 하기"
+    else:
+        text = f"할일 {title}"
+    return single(text, "task_add", {"task_title": title}, ["task"])
+
+
+def task_complete(rng):
+    n = rng.randint(1, 30)
+    text = rng.choice([f"할일 {n} 완료", f"할일 {n} 끝", f"{n} 완료"])
+    return single(text, "task_complete", {"task_id": n}, ["task"])
+
+
+def learning_log(rng):
+    topic = rng.choice(TOPICS)
+    verb = rng.choice(["배웠어", "알게 됐어", "이해했어", "에 대해 배웠어"])
+    sep = "" if verb.startswith("에") else " "
+    return single(f"{topic}{sep}{verb}", "learning_log", {"content": topic}, ["learning"])
+
+
+def compound(rng):
+    prefix, offset = rng.choice(DATES)
+    date = date_label(offset)
+    h = rng.randint(5, 9)
+    form = rng.randrange(3)
+    if form == 0:
+        m = rng.choice([20, 30, 40, 60])
+        kind = rng.choice(WORKOUTS[:3])
+        return {
+            "text": f"{prefix}{h}시간 자고 {m}분 {kind}했어",
+            "intents": [
+                {"intent": "sleep", "entities": with_date({"sleep_hours": float(h)}, date)},
+                {"intent": "workout", "entities": with_date({"workout_minutes": m}, date)},
+            ],
+            "tags": ["compound"] + (["date"] if date else []),
+        }
+    if form == 1:
+        g, kg = rng.choice([80, 100, 120, 1200]), round(rng.uniform(55, 90), 1)
+        g_text = f"{g:,}"
+        return {
+            "text": f"{prefix}단백질 {g_text}g, 체중 {kg}kg",
+            "intents": [
+                {"intent": "protein", "entities": with_date({"protein_grams": float(g)}, date)},
+                {"intent": "weight", "entities": with_date({"weight_kg": kg}, date)},
+            ],
+            "tags": ["compound"] + (["date"] if date else []),
+        }
+    title = rng.choice(TASKS)
+    return {
+        "text": f"{prefix}{h}시간 잤고 그리고 {title}해야 해",
+        "intents": [
+            {"intent": "sleep", "entities": with_date({"sleep_hours": float(h)}, date)},
+            {"intent": "task_add", "entities": {"task_title": title}},
+        ],
+        "tags": ["compound"] + (["date"] if date else []),
+    }
+
+
+TEMPLATES = {
+    sleep_digits: 3, sleep_numeral: 1, workout_digits: 3, workout_numeral: 1,
+    protein: 2, weight: 2, study: 2, summary: 1, progress: 1,
+    task_add: 2, task_complete: 1, learning_log: 1, compound: 3,
+}
+
+
+def build(per_template: int, seed: int):
+    """가중치 × per_template 개씩 생성 (중복 문장 제거, 순서 고정)"""
+    rng = random.Random(seed)
+    seen, items = set(), []
+    for template, weight_ in TEMPLATES.items():
+        for _ in range(weight_ * per_template):
+            item = template(rng)
+            if item["text"] in seen:
+                continue
+            seen.add(item["text"])
+            for intent in item["intents"]:
+                if intent["entities"].get("date") is not None and "date" not in item["tags"]:
+                    item["tags"].append("date")
+            items.append(item)
+    return items
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Build the labeled parser corpus")
+    parser.add_argument("--per-template", type=int, default=200, help="utterances per template weight")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--output", type=Path, default=DEFAULT_CORPUS)
+    args = parser.parse_args()
+
+    items = build(args.per_template, args.seed)
+    args.output.parent.mkdir(parents=True, exist_ok=True)
+    with open(args.output, "w", encoding="utf-8") as f:
+        for item in items:
+            f.write(json.dumps(item, ensure_ascii=False) + "\n")
+
+    print(f"✅ {len(items):,}개 발화 → {args.output}")
+
+
+if __name__ == "__main__":
+    main()
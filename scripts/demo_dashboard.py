@@ -119,33 +119,27 @@ def demo_dashboard():
     print("\n📈 주간 트렌드 차트:")
     print("-" * 60)
 
-    cursor = db.conn.cursor()
     week_ago = (datetime.now() - timedelta(days=7)).strftime("%Y-%m-%d")
 
-    cursor.execute("""
+    trend = db.query_df("""
         SELECT date, sleep_h, workout_min
         FROM daily_health
         WHERE date >= ?
         ORDER BY date
     """, (week_ago,))
+    trend = trend.fillna({"sleep_h": 0, "workout_min": 0}).astype({"sleep_h": "float64", "workout_min": "int64"})
 
-    rows = cursor.fetchall()
-
-    if rows:
+    if not trend.empty:
         print("\n수면 시간 (시간):")
         print("  날짜        수면   목표(7h)")
-        for row in rows:
-            date = row['date']
-            sleep = row['sleep_h'] or 0
+        for date, sleep in zip(trend["date"], trend["sleep_h"]):
             bar = "█" * int(sleep * 2)
             status = "✓" if sleep >= 7 else "⚠"
             print(f"  {date}  {sleep:4.1f}h  {bar} {status}")
 
         print("\n운동 시간 (분):")
         print("  날짜        운동   목표(30분)")
-        for row in rows:
-            date = row['date']
-            workout = row['workout_min'] or 0
+        for date, workout in zip(trend["date"], trend["workout_min"]):
             bar = "█" * int(workout / 10)
             status = "✓" if workout >= 30 else "⚠"
             print(f"  {date}  {workout:3}분  {bar} {status}")
@@ -194,37 +188,30 @@ def demo_analytics():
     print("\n💎 경험치 획득 내역 (최근 10개):")
     print("-" * 60)
 
-    cursor = db.conn.cursor()
-    cursor.execute("""
+    exp_logs = db.query_df("""
         SELECT date, action_type, exp_gained, description
         FROM exp_logs
         ORDER BY created_at DESC
         LIMIT 10
     """)
 
-    exp_logs = cursor.fetchall()
-
-    if exp_logs:
+    if not exp_logs.empty:
         print(f"{'날짜':<12} {'행동':<20} {'XP':>5}  설명")
         print("-" * 60)
-        for row in exp_logs:
-            print(f"{row['date']:<12} {row['action_type']:<20} {row['exp_gained']:>5}  {row['description']}")
+        for row in exp_logs.itertuples(index=False):
+            print(f"{row.date:<12} {row.action_type:<20} {row.exp_gained:>5}  {row.description}")
 
         # 타입별 합계
         print("\n💡 경험치 획득 비율:")
-        cursor.execute("""
+        type_stats = db.query_df("""
             SELECT action_type, SUM(exp_gained) as total
             FROM exp_logs
             GROUP BY action_type
             ORDER BY total DESC
         """)
+        total_exp = type_stats["total"].sum()
 
-        type_stats = cursor.fetchall()
-        total_exp = sum(row['total'] for row in type_stats)
-
-        for row in type_stats:
-            action = row['action_type']
-            exp = row['total']
+        for action, exp in zip(type_stats["action_type"], type_stats["total"]):
             percent = (exp / total_exp * 100) if total_exp > 0 else 0
             bar = "█" * int(percent / 5)
             print(f"  {action:<20} {exp:>5} XP  {bar} {percent:.1f}%")
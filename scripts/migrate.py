@@ -0,0 +1,61 @@
+#!/usr/bin/env python3
+"""
+스키마 마이그레이션 적용 (SQLite 또는 Supabase)
+
+사용법:
+    python scripts/migrate.py            # 밀린 마이그레이션 적용
+    python scripts/migrate.py --status   # 현재 버전 / 대기 중인 마이그레이션만 표시
+"""
+import argparse
+import sys
+from pathlib import Path
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from dotenv import load_dotenv
+
+from core.database import Database
+from core.migrations import MigrationRunner
+
+# Load environment variables
+load_dotenv()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Apply pending schema migrations")
+    parser.add_argument("--status", action="store_true", help="show pending migrations only")
+    args = parser.parse_args()
+
+    db = Database()
+    db.connect()
+    runner = MigrationRunner(db)
+
+    try:
+        pending = runner.pending()
+        print(f"🔗 {db.db_type} (latest v{runner.latest_version})")
+
+        if not pending:
+            print("✅ 스키마 최신 상태")
+            return
+
+        for migration in pending:
+            print(f"  - {migration.version:03d} {migration.name}")
+
+        if args.status:
+            return
+
+        applied = db.migrate()
+        if applied:
+            db.seed_initial_data()
+        print(f"✅ {len(applied)}개 마이그레이션 적용")
+
+    except Exception as e:
+        print(f"❌ Migration failed: {e}")
+        sys.exit(1)
+    finally:
+        db.close()
+
+
+if __name__ == "__main__":
+    main()
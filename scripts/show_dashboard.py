@@ -92,24 +92,20 @@ print(f"📝 할일:    {tasks['done']}/{tasks['total']}         ({tasks['done']
 print("\n📈 주간 트렌드:")
 print("-" * 60)
 
-cursor = db.conn.cursor()
 week_ago = (datetime.now() - timedelta(days=7)).strftime("%Y-%m-%d")
 
-cursor.execute("""
+trend = db.query_df("""
     SELECT date, sleep_h, workout_min
     FROM daily_health
     WHERE date >= ?
     ORDER BY date
 """, (week_ago,))
+trend = trend.fillna({"sleep_h": 0, "workout_min": 0}).astype({"sleep_h": "float64", "workout_min": "int64"})
 
-rows = cursor.fetchall()
-
-if rows:
+if not trend.empty:
     print("\n수면 시간 추이 (목표: 7시간)")
     print("  날짜        수면")
-    for row in rows:
-        date = row['date']
-        sleep = row['sleep_h'] or 0
+    for date, sleep in zip(trend["date"], trend["sleep_h"]):
         bar_len = int(sleep * 5)  # 1시간 = 5칸
         bar = "█" * bar_len
         status = "✓" if sleep >= 7 else "⚠"
@@ -117,9 +113,7 @@ if rows:
 
     print("\n운동 시간 추이 (목표: 30분)")
     print("  날짜        운동")
-    for row in rows:
-        date = row['date']
-        workout = row['workout_min'] or 0
+    for date, workout in zip(trend["date"], trend["workout_min"]):
         bar_len = int(workout / 3)  # 3분 = 1칸
         bar = "█" * bar_len
         status = "✓" if workout >= 30 else "⚠"
@@ -162,37 +156,31 @@ print(f"완료한 할일:   {stats['completed_tasks']}개")
 print("\n💎 경험치 획득 내역 (최근 10개):")
 print("-" * 60)
 
-cursor.execute("""
+exp_logs = db.query_df("""
     SELECT date, action_type, exp_gained, description
     FROM exp_logs
     ORDER BY created_at DESC
     LIMIT 10
 """)
 
-exp_logs = cursor.fetchall()
-
-if exp_logs:
+if not exp_logs.empty:
     print(f"{'날짜':<12} {'행동':<20} {'XP':>5}  설명")
     print("-" * 60)
-    for row in exp_logs:
-        desc = row['description'][:30] if row['description'] else ""
-        print(f"{row['date']:<12} {row['action_type']:<20} {row['exp_gained']:>5}  {desc}")
+    exp_logs["description"] = exp_logs["description"].fillna("").str[:30]
+    for row in exp_logs.itertuples(index=False):
+        print(f"{row.date:<12} {row.action_type:<20} {row.exp_gained:>5}  {row.description}")
 
     # 타입별 합계
     print("\n💡 경험치 획득 비율:")
-    cursor.execute("""
+    type_stats = db.query_df("""
         SELECT action_type, SUM(exp_gained) as total
         FROM exp_logs
         GROUP BY action_type
         ORDER BY total DESC
     """)
+    total_exp = type_stats["total"].sum()
 
-    type_stats = cursor.fetchall()
-    total_exp = sum(row['total'] for row in type_stats)
-
-    for row in type_stats:
-        action = row['action_type']
-        exp = row['total']
+    for action, exp in zip(type_stats["action_type"], type_stats["total"]):
         percent = (exp / total_exp * 100) if total_exp > 0 else 0
         bar_len = int(percent / 5)
         bar = "█" * bar_len
@@ -204,6 +192,7 @@ if exp_logs:
 print_header("🏆 업적 갤러리")
 
 # 모든 업적
+cursor = db.conn.cursor()
 cursor.execute("SELECT * FROM achievements")
 achievements = cursor.fetchall()
 
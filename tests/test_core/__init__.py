@@ -0,0 +1,3 @@
+"""
+Core 모듈 테스트
+"""
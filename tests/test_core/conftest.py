@@ -0,0 +1,39 @@
+"""
+core 테스트 공용 fixture
+"""
+import pytest
+from core.database import Database
+
+
+@pytest.fixture
+def empty_db(monkeypatch):
+    """스키마 없는 SQLite 메모리 DB (SUPABASE_URL 무시)"""
+    monkeypatch.delenv("SUPABASE_URL", raising=False)
+    database = Database(":memory:")
+    database.connect()
+    yield database
+    database.close()
+
+
+@pytest.fixture
+def db(empty_db):
+    """최신 스키마의 SQLite 메모리 DB (연결 하나 공유)"""
+    empty_db.init_schema()
+    return empty_db
+
+
+@pytest.fixture
+def file_db(tmp_path, monkeypatch):
+    """최신 스키마의 파일 SQLite DB (스레드별 연결)"""
+    monkeypatch.delenv("SUPABASE_URL", raising=False)
+    database = Database(str(tmp_path / "horcrux.db"))
+    database.connect()
+    database.init_schema()
+    yield database
+    database.close()
+
+
+@pytest.fixture
+def api_key(monkeypatch):
+    """OpenAI 클라이언트 생성용 테스트 키 (API 호출은 각 테스트의 대역이 처리)"""
+    monkeypatch.setenv("OPENAI_API_KEY", "sk-test")
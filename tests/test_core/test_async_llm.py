@@ -0,0 +1,176 @@
+"""
+AsyncSimpleLLM (비동기 처리 파이프라인) 테스트
+"""
+import asyncio
+import json
+import time
+from types import SimpleNamespace
+
+import pytest
+from core.async_llm import AsyncSimpleLLM, create_agent
+from core.async_runtime import event_loop
+from core.embeddings import EmbeddingCache
+from core.simple_llm import SimpleLLM
+
+
+class Timeline:
+    """작업 시작/끝 시각 기록"""
+
+    def __init__(self):
+        self.spans = {}
+
+    async def span(self, name, seconds):
+        start = time.perf_counter()
+        await asyncio.sleep(seconds)
+        self.spans[name] = (start, time.perf_counter())
+
+    def overlap(self, a, b):
+        (a0, a1), (b0, b1) = self.spans[a], self.spans[b]
+        return a0 < b1 and b0 < a1
+
+
+class FakeAsyncLLM:
+    """ChatOpenAI 대역 (첫 호출은 파싱 JSON, 그다음은 응답)"""
+
+    def __init__(self, timeline, parsed, answer="응답", delay=0.05):
+        self.timeline = timeline
+        self.parsed = parsed
+        self.answer = answer
+        self.delay = delay
+        self.calls = 0
+
+    async def ainvoke(self, messages):
+        self.calls += 1
+        name = "parse" if self.calls == 1 else "respond"
+        await self.timeline.span(name, self.delay)
+        return SimpleNamespace(content=json.dumps(self.parsed) if name == "parse" else self.answer)
+
+    async def astream(self, messages):
+        for token in ["수면 ", "7h ", "기록."]:
+            await asyncio.sleep(0)
+            yield SimpleNamespace(content=token)
+
+
+class FakeEmbeddingService:
+    def __init__(self, timeline, delay=0.05):
+        self.timeline = timeline
+        self.delay = delay
+        self.requested = []
+        self.cache = EmbeddingCache()
+
+    async def agenerate_embeddings_batch(self, texts):
+        self.requested.append(list(texts))
+        await self.timeline.span(f"embed:{texts[0]}", self.delay)
+        return [[0.1, 0.2] for _ in texts]
+
+
+class FakeWriter:
+    def __init__(self):
+        self.turns = []
+
+    def submit(self, role, content):
+        self.turns.append((role, content))
+
+    def close(self):
+        pass
+
+pytestmark = pytest.mark.usefixtures("api_key")
+
+
+def make_agent(db, cls=AsyncSimpleLLM):
+    agent = cls(db)
+    if agent.rag_writer:
+        agent.rag_writer.close()
+    agent.rag = None
+    agent.rag_writer = None
+    return agent
+
+
+def db_sleep(agent):
+    return agent.db.conn.execute("SELECT sleep_h FROM daily_health").fetchone()[0]
+
+
+def health_rows(db):
+    return [tuple(r) for r in db.conn.execute("SELECT date, sleep_h, workout_min, protein_g FROM daily_health")]
+
+
+@pytest.fixture
+def agent(db):
+    """가짜 LLM/임베딩/저장 큐를 붙인 AsyncSimpleLLM"""
+    timeline = Timeline()
+    llm = make_agent(db)
+    llm.timeline = timeline
+    llm.embeddings = FakeEmbeddingService(timeline)
+    llm.searched = []
+    llm.rag = SimpleNamespace(
+        embedding_service=llm.embeddings,
+        search_similar_conversations=lambda query, top_k: llm.searched.append(
+            [list(batch) for batch in llm.embeddings.requested]) or []
+    )
+    llm.rag_writer = FakeWriter()
+    return llm
+
+
+def test_llm_parse_runs_alongside_input_embedding(agent):
+    agent.llm = FakeAsyncLLM(agent.timeline, {"intent": "chat", "entities": {}}, answer="대화 응답")
+
+    assert agent.process("오늘 좀 피곤하네") == "대화 응답"
+    assert agent.timeline.overlap("parse", "embed:오늘 좀 피곤하네")
+    assert agent.rag_writer.turns == [("user", "오늘 좀 피곤하네"), ("assistant", "대화 응답")]
+
+
+def test_memory_query_embedded_before_search(agent):
+    agent.llm = FakeAsyncLLM(agent.timeline, {"intent": "query_memory", "entities": {"query": "운동"}})
+
+    agent.process("운동 얘기 했던 거 찾아줘")
+
+    # RAG 검색 시점에 검색어 임베딩이 이미 요청됨 (캐시 적중)
+    assert ["운동"] in agent.searched[0]
+
+
+def test_same_results_as_sync_pipeline(db):
+    inputs = ["7시간 잤어", "30분 운동했어", "단백질 120g 먹었어"]
+    sync_agent = make_agent(db, SimpleLLM)
+    expected = [sync_agent.process(text) for text in inputs]
+    rows = health_rows(db)
+
+    db.conn.execute("DELETE FROM daily_health")
+    db.conn.commit()
+    async_agent = make_agent(db)
+
+    assert [async_agent.process(text) for text in inputs] == expected
+    assert health_rows(db) == rows
+
+
+def test_process_stream_bridge(agent):
+    """동기 코드(Streamlit/CLI)에서 토큰 단위로 소비"""
+    agent.response_mode = "llm"
+    agent.llm = FakeAsyncLLM(agent.timeline, {})
+
+    assert list(agent.process_stream("7시간 잤어")) == ["수면 ", "7h ", "기록."]
+    assert agent.rag_writer.turns[-1] == ("assistant", "수면 7h 기록.")
+    assert db_sleep(agent) == 7
+
+
+def test_aprocess_from_async_code(agent):
+    agent.llm = FakeAsyncLLM(agent.timeline, {})
+
+    async def main():
+        return await agent.aprocess("7시간 잤어")
+
+    assert event_loop.run(main()).startswith("수면 7h")
+
+
+def test_event_loop_run_inside_loop_raises():
+    async def nested():
+        return event_loop.run(asyncio.sleep(0))
+
+    with pytest.raises(RuntimeError):
+        event_loop.run(nested())
+
+
+def test_create_agent_pipeline(db):
+    agent = create_agent(db, "async")
+    agent.close()
+    assert type(agent) is AsyncSimpleLLM
+
@@ -0,0 +1,80 @@
+"""
+LLM 클라이언트 레지스트리 (provider/model별 연결 풀 공유 + 지연 시간 지표) 테스트
+"""
+import httpx
+import pytest
+from core.client_registry import ClientRegistry, LatencyStats, TimedTransport
+
+
+@pytest.fixture
+def registry():
+    reg = ClientRegistry(pool={"max_connections": 4, "max_keepalive": 2, "keepalive_expiry": 15})
+    yield reg
+    reg.close()
+
+
+def test_one_client_per_provider_model(registry):
+    a = registry.chat_openai("gpt-4o-mini", api_key="sk-test")
+    assert registry.chat_openai("gpt-4o-mini", api_key="sk-test") is a
+    assert registry.chat_openai("gpt-4o-mini", temperature=0.0, api_key="sk-test") is not a
+
+    # 설정이 달라도 같은 모델이면 연결 풀은 하나
+    pool = registry.http_client("openai", "gpt-4o-mini")
+    assert a.http_client is pool
+    assert registry.chat_openai("gpt-4o-mini", temperature=0.0, api_key="sk-test").http_client is pool
+    assert registry.openai("text-embedding-3-small", api_key="sk-test")._client is not pool
+
+
+def test_pool_limits_from_config(registry):
+    http = registry.http_client("openai", "gpt-4o-mini")
+    pool = http._transport._transport._pool
+
+    assert (pool._max_connections, pool._max_keepalive_connections, pool._keepalive_expiry) == (4, 2, 15)
+    assert http.timeout.read == 60.0 and http.timeout.connect == 5.0
+
+
+def test_timed_transport_records_latency():
+    stats = LatencyStats()
+    responses = iter([200, 200, 503])
+    transport = TimedTransport(httpx.MockTransport(lambda request: httpx.Response(next(responses))), stats)
+
+    with httpx.Client(transport=transport) as http:
+        for _ in range(3):
+            http.get("https://api.example.com/v1/models")
+
+    snapshot = stats.snapshot()
+    assert (snapshot["calls"], snapshot["errors"]) == (3, 1)
+    assert 0 <= snapshot["p50_ms"] <= snapshot["p95_ms"] <= snapshot["max_ms"]
+
+
+def test_connection_error_counted(registry):
+    with pytest.raises(httpx.ConnectError):
+        registry.http_client("ollama", "llama3.2:3b").get("http://127.0.0.1:1/api/chat")
+
+    assert registry.stats()["ollama/llama3.2:3b"]["errors"] == 1
+
+
+def test_ollama_shares_registry_transport(registry):
+    """ollama.Client에는 레지스트리가 만든 전송 계층을 그대로 넘김 (httpx 내부 속성 사용 안 함)"""
+    transport = registry.transport("ollama", "llama3.2:3b")
+    assert isinstance(transport, TimedTransport)
+    assert registry.transport("ollama", "llama3.2:3b") is transport
+
+    ollama = pytest.importorskip("ollama")
+    client = registry.ollama("llama3.2:3b")
+    assert isinstance(client, ollama.Client)
+    assert registry.ollama("llama3.2:3b") is client
+
+
+def test_sessions_share_llm_and_embedding_clients(api_key, db):
+    """세션(SimpleLLM)마다 새 클라이언트를 만들지 않고 프로세스 공용 클라이언트 사용"""
+    from core.embeddings import EmbeddingService
+    from core.simple_llm import SimpleLLM
+
+    agents = [SimpleLLM(db) for _ in range(2)]
+    for agent in agents:
+        if agent.rag_writer:
+            agent.rag_writer.close()
+
+    assert agents[0].llm is agents[1].llm
+    assert EmbeddingService().client is EmbeddingService().client
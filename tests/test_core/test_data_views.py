@@ -0,0 +1,68 @@
+"""
+대시보드 데이터 뷰 (키셋 페이지네이션) 테스트
+"""
+import pytest
+from core.data_views import DATA_VIEWS, find_view
+
+
+def read_all(view, conn, page_size):
+    pages, after = [], None
+    while True:
+        page = view.fetch_page(conn, after, page_size)
+        pages.append(page["frame"].to_dict("records"))
+        after = page["next_cursor"]
+        if after is None:
+            return pages
+
+
+def test_keyset_pages_cover_all_rows_in_order(db):
+    """같은 날짜가 여러 행이어도 중복/누락 없이 (date, id) 내림차순"""
+    db.conn.executemany(
+        "INSERT INTO custom_metrics (date, metric_name, value) VALUES (?, 'steps', ?)",
+        [(f"2025-10-{10 + i % 5:02d}", i) for i in range(23)]
+    )
+    pages = read_all(find_view("custom_metrics"), db.conn, page_size=5)
+
+    assert [len(p) for p in pages] == [5, 5, 5, 5, 3]
+    rows = [r for p in pages for r in p]
+    keys = [(r["date"], r["id"]) for r in rows]
+    assert keys == sorted(keys, reverse=True)
+    assert len(set(keys)) == 23
+    assert "_sort_key" not in rows[0] and "_row_id" not in rows[0]
+
+
+def test_id_only_view(db):
+    db.conn.executemany("INSERT INTO tasks (title) VALUES (?)", [(f"t{i}",) for i in range(7)])
+    pages = read_all(find_view("tasks"), db.conn, page_size=3)
+    assert [r["title"] for p in pages for r in p] == [f"t{i}" for i in reversed(range(7))]
+
+
+def test_join_view(db):
+    db.conn.execute("INSERT INTO people (name) VALUES ('민수')")
+    db.conn.executemany(
+        "INSERT INTO interactions (person_id, date, type, summary) VALUES (1, ?, 'meeting', ?)",
+        [("2025-10-01", "a"), ("2025-10-02", "b"), ("2025-10-02", "c")]
+    )
+    pages = read_all(find_view("interactions"), db.conn, page_size=2)
+    assert [r["summary"] for p in pages for r in p] == ["c", "b", "a"]
+    assert pages[0][0]["person_name"] == "민수"
+
+
+def test_every_view_runs(db):
+    """모든 탭의 뷰 SQL이 현재 스키마에서 실행됨"""
+    for views in DATA_VIEWS.values():
+        for view in views.values():
+            page = view.fetch_page(db.conn, None, 10)
+            assert page["frame"].empty and page["next_cursor"] is None
+
+
+def test_last_page_has_no_cursor(db):
+    db.conn.execute("INSERT INTO daily_health (date, sleep_h) VALUES ('2025-10-17', 7)")
+    page = find_view("daily_health").fetch_page(db.conn, None, 1)
+    assert len(page["frame"]) == 1
+    assert page["next_cursor"] is None
+
+
+def test_unknown_view():
+    with pytest.raises(KeyError):
+        find_view("nope")
@@ -0,0 +1,175 @@
+"""
+연결 풀 테스트 (PostgreSQL 풀은 가짜 연결로, SQLite는 스레드별 연결)
+"""
+import threading
+import pytest
+import psycopg2
+from core.database import PostgresConnectionPool, SQLiteConnectionPool
+
+
+class FakeCursor:
+    def __init__(self, conn):
+        self.conn = conn
+
+    def execute(self, sql, params=None):
+        if not self.conn.alive:
+            raise psycopg2.OperationalError("server closed the connection unexpectedly")
+
+    def fetchone(self):
+        return (1,)
+
+
+class FakeConnection:
+    """psycopg2 연결 대역 (alive=False면 끊긴 연결)"""
+
+    def __init__(self):
+        self.closed = 0
+        self.alive = True
+        self.rollbacks = 0
+
+    def cursor(self):
+        return FakeCursor(self)
+
+    def rollback(self):
+        self.rollbacks += 1
+
+    def close(self):
+        self.closed = 1
+
+
+def make_pool(**options):
+    options.setdefault("backoff", 0)
+    return PostgresConnectionPool(FakeConnection, **options)
+
+
+def test_pool_reuses_connections():
+    """반납한 연결을 다시 사용, 반납 시 롤백"""
+    pool = make_pool(minconn=1, maxconn=3)
+
+    conn = pool.getconn()
+    assert pool.stats()["in_use"] == 1
+    pool.putconn(conn)
+
+    assert pool.getconn() is conn
+    assert conn.rollbacks == 1
+    assert pool.stats()["created"] == 1
+
+
+def test_pool_exhausted_times_out():
+    """maxconn을 넘으면 timeout 후 RuntimeError"""
+    pool = make_pool(minconn=0, maxconn=2, timeout=0.05)
+    pool.getconn()
+    pool.getconn()
+
+    with pytest.raises(RuntimeError):
+        pool.getconn()
+    assert pool.stats()["waits"] == 1
+
+
+def test_pool_waits_for_returned_connection():
+    """가득 찬 풀은 다른 스레드의 반납을 기다림"""
+    pool = make_pool(minconn=0, maxconn=1, timeout=2)
+    conn = pool.getconn()
+
+    threading.Timer(0.05, pool.putconn, args=(conn,)).start()
+    assert pool.getconn() is conn
+
+
+def test_dead_connection_is_replaced():
+    """유휴 후 생존 확인 실패 → 폐기하고 새 연결"""
+    pool = make_pool(minconn=1, maxconn=1, health_check_interval=0)
+    conn = pool.getconn()
+    pool.putconn(conn)
+    conn.alive = False
+
+    replacement = pool.getconn()
+    assert replacement is not conn
+    assert conn.closed
+    stats = pool.stats()
+    assert stats["reconnects"] == 1
+    assert stats["size"] == 1
+
+
+def test_connect_retries_with_backoff():
+    """연결 실패는 max_retries까지 재시도"""
+    attempts = []
+
+    def flaky():
+        attempts.append(1)
+        if len(attempts) < 3:
+            raise psycopg2.OperationalError("connection refused")
+        return FakeConnection()
+
+    pool = PostgresConnectionPool(flaky, minconn=0, maxconn=1, max_retries=3, backoff=0)
+    assert pool.getconn() is not None
+    assert len(attempts) == 3
+
+
+def test_connect_failure_releases_slot():
+    """재시도 모두 실패해도 풀 자리는 반환"""
+    def down():
+        raise psycopg2.OperationalError("connection refused")
+
+    pool = PostgresConnectionPool(down, minconn=0, maxconn=1, max_retries=1, backoff=0)
+    with pytest.raises(psycopg2.OperationalError):
+        pool.getconn()
+    assert pool.stats()["size"] == 0
+
+
+def test_connection_context_discards_broken_connection():
+    """with 블록에서 연결 오류가 나면 재사용하지 않음"""
+    pool = make_pool(minconn=0, maxconn=2)
+
+    with pytest.raises(psycopg2.OperationalError):
+        with pool.connection() as conn:
+            conn.alive = False
+            conn.cursor().execute("SELECT 1")
+
+    assert conn.closed
+    assert pool.stats()["idle"] == 0
+    with pool.connection() as fresh:
+        assert fresh is not conn
+
+
+def test_sqlite_connection_per_thread(tmp_path):
+    """스레드마다 별도 연결, 같은 스레드는 재사용"""
+    pool = SQLiteConnectionPool(str(tmp_path / "pool.db"))
+    main = pool.getconn()
+    assert pool.getconn() is main
+
+    seen = []
+    worker = threading.Thread(target=lambda: seen.append(pool.getconn()))
+    worker.start()
+    worker.join()
+    assert seen[0] is not main
+    assert pool.stats()["threads"] == 2
+
+    # 종료된 스레드의 연결은 다음 생성 시 정리
+    other = threading.Thread(target=pool.getconn)
+    other.start()
+    other.join()
+    assert pool.stats()["discarded"] == 1
+    pool.closeall()
+
+
+def test_sqlite_memory_database_is_shared():
+    """:memory: DB는 스레드 간 하나의 연결 공유"""
+    pool = SQLiteConnectionPool(":memory:")
+    seen = []
+    worker = threading.Thread(target=lambda: seen.append(pool.getconn()))
+    worker.start()
+    worker.join()
+    assert seen[0] is pool.getconn()
+
+
+def test_database_ensure_connection_reconnects(file_db):
+    """닫힌 conn은 ensure_connection()이 교체"""
+    db = file_db
+    db.conn.close()
+    conn = db.ensure_connection()
+    conn.execute("SELECT COUNT(*) FROM tasks")
+
+    with db.connection() as pooled:
+        assert pooled is conn
+    db.close()
+    assert db.pool_stats() == {}
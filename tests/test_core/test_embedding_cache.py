@@ -0,0 +1,103 @@
+"""
+EmbeddingCache 테스트
+"""
+import pytest
+from types import SimpleNamespace
+from core.embeddings import EmbeddingCache, EmbeddingService
+from core.unit_of_work import UnitOfWork
+
+
+class FakeEmbeddings:
+    """OpenAI embeddings API 대역 (호출 횟수 기록)"""
+
+    def __init__(self):
+        self.calls = 0
+
+    def create(self, model, input, encoding_format):
+        self.calls += 1
+        texts = input if isinstance(input, list) else [input]
+        return SimpleNamespace(data=[
+            SimpleNamespace(index=i, embedding=[float(len(t)), 0.5, -1.0])
+            for i, t in enumerate(texts)
+        ])
+
+
+@pytest.fixture
+def service(api_key, db):
+    svc = EmbeddingService(cache=EmbeddingCache(db))
+    svc.client = SimpleNamespace(embeddings=FakeEmbeddings())
+    return svc
+
+
+def test_repeated_text_hits_cache(service):
+    """같은 텍스트는 API 재호출 없음 (정규화 포함)"""
+    first = service.generate_embedding("오늘 요약")
+    second = service.generate_embedding("  오늘   요약 ")
+
+    assert first == second
+    assert service.client.embeddings.calls == 1
+    stats = service.cache.stats()
+    assert stats["hits"] == 1
+    assert stats["misses"] == 1
+
+
+def test_batch_only_requests_misses(service):
+    """배치는 캐시 미스만 API 요청"""
+    service.generate_embedding("30분 운동했어")
+    result = service.generate_embeddings_batch(["30분 운동했어", "7시간 잤어"])
+
+    assert len(result) == 2
+    assert service.client.embeddings.calls == 2
+    assert result[0] == service.generate_embedding("30분 운동했어")
+
+
+def test_persistent_store_survives_new_cache(db):
+    """DB 백업 - 새 캐시 인스턴스에서도 조회"""
+    EmbeddingCache(db).put("m", "7시간 잤어", [0.25, -0.5])
+
+    fresh = EmbeddingCache(db)
+    assert fresh.get("m", "7시간 잤어") == [0.25, -0.5]
+    assert fresh.stats()["store_hits"] == 1
+    assert fresh.get("other-model", "7시간 잤어") is None
+
+
+def test_store_does_not_commit_open_unit_of_work(file_db):
+    """캐시 저장이 같은 연결의 UnitOfWork 쓰기를 중간 커밋하지 않음 (파일 SQLite)"""
+    database = file_db
+    cache = EmbeddingCache(database)
+
+    uow = UnitOfWork(database.conn)
+    database.conn.execute("INSERT INTO tasks (title) VALUES ('보고서 작성')")
+    cache.put("m", "7시간 잤어", [0.25, -0.5])
+    assert cache.stats()["pending"] == 1
+    uow.rollback()
+
+    assert database.conn.execute("SELECT COUNT(*) FROM tasks").fetchone()[0] == 0
+    assert cache.flush() == 0
+    assert EmbeddingCache(database).get("m", "7시간 잤어") == [0.25, -0.5]
+
+
+def test_failed_store_keeps_entries_queued(db):
+    """저장 실패 시 항목을 버리지 않고 다음 flush에서 다시 씀"""
+    cache = EmbeddingCache(db)
+    db.conn.execute("DROP TABLE embedding_cache")
+    db.conn.commit()
+
+    cache.put("m", "7시간 잤어", [0.25, -0.5])
+    assert cache.stats()["pending"] == 1
+
+    cache._ensure_table()
+    assert cache.flush() == 0
+    assert EmbeddingCache(db).get("m", "7시간 잤어") == [0.25, -0.5]
+
+
+def test_lru_eviction():
+    """메모리 LRU 크기 제한"""
+    cache = EmbeddingCache(max_size=2)
+    cache.put("m", "a", [1.0])
+    cache.put("m", "b", [2.0])
+    cache.get("m", "a")
+    cache.put("m", "c", [3.0])
+
+    assert cache.get("m", "b") is None
+    assert cache.get("m", "a") == [1.0]
@@ -0,0 +1,176 @@
+"""
+의도 실행 계획 (IntentScheduler) + SimpleLLM 병렬 조회 테스트
+"""
+import threading
+import time
+from types import SimpleNamespace
+
+import pytest
+from core.embeddings import EmbeddingCache, EmbeddingService
+from core.intent_scheduler import IntentScheduler
+from core.simple_llm import SimpleLLM
+
+
+def intents(*names):
+    return [{"intent": name, "entities": {}} for name in names]
+
+
+@pytest.mark.parametrize("names, parallel, ordered", [
+    # 앞선 쓰기 없음 → 조회 둘 다 병렬
+    (("query_memory", "summary", "sleep"), [0, 1], [2]),
+    # summary는 sleep이 쓴 daily_health를 읽음 → 트랜잭션 안에서 순서대로
+    (("query_memory", "sleep", "workout", "summary"), [0], [1, 2, 3]),
+    # remember_person은 people을 씀 → 뒤의 query_memory는 의존, summary는 무관
+    (("remember_person", "query_memory", "summary"), [2], [0, 1]),
+    # 알 수 없는 쓰기 → 뒤의 조회는 모두 의존
+    (("unknown", "summary", "sleep"), [], [0, 1, 2]),
+])
+def test_plan(names, parallel, ordered):
+    assert IntentScheduler(enabled=True).plan(intents(*names)) == {"parallel": parallel, "ordered": ordered}
+
+
+@pytest.mark.parametrize("names", [
+    ("summary",),               # 의도 하나
+    ("summary", "chat"),        # DB 작업 하나 (chat은 DB 없음)
+    ("sleep", "workout"),       # 쓰기뿐
+])
+def test_nothing_to_overlap_runs_in_order(names):
+    plan = IntentScheduler(enabled=True).plan(intents(*names))
+    assert plan == {"parallel": [], "ordered": list(range(len(names)))}
+
+
+def test_disabled_runs_in_order():
+    plan = IntentScheduler(enabled=False).plan(intents("query_memory", "summary", "sleep"))
+    assert plan == {"parallel": [], "ordered": [0, 1, 2]}
+
+
+@pytest.fixture
+def llm(api_key, file_db):
+    """파일 SQLite (스레드별 연결) + RAG 없는 SimpleLLM"""
+    database = file_db
+    database.conn.execute("INSERT INTO daily_health (date, sleep_h) VALUES ('2025-10-17', 5)")
+    database.conn.commit()
+
+    agent = SimpleLLM(database)
+    if agent.rag_writer:
+        agent.rag_writer.close()
+    agent.rag = None
+    agent.rag_writer = None
+    return agent
+
+
+def record_threads(llm, monkeypatch, name):
+    """조회 헬퍼를 실행한 스레드 기록"""
+    threads = []
+    original = getattr(llm, name)
+
+    def wrapped(entities, conn=None):
+        threads.append(threading.current_thread())
+        return original(entities, conn)
+
+    monkeypatch.setattr(llm, name, wrapped)
+    return threads
+
+
+def test_independent_read_runs_on_worker_connection(llm, monkeypatch):
+    threads = record_threads(llm, monkeypatch, "_get_summary")
+
+    results = llm._execute({"intents": [
+        {"intent": "summary", "entities": {"date": "2025-10-17"}},
+        {"intent": "sleep", "entities": {"sleep_hours": 8, "date": "2025-10-17"}},
+        {"intent": "task_add", "entities": {"task_title": "보고서"}},
+    ]})
+
+    assert [r["intent"] for r in results] == ["summary", "sleep", "task_add"]
+    assert threads[0] is not threading.current_thread()
+    # 순서대로 실행했을 때와 같은 값 (이번 메시지의 쓰기 전)
+    assert results[0]["result"]["data"]["sleep"] == 5
+    assert llm.conn.execute("SELECT sleep_h FROM daily_health").fetchone()[0] == 8
+
+
+def test_dependent_read_sees_earlier_writes(llm, monkeypatch):
+    threads = record_threads(llm, monkeypatch, "_get_summary")
+
+    results = llm._execute({"intents": [
+        {"intent": "query_memory", "entities": {"query": "보고서"}},
+        {"intent": "sleep", "entities": {"sleep_hours": 8, "date": "2025-10-17"}},
+        {"intent": "summary", "entities": {"date": "2025-10-17"}},
+    ]})
+
+    assert threads == [threading.current_thread()]
+    assert results[2]["result"]["data"]["sleep"] == 8
+    assert results[0]["result"]["success"]
+
+
+def test_parallel_read_failure_keeps_writes(llm, monkeypatch):
+    def broken(entities, conn=None):
+        raise RuntimeError("search timeout")
+
+    monkeypatch.setattr(llm, "_query_memory", broken)
+    results = llm._execute({"intents": [
+        {"intent": "query_memory", "entities": {"query": "x"}},
+        {"intent": "sleep", "entities": {"sleep_hours": 8, "date": "2025-10-17"}},
+    ]})
+
+    assert results[0]["result"] == {"success": False, "error": "search timeout"}
+    assert results[1]["result"]["success"]
+    assert llm.conn.execute("SELECT sleep_h FROM daily_health").fetchone()[0] == 8
+
+
+def test_write_failure_keeps_parallel_read_result(llm, monkeypatch):
+    def broken(entities):
+        raise RuntimeError("disk I/O error")
+
+    monkeypatch.setattr(llm, "_add_task", broken)
+    results = llm._execute({"intents": [
+        {"intent": "summary", "entities": {"date": "2025-10-17"}},
+        {"intent": "sleep", "entities": {"sleep_hours": 8, "date": "2025-10-17"}},
+        {"intent": "task_add", "entities": {"task_title": "보고서"}},
+    ]})
+
+    assert results[0]["result"]["data"]["sleep"] == 5
+    assert [r["result"]["success"] for r in results[1:]] == [False, False]
+    assert llm.conn.execute("SELECT sleep_h FROM daily_health").fetchone()[0] == 5
+
+
+class SlowRAG:
+    """임베딩이 느린 RAG 대역 (검색마다 쿼리 임베딩 생성 → 캐시 저장)"""
+
+    def __init__(self, database):
+        self.embedding_service = EmbeddingService(cache=EmbeddingCache(database))
+        self.embedding_service.client = SimpleNamespace(embeddings=SimpleNamespace(create=self._create))
+
+    @staticmethod
+    def _create(model, input, encoding_format):
+        time.sleep(0.2)  # 요청 스레드가 먼저 쓰기 트랜잭션을 연다
+        return SimpleNamespace(data=[SimpleNamespace(index=0, embedding=[0.25, -0.5])])
+
+    def search_similar_conversations(self, query, top_k=5):
+        self.embedding_service.generate_embedding(query)
+        return []
+
+
+def test_parallel_read_does_not_write_under_open_transaction(llm, file_db):
+    """병렬 조회의 캐시 저장이 요청 스레드의 쓰기 락을 기다리지 않고 커밋 뒤에 저장됨"""
+    llm.rag = SlowRAG(file_db)
+    cache = llm.rag.embedding_service.cache
+
+    started = time.perf_counter()
+    results = llm._execute({"intents": [
+        {"intent": "query_memory", "entities": {"query": "보고서"}},
+        {"intent": "task_add", "entities": {"task_title": "보고서"}},
+    ]})
+
+    assert time.perf_counter() - started < 2  # SQLite busy timeout(5초)까지 막히지 않음
+    assert [r["result"]["success"] for r in results] == [True, True]
+    assert cache.stats()["pending"] == 0
+    assert EmbeddingCache(file_db).get(llm.rag.embedding_service.model, "보고서") == [0.25, -0.5]
+    assert llm.conn.execute("SELECT COUNT(*) FROM tasks").fetchone()[0] == 1
+
+
+def test_memory_database_runs_in_order(api_key, db):
+    """:memory:는 연결 하나를 공유 → 병렬 조회 없음"""
+    agent = SimpleLLM(db)
+    agent.close()
+    assert not db.separate_connections
+    assert not agent.scheduler.enabled
@@ -0,0 +1,49 @@
+"""
+무거운 모듈 지연 import 테스트 (LLM/임베딩 SDK, pandas는 첫 사용 시 로드)
+"""
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+ROOT = Path(__file__).parent.parent.parent
+HEAVY = ("langchain_openai", "langchain_core", "openai", "pandas")
+
+
+def loaded_after(code: str):
+    """새 인터프리터에서 code 실행 후 불러온 무거운 모듈"""
+    probe = f"{code}\nimport sys\nprint('LOADED:' + ','.join(m for m in {HEAVY!r} if m in sys.modules))"
+    result = subprocess.run(
+        [sys.executable, "-c", probe], cwd=ROOT, capture_output=True, text=True, check=True
+    )
+    loaded = result.stdout.rsplit("LOADED:", 1)[1].strip()
+    return [m for m in loaded.split(",") if m]
+
+
+@pytest.mark.parametrize("module", [
+    "horcrux", "core.simple_llm", "core.async_llm", "core.embeddings", "core.rag_manager", "core.data_views",
+])
+def test_import_does_not_load_heavy_modules(module):
+    assert loaded_after(f"import {module}") == []
+
+
+def test_template_turn_without_llm_client(tmp_path):
+    """기록 의도 (template 응답)는 LLM 클라이언트 없이 처리"""
+    code = f"""
+import os
+os.environ.pop("SUPABASE_URL", None)
+os.environ["OPENAI_API_KEY"] = "sk-test"
+from core.database import Database
+from core.simple_llm import SimpleLLM
+db = Database({str(tmp_path / "lazy.db")!r})
+db.connect()
+db.init_schema()
+agent = SimpleLLM(db)
+agent.rag_writer.close() if agent.rag_writer else None
+agent.rag, agent.rag_writer = None, None
+agent.response_mode = "template"
+assert agent.process("7시간 잤어").startswith("수면 7h")
+assert agent._llm is None
+"""
+    assert loaded_after(code) == []
@@ -0,0 +1,89 @@
+"""
+버전 기반 마이그레이션 (MigrationRunner) 테스트
+"""
+import pytest
+from core.migrations import MIGRATIONS, Migration, MigrationRunner, split_sql
+
+
+@pytest.fixture
+def db(empty_db):
+    """마이그레이션 전 DB"""
+    return empty_db
+
+
+def trace(conn):
+    statements = []
+    conn.set_trace_callback(statements.append)
+    return statements
+
+
+def versions(conn):
+    return [r[0] for r in conn.execute("SELECT version FROM schema_version ORDER BY version")]
+
+
+def test_fresh_database_applies_all_in_order(db):
+    assert db.migrate() == [m.version for m in MIGRATIONS]
+    assert versions(db.conn) == [m.version for m in MIGRATIONS]
+    # pgvector는 PostgreSQL 전용 → SQLite는 버전만 기록
+    names = {r[0] for r in db.conn.execute("SELECT name FROM sqlite_master")}
+    assert {"daily_health", "daily_rollup", "idx_tasks_status"} <= names
+
+
+def test_up_to_date_start_is_single_lookup(db):
+    """최신 스키마: 버전 조회 한 번, DDL 없음"""
+    db.migrate()
+    statements = trace(db.conn)
+
+    assert db.migrate() == []
+    assert statements == ["SELECT MAX(version) AS version FROM schema_version"]
+
+
+def test_only_pending_applied(db):
+    calls = []
+    runner = MigrationRunner(db, [
+        Migration(1, "one", lambda d, c: calls.append(1)),
+        Migration(2, "two", lambda d, c: calls.append(2)),
+    ])
+    runner.migrate()
+
+    runner.migrations.append(Migration(3, "three", lambda d, c: calls.append(3)))
+    assert [m.version for m in runner.pending()] == [3]
+    assert runner.migrate() == [3]
+    assert calls == [1, 2, 3]
+
+
+def test_failed_migration_rolls_back(db):
+    """실패한 마이그레이션은 DDL까지 취소, 이전 버전은 유지"""
+    def broken(d, cursor):
+        cursor.execute("CREATE TABLE half_done (id INTEGER)")
+        raise RuntimeError("boom")
+
+    runner = MigrationRunner(db, [
+        Migration(1, "ok", lambda d, c: c.execute("CREATE TABLE done (id INTEGER)")),
+        Migration(2, "broken", broken),
+    ])
+    with pytest.raises(RuntimeError):
+        runner.migrate()
+
+    tables = {r[0] for r in db.conn.execute("SELECT name FROM sqlite_master WHERE type = 'table'")}
+    assert "done" in tables and "half_done" not in tables
+    assert versions(db.conn) == [1]
+
+
+def test_pre_versioning_database_is_adopted(db):
+    """schema_version 없이 만들어진 기존 DB → 데이터 유지한 채 버전 기록"""
+    cursor = db.conn.cursor()
+    db._create_tables(cursor)
+    db._create_indexes(cursor)
+    db.conn.execute("INSERT INTO daily_health (date, sleep_h) VALUES ('2025-10-17', 7)")
+    db.conn.commit()
+
+    db.migrate()
+    assert versions(db.conn) == [m.version for m in MIGRATIONS]
+    assert db.conn.execute("SELECT sleep_h FROM daily_rollup WHERE date = '2025-10-17'").fetchone()[0] == 7
+
+
+def test_split_sql_drops_comments():
+    assert split_sql("-- a\nCREATE INDEX x ON t(a);\n\n-- b\n-- CREATE INDEX y ON t(b);\n") == [
+        "CREATE INDEX x ON t(a)"
+    ]
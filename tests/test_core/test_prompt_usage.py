@@ -0,0 +1,117 @@
+"""
+고정 프롬프트 prefix + 프롬프트 토큰 (캐시 적중) 기록 테스트
+"""
+from datetime import datetime
+from types import SimpleNamespace
+
+import pytest
+from core import simple_llm
+from core.prompt_usage import PromptUsageTracker, prompt_usage, token_usage
+from core.simple_llm import PARSE_SYSTEM_PROMPT, SimpleLLM
+
+
+def usage_message(content, prompt, cached, output=5):
+    return SimpleNamespace(content=content, usage_metadata={
+        "input_tokens": prompt, "output_tokens": output, "total_tokens": prompt + output,
+        "input_token_details": {"cache_read": cached},
+    })
+
+
+class FakeLLM:
+    def __init__(self, *messages):
+        self.messages = list(messages)
+        self.prompts = []
+
+    def invoke(self, messages):
+        self.prompts.append(messages)
+        return self.messages.pop(0)
+
+    def stream(self, messages):
+        yield SimpleNamespace(content="수면 7h 기록.", usage_metadata=None)
+        yield usage_message("", 1200, 1024)
+
+
+@pytest.fixture
+def agent(api_key, db):
+    llm = SimpleLLM(db)
+    if llm.rag_writer:
+        llm.rag_writer.close()
+    llm.rag = None
+    llm.rag_writer = None
+    prompt_usage.reset()
+    yield llm
+    prompt_usage.reset()
+
+
+def freeze(monkeypatch, moment):
+    monkeypatch.setattr(simple_llm, "datetime", SimpleNamespace(now=lambda: moment))
+
+
+def test_parse_prompt_prefix_is_byte_stable(agent, monkeypatch):
+    """시간이 바뀌어도 시스템 프롬프트는 같고, 동적인 값은 마지막 메시지에만"""
+    freeze(monkeypatch, datetime(2025, 10, 17, 9, 5))
+    morning = agent._parse_messages("3시부터 지금까지 공부했어")
+    freeze(monkeypatch, datetime(2025, 10, 18, 21, 47))
+    evening = agent._parse_messages("3시부터 지금까지 공부했어")
+
+    assert morning[0] == evening[0] == ("system", PARSE_SYSTEM_PROMPT)
+    assert morning[-1][0] == "human"
+    assert "2025-10-17 09:05 (9시)" in morning[-1][1]
+    assert "2025-10-18 21:47 (21시)" in evening[-1][1]
+
+
+def test_parse_prompt_prefix_is_long_enough_to_cache():
+    """OpenAI 프롬프트 캐시 최소 길이(1,024 토큰) 이상 (토크나이저 파일이 없으면 건너뜀)"""
+    tiktoken = pytest.importorskip("tiktoken")
+    try:
+        encoding = tiktoken.get_encoding("o200k_base")  # gpt-4o / gpt-4o-mini
+    except Exception as e:
+        pytest.skip(f"o200k_base 인코딩 없음: {e}")
+
+    assert len(encoding.encode(PARSE_SYSTEM_PROMPT)) >= 1024
+
+
+def test_token_usage_formats():
+    assert token_usage(usage_message("x", 1500, 1280, 40)) == {"prompt": 1500, "cached": 1280, "output": 40}
+
+    legacy = SimpleNamespace(response_metadata={"token_usage": {
+        "prompt_tokens": 900, "completion_tokens": 12, "prompt_tokens_details": {"cached_tokens": 0},
+    }})
+    assert token_usage(legacy) == {"prompt": 900, "cached": 0, "output": 12}
+    assert token_usage(SimpleNamespace(content="no usage")) is None
+
+
+def test_tracker_cached_vs_uncached():
+    tracker = PromptUsageTracker()
+    tracker.record("parse", usage_message("a", 1200, 0))
+    tracker.record("parse", usage_message("b", 1200, 1024))
+    tracker.record("parse", SimpleNamespace(content="c"))  # 사용량 없는 응답은 호출 수만
+
+    stats = tracker.stats()["parse"]
+    assert (stats["calls"], stats["prompt_tokens"], stats["cached_tokens"]) == (3, 2400, 1024)
+    assert stats["uncached_tokens"] == 1376
+    assert stats["cache_ratio"] == round(1024 / 2400, 3)
+
+
+def test_llm_parse_and_response_are_recorded(agent):
+    agent.response_mode = "llm"
+    agent.parse_strategy = "always"
+    agent.fast_parser = None
+    agent.llm = FakeLLM(
+        usage_message('{"intent": "sleep", "entities": {"sleep_hours": 7}}', 1100, 1024),
+        usage_message("수면 7h 기록.", 300, 0),
+    )
+
+    assert agent.process("어제 7시간 정도 잤나") == "수면 7h 기록."
+
+    stats = prompt_usage.stats()
+    assert (stats["parse"]["calls"], stats["parse"]["cached_tokens"]) == (1, 1024)
+    assert (stats["response"]["calls"], stats["response"]["uncached_tokens"]) == (1, 300)
+
+
+def test_stream_usage_from_final_chunk(agent):
+    agent.response_mode = "llm"
+    agent.llm = FakeLLM()
+
+    assert list(agent.process_stream("7시간 잤어")) == ["수면 7h 기록."]
+    assert prompt_usage.stats()["response"]["cached_tokens"] == 1024
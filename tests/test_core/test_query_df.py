@@ -0,0 +1,48 @@
+"""
+Database.query_df (조회 결과 → DataFrame) 테스트
+"""
+from core.database import rows_to_dataframe
+
+
+def test_columns_follow_cursor_description(db):
+    db.conn.executemany(
+        "INSERT INTO daily_health (date, sleep_h, workout_min) VALUES (?, ?, ?)",
+        [("2025-10-16", 6.5, None), ("2025-10-17", 7, 30)]
+    )
+    df = db.query_df(
+        "SELECT workout_min, date, sleep_h FROM daily_health WHERE date >= ? ORDER BY date",
+        ("2025-10-01",)
+    )
+
+    assert list(df.columns) == ["workout_min", "date", "sleep_h"]
+    assert df["date"].tolist() == ["2025-10-16", "2025-10-17"]
+    assert df["sleep_h"].dtype == "float64"
+    assert df["workout_min"].isna().tolist() == [True, False]
+
+
+def test_empty_result_keeps_columns(db):
+    df = db.query_df("SELECT date, sleep_h FROM daily_health")
+    assert df.empty
+    assert list(df.columns) == ["date", "sleep_h"]
+
+
+def test_dtypes(db):
+    db.conn.execute("INSERT INTO daily_health (date, workout_min) VALUES ('2025-10-17', 30)")
+    df = db.query_df("SELECT workout_min FROM daily_health", dtypes={"workout_min": "float32"})
+    assert df["workout_min"].dtype == "float32"
+
+
+def test_legacy_row_factory_untouched(db):
+    """튜플 커서는 조회에만 사용, 연결의 sqlite3.Row 설정은 그대로"""
+    db.query_df("SELECT 1 AS one")
+    assert db.conn.execute("SELECT 1 AS one").fetchone()["one"] == 1
+
+
+def test_dict_rows_match_tuple_rows():
+    """RealDictRow 형태(dict)도 같은 DataFrame으로, 중복 컬럼명 유지"""
+    columns = ["id", "name", "id"]
+    from_tuples = rows_to_dataframe(columns, [(1, "a", 10), (2, "b", 20)])
+    from_dicts = rows_to_dataframe(["id", "name"], [{"id": 1, "name": "a"}, {"id": 2, "name": "b"}])
+
+    assert list(from_tuples.columns) == columns
+    assert from_dicts.equals(from_tuples.iloc[:, :2])
@@ -0,0 +1,81 @@
+"""
+ConversationWriter (write-behind 큐) 테스트
+"""
+import pytest
+from types import SimpleNamespace
+from core.rag_manager import RAGManager, ConversationWriter
+
+
+class FakeEmbeddings:
+    """OpenAI embeddings API 대역 (배치 호출 횟수 기록)"""
+
+    def __init__(self):
+        self.calls = 0
+
+    def create(self, model, input, encoding_format):
+        self.calls += 1
+        return SimpleNamespace(data=[
+            SimpleNamespace(index=i, embedding=[1.0, 0.0])
+            for i, _ in enumerate(input)
+        ])
+
+
+@pytest.fixture
+def rag(api_key, db):
+    """SQLite 메모리 DB + RAGManager"""
+    manager = RAGManager(db)
+    manager.embedding_service.client = SimpleNamespace(embeddings=FakeEmbeddings())
+    return manager
+
+
+def _count(rag):
+    cursor = rag.db.conn.cursor()
+    cursor.execute("SELECT COUNT(*) FROM conversation_memory")
+    return cursor.fetchone()[0]
+
+
+def test_save_conversations_batch(rag):
+    """bulk INSERT"""
+    saved = rag.save_conversations_batch([
+        {'role': 'user', 'content': '7시간 잤어', 'context': None,
+         'session_id': None, 'timestamp': '2025-10-17 10:00:00'},
+        {'role': 'assistant', 'content': '수면 7h 기록.', 'context': None,
+         'session_id': None, 'timestamp': '2025-10-17 10:00:01'},
+    ])
+    assert saved == 2
+    assert _count(rag) == 2
+    assert rag.embedding_service.client.embeddings.calls == 1
+
+
+def test_submit_and_flush(rag):
+    """submit은 즉시 반환, flush 후 저장 완료"""
+    writer = ConversationWriter(rag, batch_size=4, flush_interval=10)
+    for i in range(10):
+        writer.submit('user', f'메시지 {i}')
+
+    assert writer.flush(timeout=5) is True
+    assert _count(rag) == 10
+    assert writer.written == 10
+    writer.close()
+
+
+def test_close_drains_queue(rag):
+    """종료 시 대기 중인 대화 저장"""
+    writer = ConversationWriter(rag, batch_size=100, flush_interval=10)
+    writer.submit('user', '오늘 요약')
+    writer.submit('assistant', '수면 기록 없음.')
+    writer.close()
+
+    assert _count(rag) == 2
+    with pytest.raises(RuntimeError):
+        writer.submit('user', '추가')
+
+
+def test_submit_validates_input(rag):
+    """잘못된 입력은 즉시 ValueError"""
+    writer = ConversationWriter(rag)
+    with pytest.raises(ValueError):
+        writer.submit('system', '내용')
+    with pytest.raises(ValueError):
+        writer.submit('user', '   ')
+    writer.close()
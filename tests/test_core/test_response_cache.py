@@ -0,0 +1,105 @@
+"""
+ResponseCache (응답 캐시) 테스트
+"""
+import pytest
+from types import SimpleNamespace
+from core.response_cache import ResponseCache
+from core.simple_llm import SimpleLLM
+
+
+def sleep_result(hours, date="2025-10-17"):
+    return [{"intent": "sleep", "result": {
+        "success": True,
+        "message": f"수면 {hours}시간 기록",
+        "data": {"hours": hours, "date": date, "target": 7}
+    }}]
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+class FakeLLM:
+    """ChatOpenAI 대역 (호출 횟수 기록)"""
+
+    def __init__(self):
+        self.calls = 0
+
+    def invoke(self, messages):
+        self.calls += 1
+        return SimpleNamespace(content=f"응답 {self.calls}")
+
+
+def test_key_ignores_date_and_number_format():
+    cache = ResponseCache()
+    assert cache.make_key(sleep_result(7)) == cache.make_key(sleep_result(7.0, date="2025-10-18"))
+    assert cache.make_key(sleep_result(7)) != cache.make_key(sleep_result(6))
+
+
+def test_ttl_expiry():
+    clock = FakeClock()
+    cache = ResponseCache(ttl_seconds=60, clock=clock)
+    cache.put("k", "수면 7h 기록. 목표 충족.")
+
+    clock.now = 59
+    assert cache.get("k") == "수면 7h 기록. 목표 충족."
+    clock.now = 61
+    assert cache.get("k") is None
+    assert cache.stats()["expired"] == 1
+
+
+def test_lru_eviction():
+    cache = ResponseCache(max_size=2)
+    cache.put("a", "A")
+    cache.put("b", "B")
+    cache.get("a")          # a가 최근 사용
+    cache.put("c", "C")     # b 제거
+
+    assert cache.get("b") is None
+    assert cache.get("a") == "A"
+    assert cache.get("c") == "C"
+
+
+def test_chat_key_normalization():
+    cache = ResponseCache()
+    assert cache.make_chat_key("뭐  할 수 있어?") == cache.make_chat_key("뭐 할 수 있어")
+
+
+def test_similar_chat_match():
+    cache = ResponseCache(similarity_threshold=0.95)
+    cache.put(cache.make_chat_key("뭐 할 수 있어"), "기능 목록", embedding=[1.0, 0.0, 0.0])
+
+    assert cache.get_similar([0.99, 0.05, 0.0]) == "기능 목록"
+    assert cache.get_similar([0.0, 1.0, 0.0]) is None
+    assert cache.stats()["similar_hits"] == 1
+
+
+@pytest.fixture
+def llm(api_key, db):
+    agent = SimpleLLM(db)
+    if agent.rag_writer:
+        agent.rag_writer.close()
+    agent.rag = None
+    agent.rag_writer = None
+    agent.llm = FakeLLM()
+    agent.response_mode = "llm"  # 기록 의도도 LLM 응답 (템플릿 모드는 LLM 호출 없음)
+    return agent
+
+
+def test_repeated_result_skips_llm(llm):
+    """같은 실행 결과 → 두 번째부터 LLM 호출 없음"""
+    first = llm._generate_response("7시간 잤어", sleep_result(7), {})
+    second = llm._generate_response("어제 7시간 잤다", sleep_result(7, date="2025-10-16"), {})
+
+    assert first == second
+    assert llm.llm.calls == 1
+
+
+def test_repeated_chat_skips_llm(llm):
+    llm._chat_response("안녕")
+    llm._chat_response("안녕!")
+    assert llm.llm.calls == 1
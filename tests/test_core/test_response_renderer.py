@@ -0,0 +1,48 @@
+"""
+ResponseRenderer (템플릿 응답) 테스트
+"""
+from core.response_renderer import ResponseRenderer
+
+
+def ok(intent, data, message=""):
+    return {"intent": intent, "result": {"success": True, "message": message, "data": data}}
+
+
+renderer = ResponseRenderer({"sleep_hours": 7, "workout_minutes": 30, "protein_grams": 100})
+
+
+def test_goal_deltas():
+    assert renderer.render([ok("sleep", {"hours": 5})]) == "수면 5h 기록. 목표 대비 -2h."
+    assert renderer.render([ok("sleep", {"hours": 7.0})]) == "수면 7h 기록. 목표 충족."
+    assert renderer.render([ok("workout", {"minutes": 45})]) == "운동 45min 기록. 목표 대비 +15min (충족)."
+    assert renderer.render([ok("protein", {"grams": 82.5})]) == "단백질 82.5g 기록. 목표 대비 -17.5g."
+
+
+def test_targets_from_config():
+    strict = ResponseRenderer({"sleep_hours": 8})
+    assert strict.render([ok("sleep", {"hours": 7})]) == "수면 7h 기록. 목표 대비 -1h."
+
+
+def test_multiple_intents_and_failures():
+    results = [
+        ok("sleep", {"hours": 7}),
+        ok("task_add", {"title": "보고서", "due": "2025-10-20", "priority": "high"}),
+        {"intent": "workout", "result": {"success": False, "error": "운동 시간이 필요합니다"}},
+    ]
+    assert renderer.render(results) == (
+        "수면 7h 기록. 목표 충족. "
+        "할일 추가: 보고서 (마감 2025-10-20, 우선순위 high). "
+        "운동 기록 실패: 운동 시간이 필요합니다."
+    )
+
+
+def test_llm_intents_not_rendered():
+    """chat/query_memory/summary가 섞이면 None (LLM 응답)"""
+    assert renderer.render([ok("sleep", {"hours": 7}), ok("summary", {})]) is None
+    assert renderer.render([ok("query_memory", {})]) is None
+    assert renderer.render([ok("unknown", {})]) is None
+    assert renderer.render([]) is None
+
+
+def test_unexpected_data_falls_back_to_message():
+    assert renderer.render([ok("sleep", {}, message="수면 기록")]) == "수면 기록."
@@ -0,0 +1,110 @@
+"""
+daily_rollup / weekly_rollup (트리거 집계) 테이블 테스트
+"""
+from core import rollups
+from core.rollups import Rollups
+
+
+def snapshot(conn):
+    return (
+        [tuple(r) for r in conn.execute("SELECT * FROM daily_rollup ORDER BY date")],
+        [tuple(r) for r in conn.execute("SELECT * FROM weekly_rollup ORDER BY week_start")],
+    )
+
+
+def seed(conn):
+    conn.executemany(
+        "INSERT INTO daily_health (date, sleep_h, workout_min) VALUES (?, ?, ?)",
+        [("2025-10-12", 6, 20), ("2025-10-13", 5, None), ("2025-10-19", 8, 40)]
+    )
+    conn.executemany(
+        "INSERT INTO tasks (title, created_at) VALUES (?, ?)",
+        [("a", "2025-10-13 09:00:00"), ("b", "2025-10-13 10:00:00"), ("c", "2025-10-14 08:00:00")]
+    )
+    conn.execute(
+        "UPDATE tasks SET status = 'done', completed_at = '2025-10-14 20:00:00' WHERE title IN ('a', 'c')"
+    )
+    conn.executemany(
+        "INSERT INTO exp_logs (date, action_type, exp_gained) VALUES (?, 'sleep', ?)",
+        [("2025-10-13", 10), ("2025-10-13", 5), ("2025-10-20", 7)]
+    )
+
+
+def test_writes_maintain_daily_rollup(db):
+    seed(db.conn)
+    r = Rollups(db.conn)
+
+    day = r.day("2025-10-13")
+    assert (day["sleep_h"], day["tasks_created"], day["tasks_done"], day["exp_gained"]) == (5, 2, 0, 15)
+    assert r.day("2025-10-14")["tasks_done"] == 2
+    assert r.day("2025-01-01") == {"date": "2025-01-01", **Rollups.DAY_DEFAULTS}
+
+
+def test_updates_and_deletes_are_reversed(db):
+    seed(db.conn)
+    db.conn.execute("UPDATE daily_health SET sleep_h = 7 WHERE date = '2025-10-13'")
+    db.conn.execute("UPDATE tasks SET status = 'pending', completed_at = NULL WHERE title = 'a'")
+    db.conn.execute("DELETE FROM tasks WHERE title = 'b'")
+    db.conn.execute("DELETE FROM exp_logs WHERE exp_gained = 5")
+    db.conn.execute("DELETE FROM daily_health WHERE date = '2025-10-12'")
+
+    r = Rollups(db.conn)
+    day = r.day("2025-10-13")
+    assert (day["sleep_h"], day["tasks_created"], day["exp_gained"]) == (7, 1, 10)
+    assert r.day("2025-10-14")["tasks_done"] == 1
+    assert r.day("2025-10-12")["health_logged"] == 0
+
+
+def test_weekly_rollup_monday_start(db):
+    """10-12(일)은 전주, 10-13(월)~10-19(일)은 같은 주"""
+    seed(db.conn)
+    r = Rollups(db.conn)
+
+    week = r.week("2025-10-13")
+    assert week["days_logged"] == 2
+    assert week["avg_sleep"] == 6.5
+    assert week["workout_total"] == 40
+    assert (week["tasks_created"], week["tasks_done"], week["exp_gained"]) == (3, 2, 15)
+    assert r.week("2025-10-06")["sleep_total"] == 6
+    assert r.week("2025-10-20")["exp_gained"] == 7
+
+
+def test_rebuild_matches_triggers(db):
+    seed(db.conn)
+    db.conn.execute("UPDATE daily_health SET workout_min = 0 WHERE date = '2025-10-19'")
+    maintained = snapshot(db.conn)
+
+    rollups.rebuild(db.conn.cursor())
+    assert snapshot(db.conn) == maintained
+
+
+def test_install_backfills_existing_database(db):
+    """집계 테이블이 없던 DB (add_rollups 이전 버전) → init_schema() 시 기존 기록으로 채움"""
+    seed(db.conn)
+    maintained = snapshot(db.conn)
+    db.conn.execute("DROP TABLE weekly_rollup")
+    db.conn.execute("DROP TABLE daily_rollup")
+    db.conn.execute("DELETE FROM schema_version WHERE name = 'add_rollups'")
+
+    db.init_schema()
+    assert snapshot(db.conn) == maintained
+
+
+def test_summary_is_single_lookup(api_key, db):
+    """SimpleLLM 요약: 원본 테이블 집계 없이 daily_rollup 한 번"""
+    from core.simple_llm import SimpleLLM
+
+    agent = SimpleLLM(db)
+    if agent.rag_writer:
+        agent.rag_writer.close()
+    agent.rag = None
+    agent.rag_writer = None
+    seed(db.conn)
+
+    statements = []
+    db.conn.set_trace_callback(statements.append)
+    result = agent._get_summary({"date": "2025-10-13"})
+
+    assert result["data"]["sleep"] == 5
+    assert result["data"]["tasks_total"] == 2
+    assert statements == ["SELECT * FROM daily_rollup WHERE date = '2025-10-13'"]
@@ -0,0 +1,77 @@
+"""
+SimpleLLM.process_stream (응답 토큰 스트리밍) 테스트
+"""
+import pytest
+from types import SimpleNamespace
+from core.simple_llm import SimpleLLM
+
+
+class FakeStreamingLLM:
+    """ChatOpenAI 대역 (stream은 토큰 조각을 순서대로 반환)"""
+
+    def __init__(self, tokens, fail_after=None):
+        self.tokens = tokens
+        self.fail_after = fail_after
+        self.calls = 0
+
+    def stream(self, messages):
+        self.calls += 1
+        for i, token in enumerate(self.tokens):
+            if self.fail_after is not None and i == self.fail_after:
+                raise ConnectionError("stream reset")
+            yield SimpleNamespace(content=token)
+
+    def invoke(self, messages):
+        self.calls += 1
+        return SimpleNamespace(content="".join(self.tokens))
+
+
+@pytest.fixture
+def agent(api_key, db):
+    llm = SimpleLLM(db)
+    if llm.rag_writer:
+        llm.rag_writer.close()
+    llm.rag = None
+    llm.rag_writer = None
+    llm.response_mode = "llm"
+    return llm
+
+
+def test_process_stream_yields_tokens(agent):
+    """fast path 파싱 → 실행 → 토큰 단위 응답"""
+    agent.llm = FakeStreamingLLM(["수면 ", "7h ", "기록. ", "목표 충족."])
+
+    tokens = list(agent.process_stream("7시간 잤어"))
+
+    assert tokens == ["수면 ", "7h ", "기록. ", "목표 충족."]
+    row = agent.db.conn.execute("SELECT sleep_h FROM daily_health").fetchone()
+    assert row[0] == 7
+
+
+def test_stream_result_is_cached(agent):
+    """스트리밍으로 받은 응답도 캐시 → 다음은 LLM 없이 한 번에"""
+    agent.llm = FakeStreamingLLM(["수면 7h 기록.", " 목표 충족."])
+    list(agent.process_stream("7시간 잤어"))
+
+    assert list(agent.process_stream("7시간 잤어")) == ["수면 7h 기록. 목표 충족."]
+    assert agent.llm.calls == 1
+
+
+def test_stream_failure_before_first_token_uses_fallback(agent):
+    agent.llm = FakeStreamingLLM(["수면 7h 기록."], fail_after=0)
+    assert list(agent.process_stream("7시간 잤어")) == ["1개 항목 기록 완료."]
+
+
+def test_stream_failure_midway_is_not_cached(agent):
+    agent.llm = FakeStreamingLLM(["수면 7h", " 기록."], fail_after=1)
+    assert list(agent.process_stream("7시간 잤어")) == ["수면 7h"]
+    assert agent.response_cache.stats()["size"] == 0
+
+
+def test_template_mode_streams_without_llm(agent):
+    """template 모드: 기록 의도는 LLM 없이 한 번에"""
+    agent.response_mode = "template"
+    agent.llm = FakeStreamingLLM(["사용 안 됨"])
+
+    assert list(agent.process_stream("5시간 잤어")) == ["수면 5h 기록. 목표 대비 -2h."]
+    assert agent.llm.calls == 0
@@ -0,0 +1,106 @@
+"""
+UnitOfWork / SimpleLLM 메시지 단위 트랜잭션 테스트
+"""
+import pytest
+from core.simple_llm import SimpleLLM
+from core.unit_of_work import UnitOfWork
+
+
+@pytest.fixture
+def llm(api_key, db):
+    """RAG 없는 SimpleLLM (LLM 호출 없음)"""
+    agent = SimpleLLM(db)
+    if agent.rag_writer:
+        agent.rag_writer.close()
+    agent.rag = None
+    agent.rag_writer = None
+    return agent
+
+
+def trace(conn):
+    """실행된 SQL 문장 기록 (트리거 내부 문장은 바깥 문장으로 반복 보고되므로 제외)"""
+    statements = []
+
+    def record(sql):
+        if not statements or statements[-1] != sql:
+            statements.append(sql)
+
+    conn.set_trace_callback(record)
+    return statements
+
+
+def test_daily_health_upserts_coalesced(db):
+    """같은 날짜 UPSERT는 한 문장으로"""
+    statements = trace(db.conn)
+    with UnitOfWork(db.conn) as uow:
+        uow.upsert_daily_health("2025-10-17", sleep_h=7)
+        uow.upsert_daily_health("2025-10-17", workout_min=30, protein_g=120)
+        uow.upsert_daily_health("2025-10-17", sleep_h=7.5)
+
+    assert sum("INSERT INTO daily_health" in s for s in statements) == 1
+    assert statements.count("COMMIT") == 1
+    row = db.conn.execute(
+        "SELECT sleep_h, workout_min, protein_g FROM daily_health WHERE date = '2025-10-17'"
+    ).fetchone()
+    assert tuple(row) == (7.5, 30, 120)
+
+
+def test_upsert_keeps_existing_columns(db):
+    """UPSERT는 지정한 컬럼만 갱신"""
+    with UnitOfWork(db.conn) as uow:
+        uow.upsert_daily_health("2025-10-17", weight_kg=70.5)
+    with UnitOfWork(db.conn) as uow:
+        uow.upsert_daily_health("2025-10-17", sleep_h=6)
+
+    row = db.conn.execute("SELECT sleep_h, weight_kg FROM daily_health").fetchone()
+    assert tuple(row) == (6, 70.5)
+
+
+def test_unknown_column_rejected(db):
+    with pytest.raises(ValueError):
+        UnitOfWork(db.conn).upsert_daily_health("2025-10-17", steps=1000)
+
+
+def test_multi_intent_message_commits_once(llm, db):
+    """여러 의도 → 커밋 1회, summary는 같은 트랜잭션의 값을 읽음"""
+    statements = trace(db.conn)
+    results = llm._execute({"intents": [
+        {"intent": "sleep", "entities": {"sleep_hours": 7, "date": "2025-10-17"}},
+        {"intent": "workout", "entities": {"workout_minutes": 30, "date": "2025-10-17"}},
+        {"intent": "task_add", "entities": {"task_title": "보고서"}},
+        {"intent": "summary", "entities": {"date": "2025-10-17"}},
+    ]})
+
+    assert all(r["result"]["success"] for r in results)
+    assert statements.count("COMMIT") == 1
+    assert sum("INSERT INTO daily_health" in s for s in statements) == 1
+    assert results[3]["result"]["data"]["sleep"] == 7
+    assert results[3]["result"]["data"]["workout"] == 30
+
+
+def test_failure_rolls_back_whole_message(llm, db, monkeypatch):
+    """한 의도가 실패하면 같은 메시지의 쓰기 전부 취소"""
+    def broken(entities):
+        raise RuntimeError("disk I/O error")
+
+    monkeypatch.setattr(llm, "_store_learning_log", broken)
+    results = llm._execute({"intents": [
+        {"intent": "task_add", "entities": {"task_title": "보고서"}},
+        {"intent": "sleep", "entities": {"sleep_hours": 7, "date": "2025-10-17"}},
+        {"intent": "learning_log", "entities": {"title": "SQL"}},
+        {"intent": "protein", "entities": {"protein_grams": 100}},
+    ]})
+
+    assert [r["result"]["success"] for r in results] == [False] * 4
+    assert "disk I/O error" in results[2]["result"]["error"]
+    assert db.conn.execute("SELECT COUNT(*) FROM tasks").fetchone()[0] == 0
+    assert db.conn.execute("SELECT COUNT(*) FROM daily_health").fetchone()[0] == 0
+
+
+def test_write_bumps_data_version(llm, db):
+    """쓰기가 커밋되면 data_version 증가 (대시보드 캐시 무효화), 조회만 하면 그대로"""
+    llm._execute({"intents": [{"intent": "summary", "entities": {}}]})
+    assert db.data_version == 0
+
+    llm._execute({"intents": [{"intent": "sleep", "entities": {"sleep_hours": 7}}]})
+    assert db.data_version == 1
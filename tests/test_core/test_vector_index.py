@@ -0,0 +1,136 @@
+"""
+VectorIndex 및 SQLite 벡터 검색 테스트
+"""
+import numpy as np
+import pytest
+from types import SimpleNamespace
+from core.rag_manager import RAGManager
+from core.vector_index import VectorIndex, IVFVectorIndex, VectorIndexFactory
+
+
+def _char_embedding(text, dims=1536):
+    """문자 빈도 기반 결정적 임베딩 (테스트용)"""
+    vector = [0.0] * dims
+    for ch in text:
+        vector[ord(ch) % dims] += 1.0
+    return vector
+
+
+class FakeEmbeddings:
+    def create(self, model, input, encoding_format):
+        texts = input if isinstance(input, list) else [input]
+        return SimpleNamespace(data=[
+            SimpleNamespace(index=i, embedding=_char_embedding(t))
+            for i, t in enumerate(texts)
+        ])
+
+
+@pytest.fixture
+def rag(api_key, db):
+    manager = RAGManager(db)
+    manager.embedding_service.client = SimpleNamespace(embeddings=FakeEmbeddings())
+    return manager
+
+
+def test_index_matches_exact_search():
+    """argpartition top-k == 전체 정렬 결과"""
+    rng = np.random.default_rng(0)
+    vectors = rng.normal(size=(500, 32)).astype(np.float32)
+    index = VectorIndex(dimensions=32, initial_capacity=8)
+    index.add_many((i, v, "user") for i, v in enumerate(vectors))
+
+    query = rng.normal(size=32)
+    normalized = vectors / np.linalg.norm(vectors, axis=1, keepdims=True)
+    expected = np.argsort(-(normalized @ (query / np.linalg.norm(query))))[:5]
+
+    assert len(index) == 500
+    assert [record_id for record_id, _ in index.search(query, top_k=5)] == list(expected)
+
+
+def test_index_role_filter_and_batch():
+    """역할 필터 및 배치 쿼리"""
+    index = VectorIndex(dimensions=2)
+    index.add(1, [1.0, 0.0], "user")
+    index.add(2, [0.9, 0.1], "assistant")
+    index.add(3, [0.0, 1.0], "user")
+
+    assert [r for r, _ in index.search([1.0, 0.0], top_k=3, role_filter="assistant")] == [2]
+    results = index.search_batch([[1.0, 0.0], [0.0, 1.0]], top_k=1)
+    assert [results[0][0][0], results[1][0][0]] == [1, 3]
+
+
+def _clustered(n=3000, dims=16, seed=0):
+    rng = np.random.default_rng(seed)
+    centers = rng.normal(size=(20, dims))
+    return (centers[rng.integers(0, 20, n)] + 0.3 * rng.normal(size=(n, dims))).astype(np.float32)
+
+
+def test_ivf_recall_tunable_by_nprobe():
+    """nprobe == nlist이면 정확 검색과 동일, 작으면 근사"""
+    vectors = _clustered()
+    flat = VectorIndex(dimensions=16)
+    flat.build((i, v, "user") for i, v in enumerate(vectors))
+    ivf = IVFVectorIndex(dimensions=16, nlist=16, nprobe=4)
+    ivf.build((i, v, "user") for i, v in enumerate(vectors))
+
+    assert ivf.is_trained
+    queries = vectors[:20]
+    exact = flat.search_batch(queries, top_k=10)
+    full = ivf.search_batch(queries, top_k=10, nprobe=16)
+    assert [[r for r, _ in x] for x in full] == [[r for r, _ in x] for x in exact]
+
+    approx = ivf.search_batch(queries, top_k=10)
+    hits = np.mean([len({r for r, _ in a} & {r for r, _ in e}) / 10 for a, e in zip(approx, exact)])
+    assert hits >= 0.9
+
+
+def test_ivf_incremental_add_and_persist(tmp_path):
+    """증분 추가 후 저장/로드"""
+    vectors = _clustered()
+    ivf = VectorIndexFactory.create("ivf", dimensions=16, nlist=8)
+    ivf.build((i, v, "user") for i, v in enumerate(vectors))
+    ivf.add(10_000, vectors[5], "assistant")
+
+    path = str(tmp_path / "index.npz")
+    ivf.save(path)
+    loaded = VectorIndexFactory.load(path)
+
+    assert isinstance(loaded, IVFVectorIndex)
+    assert len(loaded) == len(vectors) + 1
+    assert loaded.max_id == 10_000
+    assert loaded.search(vectors[5], top_k=1, role_filter="assistant")[0][0] == 10_000
+    assert loaded.search_batch(vectors[:5], top_k=3) == ivf.search_batch(vectors[:5], top_k=3)
+
+
+def test_sqlite_semantic_search(rag):
+    """SQLite에서 BLOB 저장 + 벡터 검색 (텍스트 LIKE 아님)"""
+    rag.save_conversation('user', '어제 7시간 잤어')
+    rag.save_conversation('user', '30분 운동했어')
+
+    results = rag.search_similar_conversations('7시간 잤어', top_k=1)
+    assert results[0]['content'] == '어제 7시간 잤어'
+    assert results[0]['similarity'] > 0.5
+
+    # 인덱스 로드 후 증분 추가
+    rag.save_conversations_batch([{
+        'role': 'assistant', 'content': '운동 30min 기록.', 'context': None,
+        'session_id': None, 'timestamp': '2025-10-17 10:00:00'
+    }])
+    results = rag.search_similar_conversations('운동', top_k=3, role_filter='assistant')
+    assert [r['content'] for r in results] == ['운동 30min 기록.']
+
+
+def test_index_catches_up_with_other_sessions(rag, db):
+    """다른 세션(RAGManager)이 저장한 대화도 이미 로드된 인덱스 검색에 포함"""
+    other = RAGManager(db)
+    other.embedding_service.client = rag.embedding_service.client
+
+    rag.save_conversation('user', '어제 7시간 잤어')
+    assert len(rag.search_similar_conversations('잤어', top_k=5)) == 1
+
+    other.save_conversation('user', '30분 운동했어')
+    rag.save_conversation('user', '단백질 120g 먹었어')
+    results = rag.search_similar_conversations('운동했어', top_k=5)
+
+    assert results[0]['content'] == '30분 운동했어'
+    assert len(results) == 3
@@ -0,0 +1,70 @@
+"""
+ClauseSegmenter 테스트
+"""
+import pytest
+from datetime import datetime
+from parsers.clause_segmenter import ClauseSegmenter
+
+
+@pytest.fixture
+def segmenter():
+    return ClauseSegmenter()
+
+
+REFERENCE = datetime(2025, 10, 17)
+
+
+def test_connective_endings(segmenter):
+    """-고, -서는 앞 절에 남고, 그리고/쉼표는 버림"""
+    texts = [c.text for c in segmenter.segment("7시간 자고 30분 운동했어")]
+    assert texts == ["7시간 자고", "30분 운동했어"]
+
+    texts = [c.text for c in segmenter.segment("일어나서 스트레칭, 그리고 헬스 1시간")]
+    assert texts == ["일어나서", "스트레칭", "헬스 1시간"]
+
+
+def test_spans_point_into_input(segmenter):
+    text = "어제 7시간 자고 1,000보 걸었어"
+    for clause in segmenter.segment(text):
+        assert text[clause.span[0]:clause.span[1]] == clause.text
+
+
+def test_thousands_separator_is_not_a_boundary(segmenter):
+    clauses = segmenter.segment("어제 7시간 자고 1,000보 걸었어", REFERENCE)
+
+    assert len(clauses) == 2
+    assert clauses[0].numbers == [(7.0, "hours")]
+    assert clauses[0].date == "2025-10-16"
+    assert clauses[1].numbers == [(1000.0, "steps")]
+    assert clauses[1].date is None
+
+
+def test_numbers_and_units(segmenter):
+    clause = segmenter.segment("헬스 1시간 30분, 단백질 120g 체중 70.5kg")[1]
+    assert clause.numbers == [(120.0, "grams"), (70.5, "kg")]
+    assert clause.quantity("kg") == 70.5
+    assert clause.quantity("hours") is None
+    assert segmenter.segment("헬스 1시간 30분")[0].quantity("minutes") == 30.0
+
+
+def test_korean_numerals(segmenter):
+    clauses = segmenter.segment("어제 일곱시간 반 자고 삼십분 운동했어", REFERENCE)
+    assert [c.numbers for c in clauses] == [[(7.5, "hours")], [(30.0, "minutes")]]
+    assert segmenter.segment("몸무게 칠십 키로")[0].quantity("kg") == 70.0
+    assert segmenter.segment("할일 3 완료")[0].numbers == [(3.0, None)]
+
+
+def test_dates_per_clause(segmenter):
+    clauses = segmenter.segment("3일 전에 6시간 잤고 10월 3일 헬스 1시간", REFERENCE)
+    assert [c.date for c in clauses] == ["2025-10-14", "2025-10-03"]
+    assert clauses[0].numbers == [(6.0, "hours")]
+
+
+@pytest.mark.parametrize("text", [
+    "보고서 작성해야 해",        # 보고서: 명사 안의 -고/-서
+    "공부하고 있어",             # 보조 용언 (-고 있다)
+    "7시간 자고 싶다",
+    "최고",
+])
+def test_single_clause(segmenter, text):
+    assert [c.text for c in segmenter.segment(text)] == [text]
@@ -44,3 +44,56 @@ def test_extract_from_sentence(parser):
     result = parser.extract_date_from_sentence("어제 5시간 잤어")
     expected = (datetime.now() - timedelta(days=1)).strftime("%Y-%m-%d")
     assert result == expected
+
+
+REFERENCE = datetime(2025, 10, 17, 23, 30)
+
+
+def test_injected_clock():
+    """clock을 고정하면 실행 시각과 무관"""
+    parser = DateParser(clock=lambda: REFERENCE)
+    assert parser.parse("어제") == "2025-10-16"
+    assert parser.parse("1주 후") == "2025-10-24"
+    assert parser.extract_date_from_sentence("그냥 잤어") == "2025-10-17"
+
+
+def test_keyword_priority_matches_sequential_check(parser):
+    """키워드가 여러 개면 relative_dates 순서 (등장 위치와 무관)"""
+    assert parser.parse("어제 말고 오늘", REFERENCE) == "2025-10-17"
+    assert parser.parse("3일 전 말고 어제", REFERENCE) == "2025-10-16"
+    # 잘못된 절대 날짜는 건너뛰고 다음 표현
+    assert parser.parse("2025-13-40 아니고 10월 3일", REFERENCE) == "2025-10-03"
+
+
+def test_parse_many_shared_reference():
+    calls = []
+
+    def clock():
+        calls.append(1)
+        return REFERENCE
+
+    parser = DateParser(clock=clock)
+    texts = ["어제 7시간 잤어", "3일 전 헬스", "10월 3일", "날짜 없음"]
+    assert parser.parse_many(texts) == ["2025-10-16", "2025-10-14", "2025-10-03", None]
+    assert len(calls) == 1  # 배치 전체에 기준 시각 한 번
+
+
+def test_parse_many_per_text_reference(parser):
+    """메시지 작성 시각별 기준 (과거 메시지 백필)"""
+    sent = [datetime(2025, 1, 1, 9), datetime(2025, 3, 1, 9)]
+    assert parser.parse_many(["어제", "어제"], sent) == ["2024-12-31", "2025-02-28"]
+
+    with pytest.raises(ValueError):
+        parser.parse_many(["어제"], sent)
+
+
+def test_memo_per_reference_date():
+    parser = DateParser(memo_size=2)
+    parser.parse_many(["어제 잤어", "어제 운동", "어제"], REFERENCE)
+    info = parser._resolve.cache_info()
+    assert (info.hits, info.misses) == (2, 1)
+
+    # 기준일이 다르면 다른 항목, 오래된 항목부터 밀려남
+    assert parser.parse("어제", datetime(2025, 1, 1)) == "2024-12-31"
+    assert parser.parse("3일 전", REFERENCE) == "2025-10-14"
+    assert parser._resolve.cache_info().currsize == 2
@@ -0,0 +1,168 @@
+"""
+FastParser 테스트
+"""
+import pytest
+from datetime import datetime, timedelta
+from parsers.fast_parser import FastParser
+
+
+@pytest.fixture
+def parser():
+    return FastParser()
+
+
+def _first(result):
+    return result["intents"][0]
+
+
+def test_parse_sleep(parser):
+    """수면 기록 fast path"""
+    result = parser.parse("7시간 잤어")
+    assert result["success"] is True
+    assert result["confidence"] >= 0.85
+    assert _first(result)["intent"] == "sleep"
+    assert _first(result)["entities"]["sleep_hours"] == 7.0
+
+
+def test_parse_sleep_with_minutes_and_date(parser):
+    """시간+분 조합 및 날짜 추출"""
+    result = parser.parse("어제 7시간 30분 잤어")
+    entities = _first(result)["entities"]
+    assert entities["sleep_hours"] == 7.5
+    assert entities["date"] == (datetime.now() - timedelta(days=1)).strftime("%Y-%m-%d")
+
+
+def test_parse_workout_hours_to_minutes(parser):
+    """운동 시간 → 분 변환"""
+    result = parser.parse("헬스 1시간")
+    assert _first(result)["intent"] == "workout"
+    assert _first(result)["entities"]["workout_minutes"] == 60
+
+
+def test_parse_korean_numerals(parser):
+    """한글 수사도 fast path에서 처리"""
+    result = parser.parse("한시간 반 잤어")
+    assert result["confidence"] >= 0.85
+    assert _first(result)["entities"]["sleep_hours"] == 1.5
+    assert _first(parser.parse("삼십분 운동했어"))["entities"]["workout_minutes"] == 30
+    assert _first(parser.parse("두시간 반 운동했어"))["entities"]["workout_minutes"] == 150
+
+
+def test_parse_protein_and_weight(parser):
+    """단백질/체중"""
+    assert _first(parser.parse("단백질 120g 먹었어"))["entities"]["protein_grams"] == 120.0
+    assert _first(parser.parse("체중 70.5kg"))["entities"]["weight_kg"] == 70.5
+
+
+def test_parse_summary(parser):
+    """요약 조회"""
+    result = parser.parse("오늘 요약")
+    assert _first(result)["intent"] == "summary"
+    assert result["confidence"] >= 0.85
+
+
+@pytest.mark.parametrize("text", ["어제 정리 좀", "정리해줘", "오늘 요약해줘"])
+def test_parse_summary_requests(parser, text):
+    result = parser.parse(text)
+    assert _first(result)["intent"] == "summary"
+    assert result["confidence"] >= 0.85
+
+
+@pytest.mark.parametrize("text", [
+    "책상 정리 할일 추가", "방 정리했어", "정리 좀 해줘", "7시간 자고 책상 정리했어",
+])
+def test_tidy_up_is_not_summary(parser, text):
+    """"정리"만 있으면 요약 요청으로 확정하지 않음"""
+    assert parser.parse(text)["confidence"] < 0.85
+
+
+@pytest.mark.parametrize("text, intent, entities", [
+    ("수면 7시간", "sleep", {"sleep_hours": 7.0}),          # 명사 "수면"은 가정 표현 아님
+    ("2시간 공부했어", "study", {"study_hours": 2.0}),
+    ("3.5시간 공부했어", "study", {"study_hours": 3.5}),
+    ("몸무게 72키로", "weight", {"weight_kg": 72.0}),
+])
+def test_parse_records(parser, text, intent, entities):
+    result = parser.parse(text)
+    assert _first(result)["intent"] == intent
+    assert _first(result)["entities"] == entities
+    assert result["confidence"] >= 0.85
+
+
+@pytest.mark.parametrize("text", [
+    "7시간 안 잤어",
+    "7시간 안잤어",
+    "잠을 못 잤어 7시간",
+    "오늘은 30분도 운동 못 했어",
+    "2시간 공부 안 했어",
+])
+def test_negation_escalates(parser, text):
+    """부정 표현은 기록하지 않고 LLM으로"""
+    assert parser.parse(text)["confidence"] < 0.85
+
+
+@pytest.mark.parametrize("text", ["70kg 벤치 했어", "벤치 70kg 들었어", "스쿼트 100키로 5세트"])
+def test_lifted_weight_is_not_body_weight(parser, text):
+    """운동 어휘와 함께 쓴 kg은 체중으로 확정하지 않음"""
+    assert parser.parse(text)["confidence"] < 0.85
+
+
+@pytest.mark.parametrize("text, entities", [
+    ("30분 전에 7시간 잤어", {"sleep_hours": 7.0}),
+    ("삼십분 전에 일어났는데 7시간 잤어", {"sleep_hours": 7.0}),
+    ("10분 늦게 자서 6시간 잤어", {"sleep_hours": 6.0}),
+    ("1시간 전에 30분 운동했어", {"workout_minutes": 30}),
+])
+def test_offsets_are_not_durations(parser, text, entities):
+    """"N분 전에", "N분 늦게"는 기록할 기간이 아님"""
+    assert _first(parser.parse(text))["entities"] == entities
+
+
+def test_several_durations_escalate(parser):
+    """기간 후보가 여럿이면 어느 것을 기록할지 LLM이 판단"""
+    assert parser.parse("낮잠 30분 밤에 7시간 잤어")["confidence"] < 0.85
+
+
+@pytest.mark.parametrize("text", [
+    "체중 5kg 빠졌어",              # 변화량
+    "체중 2kg 늘었어",
+    "체중 70kg 목표",               # 목표
+    "3시간 공부할 예정",            # 계획
+    "잠을 7시간 자야지",            # 다짐
+    "내일 30분 운동할 거야",
+    "7시간 잤고, 체중 70kg 목표",   # 복합 입력의 한 절
+])
+def test_plans_goals_and_changes_escalate(parser, text):
+    """목표/계획/변화량은 사실 기록이 아님"""
+    assert parser.parse(text)["confidence"] < 0.85
+
+
+def test_low_confidence_escalates(parser):
+    """복합/질문/엔티티 누락은 낮은 신뢰도"""
+    for text in ["7시간 자고 싶다", "몇 시간 자야 돼?",
+                 "새벽3시부터 12시까지 잤어", "자전거 1시간 탔어", "안녕"]:
+        assert parser.parse(text)["confidence"] < 0.85, text
+
+
+def test_parse_compound_by_clause(parser):
+    """복합 입력은 절마다 의도 + 미리 뽑은 숫자, 날짜는 앞 절에서 이어받음"""
+    result = parser.parse("어제 7시간 자고 30분 운동했어")
+    yesterday = (datetime.now() - timedelta(days=1)).strftime("%Y-%m-%d")
+
+    assert result["success"] and result["multiple"]
+    assert result["confidence"] >= 0.85
+    assert [(i["intent"], i["entities"]) for i in result["intents"]] == [
+        ("sleep", {"sleep_hours": 7.0, "date": yesterday}),
+        ("workout", {"workout_minutes": 30, "date": yesterday}),
+    ]
+
+
+def test_parse_compound_comma(parser):
+    result = parser.parse("단백질 1,200g, 체중 70.5kg")
+    assert [i["entities"] for i in result["intents"]] == [{"protein_grams": 1200.0}, {"weight_kg": 70.5}]
+
+
+def test_compound_with_unknown_clause_escalates(parser):
+    """한 절이라도 해석 못 하면 전체를 LLM으로"""
+    for text in ["비가 와서 30분 운동했어", "7시간 잤고 보고서 작성해야 해", "7시간 자고 일찍 일어났어"]:
+        assert parser.parse(text)["confidence"] < 0.85, text
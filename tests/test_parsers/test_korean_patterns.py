@@ -1,8 +1,11 @@
 """
 KoreanPatterns 테스트
 """
+import random
+import re
+
 import pytest
-from parsers.korean_patterns import KoreanPatterns
+from parsers.korean_patterns import IntentCandidate, KoreanPatterns
 
 
 @pytest.fixture
@@ -56,3 +59,50 @@ def test_extract_task_id(patterns):
     """할일 ID 추출"""
     assert patterns.extract_task_id("할일 1 완료") == 1
     assert patterns.extract_task_id("5 완료") == 5
+
+
+def test_match_candidates(patterns):
+    """매칭되는 모든 의도를 우선순위 순으로 (span은 원본 입력 기준)"""
+    candidates = patterns.match_candidates("  30분 운동하고 보고서 작성해야 해")
+
+    assert [c.intent for c in candidates] == ["workout", "task_add"]
+    assert candidates[0] == IntentCandidate("workout", 3, (2, 8))
+    assert candidates[0].priority < candidates[1].priority
+    assert patterns.match_candidates("점심 뭐 먹지") == []
+
+
+def test_overlapping_keywords(patterns):
+    """겹치는 키워드도 모두 후보 ("이해했어" = 이해했 + 했어)"""
+    assert patterns.match_intent("클로저 이해했어") == "task_complete"
+    assert [c.intent for c in patterns.match_candidates("클로저 이해했어")] == ["task_complete", "learning_log"]
+
+
+def legacy_intent(patterns, text):
+    """변경 전 방식: 기존 (.+?) 패턴을 우선순위대로 하나씩 search"""
+    text = text.strip()
+    for intent, attr in patterns.PRIORITY:
+        for pattern in getattr(patterns, attr):
+            source = pattern.pattern
+            if source.startswith(r".\s*"):
+                source = "(.+?)" + source[1:]
+            if re.search(source, text):
+                return intent
+    return "unknown"
+
+
+def test_same_intent_as_sequential_matching(patterns):
+    """키워드/숫자/단위 조각을 섞은 입력에서 기존 방식과 결과 동일"""
+    fragments = [k for keywords in patterns.KEYWORDS.values() for k in keywords] + [
+        "시간", "분", "7", "30", "1.5", " ", "\n", "시", "일", "가", "에 대해", "하", "해", "둬",
+        "추가", "g", "그램", "오늘", "몇", "중", "잤다가", "일어나", "안 ", "물 마시기", "금연", "것",
+    ]
+    rng = random.Random(0)
+    for _ in range(3000):
+        text = "".join(rng.choice(fragments) for _ in range(rng.randint(1, 6)))
+        assert patterns.match_intent(text) == legacy_intent(patterns, text), repr(text)
+
+
+def test_long_input_is_linear(patterns):
+    """긴 입력(약 2KB)에서도 (.+?) 역추적 없이 즉시 판별"""
+    text = "출근길 버스는 평소보다 붐볐다 " * 120 + "보고서 작성해야 해"
+    assert patterns.match_intent(text) == "task_add"
@@ -34,3 +34,86 @@ def test_parse_weight(parser):
     """체중 파싱"""
     assert parser.parse_weight("70kg") == 70.0
     assert parser.parse_weight("65.5키로") == 65.5
+
+
+@pytest.mark.parametrize("text, hours", [
+    ("한시간", 1.0), ("열두 시간", 12.0), ("스무시간", 20.0), ("한시간 반", 1.5),
+    ("두시간반정도", 2.5), ("3일 전 열시간", 10.0), ("1.5시간", 1.5),
+])
+def test_parse_hours_korean_numerals(parser, text, hours):
+    """고유어 수사 + 반"""
+    assert parser.parse_hours(text) == hours
+
+
+@pytest.mark.parametrize("text, minutes", [
+    ("삼십분", 30), ("십오 분", 15), ("사십오분", 45), ("오분", 5),
+])
+def test_parse_minutes_korean_numerals(parser, text, minutes):
+    """한자어 수사"""
+    assert parser.parse_minutes(text) == minutes
+
+
+def test_parse_duration_minutes(parser):
+    """시간 + 바로 이어지는 분"""
+    assert parser.parse_duration_minutes("1시간 20분") == 80
+    assert parser.parse_duration_minutes("한시간 반") == 90
+    assert parser.parse_duration_minutes("두 시간 삼십분 운동") == 150
+    assert parser.parse_duration_minutes("반시간") == 30
+    assert parser.parse_duration_minutes("운동") is None
+
+
+@pytest.mark.parametrize("text", [
+    "이 시간에 뭐해",     # 지시어
+    "구분해야 해",        # 단어 안의 한자어
+    "다섯 분이 오셨어",    # 고유어 + 분 = 사람
+    "사분기 보고서",
+])
+def test_numeral_unit_mismatch_is_ignored(parser, text):
+    """수사와 단위가 맞지 않으면 수량이 아님"""
+    assert parser.extract_quantities(text) == []
+
+
+def test_extract_quantities(parser):
+    """모든 수량 (표준 단위, 등장 순서)"""
+    text = "천오백보 걷고 1만보, 물 세 잔"
+    assert [(value, unit) for value, unit, _ in parser.extract_quantities(text)] == [
+        (1500.0, "steps"), (10000.0, "steps"), (3.0, "cups"),
+    ]
+    assert parser.parse_grams("단백질 1,200g") == 1200.0
+    assert parser.parse_weight("칠십 키로") == 70.0
+
+
+@pytest.mark.parametrize("text, steps", [
+    ("1만5천보", 15000.0), ("만 오천보", 15000.0), ("1만 5000보", 15000.0),
+    ("만오천보", 15000.0), ("3천5백보", 3500.0), ("1.5만보", 15000.0), ("1천만보", 10000000.0),
+])
+def test_mixed_digit_and_place_numerals(parser, text, steps):
+    """숫자와 자릿수(만/천/백)가 섞인 수는 하나의 수"""
+    assert [(value, unit) for value, unit, _ in parser.extract_quantities(text)] == [(steps, "steps")]
+
+
+@pytest.mark.parametrize("text", ["5백천보", "1만2만보"])
+def test_malformed_mixed_numeral_is_not_a_quantity(parser, text):
+    """자릿수 순서가 틀리면 일부만 읽지 않고 수량 없음 (LLM으로)"""
+    assert parser.extract_quantities(text) == []
+
+
+@pytest.mark.parametrize("text", ["7,5kg", "체중 7,5kg", "1,2000보"])
+def test_partial_digit_run_is_not_a_quantity(parser, text):
+    """천 단위가 아닌 쉼표 숫자는 뒷부분만 읽지 않음 ("7,5kg" → 5kg 아님)"""
+    assert parser.extract_quantities(text) == []
+
+
+@pytest.mark.parametrize("text, candidates", [
+    ("30분 전에 7시간 잤어", [420.0]),                 # 시점 기준
+    ("삼십분 전에 일어났는데 7시간 잤어", [420.0]),
+    ("10분 늦게 자서 6시간 잤어", [360.0]),
+    ("1시간 전에 30분 운동했어", [30.0]),
+    ("1시간 30분 전에 7시간 잤어", [420.0]),
+    ("2시 30분에 자서 7시간 잤어", [420.0]),           # 시각
+    ("30분 만에 운동 끝", [30.0]),
+    ("30분 자고 일어나서 7시간 더 잤어", [30.0, 420.0]),  # 기간이 둘 - 모호
+])
+def test_duration_candidates_skip_offsets_and_clock_times(parser, text, candidates):
+    assert parser.duration_candidates(text) == candidates
+    assert parser.parse_duration_minutes(text) == candidates[0]
@@ -0,0 +1,73 @@
+"""
+파서 평가 코퍼스 + 정확도 하한 테스트
+정확도가 하한 아래로 떨어지는 파서 변경은 실패 (파서를 개선하면 하한도 올린다).
+"""
+from datetime import datetime
+
+import pytest
+from parsers.evaluation import (
+    DateSuite, FastParserSuite, IntentSuite, NumberSuite,
+    entities_match, evaluate, load_corpus, score_intents,
+)
+
+INTENTS = {"sleep", "workout", "protein", "weight", "study", "summary", "progress",
+           "task_add", "task_complete", "learning_log"}
+
+
+@pytest.fixture(scope="module")
+def corpus():
+    return load_corpus()
+
+
+def test_corpus_is_labeled(corpus):
+    assert len(corpus) >= 2000
+    assert len({item["text"] for item in corpus}) == len(corpus)
+
+    for item in corpus:
+        assert item["intents"] and item["tags"]
+        for intent in item["intents"]:
+            assert intent["intent"] in INTENTS
+            if "date" in intent["entities"]:
+                datetime.strptime(intent["entities"]["date"], "%Y-%m-%d")
+
+    tags = {tag for item in corpus for tag in item["tags"]}
+    assert {"compound", "date", "numeral"} <= tags
+
+
+def test_scoring():
+    item = {"intents": [{"intent": "sleep", "entities": {"sleep_hours": 7.5}},
+                        {"intent": "workout", "entities": {"workout_minutes": 30}}]}
+
+    assert score_intents(item, [
+        {"intent": "sleep", "entities": {"sleep_hours": 7.5, "date": "2025-10-17"}},
+        {"intent": "workout", "entities": {"workout_minutes": 30.0}},
+    ]) == (True, True)
+    assert score_intents(item, [
+        {"intent": "sleep", "entities": {"sleep_hours": 7}},
+        {"intent": "workout", "entities": {"workout_minutes": 30}},
+    ]) == (True, False)
+    assert score_intents(item, [{"intent": "sleep", "entities": {"sleep_hours": 7.5}}]) == (False, False)
+    assert score_intents(item, None) == (False, False)
+    assert not entities_match({"task_title": "보고서"}, {})
+
+
+@pytest.mark.parametrize("suite, metric, floor", [
+    (IntentSuite, "intent_accuracy", 0.94),
+    (NumberSuite, "entity_accuracy", 0.91),
+    (DateSuite, "entity_accuracy", 1.0),
+    (FastParserSuite, "entity_accuracy", 0.81),
+])
+def test_accuracy_floor(corpus, suite, metric, floor):
+    report = evaluate(suite(), corpus)
+    assert report["items"] > 0 and report["ops_per_sec"] > 0
+    assert report[metric] >= floor, report
+
+
+def test_fast_path_precision(corpus):
+    """fast path가 답한 발화는 대부분 정답이어야 함 (틀린 기록은 LLM 비용보다 나쁨)"""
+    suite = FastParserSuite()
+    answered = [(item, suite.run(item)) for item in corpus]
+    answered = [(item, output) for item, output in answered if output]
+
+    correct = sum(score_intents(item, output)[1] for item, output in answered)
+    assert correct / len(answered) >= 0.91